@@ -11,13 +11,18 @@ from pathlib import Path
 import sys
 import threading
 import time
+from collections import OrderedDict
 
 from src.utils.config import Config
 from src.utils.logger import setup_logger
 from src.api.jsearch_client import JSearchClient
 from src.services.job_service import JobService
+from src.services.search_cache import SearchCache
+from src.services.job_store import JobStore
 from src.services.salary_service import SalaryService
 from src.services.export_service import ExportService
+from src.models.job_projection import project_jobs, job_to_dashboard
+from src.models.job_record import JobRecord
 from config.predefined_searches import PREDEFINED_SEARCHES, SEARCH_TITLES
 
 app = Flask(__name__)
@@ -26,6 +31,14 @@ CORS(app)
 # Global cache for API results
 search_cache = {}
 cache_timestamp = {}
+# Guards the check-and-start of background searches in search_cache
+search_lock = threading.Lock()
+
+# Compact read-only job details as (record, fetched_at), most recently used last.
+# Entries expire after config.cache_ttl_details like the API response cache.
+job_records = OrderedDict()
+job_records_lock = threading.Lock()
+MAX_JOB_RECORDS = 1000
 
 # Initialize services
 try:
@@ -38,7 +51,9 @@ try:
     )
     
     api_client = JSearchClient(config.api_key, config.api_host, config)
-    job_service = JobService(api_client)
+    job_search_cache = SearchCache(ttl=config.cache_ttl_search) if config.cache_enabled else None
+    job_store = JobStore(config.store_path) if config.store_enabled else None
+    job_service = JobService(api_client, job_search_cache, job_store)
     salary_service = SalaryService(api_client)
     export_service = ExportService(config.output_dir)
     
@@ -59,32 +74,23 @@ def perform_search_background(search_id):
         params = PREDEFINED_SEARCHES[search_id]
         print(f"[BG] Starting search for {search_id}: {params.query}")
         
-        # Search jobs
-        jobs = job_service.search_jobs(params)
-        print(f"[BG] Found {len(jobs)} jobs")
-        
-        # Format jobs
-        jobs_data = []
-        for job in jobs:
-            try:
-                job_dict = {
-                    'id': job.job_id,
-                    'title': job.title or 'N/A',
-                    'company': job.employer_name or 'N/A',
-                    'location': job.get_location(),
-                    'salary': job.get_salary_range() or 'Not specified',
-                    'employment_type': job.employment_type or 'N/A',
-                    'is_remote': job.is_remote,
-                    'posted_at': job.posted_at_datetime or 'N/A',
-                    'description': job.get_short_description(500),
-                    'required_experience': job.required_experience or 'Not specified',
-                    'required_education': job.required_education or 'Not specified',
-                    'apply_link': job.apply_link or '#'
+        # Project raw results straight to the dashboard shape. Page by page
+        # (opt-in, one quota unit per page) publishes progress for the
+        # status endpoint; otherwise the whole range is a single API call
+        if config.search_page_by_page:
+            jobs_data = []
+            for page in job_service.iter_search(params, parser=project_jobs):
+                jobs_data.extend(page.jobs)
+                search_cache[search_id] = {
+                    'status': 'searching',
+                    'progress': int(100 * page.pages_done / page.total_pages),
+                    'pages_done': page.pages_done,
+                    'total_pages': page.total_pages,
+                    'jobs_found': len(jobs_data)
                 }
-                jobs_data.append(job_dict)
-            except Exception as e:
-                logger.warning(f"Error formatting job: {e}")
-                continue
+        else:
+            jobs_data = project_jobs(job_service.search_raw(params)).items
+        print(f"[BG] Found {len(jobs_data)} jobs")
         
         search_cache[search_id] = {
             'success': True,
@@ -110,36 +116,37 @@ def index():
 def api_search(search_id):
     """API endpoint for predefined searches"""
     try:
-        # If already cached and recent (10 mins), return cached
-        if search_id in search_cache:
-            if search_id in cache_timestamp and time.time() - cache_timestamp[search_id] < 600:
-                print(f"[API] Returning cached results for {search_id}")
+        with search_lock:
+            # If already cached and recent (10 mins), return cached
+            if search_id in search_cache:
+                if search_id in cache_timestamp and time.time() - cache_timestamp[search_id] < 600:
+                    print(f"[API] Returning cached results for {search_id}")
+                    return jsonify(search_cache[search_id])
+
+            # Check if search is in progress
+            if search_id in search_cache and 'total' in search_cache[search_id]:
+                print(f"[API] Returning in-progress results for {search_id}")
                 return jsonify(search_cache[search_id])
-        
-        # Check if search is in progress
-        if search_id in search_cache and 'total' in search_cache[search_id]:
-            print(f"[API] Returning in-progress results for {search_id}")
-            return jsonify(search_cache[search_id])
-        
-        # Start background search
-        if search_id not in search_cache:
-            print(f"[API] Starting async search for {search_id}")
-            search_cache[search_id] = {'status': 'searching', 'progress': 0}
-            
-            thread = threading.Thread(target=perform_search_background, args=(search_id,))
-            thread.daemon = True
-            thread.start()
-            
-            # Return immediate response
-            return jsonify({
-                'success': True,
-                'status': 'searching',
-                'message': 'Search in progress, please wait...',
-                'jobs': []
-            })
-        
-        # Return current status
-        return jsonify(search_cache.get(search_id, {'status': 'waiting'}))
+
+            # Start background search (only one per search_id)
+            if search_id not in search_cache:
+                print(f"[API] Starting async search for {search_id}")
+                search_cache[search_id] = {'status': 'searching', 'progress': 0}
+
+                thread = threading.Thread(target=perform_search_background, args=(search_id,))
+                thread.daemon = True
+                thread.start()
+
+                # Return immediate response
+                return jsonify({
+                    'success': True,
+                    'status': 'searching',
+                    'message': 'Search in progress, please wait...',
+                    'jobs': []
+                })
+
+            # Return current status
+            return jsonify(search_cache.get(search_id, {'status': 'waiting'}))
     
     except Exception as e:
         print(f"[API] Error: {e}")
@@ -175,32 +182,9 @@ def api_custom_search():
         
         print(f"[API] Searching: {params.query}")
         
-        # Search jobs
-        jobs = job_service.search_jobs(params)
-        print(f"[API] Found {len(jobs)} jobs")
-        
-        # Format jobs
-        jobs_data = []
-        for job in jobs:
-            try:
-                job_dict = {
-                    'id': job.job_id,
-                    'title': job.title or 'N/A',
-                    'company': job.employer_name or 'N/A',
-                    'location': job.get_location(),
-                    'salary': job.get_salary_range() or 'Not specified',
-                    'employment_type': job.employment_type or 'N/A',
-                    'is_remote': job.is_remote,
-                    'posted_at': job.posted_at_datetime or 'N/A',
-                    'description': job.get_short_description(500),
-                    'required_experience': job.required_experience or 'Not specified',
-                    'required_education': job.required_education or 'Not specified',
-                    'apply_link': job.apply_link or '#'
-                }
-                jobs_data.append(job_dict)
-            except Exception as e:
-                logger.warning(f"Error formatting job: {e}")
-                continue
+        # Search jobs and project raw results straight to the dashboard shape
+        jobs_data = project_jobs(job_service.search_raw(params)).items
+        print(f"[API] Found {len(jobs_data)} jobs")
         
         response = {
             'success': True,
@@ -217,12 +201,55 @@ def api_custom_search():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/saved-search', methods=['GET'])
+def api_saved_search():
+    """Keyword search over saved jobs, ranked by relevance (no API quota)"""
+    try:
+        query = request.args.get('q', '').strip()
+        limit = min(int(request.args.get('limit', 20)), 100)
+
+        if not query:
+            return jsonify({'success': False, 'error': 'Missing query parameter q'}), 400
+        if job_service.job_store is None:
+            return jsonify({'success': False, 'error': 'Local job store is disabled'}), 503
+
+        jobs_data = [job_to_dashboard(job) for job in job_service.search_saved(query, limit)]
+
+        return jsonify({
+            'success': True,
+            'title': f'Saved Jobs: {query}',
+            'total': len(jobs_data),
+            'jobs': jobs_data
+        })
+
+    except Exception as e:
+        logger.error(f"Saved search error: {e}", exc_info=True)
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @app.route('/api/job-details/<job_id>', methods=['GET'])
 def api_job_details(job_id):
     """API endpoint for job details"""
     try:
         country = request.args.get('country', 'in')
-        job = job_service.get_job_details(job_id, country)
+        key = (job_id, country)
+
+        job = None
+        with job_records_lock:
+            entry = job_records.get(key)
+            if entry is not None and time.time() - entry[1] < config.cache_ttl_details:
+                job = entry[0]
+                job_records.move_to_end(key)
+            elif entry is not None:
+                del job_records[key]
+
+        if job is None:
+            job = JobRecord.from_job(job_service.get_job_details(job_id, country))
+            with job_records_lock:
+                job_records[key] = (job, time.time())
+                job_records.move_to_end(key)
+                while len(job_records) > MAX_JOB_RECORDS:
+                    job_records.popitem(last=False)
         
         return jsonify({
             'id': job.job_id,
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: skills.py
+Descripción: Diccionario de skills por defecto para la extracción de skills.
+             Asocia cada nombre canónico con los alias que aparecen en las descripciones.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+
+# Nombre canónico -> alias (el nombre canónico siempre se reconoce a sí mismo).
+# Sin distinguir mayúsculas y por palabras completas: "Java" nunca reconoce "JavaScript".
+# Los nombres que también son palabras comunes ("Go", "R", "REST", "Spring") se
+# incluyen en una forma que no aparece en texto corriente, y los alias que lo
+# son ("node", "rails") no se incluyen.
+SKILLS = {
+    # Lenguajes
+    "Python": ["python3"],
+    "Java": [],
+    "JavaScript": ["js", "ecmascript", "es6"],
+    "TypeScript": [],
+    "Golang": ["go lang"],
+    "Rust": [],
+    "C++": ["cpp"],
+    "C#": ["csharp", "c sharp"],
+    "Kotlin": [],
+    "Swift": [],
+    "Scala": [],
+    "Ruby": [],
+    "PHP": [],
+    "SQL": [],
+    "Bash": ["shell scripting"],
+    "Dart": [],
+
+    # Frontend
+    "React": ["react.js", "reactjs"],
+    "React Native": [],
+    "Angular": ["angularjs", "angular.js"],
+    "Vue.js": ["vue", "vuejs"],
+    "Next.js": ["nextjs"],
+    "HTML": ["html5"],
+    "CSS": ["css3"],
+    "Tailwind CSS": ["tailwind"],
+    "Redux": [],
+    "Flutter": [],
+
+    # Backend
+    "Node.js": ["nodejs"],
+    "Express.js": ["expressjs"],
+    "Django": [],
+    "Flask": [],
+    "FastAPI": [],
+    "Spring Boot": ["springboot"],
+    ".NET": ["dotnet", "asp.net", ".net core"],
+    "Ruby on Rails": ["ror"],
+    "GraphQL": [],
+    "REST API": ["rest apis", "restful"],
+    "gRPC": [],
+    "Microservices": ["microservice"],
+
+    # Datos y ML
+    "Machine Learning": ["ml"],
+    "Deep Learning": [],
+    "TensorFlow": [],
+    "PyTorch": [],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "Pandas": [],
+    "NumPy": [],
+    "Spark": ["apache spark", "pyspark"],
+    "Hadoop": [],
+    "Kafka": ["apache kafka"],
+    "Airflow": ["apache airflow"],
+    "NLP": ["natural language processing"],
+    "Computer Vision": [],
+    "LLM": ["llms", "large language models"],
+    "Power BI": ["powerbi"],
+    "Tableau": [],
+
+    # Bases de datos
+    "PostgreSQL": ["postgres"],
+    "MySQL": [],
+    "MongoDB": ["mongo"],
+    "Redis": [],
+    "Elasticsearch": ["elastic search"],
+    "Oracle": [],
+    "DynamoDB": [],
+    "Cassandra": [],
+    "Snowflake": [],
+
+    # Cloud y DevOps
+    "AWS": ["amazon web services"],
+    "Azure": ["microsoft azure"],
+    "GCP": ["google cloud", "google cloud platform"],
+    "Docker": [],
+    "Kubernetes": ["k8s"],
+    "Terraform": [],
+    "Ansible": [],
+    "Jenkins": [],
+    "CI/CD": ["cicd", "continuous integration"],
+    "Git": ["github", "gitlab"],
+    "Linux": [],
+    "Prometheus": [],
+    "Grafana": [],
+
+    # Prácticas
+    "Agile": ["scrum"],
+    "TDD": ["test driven development"],
+    "Unit Testing": ["unit tests"],
+}
+
+# Nombres de skills de una sola palabra que también son palabras comunes en
+# inglés ("react quickly", "swift delivery", "spark interest"). Solos solo
+# cuentan con contexto: otra skill a pocas palabras. Sus alias cualificados
+# ("react.js", "apache spark") cuentan siempre.
+AMBIGUOUS_TERMS = frozenset({
+    "react", "rust", "swift", "spark", "ruby", "dart", "flask", "flutter",
+    "oracle", "snowflake", "cassandra", "airflow", "jenkins", "redux",
+})
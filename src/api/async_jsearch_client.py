@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: async_jsearch_client.py
+Descripción: Cliente asyncio para la API JSearch con concurrencia acotada.
+             Expone los mismos endpoints que JSearchClient como corrutinas
+             compartiendo pool de conexiones y rate limiter con el cliente síncrono.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import asyncio
+import functools
+import logging
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Tuple, TypeVar
+from src.api.jsearch_client import JSearchClient
+from src.models.search_params import SearchParameters
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class AsyncJSearchClient:
+    """Cliente asíncrono para JSearch API con límite de peticiones en vuelo"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_host: str = "api.openwebninja.com",
+        config: Any = None,
+        max_concurrency: Optional[int] = None,
+        client: Optional[JSearchClient] = None
+    ):
+        """
+        Args:
+            api_key: API key de OpenWeb Ninja (ignorado si se pasa client)
+            api_host: Host de la API
+            config: Objeto Config opcional con configuración
+            max_concurrency: Máximo de peticiones simultáneas en vuelo
+            client: JSearchClient síncrono a compartir (mismo rate limiter y
+                pool); sigue siendo del llamador y aclose no lo cierra
+        """
+        self._owns_client = client is None
+        if client is None:
+            if not api_key:
+                raise ValueError("Se requiere api_key o un JSearchClient existente")
+            client = JSearchClient(api_key, api_host, config)
+
+        if max_concurrency is None:
+            max_concurrency = config.max_concurrency if config else 8
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency debe ser al menos 1")
+
+        self.client = client
+        self.rate_limiter = client.rate_limiter
+        self.max_concurrency = max_concurrency
+
+        # El I/O HTTP es bloqueante: se ejecuta en un pool de hilos acotado
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="jsearch"
+        )
+        # Un semáforo por event loop (asyncio.Semaphore no se comparte entre loops)
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+        logger.info(f"AsyncJSearchClient inicializado (concurrencia: {max_concurrency})")
+
+    async def __aenter__(self) -> "AsyncJSearchClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Libera el pool de hilos y, si el cliente síncrono es propio, sus conexiones y caché"""
+        self._executor.shutdown(wait=False)
+        if self._owns_client:
+            self.client.close()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Semáforo asociado al event loop en ejecución"""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Ejecuta una llamada del cliente síncrono respetando el límite de concurrencia
+
+        El I/O HTTP se hace en el pool de hilos, pero las esperas del rate
+        limiter se hacen con wait_async en este event loop.
+        """
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(self._call_driven, loop, func, args, kwargs)
+            )
+
+    def _call_driven(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        func: Callable[..., T],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any]
+    ) -> T:
+        """Llamada en un hilo del pool con las esperas delegadas en el loop"""
+        with self.rate_limiter.driven_by(loop):
+            return func(*args, **kwargs)
+
+    async def search_jobs(
+        self,
+        params: SearchParameters,
+        bypass_cache: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Busca trabajos usando JSearch API
+
+        Args:
+            params: Parámetros de búsqueda validados
+            bypass_cache: Ignorar respuestas cacheadas
+
+        Returns:
+            Lista de trabajos encontrados
+
+        Raises:
+            HTTPError: Si hay error en la petición
+        """
+        return await self._run(self.client.search_jobs, params, bypass_cache=bypass_cache)
+
+    async def get_job_details(
+        self,
+        job_id: str,
+        country: str = "us",
+        language: Optional[str] = None,
+        fields: Optional[str] = None,
+        bypass_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Obtiene detalles de un trabajo específico
+
+        Args:
+            job_id: ID del trabajo
+            country: Código de país
+            language: Código de idioma (opcional)
+            fields: Campos específicos a incluir (opcional)
+            bypass_cache: Ignorar respuestas cacheadas
+
+        Returns:
+            Detalles del trabajo
+
+        Raises:
+            HTTPError: Si hay error en la petición
+        """
+        return await self._run(
+            self.client.get_job_details,
+            job_id,
+            country,
+            language=language,
+            fields=fields,
+            bypass_cache=bypass_cache
+        )
+
+    async def get_estimated_salary(
+        self,
+        job_title: str,
+        location: str,
+        location_type: str = "ANY",
+        years_of_experience: str = "ALL",
+        fields: Optional[str] = None,
+        bypass_cache: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtiene estimación de salarios
+
+        Args:
+            job_title: Título del trabajo
+            location: Ubicación
+            location_type: Tipo de ubicación (ANY, CITY, STATE, COUNTRY)
+            years_of_experience: Nivel de experiencia
+            fields: Campos específicos (opcional)
+            bypass_cache: Ignorar respuestas cacheadas
+
+        Returns:
+            Lista con información salarial
+
+        Raises:
+            HTTPError: Si hay error en la petición
+        """
+        return await self._run(
+            self.client.get_estimated_salary,
+            job_title,
+            location,
+            location_type=location_type,
+            years_of_experience=years_of_experience,
+            fields=fields,
+            bypass_cache=bypass_cache
+        )
+
+    async def get_company_salary(
+        self,
+        company: str,
+        job_title: str,
+        location: Optional[str] = None,
+        location_type: str = "ANY",
+        years_of_experience: str = "ALL",
+        bypass_cache: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtiene salarios de una empresa específica
+
+        Args:
+            company: Nombre de la empresa
+            job_title: Título del trabajo
+            location: Ubicación (opcional)
+            location_type: Tipo de ubicación
+            years_of_experience: Nivel de experiencia
+            bypass_cache: Ignorar respuestas cacheadas
+
+        Returns:
+            Lista con información salarial de la empresa
+
+        Raises:
+            HTTPError: Si hay error en la petición
+        """
+        return await self._run(
+            self.client.get_company_salary,
+            company,
+            job_title,
+            location=location,
+            location_type=location_type,
+            years_of_experience=years_of_experience,
+            bypass_cache=bypass_cache
+        )
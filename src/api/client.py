@@ -3,30 +3,73 @@
 """
 Nombre del archivo: client.py
 Descripción: Cliente HTTP genérico para realizar peticiones HTTPS a APIs externas.
-             Proporciona métodos GET y POST con manejo de errores y parsing JSON.
+             Proporciona métodos GET y POST con manejo de errores y parsing JSON
+             sobre un pool de conexiones keep-alive.
 
 Autor: Hex686f6c61
 Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
 Versión: 3.0.0
 Fecha: 2025-12-08
 """
-import http.client
 import json
+import time
 import urllib.parse
 import logging
-from typing import Dict, Any, Optional
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Tuple, Callable, NamedTuple
+from src.api.connection_pool import ConnectionPool, STALE_CONNECTION_ERRORS
 
 logger = logging.getLogger(__name__)
 
 
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Interpreta un header Retry-After (segundos o fecha HTTP)
+
+    Args:
+        value: Valor del header
+
+    Returns:
+        Segundos a esperar, o None si no es válido
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
 class HTTPError(Exception):
     """Excepción para errores HTTP"""
 
-    def __init__(self, status_code: int, message: str = ""):
+    def __init__(self, status_code: int, message: str = "", headers: Optional[Dict[str, str]] = None):
         self.status_code = status_code
         self.message = message
+        self.headers = headers or {}
         super().__init__(f"HTTP {status_code}: {message}")
 
+    @property
+    def retry_after(self) -> Optional[float]:
+        """Segundos indicados por el header Retry-After, si existe"""
+        return parse_retry_after(self.headers.get('retry-after'))
+
+
+class HTTPResponse(NamedTuple):
+    """Respuesta HTTP con status, headers (en minúsculas) y JSON parseado"""
+
+    status: int
+    headers: Dict[str, str]
+    data: Dict[str, Any]
+
 
 class HTTPClient:
     """Cliente HTTP genérico para hacer requests HTTPS"""
@@ -35,17 +78,30 @@ class HTTPClient:
         self,
         host: str,
         headers: Optional[Dict[str, str]] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        pool_size: int = 10,
+        idle_timeout: float = 60.0,
+        on_response: Optional[Callable[[int, Dict[str, str]], None]] = None
     ):
         """
         Args:
             host: Hostname del servidor (sin https://)
             headers: Headers HTTP por defecto
             timeout: Timeout en segundos
+            pool_size: Máximo de conexiones keep-alive conservadas
+            idle_timeout: Segundos que una conexión inactiva permanece en el pool
+            on_response: Callback (status, headers) invocado en cada respuesta
         """
         self.host = host
         self.headers = headers or {}
         self.timeout = timeout
+        self.on_response = on_response
+        self.pool = ConnectionPool(
+            host,
+            timeout=timeout,
+            max_size=pool_size,
+            idle_timeout=idle_timeout
+        )
         logger.debug(f"HTTPClient inicializado para {host}")
 
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -63,39 +119,28 @@ class HTTPClient:
             HTTPError: Si el status code no es 200
             json.JSONDecodeError: Si la respuesta no es JSON válido
         """
-        params = params or {}
-
-        # Construir URL con parámetros
-        query_string = urllib.parse.urlencode(params)
-        full_endpoint = f"{endpoint}?{query_string}" if query_string else endpoint
-
-        logger.debug(f"GET {self.host}{full_endpoint}")
-
-        # Crear conexión HTTPS
-        conn = http.client.HTTPSConnection(self.host, timeout=self.timeout)
+        return self.get_response(endpoint, params).data
 
-        try:
-            # Realizar request
-            conn.request("GET", full_endpoint, headers=self.headers)
+    def get_response(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> HTTPResponse:
+        """
+        Realiza un GET request conservando status y headers de la respuesta
 
-            # Obtener respuesta
-            response = conn.getresponse()
-            status_code = response.status
-            data = response.read()
+        Args:
+            endpoint: Endpoint de la API (ej: "/api/search")
+            params: Parámetros de query
 
-            logger.debug(f"Response: {status_code}, {len(data)} bytes")
+        Returns:
+            HTTPResponse con status, headers y JSON parseado
 
-            # Verificar status code
-            if status_code != 200:
-                error_msg = data.decode('utf-8', errors='ignore')[:200]
-                raise HTTPError(status_code, error_msg)
+        Raises:
+            HTTPError: Si el status code no es 200 (incluye los headers)
+            json.JSONDecodeError: Si la respuesta no es JSON válido
+        """
+        full_endpoint = self._build_endpoint(endpoint, params)
 
-            # Parsear JSON
-            result = json.loads(data.decode('utf-8'))
-            return result
+        logger.debug(f"GET {self.host}{full_endpoint}")
 
-        finally:
-            conn.close()
+        return self._request("GET", full_endpoint, None, self.headers, (200,))
 
     def post(
         self,
@@ -117,12 +162,8 @@ class HTTPClient:
         Raises:
             HTTPError: Si el status code no es 200-201
         """
-        params = params or {}
         data = data or {}
-
-        # Construir URL con parámetros
-        query_string = urllib.parse.urlencode(params)
-        full_endpoint = f"{endpoint}?{query_string}" if query_string else endpoint
+        full_endpoint = self._build_endpoint(endpoint, params)
 
         # Preparar body
         body = json.dumps(data).encode('utf-8')
@@ -134,28 +175,68 @@ class HTTPClient:
 
         logger.debug(f"POST {self.host}{full_endpoint}")
 
-        # Crear conexión HTTPS
-        conn = http.client.HTTPSConnection(self.host, timeout=self.timeout)
-
-        try:
-            # Realizar request
-            conn.request("POST", full_endpoint, body=body, headers=headers)
-
-            # Obtener respuesta
-            response = conn.getresponse()
-            status_code = response.status
-            response_data = response.read()
+        return self._request("POST", full_endpoint, body, headers, (200, 201)).data
 
-            logger.debug(f"Response: {status_code}, {len(response_data)} bytes")
+    def close(self) -> None:
+        """Cierra las conexiones keep-alive abiertas"""
+        self.pool.close_all()
 
-            # Verificar status code
-            if status_code not in (200, 201):
-                error_msg = response_data.decode('utf-8', errors='ignore')[:200]
-                raise HTTPError(status_code, error_msg)
+    @staticmethod
+    def _build_endpoint(endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+        """Construye el endpoint con su query string"""
+        query_string = urllib.parse.urlencode(params or {})
+        return f"{endpoint}?{query_string}" if query_string else endpoint
 
-            # Parsear JSON
-            result = json.loads(response_data.decode('utf-8'))
-            return result
+    def _request(
+        self,
+        method: str,
+        full_endpoint: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        ok_statuses: Tuple[int, ...]
+    ) -> HTTPResponse:
+        """
+        Ejecuta un request sobre una conexión del pool
 
-        finally:
-            conn.close()
+        Si una conexión reutilizada fue cerrada por el servidor, se descarta
+        y el request se repite una vez sobre una conexión nueva.
+        """
+        while True:
+            conn, reused = self.pool.acquire()
+            reusable = False
+
+            try:
+                try:
+                    if body is None:
+                        conn.request(method, full_endpoint, headers=headers)
+                    else:
+                        conn.request(method, full_endpoint, body=body, headers=headers)
+
+                    response = conn.getresponse()
+                    status_code = response.status
+                    data = response.read()
+                except STALE_CONNECTION_ERRORS as e:
+                    if not reused:
+                        raise
+                    logger.debug(f"Conexión reutilizada cerrada por el servidor ({e}), reconectando")
+                    continue
+
+                # El servidor puede pedir cerrar la conexión tras la respuesta
+                reusable = response.will_close is False
+                headers = {key.lower(): value for key, value in response.getheaders()}
+
+                logger.debug(f"Response: {status_code}, {len(data)} bytes")
+
+                if self.on_response is not None:
+                    self.on_response(status_code, headers)
+
+                # Verificar status code
+                if status_code not in ok_statuses:
+                    error_msg = data.decode('utf-8', errors='ignore')[:200]
+                    raise HTTPError(status_code, error_msg, headers)
+
+                # Parsear JSON
+                return HTTPResponse(status_code, headers, json.loads(data.decode('utf-8')))
+
+            finally:
+                self.pool.release(conn, reusable)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: connection_pool.py
+Descripción: Pool thread-safe de conexiones HTTPS keep-alive por host.
+             Reutiliza sockets y sesiones TLS entre peticiones consecutivas.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import http.client
+import logging
+import ssl
+import threading
+import time
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Errores que indican que el servidor cerró un socket reutilizado
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+    ConnectionAbortedError,
+)
+
+
+class _SessionReusingContext(ssl.SSLContext):
+    """SSLContext que reutiliza la última sesión TLS negociada con el host"""
+
+    def wrap_socket(self, sock, *args, **kwargs):
+        if kwargs.get('session') is None and getattr(self, 'tls_session', None) is not None:
+            kwargs['session'] = self.tls_session
+
+        ssl_sock = super().wrap_socket(sock, *args, **kwargs)
+        self.remember_session(ssl_sock)
+        return ssl_sock
+
+    def remember_session(self, ssl_sock) -> None:
+        """Guarda la sesión TLS del socket para futuros handshakes"""
+        session = getattr(ssl_sock, 'session', None)
+        if isinstance(session, ssl.SSLSession):
+            self.tls_session = session
+
+
+def create_ssl_context() -> ssl.SSLContext:
+    """
+    Crea un contexto TLS verificado que reutiliza sesiones
+
+    Returns:
+        Contexto SSL equivalente a ssl.create_default_context()
+    """
+    context = _SessionReusingContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.load_default_certs()
+    context.tls_session = None
+    return context
+
+
+class ConnectionPool:
+    """Pool de conexiones HTTPS reutilizables para un único host"""
+
+    def __init__(
+        self,
+        host: str,
+        timeout: int = 30,
+        max_size: int = 10,
+        idle_timeout: float = 60.0,
+        ssl_context: Optional[ssl.SSLContext] = None
+    ):
+        """
+        Args:
+            host: Hostname del servidor (sin https://)
+            timeout: Timeout de socket en segundos
+            max_size: Máximo de conexiones inactivas conservadas
+            idle_timeout: Segundos tras los que se descarta una conexión inactiva
+            ssl_context: Contexto TLS (por defecto uno con reutilización de sesión)
+        """
+        self.host = host
+        self.timeout = timeout
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.ssl_context = ssl_context or create_ssl_context()
+
+        self._lock = threading.Lock()
+        self._idle: List[Tuple[http.client.HTTPSConnection, float]] = []
+        self.created_count = 0
+        self.reused_count = 0
+
+    def acquire(self) -> Tuple[http.client.HTTPSConnection, bool]:
+        """
+        Obtiene una conexión del pool o crea una nueva
+
+        Returns:
+            Tupla (conexión, reutilizada)
+        """
+        now = time.monotonic()
+        expired = []
+        conn = None
+
+        with self._lock:
+            while self._idle:
+                candidate, last_used = self._idle.pop()
+                if now - last_used > self.idle_timeout:
+                    expired.append(candidate)
+                    continue
+                conn = candidate
+                self.reused_count += 1
+                break
+            else:
+                self.created_count += 1
+
+        for stale in expired:
+            stale.close()
+
+        if conn is not None:
+            return conn, True
+
+        logger.debug(f"Nueva conexión HTTPS a {self.host}")
+        conn = http.client.HTTPSConnection(
+            self.host,
+            timeout=self.timeout,
+            context=self.ssl_context
+        )
+        return conn, False
+
+    def release(self, conn: http.client.HTTPSConnection, reusable: bool = True) -> None:
+        """
+        Devuelve una conexión al pool
+
+        Args:
+            conn: Conexión a devolver
+            reusable: False si la conexión debe cerrarse
+        """
+        if reusable:
+            sock = getattr(conn, 'sock', None)
+            if sock is not None and hasattr(self.ssl_context, 'remember_session'):
+                self.ssl_context.remember_session(sock)
+
+            with self._lock:
+                if len(self._idle) < self.max_size:
+                    self._idle.append((conn, time.monotonic()))
+                    return
+
+        conn.close()
+
+    def close_all(self) -> None:
+        """Cierra todas las conexiones inactivas"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+
+        for conn, _ in idle:
+            conn.close()
+
+    @property
+    def idle_count(self) -> int:
+        """Número de conexiones inactivas disponibles"""
+        with self._lock:
+            return len(self._idle)
@@ -11,88 +11,315 @@ Versión: 3.0.0
 Fecha: 2025-12-08
 """
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional, Tuple, TypeVar
 from src.api.client import HTTPClient, HTTPError
-from src.api.rate_limiter import RateLimiter
+from src.api.rate_limiter import (
+    RateLimiter,
+    ENDPOINT_SEARCH,
+    ENDPOINT_DETAILS,
+    ENDPOINT_SALARY,
+)
+from src.api.response_cache import ResponseCache, MISS, make_cache_key
+from src.api.singleflight import SingleFlight
 from src.models.search_params import SearchParameters
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# Resultados por página que devuelve JSearch
+JSEARCH_PAGE_SIZE = 10
+
+
+class SearchResults(list):
+    """
+    Resultados de una búsqueda (lista de trabajos en bruto) con metadatos
+
+    exhausted indica que la API se quedó sin resultados dentro del rango
+    pedido (la última página llegó incompleta), así que la lista contiene
+    todos los trabajos de la búsqueda desde la página inicial.
+    api_requests cuenta las peticiones que llegaron a la API; las páginas
+    servidas por la caché de respuestas o compartidas con una petición
+    idéntica en curso no consumen cuota.
+    """
+
+    def __init__(
+        self,
+        jobs: List[Dict[str, Any]] = (),
+        exhausted: bool = False,
+        api_requests: int = 0
+    ):
+        super().__init__(jobs)
+        self.exhausted = exhausted
+        self.api_requests = api_requests
+
 
 class JSearchClient:
     """Cliente para interactuar con JSearch API de OpenWeb Ninja"""
 
-    def __init__(self, api_key: str, api_host: str = "api.openwebninja.com", config: Any = None):
+    def __init__(
+        self,
+        api_key: str,
+        api_host: str = "api.openwebninja.com",
+        config: Any = None,
+        cache: Optional[ResponseCache] = None
+    ):
         """
         Args:
             api_key: API key de OpenWeb Ninja
             api_host: Host de la API
             config: Objeto Config opcional con configuración
+            cache: Caché de respuestas (por defecto se crea según config)
         """
         self.api_key = api_key
         self.api_host = api_host
 
-        # Crear cliente HTTP
+        # Configurar rate limiter (adaptativo según 429 y Retry-After)
+        self.rate_limiter = RateLimiter(
+            delay=config.rate_limit_delay if config else 1.0,
+            max_retries=config.max_retries if config else 3,
+            retry_delay=config.retry_delay if config else 2,
+            burst=config.rate_limit_burst if config else 1,
+            retry_deadline=config.retry_deadline if config else None,
+            retry_budget_ratio=config.retry_budget_ratio if config else 0.2,
+            adaptive=config.adaptive_rate_limit if config else True,
+            max_rate=config.max_requests_per_second if config else None
+        )
+
+        # Crear cliente HTTP; los headers de cada respuesta llegan al rate limiter
         self.client = HTTPClient(
             host=api_host,
             headers={'x-api-key': api_key},
-            timeout=config.request_timeout if config else 30
+            timeout=config.request_timeout if config else 30,
+            on_response=self.rate_limiter.observe_response
         )
 
-        # Configurar rate limiter
-        self.rate_limiter = RateLimiter(
-            delay=config.rate_limit_delay if config else 1.0,
-            max_retries=config.max_retries if config else 3,
-            retry_delay=config.retry_delay if config else 2
-        )
+        # Reparto de búsquedas multipágina en peticiones por página
+        self.page_fan_out = config.page_fan_out if config else False
+        self.max_concurrency = config.max_concurrency if config else 8
+
+        # Caché persistente de respuestas (sin config no se toca el disco)
+        if cache is None and config and config.cache_enabled:
+            cache = ResponseCache(
+                path=config.cache_path,
+                ttls={
+                    ENDPOINT_SEARCH: config.cache_ttl_search,
+                    ENDPOINT_DETAILS: config.cache_ttl_details,
+                    ENDPOINT_SALARY: config.cache_ttl_salary,
+                },
+                max_entries=config.cache_max_entries
+            )
+        self.cache = cache
+
+        # Peticiones idénticas concurrentes comparten una sola llamada a la API
+        self.singleflight = SingleFlight()
 
         logger.info(f"JSearchClient inicializado para {api_host}")
 
-    def search_jobs(self, params: SearchParameters) -> List[Dict[str, Any]]:
+    def close(self) -> None:
+        """Cierra las conexiones keep-alive del cliente HTTP y la caché"""
+        self.client.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def _cached(
+        self,
+        endpoint_name: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        fetch: Callable[[], T],
+        bypass_cache: bool = False
+    ) -> T:
+        """
+        Sirve una respuesta desde la caché o la pide a la API y la guarda
+
+        Con bypass_cache se ignora la entrada cacheada pero la respuesta
+        nueva sí se guarda, de modo que sirve para refrescar la caché.
+        Los errores nunca se cachean. Las llamadas idénticas concurrentes
+        comparten una única petición y reciben el mismo resultado o error.
+
+        Args:
+            endpoint_name: Nombre lógico del endpoint (determina el TTL)
+            endpoint: Ruta del endpoint
+            params: Parámetros de query
+            fetch: Función que hace la petición real
+            bypass_cache: Ignorar la caché en la lectura
+
+        Returns:
+            Respuesta cacheada o recién obtenida
+        """
+        key = (make_cache_key(endpoint, params), bypass_cache)
+        return self.singleflight.do(
+            key,
+            lambda: self._lookup_or_fetch(endpoint_name, endpoint, params, fetch, bypass_cache)
+        )
+
+    def _lookup_or_fetch(
+        self,
+        endpoint_name: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        fetch: Callable[[], T],
+        bypass_cache: bool
+    ) -> T:
+        """Consulta la caché y, si no hay entrada vigente, hace la petición"""
+        if self.cache is None:
+            return fetch()
+
+        if not bypass_cache:
+            cached = self.cache.get(endpoint_name, endpoint, params)
+            if cached is not MISS:
+                logger.info(f"Respuesta servida desde caché: {endpoint}")
+                return cached
+
+        result = fetch()
+        self.cache.set(endpoint_name, endpoint, params, result)
+        return result
+
+    def search_jobs(
+        self,
+        params: SearchParameters,
+        fan_out: Optional[bool] = None,
+        bypass_cache: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Busca trabajos usando JSearch API
 
+        Con fan_out, una búsqueda de varias páginas se divide en una petición
+        por página. Las páginas se piden en paralelo (respetando el rate limiter),
+        se reintentan de forma independiente y se combinan en orden eliminando
+        job_id duplicados; si alguna falla tras sus reintentos, falla la
+        búsqueda. Cada página consume una petición de cuota.
+
         Args:
             params: Parámetros de búsqueda validados
+            fan_out: Dividir por páginas (por defecto según configuración)
+            bypass_cache: Ignorar respuestas cacheadas
 
         Returns:
-            Lista de trabajos encontrados
+            SearchResults (lista de trabajos encontrados) que indica si la
+            API agotó los resultados
 
         Raises:
             HTTPError: Si hay error en la petición
         """
-        endpoint = "/jsearch/search"
-        api_params = params.to_api_params()
+        if fan_out is None:
+            fan_out = self.page_fan_out
 
         logger.info(f"Buscando trabajos: {params.query} en {params.country}")
 
+        if fan_out and params.num_pages > 1:
+            responses = self._search_pages_parallel(params, bypass_cache)
+            pages = [data for data, _ in responses]
+            # Agotada si la última página llegó incompleta (antes de quitar repetidos)
+            jobs = SearchResults(
+                merge_pages(pages),
+                exhausted=len(pages[-1]) < JSEARCH_PAGE_SIZE,
+                api_requests=sum(requested for _, requested in responses)
+            )
+        else:
+            data, requested = self._search_request(params, bypass_cache)
+            jobs = SearchResults(
+                data,
+                exhausted=len(data) < params.num_pages * JSEARCH_PAGE_SIZE,
+                api_requests=int(requested)
+            )
+
+        logger.info(f"Encontrados {len(jobs)} trabajos")
+        return jobs
+
+    def _search_request(
+        self,
+        params: SearchParameters,
+        bypass_cache: bool = False
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Ejecuta una única petición /jsearch/search con reintentos y caché
+
+        Returns:
+            Tupla (resultados, True si la respuesta vino de la API y no de la
+            caché de respuestas ni de otra petición idéntica en curso)
+        """
+        endpoint = "/jsearch/search"
+        api_params = params.to_api_params()
+        requested = False
+
         # Usar rate limiter con reintentos
-        @self.rate_limiter.with_retry
+        @self.rate_limiter.with_retry(endpoint=ENDPOINT_SEARCH)
         def _make_request():
+            nonlocal requested
             response = self.client.get(endpoint, api_params)
 
             # Verificar si hay error en la respuesta
             if "error" in response:
                 raise HTTPError(400, response.get("error"))
 
+            requested = True
             return response.get("data", [])
 
         try:
-            jobs = _make_request()
-            logger.info(f"Encontrados {len(jobs)} trabajos")
-            return jobs
+            data = self._cached(ENDPOINT_SEARCH, endpoint, api_params, _make_request, bypass_cache)
+            return data, requested
         except HTTPError as e:
             if e.status_code == 429:
                 logger.error("Rate limit excedido")
-                raise HTTPError(429, "Rate limit excedido. Intenta más tarde.")
+                raise HTTPError(429, "Rate limit excedido. Intenta más tarde.", e.headers)
             raise
 
+    def _search_pages_parallel(
+        self,
+        params: SearchParameters,
+        bypass_cache: bool = False
+    ) -> List[Tuple[List[Dict[str, Any]], bool]]:
+        """
+        Pide cada página de la búsqueda en paralelo, en orden de página
+
+        Si falla alguna página se lanza su error: un resultado con huecos no
+        se puede distinguir de uno completo (y acabaría en las cachés). Las
+        páginas correctas quedan en la caché de respuestas, así que repetir
+        la búsqueda solo vuelve a pedir las que fallaron.
+
+        Returns:
+            (resultados, pedida a la API) de cada página, sin combinar
+
+        Raises:
+            HTTPError: El error de la primera página fallida
+        """
+        page_params = [
+            params.model_copy(update={'page': params.page + offset, 'num_pages': 1})
+            for offset in range(params.num_pages)
+        ]
+        workers = max(1, min(len(page_params), self.max_concurrency))
+
+        logger.debug(f"Búsqueda dividida en {len(page_params)} páginas ({workers} en paralelo)")
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jsearch-page") as executor:
+            futures = [
+                executor.submit(self._search_request, p, bypass_cache) for p in page_params
+            ]
+
+        pages = []
+        errors = []
+        for page, future in zip(page_params, futures):
+            try:
+                pages.append(future.result())
+            except Exception as e:
+                logger.warning(f"Página {page.page} falló: {e}")
+                errors.append(e)
+
+        if errors:
+            raise errors[0]
+
+        return pages
+
     def get_job_details(
         self,
         job_id: str,
         country: str = "us",
         language: Optional[str] = None,
-        fields: Optional[str] = None
+        fields: Optional[str] = None,
+        bypass_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Obtiene detalles de un trabajo específico
@@ -102,6 +329,7 @@ class JSearchClient:
             country: Código de país
             language: Código de idioma (opcional)
             fields: Campos específicos a incluir (opcional)
+            bypass_cache: Ignorar respuestas cacheadas
 
         Returns:
             Detalles del trabajo
@@ -122,7 +350,7 @@ class JSearchClient:
 
         logger.info(f"Obteniendo detalles del trabajo: {job_id}")
 
-        @self.rate_limiter.with_retry
+        @self.rate_limiter.with_retry(endpoint=ENDPOINT_DETAILS)
         def _make_request():
             response = self.client.get(endpoint, params)
 
@@ -135,7 +363,7 @@ class JSearchClient:
 
             return data[0]  # Retornar primer resultado
 
-        return _make_request()
+        return self._cached(ENDPOINT_DETAILS, endpoint, params, _make_request, bypass_cache)
 
     def get_estimated_salary(
         self,
@@ -143,7 +371,8 @@ class JSearchClient:
         location: str,
         location_type: str = "ANY",
         years_of_experience: str = "ALL",
-        fields: Optional[str] = None
+        fields: Optional[str] = None,
+        bypass_cache: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Obtiene estimación de salarios
@@ -154,6 +383,7 @@ class JSearchClient:
             location_type: Tipo de ubicación (ANY, CITY, STATE, COUNTRY)
             years_of_experience: Nivel de experiencia
             fields: Campos específicos (opcional)
+            bypass_cache: Ignorar respuestas cacheadas
 
         Returns:
             Lista con información salarial
@@ -174,7 +404,7 @@ class JSearchClient:
 
         logger.info(f"Obteniendo estimación salarial: {job_title} en {location}")
 
-        @self.rate_limiter.with_retry
+        @self.rate_limiter.with_retry(endpoint=ENDPOINT_SALARY)
         def _make_request():
             response = self.client.get(endpoint, params)
 
@@ -183,7 +413,7 @@ class JSearchClient:
 
             return response.get("data", [])
 
-        return _make_request()
+        return self._cached(ENDPOINT_SALARY, endpoint, params, _make_request, bypass_cache)
 
     def get_company_salary(
         self,
@@ -191,7 +421,8 @@ class JSearchClient:
         job_title: str,
         location: Optional[str] = None,
         location_type: str = "ANY",
-        years_of_experience: str = "ALL"
+        years_of_experience: str = "ALL",
+        bypass_cache: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Obtiene salarios de una empresa específica
@@ -202,6 +433,7 @@ class JSearchClient:
             location: Ubicación (opcional)
             location_type: Tipo de ubicación
             years_of_experience: Nivel de experiencia
+            bypass_cache: Ignorar respuestas cacheadas
 
         Returns:
             Lista con información salarial de la empresa
@@ -222,7 +454,7 @@ class JSearchClient:
 
         logger.info(f"Obteniendo salarios de {company} para {job_title}")
 
-        @self.rate_limiter.with_retry
+        @self.rate_limiter.with_retry(endpoint=ENDPOINT_SALARY)
         def _make_request():
             response = self.client.get(endpoint, params)
 
@@ -231,4 +463,27 @@ class JSearchClient:
 
             return response.get("data", [])
 
-        return _make_request()
+        return self._cached(ENDPOINT_SALARY, endpoint, params, _make_request, bypass_cache)
+
+
+def merge_pages(pages: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Combina páginas de resultados en orden, descartando job_id repetidos
+
+    Args:
+        pages: Resultados de cada página, en orden de página
+
+    Returns:
+        Lista combinada de trabajos
+    """
+    seen = set()
+    merged = []
+    for page in pages:
+        for job in page:
+            job_id = job.get("job_id")
+            if job_id is not None:
+                if job_id in seen:
+                    continue
+                seen.add(job_id)
+            merged.append(job)
+    return merged
@@ -2,91 +2,429 @@
 # -*- coding: utf-8 -*-
 """
 Nombre del archivo: rate_limiter.py
-Descripción: Implementa control de tasa de peticiones (rate limiting) y sistema
-             de reintentos con backoff exponencial para evitar saturar la API.
+Descripción: Implementa control de tasa de peticiones (rate limiting) con token
+             buckets thread-safe y aplica la política de reintentos para evitar
+             saturar la API.
 
 Autor: Hex686f6c61
 Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
 Versión: 3.0.0
 Fecha: 2025-12-08
 """
+import asyncio
+import threading
 import time
 import logging
+from contextlib import contextmanager
 from functools import wraps
-from typing import Callable, TypeVar, Any
+from typing import Callable, TypeVar, Any, Dict, Iterator, Optional, Tuple
+from src.api.client import HTTPError
+from src.api.retry_policy import RetryPolicy, RetryBudget
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Endpoints con bucket propio
+ENDPOINT_SEARCH = "search"
+ENDPOINT_DETAILS = "details"
+ENDPOINT_SALARY = "salary"
+ENDPOINTS = (ENDPOINT_SEARCH, ENDPOINT_DETAILS, ENDPOINT_SALARY)
+
+# Headers habituales de cuota restante / reset de ventana
+RATE_LIMIT_REMAINING_HEADERS = (
+    'x-ratelimit-remaining',
+    'x-ratelimit-requests-remaining',
+    'ratelimit-remaining',
+)
+RATE_LIMIT_RESET_HEADERS = (
+    'x-ratelimit-reset',
+    'x-ratelimit-requests-reset',
+    'ratelimit-reset',
+)
+
+
+def _first_header(headers: Dict[str, str], names: Tuple[str, ...]) -> Optional[str]:
+    """Retorna el primer header presente de la lista"""
+    for name in names:
+        if name in headers:
+            return headers[name]
+    return None
+
+
+class TokenBucket:
+    """Token bucket thread-safe con reservas"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: Tokens repuestos por segundo (tasa sostenida)
+            burst: Capacidad máxima del bucket (ráfaga permitida)
+        """
+        if rate <= 0:
+            raise ValueError("rate debe ser mayor que 0")
+        if burst < 1:
+            raise ValueError("burst debe ser al menos 1")
+
+        self.rate = float(rate)
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Repone tokens según el tiempo transcurrido (no durante un bloqueo)"""
+        start = max(self.updated_at, self.blocked_until)
+        if now > start:
+            self.tokens = min(self.capacity, self.tokens + (now - start) * self.rate)
+        self.updated_at = max(self.updated_at, now)
+
+    def set_rate(self, rate: float) -> None:
+        """
+        Cambia la tasa sostenida conservando los tokens acumulados
+
+        Args:
+            rate: Nueva tasa en tokens por segundo
+        """
+        if rate <= 0:
+            raise ValueError("rate debe ser mayor que 0")
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+
+    def block_for(self, seconds: float) -> None:
+        """
+        Bloquea el bucket durante un tiempo (ej: Retry-After)
+
+        Args:
+            seconds: Segundos sin conceder requests
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.blocked_until = max(self.blocked_until, now + seconds)
+            # Tras el bloqueo sale como máximo un request inmediato
+            self.tokens = min(self.tokens, 1.0)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Reserva tokens y retorna cuánto hay que esperar para usarlos
+
+        El bucket puede quedar en negativo: las reservas posteriores esperan
+        en orden de llegada, sin que varios hilos pasen a la vez.
+
+        Args:
+            tokens: Tokens a consumir
+
+        Returns:
+            Segundos de espera antes de realizar el request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= tokens
+            wait = max(0.0, self.blocked_until - now)
+            if self.tokens < 0:
+                wait += -self.tokens / self.rate
+            return wait
+
+
+class AdaptiveRateController:
+    """
+    Control AIMD de la tasa de un TokenBucket
+
+    Cada respuesta correcta sube la tasa un paso fijo (aumento aditivo) hasta
+    max_rate; cada 429 la multiplica por decrease_factor (disminución
+    multiplicativa) y bloquea el bucket durante el Retry-After indicado.
+    """
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        min_rate: float,
+        max_rate: float,
+        increase_step: float = 0.05,
+        decrease_factor: float = 0.5
+    ):
+        """
+        Args:
+            bucket: Bucket cuya tasa se ajusta
+            min_rate: Tasa mínima (requests/segundo)
+            max_rate: Tasa máxima (requests/segundo)
+            increase_step: Incremento por respuesta correcta (requests/segundo)
+            decrease_factor: Factor aplicado a la tasa ante un 429
+        """
+        self.bucket = bucket
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.throttle_count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Tasa actual del bucket"""
+        return self.bucket.rate
+
+    def on_success(self) -> None:
+        """Aumento aditivo tras una respuesta sin throttling"""
+        with self._lock:
+            new_rate = min(self.max_rate, self.bucket.rate + self.increase_step)
+            if new_rate != self.bucket.rate:
+                self.bucket.set_rate(new_rate)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Disminución multiplicativa tras un 429
+
+        Args:
+            retry_after: Segundos indicados por el servidor (opcional)
+        """
+        with self._lock:
+            self.throttle_count += 1
+            new_rate = max(self.min_rate, self.bucket.rate * self.decrease_factor)
+            self.bucket.set_rate(new_rate)
+
+        logger.warning(f"Throttling detectado: tasa reducida a {new_rate:.2f} req/s")
+
+        if retry_after:
+            logger.info(f"Pausando requests {retry_after:.1f}s (Retry-After)")
+            self.bucket.block_for(retry_after)
+
 
 class RateLimiter:
     """Implementa rate limiting para requests a la API"""
 
-    def __init__(self, delay: float = 1.0, max_retries: int = 3, retry_delay: int = 2):
+    def __init__(
+        self,
+        delay: float = 1.0,
+        max_retries: int = 3,
+        retry_delay: int = 2,
+        burst: int = 1,
+        endpoint_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        retry_deadline: Optional[float] = None,
+        retry_budget_ratio: float = 0.2,
+        retry_policy: Optional[RetryPolicy] = None,
+        adaptive: bool = False,
+        max_rate: Optional[float] = None
+    ):
         """
         Args:
-            delay: Tiempo mínimo entre requests (segundos)
-            max_retries: Número máximo de reintentos
+            delay: Tiempo mínimo medio entre requests (segundos)
+            max_retries: Número máximo de intentos
             retry_delay: Delay base entre reintentos (segundos)
+            burst: Requests que pueden salir seguidos sin esperar
+            endpoint_limits: (requests/segundo, burst) por endpoint;
+                por defecto cada endpoint usa la tasa global
+            retry_deadline: Tiempo máximo por llamada incluyendo reintentos
+            retry_budget_ratio: Reintentos permitidos por request original
+            retry_policy: Política de reintentos explícita (ignora los
+                parámetros de reintento anteriores)
+            adaptive: Ajustar la tasa global con AIMD según los 429 recibidos
+            max_rate: Tasa máxima a la que puede subir el control adaptativo
+                (requests/segundo, por defecto la tasa inicial)
         """
         self.delay = delay
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.burst = burst
+        self.rate = 1.0 / delay
         self.last_request_time = 0.0
         self.request_count = 0
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_attempts=max_retries,
+            base_delay=retry_delay,
+            deadline=retry_deadline,
+            budget=RetryBudget(ratio=retry_budget_ratio)
+        )
+
+        self.max_rate = max(max_rate or self.rate, self.rate)
 
-    def wait(self) -> None:
-        """Espera el tiempo necesario para respetar rate limiting"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        # Bucket global (límite del proveedor) más un bucket por endpoint
+        self.bucket = TokenBucket(self.rate, burst)
+        limits = {name: (self.max_rate, burst) for name in ENDPOINTS}
+        limits.update(endpoint_limits or {})
+        self.endpoint_buckets = {
+            name: TokenBucket(rate, endpoint_burst)
+            for name, (rate, endpoint_burst) in limits.items()
+        }
+        self._lock = threading.Lock()
+        # Event loop que hace las esperas de cada hilo (ver driven_by)
+        self._local = threading.local()
 
-        if time_since_last_request < self.delay:
-            sleep_time = self.delay - time_since_last_request
+        self.controller: Optional[AdaptiveRateController] = None
+        if adaptive:
+            self.controller = AdaptiveRateController(
+                self.bucket,
+                min_rate=self.rate / 10,
+                max_rate=self.max_rate
+            )
+
+    def record_success(self) -> None:
+        """Registra una respuesta sin throttling"""
+        if self.controller is not None:
+            self.controller.on_success()
+
+    def record_throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Registra un 429 del proveedor
+
+        Args:
+            retry_after: Segundos indicados por Retry-After (opcional)
+        """
+        if self.controller is not None:
+            self.controller.on_throttle(retry_after)
+        elif retry_after:
+            self.bucket.block_for(retry_after)
+
+    def observe_response(self, status: int, headers: Dict[str, str]) -> None:
+        """
+        Revisa headers de rate limit de cualquier respuesta
+
+        Si el proveedor indica que no quedan requests en la ventana actual,
+        pausa el bucket global hasta el reset indicado.
+
+        Args:
+            status: Status HTTP de la respuesta
+            headers: Headers de la respuesta (en minúsculas)
+        """
+        remaining = _first_header(headers, RATE_LIMIT_REMAINING_HEADERS)
+        reset = _first_header(headers, RATE_LIMIT_RESET_HEADERS)
+        if remaining is None or reset is None:
+            return
+
+        try:
+            if float(remaining) > 0:
+                return
+            reset_seconds = float(reset)
+        except ValueError:
+            return
+
+        # Algunos proveedores envían el reset como timestamp absoluto
+        if reset_seconds > time.time() - 1:
+            reset_seconds -= time.time()
+        if reset_seconds > 0:
+            logger.info(f"Cuota de la ventana agotada, pausando {reset_seconds:.1f}s")
+            self.bucket.block_for(reset_seconds)
+
+    def reserve(self, endpoint: Optional[str] = None) -> float:
+        """
+        Reserva un request en el bucket global y en el del endpoint
+
+        Args:
+            endpoint: Nombre del endpoint (search, details, salary)
+
+        Returns:
+            Segundos a esperar antes de realizar el request
+        """
+        sleep_time = self.bucket.reserve()
+        endpoint_bucket = self.endpoint_buckets.get(endpoint) if endpoint else None
+        if endpoint_bucket is not None:
+            sleep_time = max(sleep_time, endpoint_bucket.reserve())
+
+        with self._lock:
+            self.request_count += 1
+            self.last_request_time = time.time() + sleep_time
+            count = self.request_count
+
+        logger.debug(f"Request #{count}")
+        return sleep_time
+
+    def wait(self, endpoint: Optional[str] = None) -> None:
+        """
+        Espera el tiempo necesario para respetar rate limiting
+
+        Dentro de driven_by, la espera se hace con wait_async en el event
+        loop indicado y este hilo solo aguarda el resultado.
+
+        Args:
+            endpoint: Nombre del endpoint (opcional)
+        """
+        loop = getattr(self._local, 'loop', None)
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(self.wait_async(endpoint), loop).result()
+            return
+
+        sleep_time = self.reserve(endpoint)
+        if sleep_time > 0:
             logger.debug(f"Rate limiting: esperando {sleep_time:.2f}s")
             time.sleep(sleep_time)
 
-        self.last_request_time = time.time()
-        self.request_count += 1
-        logger.debug(f"Request #{self.request_count}")
+    async def wait_async(self, endpoint: Optional[str] = None) -> None:
+        """
+        Variante asyncio de wait que no bloquea el event loop
+
+        Args:
+            endpoint: Nombre del endpoint (opcional)
+        """
+        sleep_time = self.reserve(endpoint)
+        if sleep_time > 0:
+            logger.debug(f"Rate limiting: esperando {sleep_time:.2f}s")
+            await asyncio.sleep(sleep_time)
+
+    @contextmanager
+    def driven_by(self, loop: asyncio.AbstractEventLoop) -> Iterator[None]:
+        """
+        Delega en un event loop las esperas de rate limiting del hilo actual
+
+        Para llamadas síncronas ejecutadas en un hilo en nombre de código
+        asyncio: las esperas se hacen con asyncio.sleep en el loop en lugar
+        de time.sleep en el hilo. Solo se espera cuando la llamada va a la
+        API (una respuesta cacheada no reserva turno).
+
+        Args:
+            loop: Event loop en ejecución en otro hilo
+        """
+        previous = getattr(self._local, 'loop', None)
+        self._local.loop = loop
+        try:
+            yield
+        finally:
+            self._local.loop = previous
 
-    def with_retry(self, func: Callable[..., T]) -> Callable[..., T]:
+    def with_retry(
+        self,
+        func: Optional[Callable[..., T]] = None,
+        *,
+        endpoint: Optional[str] = None
+    ) -> Any:
         """
         Decorator para agregar lógica de reintentos a una función
 
+        Se puede usar como @limiter.with_retry o
+        @limiter.with_retry(endpoint="search").
+
         Args:
             func: Función a decorar
+            endpoint: Bucket de endpoint a usar en cada intento
 
         Returns:
             Función decorada con reintentos
         """
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> T:
-            last_exception = None
-
-            for attempt in range(self.max_retries):
-                try:
-                    # Rate limiting antes de cada intento
-                    self.wait()
+        if func is None:
+            return lambda f: self.with_retry(f, endpoint=endpoint)
 
-                    # Ejecutar función
-                    result = func(*args, **kwargs)
-                    return result
+        def attempt(*args: Any, **kwargs: Any) -> T:
+            try:
+                result = func(*args, **kwargs)
+            except HTTPError as e:
+                if e.status_code == 429:
+                    self.record_throttle(e.retry_after)
+                raise
+            self.record_success()
+            return result
 
-                except Exception as e:
-                    last_exception = e
-                    logger.warning(f"Intento {attempt + 1}/{self.max_retries} falló: {e}")
-
-                    # Si no es el último intento, esperar con backoff exponencial
-                    if attempt < self.max_retries - 1:
-                        sleep_time = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                        logger.info(f"Reintentando en {sleep_time}s...")
-                        time.sleep(sleep_time)
-                    else:
-                        logger.error(f"Máximo de reintentos alcanzado")
-
-            # Si llegamos aquí, todos los intentos fallaron
-            raise last_exception or Exception("Máximo de reintentos alcanzado")
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            # Rate limiting antes de cada intento
+            return self.retry_policy.call(
+                attempt,
+                *args,
+                before_attempt=lambda: self.wait(endpoint),
+                **kwargs
+            )
 
         return wrapper
 
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: response_cache.py
+Descripción: Caché persistente en SQLite para respuestas de la API JSearch.
+             Claves canónicas por endpoint y parámetros, TTL por endpoint
+             y desalojo LRU con tamaño acotado.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+from src.api.rate_limiter import ENDPOINT_SEARCH, ENDPOINT_DETAILS, ENDPOINT_SALARY
+from src.utils.file_utils import ensure_dir_exists
+
+logger = logging.getLogger(__name__)
+
+# TTL por defecto (segundos): las búsquedas caducan rápido, los salarios no
+DEFAULT_TTLS = {
+    ENDPOINT_SEARCH: 15 * 60,
+    ENDPOINT_DETAILS: 24 * 3600,
+    ENDPOINT_SALARY: 3 * 24 * 3600,
+}
+
+# Marcador para distinguir "no está en caché" de un valor cacheado vacío
+MISS = object()
+
+
+def make_cache_key(path: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Genera una clave canónica para un endpoint y sus parámetros
+
+    El orden de los parámetros, los espacios sobrantes y los valores None
+    no afectan a la clave.
+
+    Args:
+        path: Ruta del endpoint (ej: "/jsearch/search")
+        params: Parámetros de query
+
+    Returns:
+        Hash SHA-256 hexadecimal
+    """
+    canonical_params = {
+        str(key).strip(): str(value).strip()
+        for key, value in (params or {}).items()
+        if value is not None
+    }
+    canonical = json.dumps(
+        {'path': path, 'params': canonical_params},
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """Caché de respuestas en disco con TTL por endpoint y desalojo LRU"""
+
+    def __init__(
+        self,
+        path: Union[str, Path] = "cache/api_responses.sqlite3",
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 2000
+    ):
+        """
+        Args:
+            path: Archivo SQLite (":memory:" para caché en memoria)
+            ttls: Segundos de vida por endpoint (search, details, salary)
+            max_entries: Máximo de respuestas almacenadas
+        """
+        self.path = str(path)
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        if self.path != ":memory:":
+            ensure_dir_exists(Path(self.path).parent)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)"
+            )
+
+        logger.debug(f"ResponseCache inicializada: {self.path}")
+
+    def get(self, endpoint: str, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Busca una respuesta vigente
+
+        Args:
+            endpoint: Nombre del endpoint (search, details, salary)
+            path: Ruta del endpoint
+            params: Parámetros de query
+
+        Returns:
+            Respuesta cacheada, o MISS si no existe o expiró
+        """
+        key = make_cache_key(path, params)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or row[1] <= now:
+                if row is not None:
+                    with self._conn:
+                        self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.misses += 1
+                return MISS
+
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+            self.hits += 1
+
+        logger.debug(f"Caché hit: {endpoint} {path}")
+        return json.loads(row[0])
+
+    def set(
+        self,
+        endpoint: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        value: Any
+    ) -> None:
+        """
+        Guarda una respuesta y desaloja las menos usadas si se supera el límite
+
+        Args:
+            endpoint: Nombre del endpoint (determina el TTL)
+            path: Ruta del endpoint
+            params: Parámetros de query
+            value: Respuesta serializable a JSON
+        """
+        ttl = self.ttls.get(endpoint, DEFAULT_TTLS[ENDPOINT_SEARCH])
+        if ttl <= 0:
+            return
+
+        key = make_cache_key(path, params)
+        now = time.time()
+        payload = json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, endpoint, payload, now + ttl, now)
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Elimina expirados y, si hace falta, las entradas menos usadas"""
+        self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        count = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed_at ASC LIMIT ?)",
+                (excess,)
+            )
+            logger.debug(f"Caché: desalojadas {excess} entradas (LRU)")
+
+    def clear(self) -> None:
+        """Elimina todas las respuestas cacheadas"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Cierra la conexión SQLite"""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
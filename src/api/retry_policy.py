@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: retry_policy.py
+Descripción: Política de reintentos que clasifica errores en reintentables o no,
+             con backoff exponencial con full jitter, deadline por llamada y
+             presupuesto global de reintentos.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import http.client
+import logging
+import random
+import socket
+import threading
+import time
+from typing import Callable, TypeVar, Any, Optional, FrozenSet
+from src.api.client import HTTPError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Status HTTP transitorios: vale la pena repetir el request
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Errores de red/transporte que suelen ser transitorios
+TRANSIENT_EXCEPTIONS = (
+    ConnectionError,
+    TimeoutError,
+    socket.timeout,
+    socket.gaierror,
+    http.client.HTTPException,
+)
+
+
+class RetryBudget:
+    """
+    Presupuesto global de reintentos compartido entre llamadas
+
+    Cada request original deposita `ratio` tokens y cada reintento gasta uno,
+    de modo que los reintentos no superan ~ratio * requests. Una reserva
+    mínima se repone con el tiempo para no bloquear reintentos en tráfico bajo.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 0.5, max_tokens: float = 10.0):
+        """
+        Args:
+            ratio: Tokens depositados por cada request original
+            min_per_second: Tokens repuestos por segundo (reserva mínima)
+            max_tokens: Máximo de tokens acumulables
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.max_tokens, self.tokens + elapsed * self.min_per_second)
+        self.updated_at = now
+
+    def record_request(self) -> None:
+        """Registra un request original (no reintento)"""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        """
+        Intenta gastar un token para un reintento
+
+        Returns:
+            True si queda presupuesto para reintentar
+        """
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return True
+            return False
+
+
+class RetryPolicy:
+    """Política de reintentos con clasificación de errores"""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 2.0,
+        max_delay: float = 30.0,
+        deadline: Optional[float] = None,
+        budget: Optional[RetryBudget] = None,
+        retryable_status_codes: FrozenSet[int] = RETRYABLE_STATUS_CODES
+    ):
+        """
+        Args:
+            max_attempts: Número máximo de intentos (incluye el primero)
+            base_delay: Delay base del backoff (segundos)
+            max_delay: Tope del backoff (segundos)
+            deadline: Tiempo máximo total por llamada (segundos, None = sin límite)
+            budget: Presupuesto global de reintentos (None = sin límite)
+            retryable_status_codes: Status HTTP que se consideran transitorios
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.budget = budget
+        self.retryable_status_codes = retryable_status_codes
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """
+        Clasifica un error como reintentable o no
+
+        Args:
+            error: Excepción lanzada por el intento
+
+        Returns:
+            True si el error es transitorio
+        """
+        if isinstance(error, HTTPError):
+            return error.status_code in self.retryable_status_codes
+        return isinstance(error, TRANSIENT_EXCEPTIONS)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Calcula el delay antes del siguiente intento (full jitter)
+
+        Args:
+            attempt: Índice del intento fallido (0 = primero)
+
+        Returns:
+            Segundos a esperar, uniforme entre 0 y el tope exponencial
+        """
+        cap = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, cap)
+
+    def call(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        before_attempt: Optional[Callable[[], None]] = None,
+        **kwargs: Any
+    ) -> T:
+        """
+        Ejecuta func aplicando la política de reintentos
+
+        Args:
+            func: Función a ejecutar
+            *args: Argumentos posicionales de func
+            before_attempt: Callback antes de cada intento (ej: rate limiting)
+            **kwargs: Argumentos nombrados de func
+
+        Returns:
+            Resultado de func
+
+        Raises:
+            Exception: El último error si no es reintentable o se agotan
+                intentos, deadline o presupuesto
+        """
+        started = time.monotonic()
+
+        if self.budget is not None:
+            self.budget.record_request()
+
+        attempt = 0
+        while True:
+            try:
+                if before_attempt is not None:
+                    before_attempt()
+                return func(*args, **kwargs)
+
+            except Exception as e:
+                logger.warning(f"Intento {attempt + 1}/{self.max_attempts} falló: {e}")
+
+                if not self.is_retryable(e):
+                    logger.debug("Error no reintentable")
+                    raise
+
+                if attempt + 1 >= self.max_attempts:
+                    logger.error("Máximo de reintentos alcanzado")
+                    raise
+
+                sleep_time = self.backoff(attempt)
+                retry_after = getattr(e, 'retry_after', None)
+                if retry_after:
+                    # Nunca reintentar antes de lo que pide el servidor
+                    sleep_time = max(sleep_time, retry_after)
+
+                if self.deadline is not None:
+                    elapsed = time.monotonic() - started
+                    if elapsed + sleep_time > self.deadline:
+                        logger.error(f"Deadline de {self.deadline}s alcanzado")
+                        raise
+
+                if self.budget is not None and not self.budget.try_acquire():
+                    logger.error("Presupuesto de reintentos agotado")
+                    raise
+
+                logger.info(f"Reintentando en {sleep_time:.2f}s...")
+                time.sleep(sleep_time)
+                attempt += 1
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: singleflight.py
+Descripción: Agrupación de llamadas idénticas en vuelo (singleflight).
+             Las llamadas concurrentes con la misma clave comparten una única
+             ejecución y reciben el mismo resultado o la misma excepción.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import logging
+import threading
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class _Call(Generic[T]):
+    """Llamada en vuelo compartida por los que esperan su resultado"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Agrupa llamadas concurrentes con la misma clave en una sola ejecución"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.shared_count = 0
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Ejecuta func, o espera a la ejecución en curso con la misma clave
+
+        El resultado no se guarda: en cuanto termina la llamada, la siguiente
+        con la misma clave vuelve a ejecutar func.
+
+        Args:
+            key: Identificador de la llamada (ej: endpoint + parámetros)
+            func: Función a ejecutar
+
+        Returns:
+            Resultado de func, compartido por todas las llamadas agrupadas
+
+        Raises:
+            Exception: La excepción de func, relanzada en todas las llamadas
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.shared_count += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            logger.debug(f"Esperando petición idéntica en vuelo: {key}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            if call.waiters:
+                logger.debug(f"Petición compartida con {call.waiters} llamadas: {key}")
+
+    @property
+    def in_flight(self) -> int:
+        """Número de llamadas en ejecución"""
+        with self._lock:
+            return len(self._calls)
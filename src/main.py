@@ -16,6 +16,11 @@ from src.utils.config import Config
 from src.utils.logger import setup_logger
 from src.api.jsearch_client import JSearchClient
 from src.services.job_service import JobService
+from src.services.search_cache import SearchCache
+from src.services.job_store import JobStore
+from src.services.job_dedup import JobDeduplicator
+from src.services.skill_extractor import SkillExtractor, skill_counts
+from src.services.seen_jobs import SeenJobs
 from src.services.salary_service import SalaryService
 from src.services.export_service import ExportService
 from src.ui.console import Console
@@ -25,7 +30,118 @@ from src.ui.formatters import JobFormatter, SalaryFormatter
 from config.predefined_searches import PREDEFINED_SEARCHES, SEARCH_TITLES
 
 
-def handle_custom_search(job_service, export_service, prompts, console):
+def collapse_duplicates(job_service, jobs, console):
+    """
+    Merge the same posting found on several publishers
+
+    Args:
+        job_service: Job service
+        jobs: Jobs found
+        console: Rich console
+
+    Returns:
+        Jobs without near-duplicates
+    """
+    unique = job_service.collapse_duplicates(jobs)
+    if len(unique) < len(jobs):
+        console.print_info(f"Merged {len(jobs) - len(unique)} duplicate postings from other publishers")
+    return unique
+
+
+def collapse_saved_duplicates(job_service, console):
+    """
+    Merge near-duplicates across the whole local job store
+
+    Searches only collapse duplicates within their own results, so the same
+    posting found by different searches is merged here, once per session.
+
+    Args:
+        job_service: Job service
+        console: Rich console
+    """
+    if job_service.job_store is None or job_service.deduplicator is None:
+        return
+    try:
+        with console.console.status("[bold green]Merging duplicate saved jobs...", spinner="dots"):
+            removed = job_service.collapse_saved_duplicates()
+        if removed:
+            console.print_info(f"Merged {removed} duplicate saved jobs")
+    except Exception as e:
+        console.print_error(f"Error merging saved duplicates: {e}")
+
+
+def print_top_skills(jobs, console, top=10):
+    """
+    Show the skills most requested by the jobs found
+
+    Args:
+        jobs: Jobs found
+        console: Rich console
+        top: Number of skills to show
+    """
+    counts = skill_counts(jobs, top)
+    if counts:
+        console.print_info("Top skills: " + ", ".join(f"{skill} ({count})" for skill, count in counts))
+
+
+def run_search(job_service, params, console, message, page_by_page=False):
+    """
+    Run a search behind a spinner
+
+    By default the whole page range is fetched in one API call (one quota
+    unit). With page_by_page each page is a separate call and the spinner
+    shows progress as pages arrive.
+
+    Args:
+        job_service: Job service
+        params: Search parameters
+        console: Rich console
+        message: Spinner text
+        page_by_page: Fetch and report page by page
+
+    Returns:
+        List of jobs found
+    """
+    with console.console.status(f"[bold green]{message}", spinner="dots") as status:
+        if not page_by_page:
+            return job_service.search_jobs(params)
+
+        jobs = []
+        for page in job_service.iter_search(params):
+            jobs.extend(page.jobs)
+            status.update(
+                f"[bold green]{message} page {page.pages_done}/{page.total_pages} "
+                f"({len(jobs)} found)"
+            )
+        return jobs
+
+
+def report_export(batch, console):
+    """
+    Wait for an export to finish and report the files it produced
+
+    Paths are read after the write, so files replaced by an identical
+    earlier export (EXPORT_DEDUP=skip) are reported by their real name.
+
+    Args:
+        batch: Export batch (background or already written)
+        console: Rich console
+    """
+    try:
+        batch.wait()
+    except Exception as e:
+        console.print_error(f"Export failed: {e}")
+        return
+
+    for path in batch.paths.values():
+        console.print_success(f"Saved to: {path.name}")
+    for existing in batch.duplicate_of.values():
+        console.print_info(f"Same results as {existing.name}")
+    if batch.delta_path is not None:
+        console.print_info(f"Changes since last export: {batch.delta_path.name}")
+
+
+def handle_custom_search(job_service, export_service, prompts, console, page_by_page=False):
     """
     Handle custom job search from user
 
@@ -34,14 +150,18 @@ def handle_custom_search(job_service, export_service, prompts, console):
         export_service: Export service
         prompts: Prompts handler
         console: Rich console
+        page_by_page: Fetch and report page by page
+
+    Returns:
+        Background export batch to report once it finishes, or None
     """
     try:
         # Get parameters
         params = prompts.get_custom_search_params()
 
-        # Search for jobs with spinner
-        with console.console.status("[bold green]Searching for jobs...", spinner="dots"):
-            jobs = job_service.search_jobs(params)
+        jobs = run_search(job_service, params, console, "Searching for jobs...", page_by_page)
+
+        jobs = collapse_duplicates(job_service, jobs, console)
 
         if jobs:
             # Display table with Rich
@@ -50,21 +170,33 @@ def handle_custom_search(job_service, export_service, prompts, console):
             console.console.print(table)
 
             console.print_success(f"Found {len(jobs)} jobs")
+            if job_service.seen_jobs is not None:
+                new_count = sum(1 for job in jobs if job.is_new)
+                console.print_info(f"{new_count} new since previous runs")
+            print_top_skills(jobs, console)
 
             # Save results
             if prompts.confirm_save("Save results to files?"):
-                csv_path = export_service.export_jobs_to_csv(jobs, params.query)
-                json_path = export_service.export_jobs_to_json(jobs, params.query)
-                console.print_success(f"CSV: {csv_path.name}")
-                console.print_success(f"JSON: {json_path.name}")
+                new_jobs = export_service.select_new(jobs)
+                if new_jobs:
+                    # Single pass over the jobs for both files, written in the background
+                    batch = export_service.export_many(
+                        new_jobs, params.query, ["csv", "json"], background=True
+                    )
+                    console.print_info(f"Exporting {len(new_jobs)} jobs in the background...")
+                    return batch
+                else:
+                    console.print_info("No new jobs since the last export")
         else:
             console.print_warning("No jobs found with these criteria")
 
     except Exception as e:
         console.print_error(f"Search error: {e}")
 
+    return None
+
 
-def handle_predefined_search(choice, job_service, export_service, console):
+def handle_predefined_search(choice, job_service, export_service, console, page_by_page=False):
     """
     Handle predefined searches
 
@@ -73,6 +205,7 @@ def handle_predefined_search(choice, job_service, export_service, console):
         job_service: Job service
         export_service: Export service
         console: Rich console
+        page_by_page: Fetch and report page by page
     """
     try:
         params = PREDEFINED_SEARCHES[choice]
@@ -80,19 +213,23 @@ def handle_predefined_search(choice, job_service, export_service, console):
 
         console.print_info(f"Running search: {title}")
 
-        # Search for jobs with spinner
-        with console.console.status("[bold green]Searching...", spinner="dots"):
-            jobs = job_service.search_jobs(params)
+        jobs = run_search(job_service, params, console, "Searching...", page_by_page)
+
+        jobs = collapse_duplicates(job_service, jobs, console)
 
         if jobs:
             # Display table
             table = JobFormatter.format_job_table(jobs)
             console.console.print("\n")
             console.console.print(table)
+            print_top_skills(jobs, console)
 
             # Auto save
-            csv_path = export_service.export_jobs_to_csv(jobs, params.query)
-            console.print_success(f"Saved to: {csv_path.name}")
+            new_jobs = export_service.select_new(jobs)
+            if new_jobs:
+                report_export(export_service.export_many(new_jobs, params.query, ["csv"]), console)
+            else:
+                console.print_info("No new jobs since the last export")
         else:
             console.print_warning("No jobs found")
 
@@ -132,6 +269,37 @@ def handle_job_details(job_service, export_service, prompts, console):
         console.print_error(f"Error fetching details: {e}")
 
 
+def handle_saved_search(job_service, prompts, console):
+    """
+    Search previously found jobs by relevance, without using API quota
+
+    Args:
+        job_service: Job service
+        prompts: Prompts handler
+        console: Rich console
+    """
+    try:
+        if job_service.job_store is None:
+            console.print_warning("The local job store is disabled (STORE_ENABLED=false)")
+            return
+
+        query = prompts.get_saved_search_query()
+
+        with console.console.status("[bold green]Searching saved jobs...", spinner="dots"):
+            jobs = job_service.search_saved(query, limit=20)
+
+        if jobs:
+            table = JobFormatter.format_job_table(jobs)
+            console.console.print("\n")
+            console.console.print(table)
+            console.print_success(f"Found {len(jobs)} saved jobs")
+        else:
+            console.print_warning("No saved jobs match these keywords")
+
+    except Exception as e:
+        console.print_error(f"Search error: {e}")
+
+
 def handle_salary_estimate(salary_service, export_service, prompts, console):
     """
     Handle salary estimation
@@ -245,9 +413,30 @@ def main():
     # Initialize services
     try:
         api_client = JSearchClient(config.api_key, config.api_host, config)
-        job_service = JobService(api_client)
+        search_cache = SearchCache(ttl=config.cache_ttl_search) if config.cache_enabled else None
+        job_store = JobStore(config.store_path) if config.store_enabled else None
+        deduplicator = JobDeduplicator(config.dedup_threshold) if config.dedup_enabled else None
+        skill_extractor = SkillExtractor.from_config(config.skills_path) if config.skills_enabled else None
+        seen_jobs = SeenJobs(
+            config.seen_path, job_store, error_rate=config.seen_error_rate
+        ) if config.seen_enabled else None
+        job_service = JobService(
+            api_client, search_cache, job_store, deduplicator,
+            skill_extractor=skill_extractor,
+            seen_jobs=seen_jobs,
+            skip_seen=config.skip_seen_jobs
+        )
         salary_service = SalaryService(api_client)
-        export_service = ExportService(config.output_dir)
+        exported_jobs = SeenJobs(
+            config.export_seen_path, error_rate=config.seen_error_rate
+        ) if config.export_only_new else None
+        export_service = ExportService(
+            config.output_dir, exported_jobs,
+            compression=config.export_compression,
+            compression_level=config.export_compression_level,
+            dedup=config.export_dedup,
+            write_deltas=config.export_deltas
+        )
 
         console.print_success("Services initialized successfully")
         console.print_info(f"Connected to: {config.api_host}")
@@ -262,22 +451,33 @@ def main():
     prompts = Prompts(console)
 
     # Main loop
+    pending_export = None
     while True:
         try:
+            # Report a background export once the user has seen its results
+            if pending_export is not None:
+                batch, pending_export = pending_export, None
+                report_export(batch, console)
+
             choice = menu.show_main_menu()
 
             if choice == "0":
+                export_service.wait()
+                collapse_saved_duplicates(job_service, console)
+                job_service.close()
                 console.print_info("Goodbye! Thank you for using LinkedIn Job Scraper")
                 logger.info("Application closed by user")
                 break
 
             elif choice == "1":
                 # Custom search
-                handle_custom_search(job_service, export_service, prompts, console)
+                pending_export = handle_custom_search(
+                    job_service, export_service, prompts, console, config.search_page_by_page
+                )
 
             elif choice in PREDEFINED_SEARCHES:
                 # Predefined searches
-                handle_predefined_search(choice, job_service, export_service, console)
+                handle_predefined_search(choice, job_service, export_service, console, config.search_page_by_page)
 
             elif choice == "11":
                 # Get job details
@@ -291,6 +491,10 @@ def main():
                 # View company salaries
                 handle_company_salary(salary_service, export_service, prompts, console)
 
+            elif choice == "14":
+                # Search saved jobs
+                handle_saved_search(job_service, prompts, console)
+
             # Pause before showing menu again
             menu.wait_for_enter()
 
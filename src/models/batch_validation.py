@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: batch_validation.py
+Descripción: Validación en lote de listas de la API con un TypeAdapter de pydantic.
+             Valida todo el array de una vez y solo recurre a la validación
+             individual para los elementos que fallan, informando sus índices.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import logging
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Generic, List, Sequence, Type, TypeVar
+from pydantic import TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar('M')
+
+
+@dataclass
+class BatchValidationResult(Generic[M]):
+    """Resultado de validar una lista: elementos válidos e índices omitidos"""
+    items: List[M]
+    skipped: List[int] = field(default_factory=list)
+    errors: Dict[int, ValidationError] = field(default_factory=dict)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[M]) -> TypeAdapter:
+    """TypeAdapter(List[model]) construido una sola vez por modelo"""
+    return TypeAdapter(List[model])
+
+
+@lru_cache(maxsize=None)
+def _item_adapter(model: Type[M]) -> TypeAdapter:
+    """TypeAdapter(model) para tipos que no son modelos pydantic (ej: TypedDict)"""
+    return TypeAdapter(model)
+
+
+def validate_batch(model: Type[M], data: Sequence[Any]) -> BatchValidationResult[M]:
+    """
+    Valida una lista de diccionarios como instancias de model
+
+    model puede ser un modelo pydantic o cualquier tipo que acepte
+    TypeAdapter (ej: un TypedDict con solo los campos necesarios).
+
+    El camino rápido valida todo el array en una sola llamada. Si algún
+    elemento falla, los válidos se validan de nuevo en lote y solo los
+    fallidos se validan uno a uno para obtener su error.
+
+    Args:
+        model: Tipo de cada elemento
+        data: Lista de diccionarios de la API
+
+    Returns:
+        BatchValidationResult con los elementos válidos en orden original,
+        los índices omitidos y el error de cada uno
+
+    Raises:
+        ValidationError: Si data no es una lista
+    """
+    adapter = _list_adapter(model)
+
+    try:
+        return BatchValidationResult(items=adapter.validate_python(data))
+    except ValidationError as e:
+        failing = sorted({
+            error['loc'][0] for error in e.errors()
+            if error['loc'] and isinstance(error['loc'][0], int)
+        })
+        if not failing:
+            raise
+
+    failing_set = set(failing)
+    valid_indices = [i for i in range(len(data)) if i not in failing_set]
+    validated = dict(zip(
+        valid_indices,
+        adapter.validate_python([data[i] for i in valid_indices])
+    ))
+
+    validate_item = getattr(model, 'model_validate', None) or _item_adapter(model).validate_python
+
+    errors: Dict[int, ValidationError] = {}
+    for i in failing:
+        try:
+            validated[i] = validate_item(data[i])
+        except ValidationError as item_error:
+            errors[i] = item_error
+
+    return BatchValidationResult(
+        items=[validated[i] for i in sorted(validated)],
+        skipped=sorted(errors),
+        errors=errors
+    )
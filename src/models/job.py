@@ -59,6 +59,19 @@ class Job(BaseModel):
     benefits: Optional[List[str]] = Field(None, alias="job_benefits")
     highlights: Optional[dict] = Field(None, alias="job_highlights")
 
+    # Deduplication
+    alternate_apply_links: List[str] = Field(
+        default_factory=list,
+        description="Enlaces de postulación de la misma oferta en otros publishers"
+    )
+
+    # Seen tracking (estado de la búsqueda en curso: fuera de model_dump y exportaciones)
+    is_new: Optional[bool] = Field(
+        None,
+        exclude=True,
+        description="False si el trabajo ya apareció en una ejecución anterior (sin historial: None)"
+    )
+
     model_config = {"populate_by_name": True}
 
     @field_validator('required_skills', mode='before')
@@ -83,37 +96,64 @@ class Job(BaseModel):
 
     def get_location(self) -> str:
         """Retorna ubicación formateada"""
-        parts = []
-        if self.city:
-            parts.append(self.city)
-        if self.state:
-            parts.append(self.state)
-        if self.country:
-            parts.append(self.country)
-        return ", ".join(parts) if parts else "N/A"
+        return format_location(self.city, self.state, self.country)
 
     def get_salary_range(self) -> Optional[str]:
         """Retorna rango salarial formateado"""
-        if not self.min_salary and not self.max_salary:
-            return None
-
-        currency = self.salary_currency or "USD"
-        period = self.salary_period or "YEAR"
-
-        if self.min_salary and self.max_salary:
-            return f"{self.min_salary:,.0f} - {self.max_salary:,.0f} {currency}/{period}"
-        elif self.min_salary:
-            return f"{self.min_salary:,.0f}+ {currency}/{period}"
-        else:  # self.max_salary
-            return f"Up to {self.max_salary:,.0f} {currency}/{period}"
+        return format_salary_range(
+            self.min_salary, self.max_salary, self.salary_currency, self.salary_period
+        )
 
     def get_short_description(self, max_length: int = 300) -> str:
         """Retorna descripción truncada"""
-        if not self.description:
-            return "No disponible"
-
-        desc = ' '.join(self.description.split())  # Limpia espacios
-        if len(desc) <= max_length:
+        return format_short_description(self.description, max_length)
+
+
+def format_location(city: Optional[str], state: Optional[str], country: Optional[str]) -> str:
+    """Formatea la ubicación como "ciudad, estado, país" omitiendo partes vacías"""
+    parts = []
+    if city:
+        parts.append(city)
+    if state:
+        parts.append(state)
+    if country:
+        parts.append(country)
+    return ", ".join(parts) if parts else "N/A"
+
+
+def format_salary_range(
+    min_salary: Optional[float],
+    max_salary: Optional[float],
+    currency: Optional[str],
+    period: Optional[str]
+) -> Optional[str]:
+    """Formatea el rango salarial, o None si no hay salario"""
+    if not min_salary and not max_salary:
+        return None
+
+    currency = currency or "USD"
+    period = period or "YEAR"
+
+    if min_salary and max_salary:
+        return f"{min_salary:,.0f} - {max_salary:,.0f} {currency}/{period}"
+    elif min_salary:
+        return f"{min_salary:,.0f}+ {currency}/{period}"
+    else:  # max_salary
+        return f"Up to {max_salary:,.0f} {currency}/{period}"
+
+
+def format_short_description(description: Optional[str], max_length: int = 300) -> str:
+    """Normaliza espacios y trunca la descripción a max_length caracteres"""
+    if not description:
+        return "No disponible"
+
+    # Limpiar espacios solo en un prefijo creciente: el prefijo normalizado
+    # siempre es prefijo de la descripción normalizada completa
+    size = max_length + 1
+    while True:
+        desc = ' '.join(description[:size].split())
+        if len(desc) > max_length:
+            return desc[:max_length] + "..."
+        if size >= len(description):
             return desc
-
-        return desc[:max_length] + "..."
+        size *= 2
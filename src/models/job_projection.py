@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: job_projection.py
+Descripción: Proyección directa de resultados en bruto de JSearch al formato JSON
+             del dashboard, sin construir objetos Job. Solo valida los campos
+             que usa y produce la misma salida que la proyección desde Job.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import logging
+from typing import Any, Dict, List, Optional
+from typing_extensions import Required, TypedDict
+from src.models.batch_validation import BatchValidationResult, validate_batch
+from src.models.job import format_location, format_salary_range, format_short_description
+from src.models.job_record import JobLike
+
+logger = logging.getLogger(__name__)
+
+# Longitud de la descripción en los listados del dashboard
+DASHBOARD_DESCRIPTION_LENGTH = 500
+
+
+class DashboardFields(TypedDict, total=False):
+    """Campos en bruto de JSearch que usa el dashboard, con los tipos de Job"""
+    job_id: Required[str]
+    job_title: Optional[str]
+    employer_name: Optional[str]
+    job_city: Optional[str]
+    job_state: Optional[str]
+    job_country: Optional[str]
+    job_is_remote: bool
+    job_employment_type: Optional[str]
+    job_description: Optional[str]
+    job_apply_link: Optional[str]
+    job_min_salary: Optional[float]
+    job_max_salary: Optional[float]
+    job_salary_currency: Optional[str]
+    job_salary_period: Optional[str]
+    job_posted_at_datetime_utc: Optional[str]
+    job_required_experience: Optional[str]
+    job_required_education: Optional[str]
+
+
+def project_fields(fields: DashboardFields) -> Dict[str, Any]:
+    """
+    Construye el diccionario del dashboard a partir de campos ya validados
+
+    Args:
+        fields: Campos validados de un trabajo
+
+    Returns:
+        Diccionario con las 12 claves del dashboard
+    """
+    get = fields.get
+    return {
+        'id': fields['job_id'],
+        'title': get('job_title') or 'N/A',
+        'company': get('employer_name') or 'N/A',
+        'location': format_location(get('job_city'), get('job_state'), get('job_country')),
+        'salary': format_salary_range(
+            get('job_min_salary'),
+            get('job_max_salary'),
+            get('job_salary_currency'),
+            get('job_salary_period')
+        ) or 'Not specified',
+        'employment_type': get('job_employment_type') or 'N/A',
+        'is_remote': get('job_is_remote', False),
+        'posted_at': get('job_posted_at_datetime_utc') or 'N/A',
+        'description': format_short_description(
+            get('job_description'), DASHBOARD_DESCRIPTION_LENGTH
+        ),
+        'required_experience': get('job_required_experience') or 'Not specified',
+        'required_education': get('job_required_education') or 'Not specified',
+        'apply_link': get('job_apply_link') or '#'
+    }
+
+
+def project_jobs(raw_results: List[Dict[str, Any]]) -> BatchValidationResult[Dict[str, Any]]:
+    """
+    Proyecta resultados en bruto al formato del dashboard
+
+    Se validan en lote solo los campos de DashboardFields (con los mismos
+    tipos y coerciones que Job); el resto del payload no se valida. Un
+    trabajo cuyo error esté solo en campos no usados se incluye igualmente.
+
+    Args:
+        raw_results: Resultados en bruto de la API
+
+    Returns:
+        BatchValidationResult con los diccionarios del dashboard y los
+        índices omitidos
+    """
+    result = validate_batch(DashboardFields, raw_results)
+    for i, error in result.errors.items():
+        logger.warning(f"Error proyectando trabajo #{i+1}: {error}")
+
+    result.items = [project_fields(fields) for fields in result.items]
+    return result
+
+
+def job_to_dashboard(job: JobLike) -> Dict[str, Any]:
+    """
+    Proyección del dashboard a partir de un Job o JobRecord ya construido
+
+    Args:
+        job: Trabajo validado
+
+    Returns:
+        Diccionario con las 12 claves del dashboard
+    """
+    return {
+        'id': job.job_id,
+        'title': job.title or 'N/A',
+        'company': job.employer_name or 'N/A',
+        'location': job.get_location(),
+        'salary': job.get_salary_range() or 'Not specified',
+        'employment_type': job.employment_type or 'N/A',
+        'is_remote': job.is_remote,
+        'posted_at': job.posted_at_datetime or 'N/A',
+        'description': job.get_short_description(DASHBOARD_DESCRIPTION_LENGTH),
+        'required_experience': job.required_experience or 'Not specified',
+        'required_education': job.required_education or 'Not specified',
+        'apply_link': job.apply_link or '#'
+    }
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: job_record.py
+Descripción: Representación compacta y de solo lectura de un trabajo para
+             mantener miles de resultados en memoria. Usa __slots__, interna
+             los textos repetidos y convierte a/desde Job sin pérdidas.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from src.models.job import Job, format_location, format_salary_range, format_short_description
+
+# Campos de Job en su orden de declaración
+_FIELDS: Tuple[str, ...] = tuple(Job.model_fields)
+
+# Campos que incluye Job.model_dump() (sin los excluidos, como is_new)
+_DUMP_FIELDS: Tuple[str, ...] = tuple(
+    name for name, info in Job.model_fields.items() if not info.exclude
+)
+
+# Textos con pocos valores distintos que se repiten entre trabajos
+_INTERNED_FIELDS = frozenset({
+    'employer_name',
+    'job_publisher',
+    'city',
+    'state',
+    'country',
+    'employment_type',
+    'salary_currency',
+    'salary_period',
+})
+
+_TIMESTAMP_FIELDS = frozenset({'posted_at_timestamp', 'expiration_timestamp'})
+
+# Listas de Job que se guardan como tuplas
+_LIST_FIELDS = frozenset({'required_skills', 'benefits', 'alternate_apply_links'})
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _freeze_highlights(highlights: Optional[dict]) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    """dict de listas -> tupla de pares inmutable"""
+    if highlights is None:
+        return None
+    return tuple(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in highlights.items()
+    )
+
+
+def _thaw_highlights(frozen: Optional[Tuple[Tuple[str, Any], ...]]) -> Optional[dict]:
+    """Tupla de pares -> dict de listas (copia nueva)"""
+    if frozen is None:
+        return None
+    return {
+        key: list(value) if isinstance(value, tuple) else value
+        for key, value in frozen
+    }
+
+
+class JobRecord:
+    """
+    Trabajo compacto de solo lectura
+
+    Expone los mismos atributos y métodos de formato que Job, por lo que
+    sirve en formateadores y exportaciones. Las listas se guardan como
+    tuplas y highlights como tupla de pares; model_dump() devuelve la
+    misma estructura que Job.model_dump().
+    """
+
+    __slots__ = tuple(name for name in _FIELDS if name != 'highlights') + ('_highlights',)
+
+    def __init__(self, job_id: str, **values: Any):
+        """
+        Args:
+            job_id: ID único del trabajo
+            **values: Resto de campos de Job por nombre (no alias)
+
+        Raises:
+            TypeError: Si se pasa un campo desconocido
+        """
+        unknown = set(values) - set(_FIELDS)
+        if unknown:
+            raise TypeError(f"Campos desconocidos para JobRecord: {', '.join(sorted(unknown))}")
+
+        values['job_id'] = job_id
+        for name in _FIELDS:
+            if name in values:
+                value = values[name]
+            else:
+                value = Job.model_fields[name].get_default(call_default_factory=True)
+
+            if name in _INTERNED_FIELDS:
+                value = _intern(value)
+            elif name in _TIMESTAMP_FIELDS and value is not None:
+                value = int(value)
+            elif name == 'required_skills':
+                value = tuple(sys.intern(skill) for skill in value or ())
+            elif name in _LIST_FIELDS and value is not None:
+                value = tuple(value)
+            elif name == 'highlights':
+                name, value = '_highlights', _freeze_highlights(value)
+
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_job(cls, job: Job) -> "JobRecord":
+        """
+        Crea un registro compacto a partir de un Job
+
+        Args:
+            job: Trabajo validado
+
+        Returns:
+            JobRecord equivalente
+        """
+        return cls(**{name: getattr(job, name) for name in _FIELDS})
+
+    def to_job(self) -> Job:
+        """
+        Reconstruye el Job original
+
+        Returns:
+            Job igual al usado para crear el registro
+        """
+        return Job.model_construct(**self.model_dump(), is_new=self.is_new)
+
+    def model_dump(self) -> Dict[str, Any]:
+        """
+        Diccionario con la misma estructura que Job.model_dump()
+
+        Returns:
+            Campos por nombre, con listas y dict en lugar de tuplas
+        """
+        data = {}
+        for name in _DUMP_FIELDS:
+            if name == 'highlights':
+                data[name] = _thaw_highlights(self._highlights)
+                continue
+            value = getattr(self, name)
+            if name in _LIST_FIELDS and value is not None:
+                value = list(value)
+            data[name] = value
+        return data
+
+    @property
+    def highlights(self) -> Optional[dict]:
+        """Highlights como dict (copia; el registro no se modifica)"""
+        return _thaw_highlights(self._highlights)
+
+    def get_location(self) -> str:
+        """Retorna ubicación formateada"""
+        return format_location(self.city, self.state, self.country)
+
+    def get_salary_range(self) -> Optional[str]:
+        """Retorna rango salarial formateado"""
+        return format_salary_range(
+            self.min_salary, self.max_salary, self.salary_currency, self.salary_period
+        )
+
+    def get_short_description(self, max_length: int = 300) -> str:
+        """Retorna descripción truncada"""
+        return format_short_description(self.description, max_length)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("JobRecord es de solo lectura")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("JobRecord es de solo lectura")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, JobRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self) -> int:
+        return hash(self.job_id)
+
+    def __repr__(self) -> str:
+        return f"JobRecord(job_id={self.job_id!r}, title={self.title!r})"
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+# Tipos aceptados por formateadores y exportaciones
+JobLike = Union[Job, JobRecord]
+
+
+def to_records(jobs: Iterable[Job]) -> List[JobRecord]:
+    """
+    Convierte trabajos a registros compactos
+
+    Args:
+        jobs: Trabajos validados
+
+    Returns:
+        Lista de JobRecord en el mismo orden
+    """
+    return [JobRecord.from_job(job) for job in jobs]
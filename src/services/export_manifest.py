@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: export_manifest.py
+Descripción: Manifiesto de exportaciones direccionado por contenido. Registra el
+             hash de cada conjunto de resultados exportado, los archivos que
+             lo contienen y sus job_id, para detectar exportaciones idénticas
+             y calcular deltas sin volver a leer archivos antiguos.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+from src.utils.file_utils import clean_filename, ensure_dir_exists
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+class ExportManifest:
+    """
+    Manifiesto de las exportaciones de un directorio
+
+    Se guarda en <directorio>/.exports/manifest.json con dos tablas:
+    'files' (hash de contenido -> extensión -> archivo) y 'latest'
+    (nombre base -> última exportación). Los job_id de cada contenido van
+    en .exports/ids/<hash>.txt, una vez por hash.
+    """
+
+    def __init__(self, output_dir: Union[str, Path]):
+        """
+        Args:
+            output_dir: Directorio de las exportaciones
+        """
+        self.output_dir = Path(output_dir)
+        self.directory = self.output_dir / ".exports"
+        self.path = self.directory / "manifest.json"
+        self._lock = threading.Lock()
+        self._data = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        """Lee el manifiesto; uno ausente o ilegible empieza vacío"""
+        empty = {'version': MANIFEST_VERSION, 'files': {}, 'latest': {}}
+        if not self.path.exists():
+            return empty
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Manifiesto de exportaciones ilegible, se reinicia: {e}")
+            return empty
+        if data.get('version') != MANIFEST_VERSION:
+            return empty
+        return data
+
+    def _save(self) -> None:
+        """Guarda el manifiesto de forma atómica"""
+        ensure_dir_exists(self.directory)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def find(self, content_hash: str, extension: str) -> Optional[Path]:
+        """
+        Archivo ya exportado con el mismo contenido y formato
+
+        Args:
+            content_hash: Hash del conjunto de resultados
+            extension: Extensión completa (ej: "csv", "jsonl.gz")
+
+        Returns:
+            Ruta del archivo, o None si no hay ninguno o ya no existe
+        """
+        with self._lock:
+            name = self._data['files'].get(content_hash, {}).get(extension)
+        if name is None:
+            return None
+        path = self.output_dir / name
+        return path if path.exists() else None
+
+    def previous(self, base_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Última exportación registrada para un nombre base
+
+        Returns:
+            Dict con hash, count y created, o None
+        """
+        with self._lock:
+            entry = self._data['latest'].get(clean_filename(base_name))
+        return dict(entry) if entry else None
+
+    def job_ids(self, content_hash: str) -> Optional[List[str]]:
+        """
+        job_id de un contenido registrado, en orden de exportación
+
+        Returns:
+            Lista de IDs, o None si no se guardaron
+        """
+        path = self._ids_path(content_hash)
+        if not path.exists():
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read().splitlines()
+
+    def _ids_path(self, content_hash: str) -> Path:
+        return self.directory / "ids" / f"{content_hash}.txt"
+
+    def store_ids(self, content_hash: str, ids_file: Path) -> Path:
+        """
+        Guarda los job_id de un contenido a partir de un archivo ya escrito
+
+        El archivo (un job_id por línea) se mueve a ids/<hash>.txt; si ese
+        contenido ya tenía sus IDs guardados, se descarta.
+
+        Args:
+            content_hash: Hash del conjunto de resultados
+            ids_file: Archivo temporal con los IDs, en el mismo sistema de archivos
+
+        Returns:
+            Ruta definitiva de los IDs
+        """
+        ids_path = self._ids_path(content_hash)
+        if ids_path.exists():
+            ids_file.unlink()
+        else:
+            ensure_dir_exists(ids_path.parent)
+            os.replace(ids_file, ids_path)
+        return ids_path
+
+    def record(
+        self,
+        base_name: str,
+        content_hash: str,
+        count: int,
+        files: Dict[str, Path],
+        job_ids: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Registra una exportación
+
+        Args:
+            base_name: Nombre base de la exportación
+            content_hash: Hash del conjunto de resultados
+            count: Número de trabajos
+            files: Extensión -> archivo que contiene ese contenido
+            job_ids: IDs exportados (se guardan una vez por hash; None si ya
+                se guardaron con store_ids)
+        """
+        ids_path = self._ids_path(content_hash)
+        if job_ids is not None and not ids_path.exists():
+            ensure_dir_exists(ids_path.parent)
+            tmp_path = ids_path.with_name(ids_path.name + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for job_id in job_ids:
+                    f.write(job_id)
+                    f.write('\n')
+            os.replace(tmp_path, ids_path)
+
+        with self._lock:
+            known = self._data['files'].setdefault(content_hash, {})
+            for extension, path in files.items():
+                known.setdefault(extension, path.name)
+            self._data['latest'][clean_filename(base_name)] = {
+                'hash': content_hash,
+                'count': count,
+                'created': datetime.now().isoformat(timespec='seconds'),
+            }
+            self._save()
+
+
+def job_id_delta(previous: Iterable[str], current: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    IDs añadidos y eliminados entre dos exportaciones
+
+    Args:
+        previous: IDs de la exportación anterior
+        current: IDs de la exportación actual
+
+    Returns:
+        {'added': [...], 'removed': [...]} en el orden de cada exportación
+    """
+    previous = list(previous)
+    current = list(current)
+    previous_set: Set[str] = set(previous)
+    current_set: Set[str] = set(current)
+    return {
+        'added': [job_id for job_id in current if job_id not in previous_set],
+        'removed': [job_id for job_id in previous if job_id not in current_set],
+    }
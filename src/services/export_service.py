@@ -11,34 +11,451 @@ Versión: 3.0.0
 Fecha: 2025-12-08
 """
 import csv
+import hashlib
 import json
 import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Union
-from src.models.job import Job
+from typing import (
+    Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Type, Union,
+    get_args, get_origin
+)
+from src.models.job import Job, format_short_description
+from src.models.job_record import JobLike
 from src.models.salary import SalaryInfo
-from src.utils.file_utils import generate_filename, ensure_dir_exists
+from src.services.seen_jobs import SeenJobs
+from src.services.export_manifest import ExportManifest, job_id_delta
+from src.utils.file_utils import (
+    COMPRESSION_SUFFIXES, check_compression_level, compression_from_path, generate_filename,
+    ensure_dir_exists, open_compressed
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Dependencia opcional: solo para exportar a Parquet
+    pa = None
+    pq = None
 
 logger = logging.getLogger(__name__)
 
+# Columnas del CSV de trabajos
+JOB_CSV_FIELDS = [
+    'job_id', 'title', 'employer_name', 'city', 'state', 'country',
+    'is_remote', 'employment_type', 'min_salary', 'max_salary',
+    'salary_currency', 'salary_period', 'description', 'apply_link',
+    'posted_at_datetime', 'job_publisher', 'required_experience',
+    'required_skills', 'required_education', 'benefits', 'google_link',
+    'expiration_datetime'
+]
+
+# Tamaño del buffer de escritura: las exportaciones van a disco en bloques
+# de este tamaño, sin acumular el archivo completo en memoria
+WRITE_BUFFER_SIZE = 256 * 1024
+
+# Filas por row group en Parquet (filas acumuladas en memoria como máximo)
+PARQUET_ROW_GROUP_SIZE = 2000
+
+
+class _JobWriter:
+    """Escritor de un formato: recibe cada trabajo ya convertido a dict"""
+
+    extension = ""
+    newline: Optional[str] = None
+    # True si el formato comprime por dentro (sin extensión .gz/.zst)
+    internal_compression = False
+
+    def __init__(self, file: TextIO):
+        self.file = file
+
+    @classmethod
+    def open(
+        cls,
+        path: Path,
+        compression: Optional[str],
+        level: Optional[int],
+        stack: ExitStack
+    ) -> "_JobWriter":
+        """
+        Abre el archivo de salida y crea el escritor
+
+        Args:
+            path: Archivo destino
+            compression: 'gzip', 'zstd' o None
+            level: Nivel de compresión
+            stack: Contexto que cierra el archivo al terminar (o si falla)
+
+        Returns:
+            Escritor listo para recibir trabajos
+        """
+        if compression is None:
+            file = open(path, 'w', encoding='utf-8', newline=cls.newline, buffering=WRITE_BUFFER_SIZE)
+        else:
+            # Compresión en streaming: solo el bloque en curso en memoria
+            file = open_compressed(path, 'wt', compression, level, cls.newline)
+        return cls(stack.enter_context(file))
+
+    @classmethod
+    def check_available(cls) -> None:
+        """
+        Comprueba que las dependencias del formato están instaladas
+
+        Raises:
+            ValueError: Si falta alguna
+        """
+
+    def write(self, job_dict: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Completa el archivo tras el último trabajo"""
+
+
+class _CsvJobWriter(_JobWriter):
+    """CSV con JOB_CSV_FIELDS, descripción recortada y listas unidas por comas"""
+
+    extension = "csv"
+    newline = ''
+
+    def __init__(self, file: TextIO):
+        super().__init__(file)
+        self._writer = csv.writer(file)
+        self._writer.writerow(JOB_CSV_FIELDS)
+
+    def write(self, job_dict: Dict[str, Any]) -> None:
+        # Fila nueva: el dict se comparte con el resto de formatos
+        row = [job_dict.get(name) for name in JOB_CSV_FIELDS]
+        if row[_CSV_DESCRIPTION]:
+            row[_CSV_DESCRIPTION] = format_short_description(row[_CSV_DESCRIPTION], 500)
+        for i in _CSV_LIST_COLUMNS:
+            if row[i] and isinstance(row[i], list):
+                row[i] = ', '.join(row[i])
+        self._writer.writerow(row)
+
+
+class _JsonArrayWriter(_JobWriter):
+    """Array JSON con el mismo formato que json.dump(lista, indent=2)"""
+
+    extension = "json"
+
+    def __init__(self, file: TextIO):
+        super().__init__(file)
+        self._count = 0
+
+    def write(self, job_dict: Dict[str, Any]) -> None:
+        self.file.write(',\n  ' if self._count else '[\n  ')
+        # Cada elemento con un nivel más de indentación
+        element = json.dumps(job_dict, ensure_ascii=False, indent=2)
+        self.file.write(element.replace('\n', '\n  '))
+        self._count += 1
+
+    def close(self) -> None:
+        self.file.write('\n]' if self._count else '[]')
+
+
+class _JsonLinesWriter(_JobWriter):
+    """JSON Lines: un objeto JSON por línea"""
+
+    extension = "jsonl"
+
+    def write(self, job_dict: Dict[str, Any]) -> None:
+        self.file.write(json.dumps(job_dict, ensure_ascii=False))
+        self.file.write('\n')
+
+
+def _arrow_type(annotation: Any) -> "pa.DataType":
+    """Tipo Arrow de una anotación de Job (Optional[X] -> X anulable)"""
+    if get_origin(annotation) is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    if get_origin(annotation) in (list, List):
+        return pa.list_(_arrow_type(get_args(annotation)[0]))
+    return {
+        str: pa.string(),
+        int: pa.int64(),
+        float: pa.float64(),
+        bool: pa.bool_(),
+    }.get(annotation, pa.string())
+
+
+def _exported_fields() -> List[Tuple[str, Any]]:
+    """Campos de Job que incluye model_dump() (sin is_new), con su FieldInfo"""
+    return [(name, info) for name, info in Job.model_fields.items() if not info.exclude]
+
+
+def _json_columns() -> FrozenSet[str]:
+    """Campos de Job sin tipo Arrow directo (dict), guardados como texto JSON"""
+    columns = set()
+    for name, info in _exported_fields():
+        annotation = info.annotation
+        if get_origin(annotation) is Union:
+            annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+        if annotation is dict or get_origin(annotation) in (dict, Dict):
+            columns.add(name)
+    return frozenset(columns)
+
+
+# Campos de Job guardados como texto JSON en Parquet (highlights)
+PARQUET_JSON_COLUMNS = _json_columns()
+
+
+def job_arrow_schema() -> "pa.Schema":
+    """
+    Esquema Arrow derivado de los campos de Job
+
+    Textos como string, números como int64/float64, is_remote como bool,
+    listas (required_skills, benefits...) como list<string> y highlights
+    como texto JSON.
+
+    Returns:
+        Esquema con un campo por atributo exportado de Job, en el mismo orden
+
+    Raises:
+        ValueError: Si pyarrow no está instalado
+    """
+    _ParquetJobWriter.check_available()
+    return pa.schema([
+        pa.field(name, pa.string() if name in PARQUET_JSON_COLUMNS else _arrow_type(info.annotation))
+        for name, info in _exported_fields()
+    ])
+
+
+class _ParquetJobWriter(_JobWriter):
+    """
+    Parquet columnar con esquema tipado
+
+    Acumula PARQUET_ROW_GROUP_SIZE filas por columna y escribe cada bloque
+    como un row group, así que la memoria queda acotada por ese tamaño.
+    """
+
+    extension = "parquet"
+    internal_compression = True
+
+    def __init__(self, writer: "pq.ParquetWriter"):
+        self._writer = writer
+        self._schema = writer.schema
+        self._columns: Dict[str, List[Any]] = {name: [] for name in self._schema.names}
+        self._rows = 0
+
+    @classmethod
+    def open(
+        cls,
+        path: Path,
+        compression: Optional[str],
+        level: Optional[int],
+        stack: ExitStack
+    ) -> "_JobWriter":
+        cls.check_available()
+        # Códec interno de Parquet (snappy si no se pide gzip o zstd)
+        writer = pq.ParquetWriter(
+            path,
+            job_arrow_schema(),
+            compression=compression or 'snappy',
+            compression_level=level if compression else None
+        )
+        stack.callback(writer.close)
+        return cls(writer)
+
+    @classmethod
+    def check_available(cls) -> None:
+        if pa is None:
+            raise ValueError("Exportación Parquet no disponible: instala el paquete pyarrow")
+
+    def write(self, job_dict: Dict[str, Any]) -> None:
+        for name, values in self._columns.items():
+            value = job_dict.get(name)
+            if name in PARQUET_JSON_COLUMNS and value is not None:
+                value = json.dumps(value, ensure_ascii=False)
+            values.append(value)
+        self._rows += 1
+        if self._rows >= PARQUET_ROW_GROUP_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        self._writer.write_table(pa.Table.from_pydict(self._columns, schema=self._schema))
+        for values in self._columns.values():
+            values.clear()
+        self._rows = 0
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+# Formatos de exportación de trabajos
+JOB_WRITERS: Dict[str, Type[_JobWriter]] = {
+    'csv': _CsvJobWriter,
+    'json': _JsonArrayWriter,
+    'jsonl': _JsonLinesWriter,
+    'parquet': _ParquetJobWriter,
+}
+
+_CSV_DESCRIPTION = JOB_CSV_FIELDS.index('description')
+_CSV_LIST_COLUMNS = (JOB_CSV_FIELDS.index('required_skills'), JOB_CSV_FIELDS.index('benefits'))
+
+
+@dataclass
+class ExportBatch:
+    """Exportación de unos trabajos a uno o varios formatos"""
+    paths: Dict[str, Path]
+    count: Optional[int] = None
+    future: Optional["Future[int]"] = None
+    # Con manifiesto: hash del contenido, formatos que ya existían (archivo
+    # anterior idéntico) y delta respecto a la exportación previa
+    content_hash: Optional[str] = None
+    duplicate_of: Dict[str, Path] = field(default_factory=dict)
+    delta_path: Optional[Path] = None
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        """
+        Espera a que termine la escritura (inmediato si no es en segundo plano)
+
+        Args:
+            timeout: Segundos máximos de espera
+
+        Returns:
+            Número de trabajos escritos
+
+        Raises:
+            Exception: La excepción de la escritura, si falló
+        """
+        if self.future is not None and self.count is None:
+            self.count = self.future.result(timeout)
+        return self.count
+
+    @property
+    def done(self) -> bool:
+        """True si la escritura ya terminó (con éxito o error)"""
+        return self.future is None or self.future.done()
+
+
+def _hard_link(existing: Path, path: Path) -> bool:
+    """Enlace duro path -> existing; False si el sistema de archivos no lo permite"""
+    try:
+        if path.exists():
+            if os.path.samefile(existing, path):
+                return True
+            path.unlink()
+        os.link(existing, path)
+        return True
+    except OSError as e:
+        logger.debug(f"No se pudo enlazar {path.name} a {existing.name}: {e}")
+        return False
+
+
+def _read_ids(path: Path) -> Iterator[str]:
+    """Recorre un archivo de job_id (uno por línea) sin cargarlo entero"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            yield line.rstrip('\n')
+
+
+def _log_background_error(future: "Future[int]") -> None:
+    """Registra el error de una exportación en segundo plano (nadie más lo ve)"""
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Exportación en segundo plano fallida: {error}")
+
 
 class ExportService:
     """Servicio para exportar datos a diferentes formatos"""
 
-    def __init__(self, output_dir: Union[str, Path] = "output"):
+    def __init__(
+        self,
+        output_dir: Union[str, Path] = "output",
+        seen_jobs: Optional[SeenJobs] = None,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        dedup: Optional[str] = None,
+        write_deltas: bool = False
+    ):
         """
         Args:
             output_dir: Directorio de salida
+            seen_jobs: Historial de trabajos ya exportados; con él, select_new
+                deja solo las filas nuevas y cada exportación completada
+                registra sus job_id (opcional)
+            compression: Compresión por defecto de las exportaciones de
+                trabajos: 'gzip', 'zstd' o None
+            compression_level: Nivel de compresión (por defecto, el de cada algoritmo)
+            dedup: Qué hacer si un formato ya se exportó con el mismo contenido:
+                'skip' (no escribir y devolver el archivo anterior), 'link'
+                (enlace duro al anterior con el nombre nuevo) o None (escribir)
+            write_deltas: Escribir un <base>_delta con los job_id añadidos y
+                eliminados desde la exportación anterior del mismo nombre base
+
+        Raises:
+            ValueError: Si la compresión o el modo de dedup no existen, o el
+                nivel no es válido para la compresión
         """
+        if compression is not None and compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Compresión no válida: {compression}")
+        check_compression_level(compression, compression_level)
+        if dedup not in (None, 'skip', 'link'):
+            raise ValueError(f"Modo de deduplicación no válido: {dedup}")
+
         self.output_dir = ensure_dir_exists(output_dir)
+        self.seen_jobs = seen_jobs
+        self._seen_lock = threading.Lock()
+        self.compression = compression
+        self.compression_level = compression_level
+        self.dedup = dedup
+        self.write_deltas = write_deltas
+        self.manifest = ExportManifest(self.output_dir) if dedup or write_deltas else None
+        self._executor: Optional[ThreadPoolExecutor] = None
         logger.debug(f"ExportService inicializado: {self.output_dir}")
 
-    def export_jobs_to_csv(self, jobs: List[Job], base_name: str) -> Path:
+    def select_new(self, jobs: List[JobLike]) -> List[JobLike]:
+        """
+        Deja solo los trabajos no exportados antes
+
+        Se llama una vez por resultado, antes de exportarlo en uno o varios
+        formatos. No marca nada: los job_id se registran cuando la
+        exportación termina bien, así que una escritura fallida (o en
+        segundo plano interrumpida) no los da por exportados. Sin historial
+        devuelve los trabajos tal cual.
+
+        El historial es un filtro de Bloom sin almacén que confirme los
+        positivos: con probabilidad error_rate, un trabajo nunca exportado se
+        toma por exportado y se omite sin aviso.
+
+        Args:
+            jobs: Trabajos a exportar
+
+        Returns:
+            Trabajos nuevos, en el orden original
+        """
+        if self.seen_jobs is None:
+            return jobs
+
+        with self._seen_lock:
+            new_jobs, _ = self.seen_jobs.split(jobs)
+        logger.info(f"Exportación incremental: {len(new_jobs)} trabajos nuevos de {len(jobs)}")
+        return new_jobs
+
+    def _mark_exported(self, ids_file: Optional[Path]) -> None:
+        """Registra en el historial los job_id (uno por línea) de una exportación completada"""
+        if self.seen_jobs is None or ids_file is None:
+            return
+        with self._seen_lock:
+            self.seen_jobs.add_many(_read_ids(ids_file))
+            self.seen_jobs.save()
+
+    def export_jobs_to_csv(self, jobs: Iterable[JobLike], base_name: str) -> Path:
         """
         Exporta trabajos a CSV
 
+        Las filas se escriben según llegan, así que jobs puede ser cualquier
+        iterable (ej: una búsqueda incremental o JobStore.iter_jobs()) y la
+        memoria no crece con el número de trabajos.
+
         Args:
-            jobs: Lista de trabajos
+            jobs: Trabajos (lista o iterable)
             base_name: Nombre base del archivo
 
         Returns:
@@ -47,56 +464,33 @@ class ExportService:
         Raises:
             Exception: Si hay error al escribir
         """
-        filename = generate_filename(base_name, "csv")
-        filepath = self.output_dir / filename
+        return self.export_many(jobs, base_name, ["csv"]).paths["csv"]
 
-        logger.info(f"Exportando {len(jobs)} trabajos a CSV: {filepath}")
-
-        try:
-            # Definir columnas
-            fieldnames = [
-                'job_id', 'title', 'employer_name', 'city', 'state', 'country',
-                'is_remote', 'employment_type', 'min_salary', 'max_salary',
-                'salary_currency', 'salary_period', 'description', 'apply_link',
-                'posted_at_datetime', 'job_publisher', 'required_experience',
-                'required_skills', 'required_education', 'benefits', 'google_link',
-                'expiration_datetime'
-            ]
-
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
-                writer.writeheader()
-
-                for job in jobs:
-                    # Convertir job a dict
-                    job_dict = job.model_dump()
-
-                    # Limpiar descripción
-                    if job_dict.get('description'):
-                        job_dict['description'] = job.get_short_description(500)
-
-                    # Convertir listas a strings
-                    if job_dict.get('required_skills') and isinstance(job_dict['required_skills'], list):
-                        job_dict['required_skills'] = ', '.join(job_dict['required_skills'])
+    def export_jobs_to_json(self, jobs: Iterable[JobLike], base_name: str) -> Path:
+        """
+        Exporta trabajos a JSON (array con indentación)
 
-                    if job_dict.get('benefits') and isinstance(job_dict['benefits'], list):
-                        job_dict['benefits'] = ', '.join(job_dict['benefits'])
+        El array se escribe elemento a elemento con el mismo formato que
+        json.dump(..., indent=2), sin construir antes la lista completa.
 
-                    writer.writerow(job_dict)
+        Args:
+            jobs: Trabajos (lista o iterable)
+            base_name: Nombre base del archivo
 
-            logger.info(f"CSV creado exitosamente: {filepath}")
-            return filepath
+        Returns:
+            Path del archivo creado
 
-        except Exception as e:
-            logger.error(f"Error exportando a CSV: {e}")
-            raise
+        Raises:
+            Exception: Si hay error al escribir
+        """
+        return self.export_many(jobs, base_name, ["json"]).paths["json"]
 
-    def export_jobs_to_json(self, jobs: List[Job], base_name: str) -> Path:
+    def export_jobs_to_jsonl(self, jobs: Iterable[JobLike], base_name: str) -> Path:
         """
-        Exporta trabajos a JSON
+        Exporta trabajos a JSON Lines (un objeto JSON por línea)
 
         Args:
-            jobs: Lista de trabajos
+            jobs: Trabajos (lista o iterable)
             base_name: Nombre base del archivo
 
         Returns:
@@ -105,25 +499,222 @@ class ExportService:
         Raises:
             Exception: Si hay error al escribir
         """
-        filename = generate_filename(base_name, "json")
-        filepath = self.output_dir / filename
+        return self.export_many(jobs, base_name, ["jsonl"]).paths["jsonl"]
+
+    def export_many(
+        self,
+        jobs: Iterable[JobLike],
+        base_name: str,
+        formats: Sequence[str] = ("csv", "json"),
+        background: bool = False,
+        compression: Optional[str] = None,
+        level: Optional[int] = None
+    ) -> ExportBatch:
+        """
+        Exporta los mismos trabajos a varios formatos en una sola pasada
 
-        logger.info(f"Exportando {len(jobs)} trabajos a JSON: {filepath}")
+        Cada trabajo se convierte a dict una única vez y ese dict se reparte
+        entre todos los formatos pedidos. Los nombres de archivo se fijan
+        antes de escribir, así que se conocen aunque la escritura siga en
+        segundo plano (con dedup='skip', paths puede apuntar al archivo
+        anterior cuando termina). Cada archivo se escribe en un .part y se
+        renombra al final.
 
-        try:
-            # Convertir jobs a dicts
-            jobs_data = [job.model_dump() for job in jobs]
+        Args:
+            jobs: Trabajos (lista o iterable)
+            base_name: Nombre base de los archivos
+            formats: Formatos de JOB_WRITERS (csv, json, jsonl)
+            background: Escribir en un hilo aparte y volver enseguida
+            compression: 'gzip' (.gz) o 'zstd' (.zst); por defecto la del servicio
+            level: Nivel de compresión; por defecto el del servicio
 
-            with open(filepath, 'w', encoding='utf-8') as jsonfile:
-                json.dump(jobs_data, jsonfile, ensure_ascii=False, indent=2)
+        Returns:
+            ExportBatch con la ruta de cada formato
 
-            logger.info(f"JSON creado exitosamente: {filepath}")
-            return filepath
+        Raises:
+            ValueError: Si algún formato o la compresión no existen, o el
+                nivel no es válido para la compresión
+            Exception: Si hay error al escribir (sin background)
+        """
+        formats = list(dict.fromkeys(formats))
+        unknown = [name for name in formats if name not in JOB_WRITERS]
+        if unknown or not formats:
+            raise ValueError(f"Formatos de exportación no válidos: {', '.join(unknown) or '(ninguno)'}")
+
+        compression = compression or self.compression
+        if compression is not None and compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Compresión no válida: {compression}")
+        level = level if level is not None else self.compression_level
+        check_compression_level(compression, level)
+        suffix = COMPRESSION_SUFFIXES.get(compression, "")
+
+        for name in formats:
+            JOB_WRITERS[name].check_available()
+
+        paths = {}
+        for name in formats:
+            writer_class = JOB_WRITERS[name]
+            extension = writer_class.extension + ("" if writer_class.internal_compression else suffix)
+            paths[name] = self.output_dir / generate_filename(base_name, extension)
+        batch = ExportBatch(paths=paths)
+
+        if background:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export")
+            batch.future = self._executor.submit(self._write_jobs, jobs, batch, base_name, compression, level)
+            batch.future.add_done_callback(_log_background_error)
+        else:
+            batch.count = self._write_jobs(jobs, batch, base_name, compression, level)
+        return batch
+
+    def _write_jobs(
+        self,
+        jobs: Iterable[JobLike],
+        batch: ExportBatch,
+        base_name: str,
+        compression: Optional[str] = None,
+        level: Optional[int] = None
+    ) -> int:
+        """Escribe los trabajos en todos los archivos; devuelve cuántos escribió"""
+        paths = dict(batch.paths)
+        parts = {name: path.with_name(path.name + ".part") for name, path in paths.items()}
+        names = ", ".join(path.name for path in paths.values())
+        logger.info(f"Exportando trabajos a {names}")
+
+        tracked = self.manifest is not None
+        hasher = hashlib.sha256()
+        # Los job_id van a un archivo según se escriben, no a una lista en memoria
+        ids_part: Optional[Path] = None
+        if tracked or self.seen_jobs is not None:
+            first = next(iter(parts.values()))
+            ids_part = first.with_name(first.name[:-len(".part")] + ".ids.part")
+
+        try:
+            count = 0
+            with ExitStack() as stack:
+                writers = [
+                    JOB_WRITERS[name].open(parts[name], compression, level, stack)
+                    for name in paths
+                ]
+                ids_out = stack.enter_context(open(ids_part, 'w', encoding='utf-8')) if ids_part else None
+
+                for job in jobs:
+                    job_dict = job.model_dump()
+                    for writer in writers:
+                        writer.write(job_dict)
+                    if tracked:
+                        # Mismos campos en el mismo orden: dicts iguales dan el mismo repr.
+                        # model_dump() omite is_new, así que el hash solo depende del trabajo
+                        hasher.update(repr(job_dict).encode('utf-8'))
+                        hasher.update(b'\n')
+                    if ids_out is not None:
+                        ids_out.write(job_dict['job_id'])
+                        ids_out.write('\n')
+                    count += 1
+
+                for writer in writers:
+                    writer.close()
 
         except Exception as e:
-            logger.error(f"Error exportando a JSON: {e}")
+            for part in (*parts.values(), ids_part):
+                if part is not None:
+                    part.unlink(missing_ok=True)
+            logger.error(f"Error exportando trabajos: {e}")
             raise
 
+        if tracked:
+            ids_file = self._finish_tracked(batch, base_name, parts, hasher.hexdigest(), count, ids_part)
+            self._mark_exported(ids_file)
+        else:
+            for name, part in parts.items():
+                os.replace(part, paths[name])
+            self._mark_exported(ids_part)
+            if ids_part is not None:
+                ids_part.unlink()
+
+        logger.info(f"Exportación completada: {names} ({count} trabajos)")
+        return count
+
+    def _finish_tracked(
+        self,
+        batch: ExportBatch,
+        base_name: str,
+        parts: Dict[str, Path],
+        content_hash: str,
+        count: int,
+        ids_part: Path
+    ) -> Path:
+        """
+        Deduplica contra el manifiesto, escribe el delta y registra la exportación
+
+        Returns:
+            Archivo definitivo con los job_id exportados
+        """
+        previous = self.manifest.previous(base_name)
+        files: Dict[str, Path] = {}
+
+        for name, part in parts.items():
+            path = batch.paths[name]
+            extension = path.name.split('.', 1)[1]
+            existing = self.manifest.find(content_hash, extension) if self.dedup else None
+
+            if existing is not None and (self.dedup == 'skip' or _hard_link(existing, path)):
+                part.unlink()
+                batch.duplicate_of[name] = existing
+                if self.dedup == 'skip':
+                    batch.paths[name] = existing
+                logger.info(f"Contenido idéntico a {existing.name}: no se vuelve a escribir")
+                files[extension] = existing
+            else:
+                os.replace(part, path)
+                files[extension] = path
+
+        batch.content_hash = content_hash
+        if self.write_deltas and previous is not None and previous['hash'] != content_hash:
+            previous_ids = self.manifest.job_ids(previous['hash'])
+            if previous_ids is not None:
+                batch.delta_path = self._write_delta(
+                    base_name, previous, previous_ids, count, _read_ids(ids_part)
+                )
+
+        ids_file = self.manifest.store_ids(content_hash, ids_part)
+        self.manifest.record(base_name, content_hash, count, files)
+        return ids_file
+
+    def _write_delta(
+        self,
+        base_name: str,
+        previous: Dict[str, Any],
+        previous_ids: List[str],
+        count: int,
+        job_ids: Iterable[str]
+    ) -> Path:
+        """Escribe los job_id añadidos y eliminados desde la exportación anterior"""
+        delta = job_id_delta(previous_ids, job_ids)
+        filepath = self.output_dir / generate_filename(f"{base_name}_delta", "json")
+        data = {
+            'base_name': base_name,
+            'previous_export': previous['created'],
+            'previous_count': previous['count'],
+            'count': count,
+            'added': delta['added'],
+            'removed': delta['removed'],
+        }
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+        logger.info(
+            f"Delta de '{base_name}': {len(delta['added'])} añadidos, "
+            f"{len(delta['removed'])} eliminados ({filepath.name})"
+        )
+        return filepath
+
+    def wait(self) -> None:
+        """Espera a que terminen las exportaciones en segundo plano"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def export_salaries_to_json(self, salaries: List[SalaryInfo], base_name: str) -> Path:
         """
         Exporta información salarial a JSON
@@ -193,3 +784,124 @@ class ExportService:
         except Exception as e:
             logger.error(f"Error exportando salarios a CSV: {e}")
             raise
+
+
+def _export_format(file_path: Union[str, Path]) -> str:
+    """Formato de un archivo exportado, sin la extensión de compresión"""
+    path = Path(file_path)
+    if compression_from_path(path) is not None:
+        path = path.with_suffix('')
+    extension = path.suffix.lstrip('.')
+    if extension not in JOB_WRITERS:
+        raise ValueError(f"Formato de exportación desconocido: {file_path}")
+    return extension
+
+
+def iter_export_rows(file_path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Lee un archivo exportado descomprimiéndolo sobre la marcha
+
+    Acepta .csv, .json y .jsonl, comprimidos o no (.gz, .zst), y .parquet.
+    CSV, JSON Lines y Parquet se leen por filas o lotes; un array JSON se
+    carga completo.
+
+    Args:
+        file_path: Archivo exportado
+
+    Yields:
+        Cada fila como dict (en CSV, con los valores como texto)
+
+    Raises:
+        ValueError: Si la extensión no corresponde a una exportación
+    """
+    export_format = _export_format(file_path)
+    if export_format == 'parquet':
+        yield from _iter_parquet_rows(file_path)
+        return
+    newline = JOB_WRITERS[export_format].newline
+
+    with open_compressed(file_path, 'rt', newline=newline) as f:
+        if export_format == 'csv':
+            yield from csv.DictReader(f)
+        elif export_format == 'jsonl':
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from json.load(f)
+
+
+def iter_exported_jobs(file_path: Union[str, Path]) -> Iterator[Job]:
+    """
+    Lee los trabajos de una exportación JSON o JSON Lines (comprimida o no)
+
+    Args:
+        file_path: Archivo exportado (.json, .jsonl, con .gz o .zst
+            opcional, o .parquet)
+
+    Yields:
+        Job con los mismos campos que al exportarlo
+
+    Raises:
+        ValueError: Si es un CSV (sus columnas no conservan todos los campos)
+    """
+    if _export_format(file_path) == 'csv':
+        raise ValueError("El CSV no conserva todos los campos; usa iter_export_rows")
+    for row in iter_export_rows(file_path):
+        yield Job.model_validate(row)
+
+
+def read_parquet(
+    source: Union[str, Path, Sequence[Union[str, Path]]],
+    columns: Optional[Sequence[str]] = None
+) -> "pa.Table":
+    """
+    Lee una o varias exportaciones Parquet cargando solo las columnas pedidas
+
+    Las columnas no pedidas (ej: description) no se leen del disco.
+
+    Args:
+        source: Archivo, lista de archivos o directorio con exportaciones
+        columns: Columnas a leer (por defecto, todas)
+
+    Returns:
+        Tabla Arrow con el esquema de job_arrow_schema()
+
+    Raises:
+        ValueError: Si pyarrow no está instalado
+    """
+    _ParquetJobWriter.check_available()
+    if isinstance(source, (str, Path)):
+        source = str(source)
+    else:
+        source = [str(path) for path in source]
+    return pq.read_table(source, columns=list(columns) if columns is not None else None)
+
+
+def iter_parquet_jobs(file_path: Union[str, Path], batch_size: int = PARQUET_ROW_GROUP_SIZE) -> Iterator[Job]:
+    """
+    Reconstruye los trabajos de una exportación Parquet por lotes
+
+    Args:
+        file_path: Archivo Parquet
+        batch_size: Filas leídas por lote
+
+    Yields:
+        Job con los mismos campos que al exportarlo
+
+    Raises:
+        ValueError: Si pyarrow no está instalado
+    """
+    for row in _iter_parquet_rows(file_path, batch_size):
+        yield Job.model_validate(row)
+
+
+def _iter_parquet_rows(file_path: Union[str, Path], batch_size: int = PARQUET_ROW_GROUP_SIZE) -> Iterator[Dict[str, Any]]:
+    """Filas de un Parquet como dict, con las columnas JSON ya decodificadas"""
+    _ParquetJobWriter.check_available()
+    for batch in pq.ParquetFile(file_path).iter_batches(batch_size=batch_size):
+        for row in batch.to_pylist():
+            for name in PARQUET_JSON_COLUMNS:
+                if row.get(name) is not None:
+                    row[name] = json.loads(row[name])
+            yield row
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: job_dedup.py
+Descripción: Detección de ofertas casi duplicadas publicadas en varios publishers
+             con MinHash y LSH por bandas. Agrupa los duplicados en tiempo
+             aproximadamente lineal y conserva un trabajo canónico por grupo
+             con los enlaces de postulación alternativos.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import logging
+import re
+import unicodedata
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import numpy as np
+from src.models.job_record import JobLike, JobRecord
+
+logger = logging.getLogger(__name__)
+
+# Hash multiply-shift: los 32 bits altos de (a*x + b) mod 2^64, con a impar
+_SHIFT = np.uint64(32)
+
+# Constante impar para combinar hashes de palabras en n-gramas
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+# Tope de palabras distintas en la caché de hashes
+_WORD_CACHE_SIZE = 500_000
+
+
+class _WordHashes(dict):
+    """Caché palabra -> CRC32; las palabras se repiten mucho entre descripciones"""
+
+    def __missing__(self, word: str) -> int:
+        if len(self) >= _WORD_CACHE_SIZE:
+            self.clear()
+        value = self[word] = zlib.crc32(word.encode('utf-8'))
+        return value
+
+
+_WORD_HASHES = _WordHashes()
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """
+    Normaliza un texto para comparar ofertas
+
+    Minúsculas, sin tildes ni signos de puntuación y con espacios simples.
+
+    Args:
+        text: Texto original
+
+    Returns:
+        Texto normalizado ("" si no hay texto)
+    """
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    ascii_text = decomposed.encode('ascii', 'ignore').decode('ascii')
+    return _NON_WORD.sub(' ', ascii_text).strip()
+
+
+def ngram_hashes(text: str, size: int = 3) -> np.ndarray:
+    """
+    Hashes de los n-gramas de palabras de un texto normalizado
+
+    Cada palabra se hashea con CRC32 (con caché) y los n-gramas se combinan con
+    NumPy; un texto con menos de size palabras produce un único hash.
+
+    Args:
+        text: Texto normalizado
+        size: Palabras por n-grama
+
+    Returns:
+        Array uint64 (vacío si no hay palabras)
+    """
+    words = np.array(list(map(_WORD_HASHES.__getitem__, text.split())), dtype=np.uint64)
+    size = min(size, len(words))
+    if size == 0:
+        return words
+
+    count = len(words) - size + 1
+    combined = words[:count].copy()
+    for k in range(1, size):
+        combined *= _MIX
+        combined ^= words[k:k + count]
+    return combined
+
+
+def job_feature_hashes(job: JobLike, size: int = 3) -> np.ndarray:
+    """
+    Rasgos de un trabajo para MinHash
+
+    Título, empresa y ubicación normalizados como rasgos completos, más los
+    n-gramas de palabras del título y de la descripción normalizados.
+
+    Args:
+        job: Trabajo
+        size: Palabras por n-grama
+
+    Returns:
+        Array uint64 de hashes (puede contener repetidos)
+    """
+    title = normalize_text(job.title)
+    fields = np.array([
+        zlib.crc32(f"title:{title}".encode('utf-8')),
+        zlib.crc32(f"employer:{normalize_text(job.employer_name)}".encode('utf-8')),
+        zlib.crc32(f"location:{normalize_text(job.get_location())}".encode('utf-8')),
+    ], dtype=np.uint64)
+    return np.concatenate((
+        fields,
+        ngram_hashes(title, size),
+        ngram_hashes(normalize_text(job.description), size),
+    ))
+
+
+@dataclass
+class DedupResult:
+    """Resultado de colapsar duplicados"""
+    jobs: List[JobLike]
+    duplicates: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def removed(self) -> int:
+        """Número de trabajos colapsados en otro"""
+        return len(self.duplicates)
+
+
+class JobDeduplicator:
+    """
+    Agrupa ofertas casi idénticas con MinHash + LSH
+
+    Cada trabajo se resume en una firma de num_perm mínimos. Dos trabajos
+    son candidatos si coinciden en alguna banda completa de la firma, y se
+    confirman como duplicados si la similitud de Jaccard estimada alcanza
+    threshold y la empresa normalizada coincide con la del grupo del otro
+    (cuando ambas existen).
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 3,
+        seed: int = 1
+    ):
+        """
+        Args:
+            threshold: Similitud de Jaccard mínima para considerar duplicados
+            num_perm: Número de funciones hash de la firma
+            bands: Bandas LSH (num_perm debe ser múltiplo)
+            shingle_size: Palabras por n-grama
+            seed: Semilla de las permutaciones (firmas comparables con la misma)
+
+        Raises:
+            ValueError: Si num_perm no es múltiplo de bands
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm debe ser múltiplo de bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(0, 1 << 63, size=(num_perm, 1), dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.randint(0, 1 << 63, size=(num_perm, 1), dtype=np.uint64)
+
+    def signature(self, job: JobLike) -> np.ndarray:
+        """
+        Firma MinHash de un trabajo
+
+        Args:
+            job: Trabajo
+
+        Returns:
+            Array uint32 de num_perm valores
+        """
+        hashes = job_feature_hashes(job, self.shingle_size)
+        # La multiplicación desborda a propósito (aritmética módulo 2^64)
+        permuted = self._a * hashes
+        permuted += self._b
+        permuted >>= _SHIFT
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        """Clave de cada banda de la firma"""
+        return [
+            (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def find_clusters(self, jobs: Iterable[JobLike]) -> List[List[int]]:
+        """
+        Agrupa los trabajos casi duplicados
+
+        Recorre los trabajos una sola vez y conserva solo su firma, así que
+        acepta un iterador sobre todo el historial (ver
+        JobService.collapse_saved_duplicates) sin cargarlo en memoria.
+
+        Cada grupo tiene a lo sumo una empresa: un trabajo sin empresa puede
+        unirse a cualquier grupo, pero dos grupos con empresas distintas no
+        se unen nunca, ni siquiera a través de él.
+
+        Args:
+            jobs: Trabajos
+
+        Returns:
+            Grupos de posiciones (cada grupo en orden de entrada, los grupos
+            por su primer elemento); los trabajos sin duplicados forman grupo propio
+        """
+        parent: List[int] = []
+        # Empresa normalizada de cada grupo, por raíz ("" si ninguna)
+        cluster_employer: Dict[int, str] = {}
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        buckets: Dict[Tuple[int, bytes], List[int]] = defaultdict(list)
+        signatures: List[np.ndarray] = []
+
+        for i, job in enumerate(jobs):
+            parent.append(i)
+            cluster_employer[i] = normalize_text(job.employer_name)
+            signature = self.signature(job)
+            signatures.append(signature)
+
+            candidates: Set[int] = set()
+            for key in self._band_keys(signature):
+                bucket = buckets[key]
+                candidates.update(bucket)
+                bucket.append(i)
+
+            for j in sorted(candidates):
+                root_i, root_j = find(i), find(j)
+                if root_i == root_j:
+                    continue
+                employer_i, employer_j = cluster_employer[root_i], cluster_employer[root_j]
+                if employer_i and employer_j and employer_i != employer_j:
+                    continue
+                if np.count_nonzero(signature == signatures[j]) >= self.threshold * self.num_perm:
+                    parent[root_i] = root_j
+                    cluster_employer[root_j] = employer_j or employer_i
+                    del cluster_employer[root_i]
+
+        clusters: Dict[int, List[int]] = {}
+        for i in range(len(parent)):
+            clusters.setdefault(find(i), []).append(i)
+        return sorted(clusters.values(), key=lambda members: members[0])
+
+    @staticmethod
+    def merge(group: List[JobLike]) -> Tuple[JobLike, List[JobLike]]:
+        """
+        Elige el canónico de un grupo de duplicados y le añade los enlaces del resto
+
+        El canónico es el trabajo más completo del grupo (enlace de
+        postulación, salario, descripción más larga) y recibe en
+        alternate_apply_links los enlaces de los demás.
+
+        Args:
+            group: Trabajos de un mismo grupo
+
+        Returns:
+            Tupla (canónico con los enlaces combinados, resto del grupo)
+        """
+        canonical = max(group, key=_completeness)
+        others = [job for job in group if job is not canonical]
+        return _merge_links(canonical, group), others
+
+    def collapse(self, jobs: Iterable[JobLike]) -> DedupResult:
+        """
+        Colapsa cada grupo de duplicados en un trabajo canónico (ver merge)
+
+        El canónico ocupa la posición del primer trabajo del grupo.
+
+        Args:
+            jobs: Trabajos (Job o JobRecord)
+
+        Returns:
+            DedupResult con los trabajos únicos y el canónico de cada duplicado
+        """
+        jobs = list(jobs)
+        result = DedupResult(jobs=[])
+
+        for members in self.find_clusters(jobs):
+            if len(members) == 1:
+                result.jobs.append(jobs[members[0]])
+                continue
+
+            canonical, others = self.merge([jobs[i] for i in members])
+            result.jobs.append(canonical)
+            for job in others:
+                result.duplicates[job.job_id] = canonical.job_id
+
+        if result.removed:
+            logger.info(f"Colapsados {result.removed} duplicados de {len(jobs)} trabajos")
+        return result
+
+
+def _completeness(job: JobLike) -> Tuple[bool, bool, int]:
+    """Prioridad para elegir el canónico de un grupo (max() conserva el primero en empate)"""
+    return (
+        bool(job.apply_link),
+        bool(job.min_salary or job.max_salary),
+        len(job.description or ""),
+    )
+
+
+def _merge_links(canonical: JobLike, group: List[JobLike]) -> JobLike:
+    """Copia del canónico con los enlaces de postulación del resto del grupo"""
+    links: List[str] = []
+    seen = {canonical.apply_link, *canonical.alternate_apply_links}
+    for job in group:
+        for link in (job.apply_link, *job.alternate_apply_links):
+            if link and link not in seen:
+                seen.add(link)
+                links.append(link)
+
+    if not links:
+        return canonical
+    links = list(canonical.alternate_apply_links) + links
+    if isinstance(canonical, JobRecord):
+        return JobRecord(**dict(canonical.model_dump(), alternate_apply_links=links))
+    return canonical.model_copy(update={'alternate_apply_links': links})
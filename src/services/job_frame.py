@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: job_frame.py
+Descripción: Vista columnar de trabajos sobre arrays NumPy para filtrar, ordenar
+             y agregar de forma vectorizada grandes volúmenes de resultados,
+             conservando la referencia a cada trabajo completo.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+import numpy as np
+from src.models.job_record import JobLike
+
+logger = logging.getLogger(__name__)
+
+# Valor de posted_at cuando el trabajo no tiene timestamp
+MISSING_TIMESTAMP = np.iinfo(np.int64).min
+
+# Columnas categóricas y numéricas disponibles para agrupar/agregar
+CATEGORICAL_COLUMNS = ('currency', 'period', 'employment_type', 'employer', 'city')
+NUMERIC_COLUMNS = ('min_salary', 'max_salary', 'salary', 'latitude', 'longitude')
+
+
+class Categorical:
+    """Columna categórica: códigos int32 sobre una lista de categorías (-1 = sin valor)"""
+
+    def __init__(self, codes: np.ndarray, categories: List[str]):
+        self.codes = codes
+        self.categories = categories
+        self._index = {value: code for code, value in enumerate(categories)}
+
+    @classmethod
+    def from_values(cls, values: Sequence[Optional[str]]) -> "Categorical":
+        """Codifica una secuencia de textos (None o vacío = sin valor)"""
+        index: Dict[str, int] = {}
+        codes = np.fromiter(
+            (index.setdefault(v, len(index)) if v else -1 for v in values),
+            dtype=np.int32,
+            count=len(values)
+        )
+        return cls(codes, list(index))
+
+    def isin(self, values: Iterable[str], casefold: bool = False) -> np.ndarray:
+        """
+        Máscara de filas cuyo valor está en values
+
+        Args:
+            values: Valores buscados
+            casefold: Si comparar sin distinguir mayúsculas
+
+        Returns:
+            Array booleano por fila
+        """
+        if casefold:
+            folded = {v.casefold() for v in values}
+            wanted = [code for code, c in enumerate(self.categories) if c.casefold() in folded]
+        else:
+            wanted = [self._index[v] for v in values if v in self._index]
+        return np.isin(self.codes, wanted)
+
+    def take(self, indices: np.ndarray) -> "Categorical":
+        """Subconjunto de filas (las categorías se comparten)"""
+        return Categorical(self.codes[indices], self.categories)
+
+    def labels(self) -> List[Optional[str]]:
+        """Valores de texto por fila"""
+        return [self.categories[c] if c >= 0 else None for c in self.codes]
+
+
+class JobFrame:
+    """
+    Columnas NumPy de un conjunto de trabajos con referencia a cada fila
+
+    Columnas: min_salary, max_salary, latitude, longitude (float64, NaN si
+    falta), posted_at (int64, MISSING_TIMESTAMP si falta), is_remote (bool)
+    y currency, period, employment_type, employer, city (categóricas).
+    """
+
+    def __init__(
+        self,
+        jobs: List[JobLike],
+        min_salary: np.ndarray,
+        max_salary: np.ndarray,
+        posted_at: np.ndarray,
+        is_remote: np.ndarray,
+        latitude: np.ndarray,
+        longitude: np.ndarray,
+        currency: Categorical,
+        period: Categorical,
+        employment_type: Categorical,
+        employer: Categorical,
+        city: Categorical
+    ):
+        self.jobs = jobs
+        self.min_salary = min_salary
+        self.max_salary = max_salary
+        self.posted_at = posted_at
+        self.is_remote = is_remote
+        self.latitude = latitude
+        self.longitude = longitude
+        self.currency = currency
+        self.period = period
+        self.employment_type = employment_type
+        self.employer = employer
+        self.city = city
+
+    @classmethod
+    def from_jobs(cls, jobs: Iterable[JobLike]) -> "JobFrame":
+        """
+        Construye las columnas recorriendo los trabajos una sola vez
+
+        Args:
+            jobs: Trabajos (Job o JobRecord)
+
+        Returns:
+            JobFrame con una fila por trabajo, en el mismo orden
+        """
+        jobs = list(jobs)
+        n = len(jobs)
+
+        def floats(attr: str) -> np.ndarray:
+            return np.fromiter(
+                (v if v is not None else np.nan for v in (getattr(j, attr) for j in jobs)),
+                dtype=np.float64,
+                count=n
+            )
+
+        frame = cls(
+            jobs=jobs,
+            min_salary=floats('min_salary'),
+            max_salary=floats('max_salary'),
+            posted_at=np.fromiter(
+                (j.posted_at_timestamp if j.posted_at_timestamp is not None else MISSING_TIMESTAMP
+                 for j in jobs),
+                dtype=np.int64,
+                count=n
+            ),
+            is_remote=np.fromiter((bool(j.is_remote) for j in jobs), dtype=bool, count=n),
+            latitude=floats('latitude'),
+            longitude=floats('longitude'),
+            currency=Categorical.from_values([j.salary_currency for j in jobs]),
+            period=Categorical.from_values([j.salary_period for j in jobs]),
+            employment_type=Categorical.from_values([j.employment_type for j in jobs]),
+            employer=Categorical.from_values([j.employer_name for j in jobs]),
+            city=Categorical.from_values([j.city for j in jobs])
+        )
+        logger.debug(f"JobFrame construido con {n} trabajos")
+        return frame
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    # ------------------------------------------------------------------
+    # Máscaras
+    # ------------------------------------------------------------------
+
+    def remote_mask(self) -> np.ndarray:
+        """Máscara de trabajos remotos"""
+        return self.is_remote.copy()
+
+    def salary_mask(self, min_salary: float, currency: str = "USD") -> np.ndarray:
+        """
+        Máscara equivalente a JobService.filter_by_salary
+
+        Args:
+            min_salary: Salario mínimo
+            currency: Moneda
+
+        Returns:
+            Filas con min_salary informado (distinto de 0), en la moneda
+            indicada y >= min_salary
+        """
+        values = self.min_salary
+        with np.errstate(invalid='ignore'):
+            return (
+                ~np.isnan(values)
+                & (values != 0)
+                & self.currency.isin([currency])
+                & (values >= min_salary)
+            )
+
+    def posted_after_mask(self, timestamp: int) -> np.ndarray:
+        """Máscara de trabajos publicados en o después de timestamp"""
+        return self.posted_at >= timestamp
+
+    def employment_type_mask(self, types: Iterable[str]) -> np.ndarray:
+        """Máscara de trabajos con alguno de los tipos de empleo indicados"""
+        return self.employment_type.isin(types)
+
+    def has_salary_mask(self) -> np.ndarray:
+        """Máscara de trabajos con algún salario informado"""
+        return self.salary_key() != 0
+
+    # ------------------------------------------------------------------
+    # Selección y orden
+    # ------------------------------------------------------------------
+
+    def take(self, indices: Union[np.ndarray, Sequence[int]]) -> "JobFrame":
+        """
+        Nuevo frame con las filas indicadas, en ese orden
+
+        Args:
+            indices: Posiciones de fila
+
+        Returns:
+            JobFrame con las filas seleccionadas
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        return JobFrame(
+            jobs=[self.jobs[i] for i in indices],
+            min_salary=self.min_salary[indices],
+            max_salary=self.max_salary[indices],
+            posted_at=self.posted_at[indices],
+            is_remote=self.is_remote[indices],
+            latitude=self.latitude[indices],
+            longitude=self.longitude[indices],
+            currency=self.currency.take(indices),
+            period=self.period.take(indices),
+            employment_type=self.employment_type.take(indices),
+            employer=self.employer.take(indices),
+            city=self.city.take(indices)
+        )
+
+    def where(self, mask: np.ndarray) -> "JobFrame":
+        """Nuevo frame con las filas donde mask es True"""
+        return self.take(np.flatnonzero(mask))
+
+    def salary_key(self) -> np.ndarray:
+        """
+        Clave de orden por salario, como JobService.sort_by_salary
+
+        Returns:
+            max_salary si está informado (y no es 0), si no min_salary, si no 0
+        """
+        max_salary = np.nan_to_num(self.max_salary, nan=0.0)
+        min_salary = np.nan_to_num(self.min_salary, nan=0.0)
+        return np.where(max_salary != 0, max_salary, min_salary)
+
+    def argsort_salary(self, descending: bool = True) -> np.ndarray:
+        """
+        Índices ordenados por salario (orden estable, empates en orden original)
+
+        Args:
+            descending: Si ordenar descendente
+
+        Returns:
+            Posiciones de fila ordenadas
+        """
+        key = self.salary_key()
+        return np.argsort(-key if descending else key, kind='stable')
+
+    def sort_by_salary(self, descending: bool = True) -> "JobFrame":
+        """Nuevo frame ordenado por salario"""
+        return self.take(self.argsort_salary(descending))
+
+    def top_k_salary(self, k: int, descending: bool = True) -> np.ndarray:
+        """
+        Índices de las k filas con mayor (o menor) salario
+
+        Usa argpartition en lugar de ordenar todo; el resultado coincide con
+        los k primeros de argsort_salary, incluidos los empates.
+
+        Args:
+            k: Número de filas
+            descending: Mayores salarios primero
+
+        Returns:
+            Posiciones de fila ordenadas
+        """
+        n = len(self)
+        k = max(0, min(k, n))
+        if k == 0:
+            return np.empty(0, dtype=np.intp)
+
+        key = self.salary_key()
+        score = -key if descending else key
+
+        # Umbral del k-ésimo valor; se conservan todos los empates y se
+        # resuelven en orden original con un sort estable sobre pocos elementos
+        threshold = score[np.argpartition(score, k - 1)[k - 1]]
+        candidates = np.flatnonzero(score <= threshold)
+        order = np.argsort(score[candidates], kind='stable')
+        return candidates[order][:k]
+
+    def rows(self, indices: Optional[Iterable[int]] = None) -> List[JobLike]:
+        """
+        Trabajos completos de las filas indicadas (todas si None)
+
+        Args:
+            indices: Posiciones de fila
+
+        Returns:
+            Lista de trabajos
+        """
+        if indices is None:
+            return list(self.jobs)
+        return [self.jobs[i] for i in indices]
+
+    # ------------------------------------------------------------------
+    # Agregados
+    # ------------------------------------------------------------------
+
+    def _numeric(self, column: str) -> np.ndarray:
+        if column not in NUMERIC_COLUMNS:
+            raise ValueError(f"Columna numérica no válida: {column}")
+        if column == 'salary':
+            key = self.salary_key()
+            return np.where(key != 0, key, np.nan)
+        return getattr(self, column)
+
+    def group_by(self, by: str, value: str = 'salary') -> Dict[Any, Dict[str, float]]:
+        """
+        Estadísticas de una columna numérica agrupadas por una categórica
+
+        Args:
+            by: Columna de agrupación (currency, period, employment_type,
+                employer, city o is_remote)
+            value: Columna numérica (min_salary, max_salary, salary, latitude, longitude)
+
+        Returns:
+            {grupo: {count, with_value, mean, median, min, max}}; las
+            estadísticas ignoran valores ausentes (NaN si el grupo no tiene)
+
+        Raises:
+            ValueError: Si alguna columna no es válida
+        """
+        if by == 'is_remote':
+            codes = self.is_remote.astype(np.int32)
+            labels: List[Any] = [False, True]
+        elif by in CATEGORICAL_COLUMNS:
+            column = getattr(self, by)
+            codes = column.codes
+            labels = column.categories
+        else:
+            raise ValueError(f"Columna de agrupación no válida: {by}")
+
+        values = self._numeric(value)
+        present = codes >= 0
+        codes, values = codes[present], values[present]
+
+        counts = np.bincount(codes, minlength=len(labels))
+        has_value = ~np.isnan(values)
+        g, v = codes[has_value], values[has_value]
+        with_value = np.bincount(g, minlength=len(labels))
+        sums = np.bincount(g, weights=v, minlength=len(labels))
+
+        # Orden por (grupo, valor): cada grupo queda contiguo y ordenado
+        order = np.lexsort((v, g))
+        g_sorted, v_sorted = g[order], v[order]
+        starts = np.searchsorted(g_sorted, np.arange(len(labels)), side='left')
+
+        stats: Dict[Any, Dict[str, float]] = {}
+        for code, label in enumerate(labels):
+            count = int(counts[code])
+            if count == 0:
+                continue
+            m = int(with_value[code])
+            if m:
+                group_values = v_sorted[starts[code]:starts[code] + m]
+                stats[label] = {
+                    'count': count,
+                    'with_value': m,
+                    'mean': float(sums[code] / m),
+                    'median': float(np.median(group_values)),
+                    'min': float(group_values[0]),
+                    'max': float(group_values[-1]),
+                }
+            else:
+                stats[label] = {
+                    'count': count,
+                    'with_value': 0,
+                    'mean': float('nan'),
+                    'median': float('nan'),
+                    'min': float('nan'),
+                    'max': float('nan'),
+                }
+        return stats
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: job_query.py
+Descripción: Constructor de consultas sobre trabajos ya obtenidos. Compila todos
+             los filtros en un único predicado evaluado en una sola pasada,
+             usa top-k con heap cuando hay límite y aprovecha las columnas de
+             un JobFrame cuando se consulta sobre él.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import heapq
+import logging
+from dataclasses import dataclass, replace
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+import numpy as np
+from src.models.job_record import JobLike
+from src.services.job_frame import JobFrame
+
+logger = logging.getLogger(__name__)
+
+Predicate = Callable[[JobLike], bool]
+
+
+def salary_key(job: JobLike) -> float:
+    """Clave de salario de JobService.sort_by_salary: max, si no min, si no 0"""
+    return job.max_salary or job.min_salary or 0
+
+
+# Claves de orden disponibles; None se ordena siempre al final
+SORT_KEYS: Dict[str, Callable[[JobLike], Optional[float]]] = {
+    'salary': salary_key,
+    'min_salary': lambda job: job.min_salary,
+    'max_salary': lambda job: job.max_salary,
+    'posted_at': lambda job: job.posted_at_timestamp,
+}
+
+
+def _folded(values: Iterable[str]) -> FrozenSet[str]:
+    return frozenset(v.casefold() for v in values if v)
+
+
+@dataclass(frozen=True)
+class JobQuery:
+    """
+    Consulta inmutable sobre una colección de trabajos
+
+    Cada método devuelve una consulta nueva, por lo que una consulta base
+    puede reutilizarse. Los textos (empresa, ciudad, tipo de empleo y
+    skills) se comparan sin distinguir mayúsculas.
+
+    Ejemplo:
+        JobQuery().remote().has_salary().order_by('salary').limit(20).run(jobs)
+    """
+    employers: Optional[FrozenSet[str]] = None
+    cities: Optional[FrozenSet[str]] = None
+    employment_types: Optional[FrozenSet[str]] = None
+    posted_after_ts: Optional[int] = None
+    salary_required: bool = False
+    min_salary_filter: Optional[Tuple[float, str]] = None
+    skills: FrozenSet[str] = frozenset()
+    remote_filter: Optional[bool] = None
+    sort_keys: Tuple[Tuple[str, bool], ...] = ()
+    max_results: Optional[int] = None
+
+    # ------------------------------------------------------------------
+    # Constructor
+    # ------------------------------------------------------------------
+
+    def employer_in(self, *employers: str) -> "JobQuery":
+        """Trabajos de alguna de las empresas indicadas"""
+        return replace(self, employers=_folded(employers))
+
+    def city(self, *cities: str) -> "JobQuery":
+        """Trabajos en alguna de las ciudades indicadas"""
+        return replace(self, cities=_folded(cities))
+
+    def employment_type(self, *types: str) -> "JobQuery":
+        """Trabajos con alguno de los tipos de empleo (FULLTIME, CONTRACTOR...)"""
+        return replace(self, employment_types=_folded(types))
+
+    def posted_after(self, when: Union[int, float, datetime]) -> "JobQuery":
+        """
+        Trabajos publicados en o después de when
+
+        Args:
+            when: Timestamp Unix o datetime
+
+        Returns:
+            Nueva consulta
+        """
+        if isinstance(when, datetime):
+            when = when.timestamp()
+        return replace(self, posted_after_ts=int(when))
+
+    def has_salary(self) -> "JobQuery":
+        """Trabajos con salario mínimo o máximo informado"""
+        return replace(self, salary_required=True)
+
+    def min_salary(self, amount: float, currency: str = "USD") -> "JobQuery":
+        """Trabajos con min_salary >= amount en la moneda indicada (como filter_by_salary)"""
+        return replace(self, min_salary_filter=(amount, currency))
+
+    def skills_contain(self, *skills: str) -> "JobQuery":
+        """Trabajos cuyas required_skills incluyen todas las indicadas"""
+        return replace(self, skills=self.skills | _folded(skills))
+
+    def remote(self, is_remote: bool = True) -> "JobQuery":
+        """Solo trabajos remotos (o solo presenciales con is_remote=False)"""
+        return replace(self, remote_filter=is_remote)
+
+    def order_by(self, key: str, descending: bool = True) -> "JobQuery":
+        """
+        Añade una clave de orden; las siguientes desempatan a las anteriores
+
+        Args:
+            key: Una de SORT_KEYS
+            descending: Si ordenar descendente
+
+        Returns:
+            Nueva consulta
+
+        Raises:
+            ValueError: Si la clave no existe
+        """
+        if key not in SORT_KEYS:
+            raise ValueError(f"Clave de orden no válida: {key}")
+        return replace(self, sort_keys=self.sort_keys + ((key, descending),))
+
+    def limit(self, count: int) -> "JobQuery":
+        """
+        Limita el número de resultados
+
+        Raises:
+            ValueError: Si count es negativo
+        """
+        if count < 0:
+            raise ValueError("El límite no puede ser negativo")
+        return replace(self, max_results=count)
+
+    # ------------------------------------------------------------------
+    # Compilación
+    # ------------------------------------------------------------------
+
+    def _row_checks(self, vectorised: bool = False) -> List[Predicate]:
+        """
+        Comprobaciones por trabajo, de la más barata a la más cara
+
+        Args:
+            vectorised: Omitir las que ya resuelven las columnas de un JobFrame
+
+        Returns:
+            Lista de predicados
+        """
+        checks: List[Predicate] = []
+
+        if not vectorised:
+            if self.remote_filter is not None:
+                remote = self.remote_filter
+                checks.append(lambda job: bool(job.is_remote) == remote)
+            if self.posted_after_ts is not None:
+                cutoff = self.posted_after_ts
+                checks.append(
+                    lambda job: job.posted_at_timestamp is not None and job.posted_at_timestamp >= cutoff
+                )
+            if self.salary_required:
+                checks.append(lambda job: bool(job.max_salary or job.min_salary))
+            if self.min_salary_filter is not None:
+                amount, currency = self.min_salary_filter
+                checks.append(
+                    lambda job: bool(job.min_salary)
+                    and job.salary_currency == currency
+                    and job.min_salary >= amount
+                )
+            if self.employment_types is not None:
+                types = self.employment_types
+                checks.append(lambda job: (job.employment_type or '').casefold() in types)
+            if self.employers is not None:
+                employers = self.employers
+                checks.append(lambda job: (job.employer_name or '').casefold() in employers)
+            if self.cities is not None:
+                cities = self.cities
+                checks.append(lambda job: (job.city or '').casefold() in cities)
+
+        if self.skills:
+            wanted = self.skills
+            checks.append(
+                lambda job: wanted.issubset({skill.casefold() for skill in job.required_skills})
+            )
+
+        return checks
+
+    def matcher(self, vectorised: bool = False) -> Predicate:
+        """
+        Compila todos los filtros en un único predicado
+
+        Args:
+            vectorised: Omitir los filtros que resuelve un JobFrame
+
+        Returns:
+            Función job -> bool que corta en el primer filtro que falla
+        """
+        checks = tuple(self._row_checks(vectorised))
+        if not checks:
+            return lambda job: True
+
+        def matches(job: JobLike) -> bool:
+            for check in checks:
+                if not check(job):
+                    return False
+            return True
+
+        return matches
+
+    def sort_key(self) -> Callable[[JobLike], Tuple[Any, ...]]:
+        """
+        Clave compuesta para ordenar ascendente según sort_keys
+
+        Returns:
+            Función job -> tupla (ausente, valor) por clave
+        """
+        getters = tuple((SORT_KEYS[name], descending) for name, descending in self.sort_keys)
+
+        def key(job: JobLike) -> Tuple[Any, ...]:
+            parts: List[Any] = []
+            for getter, descending in getters:
+                value = getter(job)
+                if value is None:
+                    parts += (True, 0)
+                else:
+                    parts += (False, -value if descending else value)
+            return tuple(parts)
+
+        return key
+
+    def frame_mask(self, frame: JobFrame) -> np.ndarray:
+        """
+        Máscara con los filtros que resuelven las columnas del frame
+
+        Args:
+            frame: Frame sobre el que se consulta
+
+        Returns:
+            Array booleano por fila
+        """
+        mask = np.ones(len(frame), dtype=bool)
+        if self.remote_filter is not None:
+            mask &= frame.is_remote == self.remote_filter
+        if self.posted_after_ts is not None:
+            mask &= frame.posted_after_mask(self.posted_after_ts)
+        if self.salary_required:
+            mask &= frame.has_salary_mask()
+        if self.min_salary_filter is not None:
+            mask &= frame.salary_mask(*self.min_salary_filter)
+        if self.employment_types is not None:
+            mask &= frame.employment_type.isin(self.employment_types, casefold=True)
+        if self.employers is not None:
+            mask &= frame.employer.isin(self.employers, casefold=True)
+        if self.cities is not None:
+            mask &= frame.city.isin(self.cities, casefold=True)
+        return mask
+
+    # ------------------------------------------------------------------
+    # Ejecución
+    # ------------------------------------------------------------------
+
+    def run(self, source: Union[Iterable[JobLike], JobFrame]) -> List[JobLike]:
+        """
+        Ejecuta la consulta
+
+        Sobre una lista (o cualquier iterable) se recorre una vez con el
+        predicado compilado. Sobre un JobFrame los filtros con columna se
+        evalúan vectorizados y solo los restantes se comprueban por fila.
+        Con límite se usa un heap de tamaño k en lugar de ordenar todo; sin
+        orden, la pasada se corta al alcanzar el límite.
+
+        Args:
+            source: Trabajos o JobFrame
+
+        Returns:
+            Trabajos que cumplen la consulta, ordenados y limitados
+        """
+        if isinstance(source, JobFrame):
+            return self._run_frame(source)
+        return self._select(filter(self.matcher(), source))
+
+    def _run_frame(self, frame: JobFrame) -> List[JobLike]:
+        indices = np.flatnonzero(self.frame_mask(frame))
+        residual = self._row_checks(vectorised=True)
+
+        if not residual and len(self.sort_keys) == 1 and self.sort_keys[0][0] == 'salary':
+            # Orden por salario resuelto también con columnas (mismo orden estable)
+            subset = frame.take(indices)
+            descending = self.sort_keys[0][1]
+            count = len(subset) if self.max_results is None else self.max_results
+            order = subset.top_k_salary(count, descending)
+            return subset.rows(order)
+
+        jobs = frame.jobs
+        candidates = (jobs[i] for i in indices)
+        if residual:
+            candidates = filter(self.matcher(vectorised=True), candidates)
+        return self._select(candidates)
+
+    def _select(self, candidates: Iterable[JobLike]) -> List[JobLike]:
+        """Orden y límite sobre los candidatos ya filtrados"""
+        if not self.sort_keys:
+            results = list(islice(candidates, self.max_results))
+        elif self.max_results is not None:
+            # nsmallest equivale a sorted(...)[:k] (estable) con memoria O(k)
+            results = heapq.nsmallest(self.max_results, candidates, key=self.sort_key())
+        else:
+            results = sorted(candidates, key=self.sort_key())
+
+        logger.debug(f"Consulta devolvió {len(results)} trabajos")
+        return results
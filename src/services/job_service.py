@@ -10,27 +10,138 @@ Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
 Versión: 3.0.0
 Fecha: 2025-12-08
 """
+import asyncio
 import logging
-from typing import List
+import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Iterator, AsyncIterator, Set, Callable, Tuple, Union
 from pydantic import ValidationError
 from src.api.jsearch_client import JSearchClient
 from src.models.job import Job
 from src.models.search_params import SearchParameters
+from src.models.batch_validation import BatchValidationResult, validate_batch
+from src.services.search_cache import SearchCache
+from src.services.job_store import JobStore
+from src.services.job_dedup import JobDeduplicator
+from src.services.job_frame import JobFrame
+from src.services.job_query import JobQuery
+from src.services.search_index import SearchIndex
+from src.services.skill_extractor import SkillExtractor
+from src.services.seen_jobs import SeenJobs
 
 logger = logging.getLogger(__name__)
 
+# Convierte una página en bruto en elementos validados (por defecto, objetos Job)
+PageParser = Callable[[List[Dict[str, Any]]], BatchValidationResult]
+
+
+@dataclass
+class SearchPage:
+    """Página de resultados de una búsqueda incremental con su progreso"""
+    jobs: List[Any]
+    page: int
+    pages_done: int
+    total_pages: int
+    quota_spent: int  # Peticiones que llegaron a la API en esta búsqueda (sin cachés)
+    skipped: List[int] = field(default_factory=list)
+
+    @property
+    def is_last(self) -> bool:
+        """True si es la última página de la búsqueda"""
+        return self.pages_done >= self.total_pages
+
+
+def _as_frame(jobs: Union[List[Job], JobFrame]) -> JobFrame:
+    """Vista columnar de los trabajos, reutilizando el frame si ya lo es"""
+    return jobs if isinstance(jobs, JobFrame) else JobFrame.from_jobs(jobs)
+
+
+def _log_store_error(future: "Future[None]") -> None:
+    """Registra el error de un guardado en segundo plano (nadie más lo ve)"""
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Guardado en segundo plano fallido: {error}")
+
 
 class JobService:
     """Servicio para búsqueda y gestión de trabajos"""
 
-    def __init__(self, api_client: JSearchClient):
+    def __init__(
+        self,
+        api_client: JSearchClient,
+        search_cache: Optional[SearchCache] = None,
+        job_store: Optional[JobStore] = None,
+        deduplicator: Optional[JobDeduplicator] = None,
+        search_index: Optional[SearchIndex] = None,
+        skill_extractor: Optional[SkillExtractor] = None,
+        seen_jobs: Optional[SeenJobs] = None,
+        skip_seen: bool = False
+    ):
         """
         Args:
             api_client: Cliente de JSearch API
+            search_cache: Caché de búsquedas para responder consultas contenidas
+                en otras ya ejecutadas (opcional)
+            job_store: Almacén local donde se guardan los trabajos encontrados
+                (opcional)
+            deduplicator: Detector de ofertas casi duplicadas para
+                collapse_duplicates (opcional; sin él no se colapsa nada)
+            search_index: Índice BM25 de los trabajos del almacén (por
+                defecto se construye desde job_store en la primera búsqueda local)
+            skill_extractor: Extractor que completa required_skills con las
+                skills de la descripción (opcional)
+            seen_jobs: Historial de trabajos vistos en ejecuciones anteriores;
+                con él, cada trabajo encontrado se marca con is_new (opcional)
+            skip_seen: Omitir de los resultados los trabajos ya vistos
+                (requiere seen_jobs)
         """
         self.api_client = api_client
+        self.search_cache = search_cache
+        self.job_store = job_store
+        self.deduplicator = deduplicator
+        self.search_index = search_index
+        self.skill_extractor = skill_extractor
+        self.seen_jobs = seen_jobs
+        self.skip_seen = skip_seen
+        self._index_lock = threading.Lock()
+        self._seen_lock = threading.Lock()
+        self._store_executor: Optional[ThreadPoolExecutor] = None
         logger.debug("JobService inicializado")
 
+    def _fetch_raw(self, params: SearchParameters) -> List[Dict[str, Any]]:
+        """
+        Obtiene los resultados en bruto, desde la caché de búsquedas si la
+        consulta está contenida en una ya ejecutada, o desde la API si es nueva
+
+        Args:
+            params: Parámetros de búsqueda
+
+        Returns:
+            Resultados en bruto de la API
+        """
+        return self._fetch(params)[0]
+
+    def _fetch(self, params: SearchParameters) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Como _fetch_raw, indicando además cuántas peticiones llegaron a la API
+
+        Las respuestas servidas por la caché de búsquedas o por la caché de
+        respuestas del cliente no cuentan.
+        """
+        if self.search_cache is not None:
+            cached = self.search_cache.get(params)
+            if cached is not None:
+                return cached, 0
+
+        raw_results = self.api_client.search_jobs(params)
+
+        if self.search_cache is not None:
+            self.search_cache.put(params, raw_results, getattr(raw_results, 'exhausted', False))
+
+        return raw_results, getattr(raw_results, 'api_requests', 1)
+
     def search_jobs(self, params: SearchParameters) -> List[Job]:
         """
         Busca trabajos y retorna objetos Job validados
@@ -47,19 +158,14 @@ class JobService:
         logger.info(f"Buscando trabajos: '{params.query}' en {params.country}")
 
         try:
-            # Llamar a la API
-            raw_results = self.api_client.search_jobs(params)
+            # Llamar a la API (o responder desde la caché de búsquedas)
+            raw_results = self._fetch_raw(params)
 
             # Parsear resultados a objetos Job
-            jobs = []
-            for i, job_data in enumerate(raw_results):
-                try:
-                    job = Job.model_validate(job_data)
-                    jobs.append(job)
-                except ValidationError as e:
-                    logger.warning(f"Error parseando trabajo #{i+1}: {e}")
-                    # Continuar con el resto de trabajos
-                    continue
+            jobs = self._parse_jobs(raw_results)
+            self._track_seen(jobs)
+            self._persist(jobs)
+            jobs = self._drop_seen(jobs)
 
             logger.info(f"Parseados {len(jobs)} trabajos de {len(raw_results)} resultados")
             return jobs
@@ -68,6 +174,269 @@ class JobService:
             logger.error(f"Error en búsqueda: {e}")
             raise
 
+    def search_raw(self, params: SearchParameters) -> List[Dict[str, Any]]:
+        """
+        Busca trabajos y retorna los resultados en bruto, sin validarlos
+
+        Útil para proyecciones que no necesitan objetos Job completos
+        (ver src.models.job_projection). Los resultados se guardan igualmente
+        en el almacén local, si lo hay, en segundo plano (ver wait).
+
+        Args:
+            params: Parámetros de búsqueda
+
+        Returns:
+            Resultados en bruto de la API
+        """
+        logger.info(f"Buscando trabajos (en bruto): '{params.query}' en {params.country}")
+        raw_results = self._fetch_raw(params)
+        self._store_raw(raw_results)
+        return raw_results
+
+    def iter_search(
+        self,
+        params: SearchParameters,
+        parser: Optional[PageParser] = None
+    ) -> Iterator[SearchPage]:
+        """
+        Busca trabajos página a página, entregando cada página al llegar
+
+        Cada página se pide por separado (una petición de cuota por página no
+        cacheada, frente a una sola de search_jobs para todo el rango), así
+        que el llamador puede mostrar, exportar o detenerse en cuanto llega
+        la primera. Usar solo cuando el progreso compense la cuota extra. Los
+        job_id repetidos entre páginas se omiten.
+
+        Args:
+            params: Parámetros de búsqueda (page y num_pages definen el rango)
+            parser: Conversión de cada página (por defecto, validación a Job;
+                ej: project_jobs para el formato del dashboard)
+
+        Yields:
+            SearchPage con los trabajos validados y el progreso
+
+        Raises:
+            Exception: Si falla la petición de alguna página
+        """
+        logger.info(
+            f"Búsqueda incremental: '{params.query}' en {params.country} "
+            f"({params.num_pages} páginas)"
+        )
+        quota_spent = 0
+        seen: Set[str] = set()
+
+        for offset in range(params.num_pages):
+            page_params = self._page_params(params, offset)
+            raw_results, api_requests = self._fetch(page_params)
+            quota_spent += api_requests
+            yield self._build_page(params, offset, raw_results, seen, quota_spent, parser)
+
+    def iter_jobs(self, params: SearchParameters) -> Iterator[Job]:
+        """
+        Trabajos de una búsqueda incremental, uno a uno
+
+        Útil para exportar en streaming: los trabajos de cada página se
+        entregan en cuanto llega, sin esperar al resto.
+
+        Args:
+            params: Parámetros de búsqueda
+
+        Yields:
+            Job validado
+        """
+        for page in self.iter_search(params):
+            yield from page.jobs
+
+    async def aiter_search(
+        self,
+        params: SearchParameters,
+        parser: Optional[PageParser] = None
+    ) -> AsyncIterator[SearchPage]:
+        """
+        Variante asíncrona de iter_search
+
+        Las peticiones bloqueantes se ejecutan en un hilo para no bloquear el
+        event loop. Las páginas se piden de una en una, de modo que detener la
+        iteración no gasta cuota en páginas que no se van a usar.
+
+        Args:
+            params: Parámetros de búsqueda
+            parser: Conversión de cada página (por defecto, validación a Job)
+
+        Yields:
+            SearchPage con los trabajos validados y el progreso
+        """
+        quota_spent = 0
+        seen: Set[str] = set()
+
+        for offset in range(params.num_pages):
+            page_params = self._page_params(params, offset)
+            raw_results, api_requests = await asyncio.to_thread(self._fetch, page_params)
+            quota_spent += api_requests
+            yield self._build_page(params, offset, raw_results, seen, quota_spent, parser)
+
+    @staticmethod
+    def _page_params(params: SearchParameters, offset: int) -> SearchParameters:
+        """Parámetros de una sola página dentro del rango de la búsqueda"""
+        return params.model_copy(update={'page': params.page + offset, 'num_pages': 1})
+
+    def _build_page(
+        self,
+        params: SearchParameters,
+        offset: int,
+        raw_results: List[Dict[str, Any]],
+        seen: Set[str],
+        quota_spent: int,
+        parser: Optional[PageParser] = None
+    ) -> SearchPage:
+        """Descarta repetidos, valida la página y calcula el progreso"""
+        # Descartar job_id ya vistos antes de validar, conservando el índice original
+        indices = []
+        unique = []
+        for i, job_data in enumerate(raw_results):
+            job_id = job_data.get('job_id') if isinstance(job_data, dict) else None
+            if job_id is not None:
+                if job_id in seen:
+                    continue
+                seen.add(job_id)
+            indices.append(i)
+            unique.append(job_data)
+
+        result = (parser or self._validate)(unique)
+        if parser is None:
+            self._track_seen(result.items)
+            self._persist(result.items)
+            result.items = self._drop_seen(result.items)
+        else:
+            self._store_raw(unique)
+
+        page = SearchPage(
+            jobs=result.items,
+            page=params.page + offset,
+            pages_done=offset + 1,
+            total_pages=params.num_pages,
+            quota_spent=quota_spent,
+            skipped=[indices[i] for i in result.skipped]
+        )
+        logger.debug(
+            f"Página {page.page} ({page.pages_done}/{page.total_pages}): "
+            f"{len(page.jobs)} trabajos, {page.quota_spent} peticiones"
+        )
+        return page
+
+    def _track_seen(self, jobs: List[Job]) -> None:
+        """
+        Marca is_new según el historial de vistos y registra los nuevos
+
+        Debe llamarse antes de _persist: el historial confirma sus positivos
+        contra el almacén. El historial se guarda en disco en close(), no en
+        cada búsqueda.
+
+        Args:
+            jobs: Trabajos validados
+        """
+        if self.seen_jobs is None or not jobs:
+            return
+
+        with self._seen_lock:
+            new_jobs, seen_jobs = self.seen_jobs.split(jobs)
+            for job in new_jobs:
+                job.is_new = True
+            for job in seen_jobs:
+                job.is_new = False
+            self.seen_jobs.add_many(job.job_id for job in new_jobs)
+
+        logger.debug(f"Vistos: {len(new_jobs)} nuevos, {len(seen_jobs)} ya vistos")
+
+    def _drop_seen(self, jobs: List[Job]) -> List[Job]:
+        """
+        Con skip_seen, deja solo los trabajos nuevos de la lista a devolver
+
+        Se aplica después de _persist: los ya vistos también se guardan para
+        actualizar su última aparición (si no, prune_saved los eliminaría
+        aunque sigan publicados).
+        """
+        if self.seen_jobs is None or not self.skip_seen:
+            return jobs
+        return [job for job in jobs if job.is_new]
+
+    def _persist(self, jobs: List[Job]) -> None:
+        """Guarda los trabajos en el almacén local; un fallo no interrumpe la búsqueda"""
+        if self.job_store is None or not jobs:
+            return
+        try:
+            new_jobs = self.job_store.upsert_many(jobs)
+            logger.debug(f"Almacén: {new_jobs} trabajos nuevos de {len(jobs)}")
+        except sqlite3.Error as e:
+            logger.warning(f"No se pudieron guardar los trabajos en el almacén: {e}")
+            return
+
+        if self.search_index is not None:
+            self.search_index.add_many(jobs)
+
+    def _store_raw(self, raw_results: List[Dict[str, Any]]) -> None:
+        """
+        Guarda en el almacén los resultados en bruto de una búsqueda proyectada
+
+        Las proyecciones no producen objetos Job, así que se validan aparte
+        solo cuando hay almacén, y en un hilo propio: la validación completa
+        y el upsert no retrasan la respuesta de la búsqueda proyectada.
+
+        Args:
+            raw_results: Resultados en bruto de la API
+        """
+        if self.job_store is None or not raw_results:
+            return
+        if self._store_executor is None:
+            self._store_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="job-store")
+        future = self._store_executor.submit(self._store_jobs, raw_results)
+        future.add_done_callback(_log_store_error)
+
+    def _store_jobs(self, raw_results: List[Dict[str, Any]]) -> None:
+        """Valida, marca en el historial de vistos y guarda (en el hilo de guardado)"""
+        jobs = self._parse_jobs(raw_results)
+        self._track_seen(jobs)
+        self._persist(jobs)
+
+    def wait(self) -> None:
+        """Espera a que terminen los guardados en segundo plano de search_raw e iter_search"""
+        if self._store_executor is not None:
+            self._store_executor.shutdown(wait=True)
+            self._store_executor = None
+
+    def close(self) -> None:
+        """
+        Termina los guardados pendientes y guarda el historial de vistos
+
+        El filtro de vistos se escribe una vez por ejecución, aquí, y solo
+        si cambió.
+        """
+        self.wait()
+        if self.seen_jobs is not None:
+            with self._seen_lock:
+                self.seen_jobs.save()
+
+    def _parse_jobs(self, raw_results: List[Dict[str, Any]]) -> List[Job]:
+        """
+        Valida resultados en bruto como objetos Job, omitiendo los inválidos
+
+        Args:
+            raw_results: Resultados en bruto de la API
+
+        Returns:
+            Lista de objetos Job válidos
+        """
+        return self._validate(raw_results).items
+
+    def _validate(self, raw_results: List[Dict[str, Any]]) -> BatchValidationResult[Job]:
+        """Valida en lote, registra los trabajos omitidos y completa las skills"""
+        result = validate_batch(Job, raw_results)
+        for i, error in result.errors.items():
+            logger.warning(f"Error parseando trabajo #{i+1}: {error}")
+        if self.skill_extractor is not None:
+            result.items = self.skill_extractor.enrich_many(result.items)
+        return result
+
     def get_job_details(self, job_id: str, country: str = "us") -> Job:
         """
         Obtiene detalles completos de un trabajo
@@ -87,6 +456,8 @@ class JobService:
         try:
             raw_data = self.api_client.get_job_details(job_id, country)
             job = Job.model_validate(raw_data)
+            if self.skill_extractor is not None:
+                job = self.skill_extractor.enrich(job)
 
             logger.info(f"Detalles obtenidos: {job.title}")
             return job
@@ -98,23 +469,23 @@ class JobService:
             logger.error(f"Error obteniendo detalles: {e}")
             raise
 
-    def filter_remote_jobs(self, jobs: List[Job]) -> List[Job]:
+    def filter_remote_jobs(self, jobs: Union[List[Job], JobFrame]) -> List[Job]:
         """
         Filtra solo trabajos remotos
 
         Args:
-            jobs: Lista de trabajos
+            jobs: Lista de trabajos o JobFrame ya construido (se reutiliza)
 
         Returns:
             Lista de trabajos remotos
         """
-        remote_jobs = [job for job in jobs if job.is_remote]
+        remote_jobs = JobQuery().remote().run(_as_frame(jobs))
         logger.debug(f"Filtrados {len(remote_jobs)} trabajos remotos de {len(jobs)}")
         return remote_jobs
 
     def filter_by_salary(
         self,
-        jobs: List[Job],
+        jobs: Union[List[Job], JobFrame],
         min_salary: float,
         currency: str = "USD"
     ) -> List[Job]:
@@ -122,38 +493,144 @@ class JobService:
         Filtra trabajos por salario mínimo
 
         Args:
-            jobs: Lista de trabajos
+            jobs: Lista de trabajos o JobFrame ya construido (se reutiliza)
             min_salary: Salario mínimo
             currency: Moneda
 
         Returns:
             Lista de trabajos que cumplen el criterio
         """
-        filtered = [
-            job for job in jobs
-            if job.min_salary and job.salary_currency == currency and job.min_salary >= min_salary
-        ]
+        filtered = JobQuery().min_salary(min_salary, currency).run(_as_frame(jobs))
         logger.debug(f"Filtrados {len(filtered)} trabajos con salario >= {min_salary} {currency}")
         return filtered
 
-    def sort_by_salary(self, jobs: List[Job], descending: bool = True) -> List[Job]:
+    def sort_by_salary(self, jobs: Union[List[Job], JobFrame], descending: bool = True) -> List[Job]:
         """
-        Ordena trabajos por salario
+        Ordena trabajos por salario (max_salary, si no min_salary, si no 0)
 
         Args:
-            jobs: Lista de trabajos
+            jobs: Lista de trabajos o JobFrame ya construido (se reutiliza)
             descending: Si ordenar descendente
 
         Returns:
-            Lista ordenada
+            Lista ordenada (orden estable)
         """
-        def get_salary_key(job: Job) -> float:
-            if job.max_salary:
-                return job.max_salary
-            elif job.min_salary:
-                return job.min_salary
-            return 0
-
-        sorted_jobs = sorted(jobs, key=get_salary_key, reverse=descending)
+        frame = _as_frame(jobs)
+        sorted_jobs = frame.rows(frame.argsort_salary(descending))
         logger.debug(f"Trabajos ordenados por salario")
         return sorted_jobs
+
+    def collapse_duplicates(self, jobs: List[Job]) -> List[Job]:
+        """
+        Colapsa la misma oferta publicada en varios publishers
+
+        Args:
+            jobs: Lista de trabajos
+
+        Returns:
+            Lista sin casi duplicados; cada trabajo conservado incluye en
+            alternate_apply_links los enlaces de sus duplicados
+        """
+        if self.deduplicator is None:
+            return list(jobs)
+
+        result = self.deduplicator.collapse(jobs)
+        logger.debug(f"Colapsados {result.removed} duplicados de {len(jobs)} trabajos")
+        return result.jobs
+
+    def search_saved(self, text: str, limit: int = 20) -> List[Job]:
+        """
+        Busca por relevancia (BM25) entre los trabajos del almacén local
+
+        No hace peticiones a la API. El índice se construye desde el almacén
+        la primera vez y después se actualiza con cada búsqueda.
+
+        Args:
+            text: Palabras a buscar
+            limit: Máximo de resultados
+
+        Returns:
+            Trabajos más relevantes (lista vacía si no hay almacén)
+        """
+        if self.job_store is None:
+            logger.warning("Búsqueda local sin almacén de trabajos configurado")
+            return []
+
+        hits = self._saved_index().search(text, limit)
+        jobs = self.job_store.get_many(hit.job_id for hit in hits)
+        logger.info(f"Búsqueda local '{text}': {len(hits)} resultados")
+        return [jobs[hit.job_id] for hit in hits if hit.job_id in jobs]
+
+    def prune_saved(self, not_seen_since: float) -> int:
+        """
+        Elimina del almacén y del índice los trabajos no vistos desde una fecha
+
+        Args:
+            not_seen_since: Timestamp límite de última aparición
+
+        Returns:
+            Número de trabajos eliminados
+        """
+        if self.job_store is None:
+            return 0
+
+        stale = self.job_store.stale_ids(not_seen_since)
+        removed = self.job_store.remove(stale)
+        if self.search_index is not None:
+            for job_id in stale:
+                self.search_index.remove(job_id)
+        logger.info(f"Eliminados {removed} trabajos caducados del almacén")
+        return removed
+
+    def collapse_saved_duplicates(self) -> int:
+        """
+        Colapsa los casi duplicados de todo el almacén local
+
+        Complementa a collapse_duplicates, que solo compara los trabajos de
+        un resultado: la misma oferta encontrada en búsquedas distintas queda
+        guardada con job_id distintos. El historial se recorre una vez
+        guardando solo las firmas; después se leen únicamente los trabajos
+        de cada grupo. El canónico se guarda con los enlaces del grupo y la
+        última aparición más reciente del grupo, y el resto se elimina del
+        almacén y del índice.
+
+        Returns:
+            Número de trabajos eliminados (0 sin almacén o sin deduplicador)
+        """
+        if self.job_store is None or self.deduplicator is None:
+            return 0
+
+        ids: List[str] = []
+
+        def stored_jobs() -> Iterator[Job]:
+            for job in self.job_store.iter_jobs():
+                ids.append(job.job_id)
+                yield job
+
+        groups = [
+            [ids[i] for i in members]
+            for members in self.deduplicator.find_clusters(stored_jobs())
+            if len(members) > 1
+        ]
+
+        removed: List[str] = []
+        for group_ids in groups:
+            jobs = self.job_store.get_many(group_ids)
+            canonical, others = self.deduplicator.merge([jobs[job_id] for job_id in group_ids])
+            last_seen = max(self.job_store.seen_range(job_id)[1] for job_id in group_ids)
+            self.job_store.upsert(canonical, seen_at=last_seen)
+            removed.extend(job.job_id for job in others)
+
+        self.job_store.remove(removed)
+        if self.search_index is not None:
+            for job_id in removed:
+                self.search_index.remove(job_id)
+        logger.info(f"Colapsados {len(removed)} duplicados de {len(ids)} trabajos guardados")
+        return len(removed)
+
+    def _saved_index(self) -> SearchIndex:
+        """Índice de búsqueda local, construido desde el almacén si aún no existe"""
+        with self._index_lock:
+            if self.search_index is None:
+                self.search_index = SearchIndex.from_jobs(self.job_store.iter_jobs())
+            return self.search_index
@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: job_store.py
+Descripción: Almacén local persistente de trabajos en SQLite. Upsert por job_id
+             con fechas de primera y última aparición, índices secundarios para
+             las consultas habituales e índice FTS5 de texto completo sobre
+             título, descripción y skills.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from src.models.job import Job
+from src.models.job_record import JobLike
+from src.services.job_query import JobQuery
+from src.utils.file_utils import ensure_dir_exists
+
+logger = logging.getLogger(__name__)
+
+# Máximo de parámetros por sentencia (SQLITE_MAX_VARIABLE_NUMBER antiguo es 999)
+_CHUNK_SIZE = 500
+
+# Clave de salario de JobService.sort_by_salary: max, si no min, si no 0
+_SALARY_KEY_SQL = "COALESCE(NULLIF(max_salary, 0), NULLIF(min_salary, 0), 0)"
+
+# Columnas del trabajo que se guardan fuera del JSON (indexadas o de texto completo)
+_COLUMN_FIELDS = (
+    'title', 'employer_name', 'city', 'country', 'is_remote', 'employment_type',
+    'min_salary', 'max_salary', 'salary_currency', 'posted_at_timestamp', 'description',
+)
+
+# Columnas leídas para reconstruir un Job (ver JobStore._to_job)
+_SELECT_COLUMNS = ", ".join(
+    f"jobs.{column}" for column in (
+        'job_id', 'title', 'employer_name', 'city', 'country', 'is_remote', 'employment_type',
+        'min_salary', 'max_salary', 'salary_currency', 'posted_at', 'description', 'skills', 'data',
+    )
+)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT NOT NULL UNIQUE,
+    title TEXT,
+    employer_name TEXT COLLATE NOCASE,
+    city TEXT COLLATE NOCASE,
+    country TEXT COLLATE NOCASE,
+    is_remote INTEGER NOT NULL DEFAULT 0,
+    employment_type TEXT COLLATE NOCASE,
+    min_salary REAL,
+    max_salary REAL,
+    salary_currency TEXT,
+    posted_at INTEGER,
+    description TEXT,
+    skills TEXT NOT NULL DEFAULT '[]',
+    data TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_country ON jobs(country);
+CREATE INDEX IF NOT EXISTS idx_jobs_employer ON jobs(employer_name);
+CREATE INDEX IF NOT EXISTS idx_jobs_posted_at ON jobs(posted_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_remote ON jobs(is_remote, posted_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_salary ON jobs(salary_currency, min_salary);
+CREATE INDEX IF NOT EXISTS idx_jobs_salary_key ON jobs({_SALARY_KEY_SQL});
+CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs(last_seen);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, description, skills,
+    content='jobs', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, title, description, skills)
+    VALUES (new.id, new.title, new.description, new.skills);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, description, skills)
+    VALUES ('delete', old.id, old.title, old.description, old.skills);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, description, skills ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, description, skills)
+    VALUES ('delete', old.id, old.title, old.description, old.skills);
+    INSERT INTO jobs_fts(rowid, title, description, skills)
+    VALUES (new.id, new.title, new.description, new.skills);
+END;
+"""
+
+_UPSERT_SQL = """
+INSERT INTO jobs (
+    job_id, title, employer_name, city, country, is_remote, employment_type,
+    min_salary, max_salary, salary_currency, posted_at, description, skills,
+    data, first_seen, last_seen
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(job_id) DO UPDATE SET
+    title = excluded.title,
+    employer_name = excluded.employer_name,
+    city = excluded.city,
+    country = excluded.country,
+    is_remote = excluded.is_remote,
+    employment_type = excluded.employment_type,
+    min_salary = excluded.min_salary,
+    max_salary = excluded.max_salary,
+    salary_currency = excluded.salary_currency,
+    posted_at = excluded.posted_at,
+    description = excluded.description,
+    skills = excluded.skills,
+    data = excluded.data,
+    last_seen = MAX(jobs.last_seen, excluded.last_seen)
+"""
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def to_fts_query(text: str) -> str:
+    """
+    Convierte texto libre en una consulta FTS5 segura
+
+    Cada palabra se entrecomilla (sin operadores ni sintaxis FTS5) y todas
+    deben aparecer; la última admite prefijo para búsquedas mientras se escribe.
+
+    Args:
+        text: Texto introducido por el usuario
+
+    Returns:
+        Consulta FTS5, o cadena vacía si no hay palabras
+    """
+    tokens = _TOKEN_PATTERN.findall(text)
+    if not tokens:
+        return ""
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += '*'
+    return " ".join(terms)
+
+
+class JobStore:
+    """Almacén SQLite de trabajos con upsert, índices y búsqueda de texto completo"""
+
+    def __init__(self, path: Union[str, Path] = "data/jobs.sqlite3"):
+        """
+        Args:
+            path: Archivo SQLite (":memory:" para un almacén en memoria)
+        """
+        self.path = str(path)
+
+        if self.path != ":memory:":
+            ensure_dir_exists(Path(self.path).parent)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+        logger.debug(f"JobStore inicializado: {self.path}")
+
+    # ------------------------------------------------------------------
+    # Escritura
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _row(job: JobLike, seen_at: float) -> Tuple[Any, ...]:
+        """Fila de la tabla jobs para un trabajo"""
+        data = job.model_dump()
+        for name in _COLUMN_FIELDS:
+            data.pop(name, None)
+        skills = data.pop('required_skills') or []
+
+        return (
+            job.job_id,
+            job.title,
+            job.employer_name,
+            job.city,
+            job.country,
+            int(bool(job.is_remote)),
+            job.employment_type,
+            job.min_salary,
+            job.max_salary,
+            job.salary_currency,
+            job.posted_at_timestamp,
+            job.description,
+            json.dumps(list(skills), ensure_ascii=False),
+            json.dumps(data, ensure_ascii=False, separators=(',', ':')),
+            seen_at,
+            seen_at,
+        )
+
+    def upsert_many(self, jobs: Iterable[JobLike], seen_at: Optional[float] = None) -> int:
+        """
+        Inserta o actualiza trabajos por job_id en una sola transacción
+
+        Los trabajos ya almacenados conservan first_seen y actualizan el
+        resto de campos y last_seen. Si un job_id se repite en la entrada,
+        prevalece la última aparición.
+
+        Args:
+            jobs: Trabajos (Job o JobRecord)
+            seen_at: Timestamp de la observación (por defecto, ahora)
+
+        Returns:
+            Número de trabajos nuevos (no vistos antes)
+        """
+        seen_at = time.time() if seen_at is None else seen_at
+        latest: Dict[str, JobLike] = {}
+        for job in jobs:
+            latest[job.job_id] = job
+        if not latest:
+            return 0
+
+        with self._lock, self._conn:
+            existing = self._existing_ids(latest)
+            self._conn.executemany(
+                _UPSERT_SQL, (self._row(job, seen_at) for job in latest.values())
+            )
+
+        inserted = len(latest) - len(existing)
+        logger.debug(f"JobStore: {inserted} trabajos nuevos, {len(existing)} actualizados")
+        return inserted
+
+    def upsert(self, job: JobLike, seen_at: Optional[float] = None) -> bool:
+        """
+        Inserta o actualiza un trabajo
+
+        Returns:
+            True si el trabajo es nuevo
+        """
+        return self.upsert_many([job], seen_at) == 1
+
+    def remove(self, job_ids: Iterable[str]) -> int:
+        """
+        Elimina trabajos por job_id
+
+        Args:
+            job_ids: IDs a eliminar
+
+        Returns:
+            Número de trabajos eliminados
+        """
+        ids = list(job_ids)
+        removed = 0
+        with self._lock, self._conn:
+            for start in range(0, len(ids), _CHUNK_SIZE):
+                chunk = ids[start:start + _CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                removed += self._conn.execute(
+                    f"DELETE FROM jobs WHERE job_id IN ({placeholders})", chunk
+                ).rowcount
+        return removed
+
+    def remove_not_seen_since(self, timestamp: float) -> int:
+        """
+        Elimina trabajos cuya última aparición es anterior a timestamp
+
+        Args:
+            timestamp: Límite de last_seen
+
+        Returns:
+            Número de trabajos eliminados
+        """
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "DELETE FROM jobs WHERE last_seen < ?", (timestamp,)
+            ).rowcount
+
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+
+    def _existing_ids(self, job_ids: Iterable[str]) -> Set[str]:
+        """IDs ya almacenados (sin tomar el lock)"""
+        ids = list(job_ids)
+        found: Set[str] = set()
+        for start in range(0, len(ids), _CHUNK_SIZE):
+            chunk = ids[start:start + _CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(
+                row[0] for row in self._conn.execute(
+                    f"SELECT job_id FROM jobs WHERE job_id IN ({placeholders})", chunk
+                )
+            )
+        return found
+
+    def known_ids(self, job_ids: Iterable[str]) -> Set[str]:
+        """
+        Subconjunto de job_ids que ya están almacenados
+
+        Args:
+            job_ids: IDs a comprobar
+
+        Returns:
+            IDs presentes en el almacén
+        """
+        with self._lock:
+            return self._existing_ids(job_ids)
+
+    def __contains__(self, job_id: object) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone() is not None
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Obtiene un trabajo por job_id
+
+        Returns:
+            Job almacenado, o None si no existe
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_SELECT_COLUMNS} FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return self._to_job(row) if row else None
+
+    def get_many(self, job_ids: Iterable[str]) -> Dict[str, Job]:
+        """
+        Obtiene varios trabajos por job_id
+
+        Args:
+            job_ids: IDs a buscar
+
+        Returns:
+            {job_id: Job} con los que existen
+        """
+        ids = list(job_ids)
+        jobs: Dict[str, Job] = {}
+        with self._lock:
+            for start in range(0, len(ids), _CHUNK_SIZE):
+                chunk = ids[start:start + _CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                for row in self._conn.execute(
+                    f"SELECT {_SELECT_COLUMNS} FROM jobs WHERE job_id IN ({placeholders})", chunk
+                ):
+                    jobs[row[0]] = self._to_job(row)
+        return jobs
+
+    def stale_ids(self, timestamp: float) -> List[str]:
+        """
+        IDs de los trabajos cuya última aparición es anterior a timestamp
+
+        Args:
+            timestamp: Límite de last_seen
+
+        Returns:
+            Lista de job_id
+        """
+        with self._lock:
+            return [
+                row[0] for row in self._conn.execute(
+                    "SELECT job_id FROM jobs WHERE last_seen < ?", (timestamp,)
+                )
+            ]
+
+    def seen_range(self, job_id: str) -> Optional[Tuple[float, float]]:
+        """
+        Fechas de primera y última aparición de un trabajo
+
+        Returns:
+            (first_seen, last_seen), o None si no existe
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT first_seen, last_seen FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    @staticmethod
+    def _to_job(row: Tuple[Any, ...]) -> Job:
+        """Reconstruye el Job a partir de una fila"""
+        data = json.loads(row[13])
+        data.update(
+            job_id=row[0],
+            title=row[1],
+            employer_name=row[2],
+            city=row[3],
+            country=row[4],
+            is_remote=bool(row[5]),
+            employment_type=row[6],
+            min_salary=row[7],
+            max_salary=row[8],
+            salary_currency=row[9],
+            posted_at_timestamp=row[10],
+            description=row[11],
+            required_skills=json.loads(row[12]),
+        )
+        return Job.model_construct(**data)
+
+    def iter_jobs(self, batch_size: int = 1000) -> Iterator[Job]:
+        """
+        Recorre todos los trabajos en orden de inserción, por lotes
+
+        Args:
+            batch_size: Filas leídas por consulta
+
+        Yields:
+            Job almacenado
+        """
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT jobs.id, {_SELECT_COLUMNS} FROM jobs WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            for row in rows:
+                yield self._to_job(row[1:])
+
+    def iter_ids(self, batch_size: int = 10000) -> Iterator[str]:
+        """
+        Recorre los job_id almacenados sin cargar los trabajos
+
+        Args:
+            batch_size: Filas leídas por consulta
+
+        Yields:
+            job_id en orden de inserción
+        """
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT id, job_id FROM jobs WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            for _, job_id in rows:
+                yield job_id
+
+    def query(self, query: JobQuery, text: Optional[str] = None) -> List[Job]:
+        """
+        Ejecuta un JobQuery en SQL usando los índices del almacén
+
+        Args:
+            query: Filtros, orden y límite
+            text: Texto libre a buscar en título, descripción y skills (FTS5);
+                sin orden explícito, los resultados se ordenan por relevancia
+
+        Returns:
+            Trabajos que cumplen la consulta
+        """
+        where, params = self._where(query)
+        joins = ""
+        order: List[str] = []
+
+        if text:
+            match = to_fts_query(text)
+            if not match:
+                return []
+            joins = "JOIN jobs_fts ON jobs_fts.rowid = jobs.id"
+            where.append("jobs_fts MATCH ?")
+            params.append(match)
+
+        for name, descending in query.sort_keys:
+            column = {
+                'salary': _SALARY_KEY_SQL,
+                'min_salary': 'min_salary',
+                'max_salary': 'max_salary',
+                'posted_at': 'posted_at',
+            }[name]
+            order.append(f"{column} IS NULL")
+            order.append(f"{column} {'DESC' if descending else 'ASC'}")
+        if text and not order:
+            order.append("bm25(jobs_fts, 10.0, 1.0, 5.0)")
+        order.append("jobs.id")
+
+        sql = f"SELECT {_SELECT_COLUMNS} FROM jobs {joins}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY " + ", ".join(order)
+        if query.max_results is not None:
+            sql += " LIMIT ?"
+            params.append(query.max_results)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        logger.debug(f"JobStore: consulta devolvió {len(rows)} trabajos")
+        return [self._to_job(row) for row in rows]
+
+    def search(self, text: str, limit: int = 20) -> List[Job]:
+        """
+        Búsqueda de texto completo ordenada por relevancia
+
+        Args:
+            text: Palabras a buscar
+            limit: Máximo de resultados
+
+        Returns:
+            Trabajos más relevantes
+        """
+        return self.query(JobQuery().limit(limit), text=text)
+
+    @staticmethod
+    def _where(query: JobQuery) -> Tuple[List[str], List[Any]]:
+        """Condiciones SQL equivalentes a los filtros de un JobQuery"""
+        where: List[str] = []
+        params: List[Any] = []
+
+        def member(column: str, values: Iterable[str]) -> None:
+            values = sorted(values)
+            if not values:
+                where.append("0")
+                return
+            where.append(f"{column} IN ({','.join('?' * len(values))})")
+            params.extend(values)
+
+        if query.remote_filter is not None:
+            where.append("is_remote = ?")
+            params.append(int(query.remote_filter))
+        if query.posted_after_ts is not None:
+            where.append("posted_at >= ?")
+            params.append(query.posted_after_ts)
+        if query.salary_required:
+            where.append(f"{_SALARY_KEY_SQL} != 0")
+        if query.min_salary_filter is not None:
+            amount, currency = query.min_salary_filter
+            where.append("min_salary != 0 AND salary_currency = ? AND min_salary >= ?")
+            params.extend([currency, amount])
+        if query.employment_types is not None:
+            member("employment_type", query.employment_types)
+        if query.employers is not None:
+            member("employer_name", query.employers)
+        if query.cities is not None:
+            member("city", query.cities)
+        for skill in sorted(query.skills):
+            where.append(
+                "EXISTS (SELECT 1 FROM json_each(jobs.skills) WHERE lower(json_each.value) = ?)"
+            )
+            params.append(skill)
+
+        return where, params
+
+    # ------------------------------------------------------------------
+    # Mantenimiento
+    # ------------------------------------------------------------------
+
+    def optimize(self) -> None:
+        """Compacta el índice FTS5 y actualiza las estadísticas del planificador"""
+        with self._lock, self._conn:
+            self._conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('optimize')")
+            self._conn.execute("ANALYZE")
+
+    def close(self) -> None:
+        """Cierra la conexión SQLite"""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
@@ -12,9 +12,9 @@ Fecha: 2025-12-08
 """
 import logging
 from typing import List, Optional
-from pydantic import ValidationError
 from src.api.jsearch_client import JSearchClient
 from src.models.salary import SalaryInfo
+from src.models.batch_validation import validate_batch
 
 logger = logging.getLogger(__name__)
 
@@ -59,16 +59,8 @@ class SalaryService:
                 years_of_experience=years_of_experience
             )
 
-            # Parsear resultados
-            salaries = []
-            for i, salary_data in enumerate(raw_results):
-                try:
-                    salary = SalaryInfo.model_validate(salary_data)
-                    if salary.has_salary_data():  # Solo incluir si tiene datos
-                        salaries.append(salary)
-                except ValidationError as e:
-                    logger.warning(f"Error parseando salario #{i+1}: {e}")
-                    continue
+            # Parsear resultados en lote (solo incluir si tienen datos)
+            salaries = self._parse_salaries(raw_results, "salario")
 
             logger.info(f"Obtenidos {len(salaries)} datos salariales")
             return salaries
@@ -77,6 +69,24 @@ class SalaryService:
             logger.error(f"Error consultando salarios: {e}")
             raise
 
+    def _parse_salaries(self, raw_results: List[dict], label: str) -> List[SalaryInfo]:
+        """
+        Valida resultados en bruto como SalaryInfo y descarta los que no
+        tienen datos salariales
+
+        Args:
+            raw_results: Resultados en bruto de la API
+            label: Descripción para los mensajes de log
+
+        Returns:
+            Lista de SalaryInfo con datos
+        """
+        result = validate_batch(SalaryInfo, raw_results)
+        for i, error in result.errors.items():
+            logger.warning(f"Error parseando {label} #{i+1}: {error}")
+
+        return [salary for salary in result.items if salary.has_salary_data()]
+
     def get_company_salary(
         self,
         company: str,
@@ -109,16 +119,8 @@ class SalaryService:
                 years_of_experience=years_of_experience
             )
 
-            # Parsear resultados
-            salaries = []
-            for i, salary_data in enumerate(raw_results):
-                try:
-                    salary = SalaryInfo.model_validate(salary_data)
-                    if salary.has_salary_data():
-                        salaries.append(salary)
-                except ValidationError as e:
-                    logger.warning(f"Error parseando salario de empresa #{i+1}: {e}")
-                    continue
+            # Parsear resultados en lote (solo incluir si tienen datos)
+            salaries = self._parse_salaries(raw_results, "salario de empresa")
 
             logger.info(f"Obtenidos {len(salaries)} datos salariales de {company}")
             return salaries
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: search_cache.py
+Descripción: Caché de resultados de búsqueda que responde localmente consultas
+             contenidas en otras ya ejecutadas (periodo más corto o solo
+             remotos sobre un resultado agotado, o menos páginas), filtrando
+             los resultados cacheados.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
+from src.api.jsearch_client import JSEARCH_PAGE_SIZE
+from src.models.search_params import SearchParameters
+
+logger = logging.getLogger(__name__)
+
+# Ventana de cada valor de date_posted en segundos (None = sin límite)
+DATE_POSTED_WINDOWS: Dict[str, Optional[int]] = {
+    'all': None,
+    'month': 30 * 86400,
+    'week': 7 * 86400,
+    '3days': 3 * 86400,
+    'today': 86400,
+}
+
+# Parámetros que deben coincidir exactamente para reutilizar resultados
+_EXACT_FIELDS = (
+    'query',
+    'country',
+    'employment_types',
+    'job_requirements',
+    'radius',
+    'exclude_job_publishers',
+    'language',
+)
+
+
+@dataclass
+class _Entry:
+    """Resultado cacheado de una búsqueda"""
+    params: SearchParameters
+    results: List[Dict[str, Any]]
+    fetched_at: float
+    exhausted: bool = False
+
+
+def _base_key(params: SearchParameters) -> Tuple:
+    """Clave con los parámetros que no admiten subsunción"""
+    return tuple(getattr(params, name) for name in _EXACT_FIELDS)
+
+
+def _window_covers(cached: _Entry, params: SearchParameters, now: float) -> bool:
+    """
+    Comprueba si la ventana de fechas cacheada contiene la solicitada
+
+    La ventana cacheada empezó en fetched_at - ventana; la solicitada empieza
+    en now - ventana, así que el paso del tiempo reduce lo que cubre.
+    """
+    cached_window = DATE_POSTED_WINDOWS[cached.params.date_posted]
+    requested_window = DATE_POSTED_WINDOWS[params.date_posted]
+
+    if cached_window is None:
+        return True
+    if requested_window is None:
+        return False
+    return now - requested_window >= cached.fetched_at - cached_window
+
+
+def _needs_filter(cached: _Entry, params: SearchParameters) -> bool:
+    """Indica si la búsqueda nueva es más estricta en remotos o fecha"""
+    return (
+        (params.work_from_home and not cached.params.work_from_home)
+        or params.date_posted != cached.params.date_posted
+    )
+
+
+def covers(cached: _Entry, params: SearchParameters, now: float) -> bool:
+    """
+    Indica si una búsqueda cacheada contiene a la solicitada
+
+    Un filtro más estricto (remotos o periodo más corto) cambia qué trabajos
+    caen en cada página de la API, así que solo se responde si la búsqueda
+    cacheada empezó en la primera página y el cliente la marcó como agotada
+    (ver SearchResults.exhausted): entonces contiene todos los resultados
+    filtrados. No se deduce del número de resultados, que también baja al
+    quitar repetidos. Con los mismos filtros, un rango de páginas
+    contenido se toma por posición solo si todas las páginas cacheadas
+    venían completas (sin duplicados descartados que desplacen posiciones).
+
+    Args:
+        cached: Entrada cacheada
+        params: Parámetros de la nueva búsqueda
+        now: Timestamp actual
+
+    Returns:
+        True si la nueva búsqueda se puede responder filtrando la cacheada
+    """
+    c = cached.params
+
+    if _base_key(c) != _base_key(params):
+        return False
+
+    # Solo remotos se obtiene filtrando; lo contrario no
+    if c.work_from_home and not params.work_from_home:
+        return False
+
+    if not _window_covers(cached, params, now):
+        return False
+
+    if _needs_filter(cached, params):
+        return c.page == 1 and cached.exhausted
+
+    if (params.page, params.num_pages) == (c.page, c.num_pages):
+        return True
+
+    # Rango de páginas contenido en el cacheado
+    if params.page < c.page or params.page + params.num_pages > c.page + c.num_pages:
+        return False
+    return len(cached.results) == c.num_pages * JSEARCH_PAGE_SIZE
+
+
+def narrow_results(cached: _Entry, params: SearchParameters, now: float) -> List[Dict[str, Any]]:
+    """
+    Obtiene los resultados de una búsqueda contenida en la cacheada
+
+    Si la búsqueda nueva es más estricta, se filtra por is_remote y
+    posted_at_timestamp todo el resultado agotado y después se toman las
+    páginas solicitadas; si no, se toman las páginas por posición. Los
+    trabajos sin timestamp se descartan si hay que filtrar por fecha.
+
+    Args:
+        cached: Entrada cacheada que cubre la búsqueda
+        params: Parámetros de la nueva búsqueda
+        now: Timestamp actual
+
+    Returns:
+        Resultados en bruto de la API
+    """
+    if (params.page, params.num_pages) == (cached.params.page, cached.params.num_pages) \
+            and not _needs_filter(cached, params):
+        return list(cached.results)
+
+    results = cached.results
+    first_page = cached.params.page
+
+    if params.work_from_home and not cached.params.work_from_home:
+        results = [job for job in results if job.get('job_is_remote')]
+
+    requested_window = DATE_POSTED_WINDOWS[params.date_posted]
+    if requested_window is not None and params.date_posted != cached.params.date_posted:
+        cutoff = now - requested_window
+        results = [
+            job for job in results
+            if job.get('job_posted_at_timestamp') is not None
+            and job['job_posted_at_timestamp'] >= cutoff
+        ]
+
+    start = (params.page - first_page) * JSEARCH_PAGE_SIZE
+    return results[start:start + params.num_pages * JSEARCH_PAGE_SIZE]
+
+
+class SearchCache:
+    """Caché en memoria de búsquedas con respuesta por subsunción"""
+
+    def __init__(self, ttl: float = 900, max_entries: int = 256):
+        """
+        Args:
+            ttl: Segundos de validez de cada búsqueda cacheada
+            max_entries: Máximo de búsquedas almacenadas
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, List[_Entry]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, params: SearchParameters) -> Optional[List[Dict[str, Any]]]:
+        """
+        Busca resultados para una búsqueda, exacta o contenida en otra cacheada
+
+        Args:
+            params: Parámetros de búsqueda
+
+        Returns:
+            Resultados en bruto, o None si la búsqueda es nueva
+        """
+        now = time.time()
+        key = _base_key(params)
+
+        with self._lock:
+            entries = self._entries.get(key)
+            if entries:
+                self._expire(key, entries, now)
+
+            for entry in self._entries.get(key, ()):
+                if covers(entry, params, now):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    results = narrow_results(entry, params, now)
+                    logger.info(
+                        f"Búsqueda respondida desde caché local: '{params.query}' "
+                        f"({len(results)} de {len(entry.results)} resultados)"
+                    )
+                    return results
+
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        params: SearchParameters,
+        results: List[Dict[str, Any]],
+        exhausted: bool = False
+    ) -> None:
+        """
+        Guarda los resultados de una búsqueda ejecutada contra la API
+
+        Las entradas que pasan a estar contenidas en la nueva se eliminan.
+
+        Args:
+            params: Parámetros de búsqueda
+            results: Resultados en bruto de la API
+            exhausted: La API agotó los resultados dentro del rango pedido
+                (solo entonces se responden filtros más estrictos)
+        """
+        if self.ttl <= 0:
+            return
+
+        now = time.time()
+        key = _base_key(params)
+        entry = _Entry(params=params, results=list(results), fetched_at=now, exhausted=exhausted)
+
+        with self._lock:
+            entries = self._entries.pop(key, [])
+            kept = [e for e in entries if not covers(entry, e.params, e.fetched_at)]
+            kept.append(entry)
+            self._size += len(kept) - len(entries)
+            self._entries[key] = kept
+
+            while self._size > self.max_entries and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def _expire(self, key: Tuple, entries: List[_Entry], now: float) -> None:
+        """Elimina las entradas caducadas de una clave"""
+        alive = [e for e in entries if now - e.fetched_at < self.ttl]
+        self._size -= len(entries) - len(alive)
+        if alive:
+            self._entries[key] = alive
+        else:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Elimina todas las búsquedas cacheadas"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
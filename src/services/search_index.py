@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: search_index.py
+Descripción: Índice invertido en memoria con ranking BM25 sobre título,
+             descripción, skills y highlights de los trabajos ya obtenidos.
+             Admite altas y bajas incrementales y devuelve los k mejores
+             resultados con un heap.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import heapq
+import logging
+import math
+import threading
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+from src.models.job_record import JobLike
+from src.services.job_dedup import normalize_text
+
+logger = logging.getLogger(__name__)
+
+# Peso de cada campo en la frecuencia de un término
+DEFAULT_FIELD_WEIGHTS = {
+    'title': 3.0,
+    'required_skills': 2.0,
+    'highlights': 1.0,
+    'description': 1.0,
+}
+
+# Palabras vacías en inglés y español (tras normalizar: sin tildes)
+STOP_WORDS = frozenset("""
+a about after all also an and any are as at be been but by can de del for from
+has have if in into is it its la las los more not of on or our the their this
+to we will with you your
+al como con el en es esta este lo mas o para pero por que se si sin sobre su
+sus un una uno unos y
+""".split())
+
+# Fracción de documentos borrados a partir de la cual se compacta el índice
+_COMPACT_RATIO = 0.25
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Divide un texto en términos normalizados sin palabras vacías
+
+    Args:
+        text: Texto original
+
+    Returns:
+        Lista de términos (con repeticiones, en orden)
+    """
+    return [token for token in normalize_text(text).split() if token not in STOP_WORDS]
+
+
+def job_fields(job: JobLike) -> Dict[str, str]:
+    """Texto de cada campo indexado de un trabajo"""
+    highlights = job.highlights or {}
+    highlight_text = " ".join(
+        " ".join(value) if isinstance(value, (list, tuple)) else str(value)
+        for value in highlights.values()
+    )
+    return {
+        'title': job.title or "",
+        'required_skills': " ".join(job.required_skills or ()),
+        'highlights': highlight_text,
+        'description': job.description or "",
+    }
+
+
+class _TermIds(dict):
+    """Término -> id; los términos nuevos reciben el siguiente id"""
+
+    def __missing__(self, term: str) -> int:
+        term_id = self[term] = len(self)
+        return term_id
+
+
+@dataclass
+class SearchHit:
+    """Resultado de una búsqueda con su puntuación BM25"""
+    job_id: str
+    score: float
+
+
+class SearchIndex:
+    """
+    Índice invertido BM25 con altas y bajas incrementales
+
+    Las altas se acumulan en arrays planos y se fusionan en las listas de
+    cada término (arrays NumPy ordenados por documento) antes de la
+    siguiente consulta. Las bajas se marcan y se descartan al consultar;
+    cuando superan una fracción del índice, se compacta. Es seguro entre hilos.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        field_weights: Optional[Dict[str, float]] = None
+    ):
+        """
+        Args:
+            k1: Saturación de la frecuencia de término
+            b: Normalización por longitud del documento
+            field_weights: Peso por campo (ver DEFAULT_FIELD_WEIGHTS)
+        """
+        self.k1 = k1
+        self.b = b
+        self.field_weights = dict(DEFAULT_FIELD_WEIGHTS)
+        self.field_weights.update(field_weights or {})
+
+        self._lock = threading.RLock()
+        self._terms = _TermIds()
+        self._postings_docs: List[np.ndarray] = []
+        self._postings_tf: List[np.ndarray] = []
+        self._df = np.zeros(0, dtype=np.int64)
+
+        # Altas pendientes de fusionar: (término, documento, frecuencia)
+        self._pending_terms = array('I')
+        self._pending_docs = array('I')
+        self._pending_tf = array('f')
+
+        self._doc_ids: List[Optional[str]] = []
+        self._doc_terms: List[Optional[array]] = []
+        self._doc_len = array('f')
+        self._alive = bytearray()
+        self._docs: Dict[str, int] = {}
+        self._total_len = 0.0
+        self._deleted = 0
+
+    @classmethod
+    def from_jobs(cls, jobs: Iterable[JobLike], **kwargs) -> "SearchIndex":
+        """
+        Construye un índice con los trabajos indicados
+
+        Args:
+            jobs: Trabajos a indexar
+            **kwargs: Parámetros de SearchIndex
+
+        Returns:
+            Índice con todos los trabajos
+        """
+        index = cls(**kwargs)
+        index.add_many(jobs)
+        return index
+
+    # ------------------------------------------------------------------
+    # Altas y bajas
+    # ------------------------------------------------------------------
+
+    def add(self, job: JobLike) -> None:
+        """
+        Indexa un trabajo (si ya existe, lo reemplaza)
+
+        Args:
+            job: Trabajo a indexar
+        """
+        frequencies: Counter = Counter()
+        for name, text in job_fields(job).items():
+            weight = self.field_weights.get(name, 0.0)
+            if weight == 1.0:
+                frequencies.update(tokenize(text))
+            elif weight:
+                for term, count in Counter(tokenize(text)).items():
+                    frequencies[term] += weight * count
+
+        with self._lock:
+            if job.job_id in self._docs:
+                self._remove(job.job_id)
+
+            doc = len(self._doc_ids)
+            term_ids = array('I', map(self._terms.__getitem__, frequencies))
+            self._pending_terms.extend(term_ids)
+            self._pending_docs.extend(array('I', [doc]) * len(term_ids))
+            self._pending_tf.extend(array('f', frequencies.values()))
+
+            length = sum(frequencies.values())
+            self._doc_ids.append(job.job_id)
+            self._doc_terms.append(term_ids)
+            self._doc_len.append(length)
+            self._alive.append(1)
+            self._docs[job.job_id] = doc
+            self._total_len += length
+
+    def add_many(self, jobs: Iterable[JobLike]) -> int:
+        """
+        Indexa varios trabajos
+
+        Returns:
+            Número de trabajos indexados
+        """
+        count = 0
+        for job in jobs:
+            self.add(job)
+            count += 1
+        logger.debug(f"SearchIndex: {count} trabajos indexados, {len(self)} en total")
+        return count
+
+    def _flush(self) -> None:
+        """Fusiona las altas pendientes en las listas de cada término"""
+        if not self._pending_terms:
+            return
+
+        terms = np.frombuffer(self._pending_terms, dtype=np.uint32)
+        docs = np.frombuffer(self._pending_docs, dtype=np.uint32)
+        # Clave única (término, documento): cada término queda contiguo y con
+        # sus documentos en orden creciente
+        order = np.argsort((terms.astype(np.uint64) << np.uint64(32)) | docs)
+        terms = terms[order].astype(np.int64)
+        docs = docs[order]
+        tf = np.frombuffer(self._pending_tf, dtype=np.float32)[order]
+        self._pending_terms = array('I')
+        self._pending_docs = array('I')
+        self._pending_tf = array('f')
+
+        vocabulary = len(self._terms)
+        empty_docs = np.zeros(0, dtype=np.uint32)
+        empty_tf = np.zeros(0, dtype=np.float32)
+        while len(self._postings_docs) < vocabulary:
+            self._postings_docs.append(empty_docs)
+            self._postings_tf.append(empty_tf)
+        if len(self._df) < vocabulary:
+            self._df = np.concatenate((self._df, np.zeros(vocabulary - len(self._df), dtype=np.int64)))
+
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(terms)) + 1))
+        ends = np.append(starts[1:], len(terms))
+        for term_id, start, end in zip(terms[starts].tolist(), starts.tolist(), ends.tolist()):
+            self._postings_docs[term_id] = np.concatenate((self._postings_docs[term_id], docs[start:end]))
+            self._postings_tf[term_id] = np.concatenate((self._postings_tf[term_id], tf[start:end]))
+        self._df += np.bincount(terms, minlength=vocabulary)[:len(self._df)]
+
+    def remove(self, job_id: str) -> bool:
+        """
+        Quita un trabajo del índice
+
+        Args:
+            job_id: ID del trabajo
+
+        Returns:
+            True si estaba indexado
+        """
+        with self._lock:
+            removed = self._remove(job_id)
+            if removed and self._deleted > _COMPACT_RATIO * len(self._doc_ids):
+                self.compact()
+            return removed
+
+    def _remove(self, job_id: str) -> bool:
+        doc = self._docs.pop(job_id, None)
+        if doc is None:
+            return False
+
+        self._flush()
+        self._df[np.frombuffer(self._doc_terms[doc], dtype=np.uint32)] -= 1
+        self._total_len -= self._doc_len[doc]
+        self._doc_ids[doc] = None
+        self._doc_terms[doc] = None
+        self._alive[doc] = 0
+        self._deleted += 1
+        return True
+
+    def compact(self) -> None:
+        """Elimina del índice los documentos dados de baja y renumera"""
+        with self._lock:
+            if not self._deleted:
+                return
+            self._flush()
+
+            alive = np.frombuffer(self._alive, dtype=np.uint8).astype(bool)
+            renumber = (np.cumsum(alive, dtype=np.int64) - 1).astype(np.uint32)
+
+            for term_id, docs in enumerate(self._postings_docs):
+                keep = alive[docs]
+                self._postings_docs[term_id] = renumber[docs[keep]]
+                self._postings_tf[term_id] = self._postings_tf[term_id][keep]
+
+            self._doc_len = array('f', np.frombuffer(self._doc_len, dtype=np.float32)[alive].tobytes())
+            self._doc_ids = [job_id for job_id in self._doc_ids if job_id is not None]
+            self._doc_terms = [terms for terms in self._doc_terms if terms is not None]
+            self._alive = bytearray(b'\x01' * len(self._doc_ids))
+            self._docs = {job_id: doc for doc, job_id in enumerate(self._doc_ids)}
+            self._deleted = 0
+
+        logger.debug(f"SearchIndex compactado: {len(self._doc_ids)} documentos")
+
+    # ------------------------------------------------------------------
+    # Consulta
+    # ------------------------------------------------------------------
+
+    def search(self, text: str, limit: int = 20) -> List[SearchHit]:
+        """
+        Busca los trabajos más relevantes para un texto
+
+        Args:
+            text: Palabras a buscar (basta con que aparezca una)
+            limit: Máximo de resultados
+
+        Returns:
+            Resultados por puntuación BM25 descendente (empates por orden de alta)
+        """
+        terms = list(dict.fromkeys(tokenize(text)))
+        if not terms or limit <= 0:
+            return []
+
+        with self._lock:
+            self._flush()
+            total = len(self._docs)
+            if total == 0:
+                return []
+            avg_len = self._total_len / total or 1.0
+
+            doc_len = np.frombuffer(self._doc_len, dtype=np.float32).copy()
+            scores = np.zeros(len(self._doc_ids), dtype=np.float64)
+
+            for term in terms:
+                term_id = self._terms.get(term)
+                if term_id is None or self._df[term_id] == 0:
+                    continue
+                df = self._df[term_id]
+                idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+
+                docs = self._postings_docs[term_id]
+                tf = self._postings_tf[term_id]
+                norm = self.k1 * (1 - self.b + self.b * doc_len[docs] / avg_len)
+                scores[docs] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+            alive = np.frombuffer(self._alive, dtype=np.uint8).astype(bool)
+            candidates = np.flatnonzero(scores)
+            candidates = candidates[alive[candidates]].tolist()
+            # Heap de tamaño limit: equivale a sorted(..., reverse=True)[:limit] (estable)
+            best = heapq.nlargest(limit, candidates, key=scores.__getitem__)
+            return [SearchHit(self._doc_ids[doc], float(scores[doc])) for doc in best]
+
+    def __contains__(self, job_id: object) -> bool:
+        return job_id in self._docs
+
+    def __len__(self) -> int:
+        return len(self._docs)
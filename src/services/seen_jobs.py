@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: seen_jobs.py
+Descripción: Historial persistente de job_id ya vistos con un filtro de Bloom
+             escalable. Comprobar un ID cuesta un hash y unas pocas lecturas de
+             bits, con memoria fija por capa; opcionalmente confirma los
+             positivos contra el JobStore para evitar falsos positivos.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import hashlib
+import json
+import logging
+import math
+import os
+import struct
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+from src.models.job_record import JobLike
+from src.services.job_store import JobStore
+from src.utils.file_utils import ensure_dir_exists
+
+logger = logging.getLogger(__name__)
+
+# Cabecera del archivo: firma + longitud de los metadatos JSON
+_MAGIC = b"JSBLOOM1"
+_HEADER = struct.Struct("<8sI")
+
+_MASK64 = (1 << 64) - 1
+
+
+def _hash_pair(key: str) -> Tuple[int, int]:
+    """Dos hashes de 64 bits independientes para el doble hashing"""
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom de capacidad fija
+
+    Las k posiciones de cada clave se obtienen por doble hashing
+    (h1 + i*h2) sobre un único digest, así que añadir o consultar cuesta
+    un hash y k accesos a bits, independientemente de los elementos guardados.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        """
+        Args:
+            capacity: Elementos previstos
+            error_rate: Probabilidad de falso positivo con capacity elementos
+
+        Raises:
+            ValueError: Si los parámetros están fuera de rango
+        """
+        if capacity <= 0:
+            raise ValueError("La capacidad debe ser positiva")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate debe estar entre 0 y 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # Tamaño y número de hashes óptimos para capacity y error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, hashes: Tuple[int, int]) -> List[int]:
+        h1, h2 = hashes
+        m = self.num_bits
+        return [((h1 + i * h2) & _MASK64) % m for i in range(self.num_hashes)]
+
+    def add_hashed(self, hashes: Tuple[int, int]) -> bool:
+        """
+        Añade una clave ya hasheada
+
+        Returns:
+            True si la clave no estaba (algún bit cambió)
+        """
+        bits = self._bits
+        added = False
+        for position in self._positions(hashes):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def contains_hashed(self, hashes: Tuple[int, int]) -> bool:
+        """True si la clave ya hasheada puede estar (False es seguro)"""
+        bits = self._bits
+        for position in self._positions(hashes):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def add(self, key: str) -> bool:
+        """Añade una clave; True si no estaba"""
+        return self.add_hashed(_hash_pair(key))
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.contains_hashed(_hash_pair(key))
+
+    @property
+    def is_full(self) -> bool:
+        """True si alcanzó la capacidad prevista"""
+        return self.count >= self.capacity
+
+
+class ScalableBloomFilter:
+    """
+    Filtro de Bloom que crece por capas
+
+    Cuando la capa actual llega a su capacidad se añade otra growth veces
+    mayor y con un error tightening veces menor, de modo que el error total
+    queda acotado por error_rate sin conocer de antemano cuántos IDs habrá.
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = 100_000,
+        error_rate: float = 0.001,
+        growth: int = 2,
+        tightening: float = 0.5
+    ):
+        """
+        Args:
+            initial_capacity: Capacidad de la primera capa
+            error_rate: Probabilidad máxima de falso positivo del conjunto
+            growth: Factor de capacidad de cada capa nueva
+            tightening: Factor de error de cada capa nueva (entre 0 y 1)
+        """
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self.filters: List[BloomFilter] = []
+
+    def _new_filter(self) -> BloomFilter:
+        level = len(self.filters)
+        # Serie geométrica: la suma de errores de todas las capas <= error_rate
+        error = self.error_rate * (1 - self.tightening) * self.tightening ** level
+        layer = BloomFilter(self.initial_capacity * self.growth ** level, error)
+        self.filters.append(layer)
+        return layer
+
+    def add(self, key: str) -> bool:
+        """
+        Añade una clave
+
+        Returns:
+            True si la clave no estaba
+        """
+        hashes = _hash_pair(key)
+        if any(layer.contains_hashed(hashes) for layer in self.filters):
+            return False
+        layer = self.filters[-1] if self.filters and not self.filters[-1].is_full else self._new_filter()
+        return layer.add_hashed(hashes)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        hashes = _hash_pair(key)
+        return any(layer.contains_hashed(hashes) for layer in self.filters)
+
+    def __len__(self) -> int:
+        """Claves añadidas (aproximado: un falso positivo al añadir no cuenta)"""
+        return sum(layer.count for layer in self.filters)
+
+    @property
+    def size_bytes(self) -> int:
+        """Memoria ocupada por los bits de todas las capas"""
+        return sum(len(layer._bits) for layer in self.filters)
+
+    # ------------------------------------------------------------------
+    # Persistencia
+    # ------------------------------------------------------------------
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Guarda el filtro de forma atómica (archivo temporal + rename)
+
+        Args:
+            path: Archivo destino
+        """
+        path = Path(path)
+        ensure_dir_exists(path.parent)
+        meta = json.dumps({
+            'initial_capacity': self.initial_capacity,
+            'error_rate': self.error_rate,
+            'growth': self.growth,
+            'tightening': self.tightening,
+            'layers': [
+                {'capacity': f.capacity, 'error_rate': f.error_rate, 'count': f.count}
+                for f in self.filters
+            ],
+        }).encode('utf-8')
+
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, len(meta)))
+            f.write(meta)
+            for layer in self.filters:
+                f.write(layer._bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ScalableBloomFilter":
+        """
+        Carga un filtro guardado con save()
+
+        Args:
+            path: Archivo
+
+        Returns:
+            ScalableBloomFilter
+
+        Raises:
+            ValueError: Si el archivo no es un filtro válido
+        """
+        with open(path, 'rb') as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size or _HEADER.unpack(header)[0] != _MAGIC:
+                raise ValueError(f"No es un filtro de vistos: {path}")
+            meta = json.loads(f.read(_HEADER.unpack(header)[1]))
+
+            bloom = cls(meta['initial_capacity'], meta['error_rate'], meta['growth'], meta['tightening'])
+            for info in meta['layers']:
+                layer = BloomFilter(info['capacity'], info['error_rate'])
+                layer.count = info['count']
+                bits = f.read(len(layer._bits))
+                if len(bits) != len(layer._bits):
+                    raise ValueError(f"Filtro de vistos truncado: {path}")
+                layer._bits[:] = bits
+                bloom.filters.append(layer)
+        return bloom
+
+
+class SeenJobs:
+    """
+    Historial de job_id vistos en ejecuciones anteriores
+
+    Un "no visto" del filtro es siempre correcto. Un "visto" puede ser un
+    falso positivo (con probabilidad error_rate); si hay JobStore se
+    confirma con una consulta por clave primaria.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        job_store: Optional[JobStore] = None,
+        initial_capacity: int = 100_000,
+        error_rate: float = 0.001
+    ):
+        """
+        Args:
+            path: Archivo donde persiste el filtro (None: solo en memoria)
+            job_store: Almacén para confirmar los positivos (opcional). Si el
+                archivo aún no existe, el filtro se siembra con sus IDs.
+            initial_capacity: Capacidad de la primera capa del filtro
+            error_rate: Probabilidad máxima de falso positivo
+        """
+        self.path = Path(path) if path is not None else None
+        self.job_store = job_store
+        self._dirty = False
+
+        if self.path is not None and self.path.exists():
+            self.bloom = ScalableBloomFilter.load(self.path)
+            logger.debug(f"SeenJobs cargado: {len(self.bloom)} IDs desde {self.path}")
+        else:
+            self.bloom = ScalableBloomFilter(initial_capacity, error_rate)
+            if job_store is not None:
+                for job_id in job_store.iter_ids():
+                    self.bloom.add(job_id)
+                self._dirty = len(self.bloom) > 0
+                logger.debug(f"SeenJobs sembrado con {len(self.bloom)} IDs del almacén")
+
+    def __contains__(self, job_id: object) -> bool:
+        if job_id not in self.bloom:
+            return False
+        if self.job_store is not None:
+            return job_id in self.job_store
+        return True
+
+    def add_many(self, job_ids: Iterable[str]) -> int:
+        """
+        Marca IDs como vistos
+
+        Returns:
+            Número de IDs que no estaban en el filtro
+        """
+        added = sum(1 for job_id in job_ids if self.bloom.add(job_id))
+        self._dirty = self._dirty or added > 0
+        return added
+
+    def split(self, jobs: Iterable[JobLike]) -> Tuple[List[JobLike], List[JobLike]]:
+        """
+        Separa trabajos nuevos y ya vistos (sin marcarlos)
+
+        Args:
+            jobs: Trabajos
+
+        Returns:
+            Tupla (nuevos, vistos), cada una en el orden original
+        """
+        new_jobs: List[JobLike] = []
+        seen_jobs: List[JobLike] = []
+        for job in jobs:
+            (seen_jobs if job.job_id in self else new_jobs).append(job)
+        return new_jobs, seen_jobs
+
+    def save(self) -> None:
+        """Persiste el filtro si cambió desde la última vez"""
+        if self.path is None or not self._dirty:
+            return
+        self.bloom.save(self.path)
+        self._dirty = False
+        logger.debug(f"SeenJobs guardado: {len(self.bloom)} IDs en {self.path}")
+
+    def __len__(self) -> int:
+        return len(self.bloom)
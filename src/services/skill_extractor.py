@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: skill_extractor.py
+Descripción: Extracción de skills de las descripciones con un autómata
+             Aho-Corasick construido a partir de un diccionario configurable
+             con alias. Cada descripción se recorre una sola vez, sea cual
+             sea el tamaño del diccionario.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import json
+import logging
+import re
+from bisect import bisect_left
+from collections import Counter, deque
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple, Union
+from src.models.job_record import JobLike, JobRecord
+from config.skills import AMBIGUOUS_TERMS, SKILLS
+
+logger = logging.getLogger(__name__)
+
+# Palabras tal como aparecen en skills: "c++", "c#", "node.js", ".net"
+# (el punto inicial solo cuenta al principio de una palabra)
+_TOKEN = re.compile(r"(?:(?<!\S)\.)?[\w+#]+(?:\.[\w+#]+)*")
+
+SkillDictionary = Dict[str, Sequence[str]]
+
+# Palabras a cada lado en las que otra skill da contexto a un término ambiguo
+CONTEXT_WINDOW = 8
+
+
+def tokenize_skills(text: Optional[str]) -> List[str]:
+    """
+    Divide un texto en palabras en minúsculas conservando +, # y puntos internos
+
+    Args:
+        text: Texto original
+
+    Returns:
+        Lista de palabras en orden
+    """
+    if not text:
+        return []
+    return _TOKEN.findall(text.lower())
+
+
+def load_skill_dictionary(path: Union[str, Path]) -> SkillDictionary:
+    """
+    Lee un diccionario de skills en JSON ({"Kubernetes": ["k8s"], ...})
+
+    Args:
+        path: Ruta del archivo
+
+    Returns:
+        Diccionario nombre canónico -> alias
+
+    Raises:
+        ValueError: Si el archivo no tiene ese formato
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if not isinstance(data, dict) or not all(
+        isinstance(aliases, list) and all(isinstance(alias, str) for alias in aliases)
+        for aliases in data.values()
+    ):
+        raise ValueError(f"Diccionario de skills inválido: {path}")
+    return data
+
+
+class SkillExtractor:
+    """
+    Autómata Aho-Corasick sobre palabras
+
+    El alfabeto del autómata son palabras completas en lugar de caracteres,
+    de modo que una coincidencia siempre empieza y termina en límite de
+    palabra ("Java" no aparece en "JavaScript") y el recorrido avanza una
+    palabra por paso. Cuando dos coincidencias se solapan gana la más
+    larga ("React Native" frente a "React").
+
+    Los patrones de una sola palabra que también son palabras comunes
+    (ambiguous) solo cuentan si otra skill aparece a CONTEXT_WINDOW palabras
+    o menos: "React and TypeScript" sí, "react quickly to incidents" no.
+    """
+
+    def __init__(
+        self,
+        dictionary: Optional[SkillDictionary] = None,
+        ambiguous: Iterable[str] = AMBIGUOUS_TERMS
+    ):
+        """
+        Args:
+            dictionary: Nombre canónico -> alias (por defecto config.skills.SKILLS)
+            ambiguous: Palabras que solo cuentan con otra skill cerca (por
+                defecto config.skills.AMBIGUOUS_TERMS)
+        """
+        dictionary = SKILLS if dictionary is None else dictionary
+        self.ambiguous: FrozenSet[str] = frozenset(word.lower() for word in ambiguous)
+
+        self.skills: List[str] = []
+        # Transiciones, enlace de fallo y coincidencias (skill, longitud) por estado
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[Tuple[int, int], ...]] = [()]
+
+        for canonical, aliases in dictionary.items():
+            skill = len(self.skills)
+            self.skills.append(canonical)
+            for pattern in (canonical, *aliases):
+                self._add_pattern(tokenize_skills(pattern), skill)
+        self._build_failure_links()
+
+        logger.debug(
+            f"SkillExtractor: {len(self.skills)} skills, {len(self._goto)} estados"
+        )
+
+    @classmethod
+    def from_config(cls, path: Optional[Union[str, Path]] = None) -> "SkillExtractor":
+        """
+        Crea el extractor con el diccionario por defecto ampliado con un archivo
+
+        Args:
+            path: Archivo JSON con skills adicionales o alias nuevos (opcional)
+
+        Returns:
+            SkillExtractor
+        """
+        dictionary = {name: list(aliases) for name, aliases in SKILLS.items()}
+        if path is not None:
+            for name, aliases in load_skill_dictionary(path).items():
+                dictionary.setdefault(name, []).extend(aliases)
+        return cls(dictionary)
+
+    def _add_pattern(self, words: List[str], skill: int) -> None:
+        """Añade la secuencia de palabras de un alias al trie"""
+        if not words:
+            return
+        state = 0
+        for word in words:
+            next_state = self._goto[state].get(word)
+            if next_state is None:
+                next_state = self._goto[state][word] = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = next_state
+        if all(match[0] != skill for match in self._out[state]):
+            self._out[state] += ((skill, len(words)),)
+
+    def _build_failure_links(self) -> None:
+        """Enlaces de fallo por anchura; cada estado hereda las coincidencias de su fallo"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(word, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] += self._out[self._fail[child]]
+
+    # ------------------------------------------------------------------
+    # Extracción
+    # ------------------------------------------------------------------
+
+    def extract(self, text: Optional[str]) -> List[str]:
+        """
+        Skills mencionadas en un texto
+
+        Args:
+            text: Descripción u otro texto
+
+        Returns:
+            Nombres canónicos sin repetir, por orden de primera aparición
+        """
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        root = goto[0]
+
+        # (inicio, -longitud, skill): al ordenar, la más larga primero en cada inicio
+        matches: List[Tuple[int, int, int]] = []
+        words = tokenize_skills(text)
+        state = 0
+        for position, word in enumerate(words):
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0) if state else root.get(word, 0)
+            if out[state]:
+                for skill, length in out[state]:
+                    matches.append((position - length + 1, -length, skill))
+
+        if not matches:
+            return []
+
+        # Sin solapes; las palabras ambiguas sueltas quedan pendientes de contexto
+        accepted: List[Tuple[int, int, bool]] = []
+        anchors: List[int] = []
+        covered = -1
+        for start, negative_length, skill in sorted(matches):
+            if start > covered:
+                ambiguous = negative_length == -1 and words[start] in self.ambiguous
+                accepted.append((start, skill, ambiguous))
+                if not ambiguous:
+                    anchors.append(start)
+                covered = start - negative_length - 1
+
+        found: Dict[int, None] = {}
+        for start, skill, ambiguous in accepted:
+            if ambiguous and not self._has_context(anchors, start):
+                continue
+            found.setdefault(skill)
+        return [self.skills[skill] for skill in found]
+
+    @staticmethod
+    def _has_context(anchors: List[int], position: int) -> bool:
+        """Indica si alguna skill no ambigua empieza a CONTEXT_WINDOW palabras o menos"""
+        i = bisect_left(anchors, position - CONTEXT_WINDOW)
+        return i < len(anchors) and anchors[i] <= position + CONTEXT_WINDOW
+
+    def extract_job(self, job: JobLike) -> List[str]:
+        """
+        Skills de un trabajo: las de required_skills seguidas de las extraídas
+        del título, los highlights y la descripción
+
+        Args:
+            job: Trabajo
+
+        Returns:
+            Skills sin repetir (sin distinguir mayúsculas)
+        """
+        highlights = " ".join(
+            " ".join(value) if isinstance(value, (list, tuple)) else str(value)
+            for value in (job.highlights or {}).values()
+        )
+        text = "\n".join(filter(None, (job.title, highlights, job.description)))
+
+        skills: Dict[str, str] = {}
+        for skill in (*job.required_skills, *self.extract(text)):
+            skills.setdefault(skill.casefold(), skill)
+        return list(skills.values())
+
+    def enrich(self, job: JobLike) -> JobLike:
+        """
+        Completa required_skills con las skills extraídas del trabajo
+
+        Args:
+            job: Job o JobRecord
+
+        Returns:
+            El mismo trabajo si no hay skills nuevas; si no, una copia con ellas
+        """
+        skills = self.extract_job(job)
+        if len(skills) == len(job.required_skills):
+            return job
+        if isinstance(job, JobRecord):
+            return JobRecord(**dict(job.model_dump(), required_skills=skills))
+        return job.model_copy(update={'required_skills': skills})
+
+    def enrich_many(self, jobs: Iterable[JobLike]) -> List[JobLike]:
+        """
+        Completa required_skills en varios trabajos
+
+        Args:
+            jobs: Trabajos
+
+        Returns:
+            Trabajos enriquecidos, en el mismo orden
+        """
+        return [self.enrich(job) for job in jobs]
+
+
+def skill_counts(jobs: Iterable[JobLike], top: Optional[int] = None) -> List[Tuple[str, int]]:
+    """
+    Número de trabajos que piden cada skill
+
+    Args:
+        jobs: Trabajos (con required_skills ya enriquecidas)
+        top: Devolver solo las top más pedidas (opcional)
+
+    Returns:
+        Pares (skill, trabajos) de más a menos pedida
+    """
+    counts: Counter = Counter()
+    names: Dict[str, str] = {}
+    for job in jobs:
+        keys = {skill.casefold() for skill in job.required_skills}
+        for skill in job.required_skills:
+            names.setdefault(skill.casefold(), skill)
+        counts.update(keys)
+    return [(names[key], count) for key, count in counts.most_common(top)]
@@ -14,7 +14,7 @@ from typing import List
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
-from src.models.job import Job
+from src.models.job_record import JobLike
 from src.models.salary import SalaryInfo
 
 
@@ -22,7 +22,7 @@ class JobFormatter:
     """Formatter for jobs"""
 
     @staticmethod
-    def format_job_table(jobs: List[Job]) -> Table:
+    def format_job_table(jobs: List[JobLike]) -> Table:
         """
         Create Rich table of jobs with all details
 
@@ -72,12 +72,12 @@ class JobFormatter:
         return table
 
     @staticmethod
-    def format_job_details(job: Job) -> Panel:
+    def format_job_details(job: JobLike) -> Panel:
         """
         Format job details in Rich panel
 
         Args:
-            job: Job object
+            job: Job or JobRecord object
 
         Returns:
             Rich Panel with details
@@ -111,7 +111,7 @@ class JobFormatter:
         )
 
     @staticmethod
-    def format_job_summary(jobs: List[Job]) -> str:
+    def format_job_summary(jobs: List[JobLike]) -> str:
         """
         Format job summary in plain text
 
@@ -51,6 +51,7 @@ class MenuSystem:
   [11] Get Job Details (by ID)
   [12] View Estimated Salaries
   [13] View Company Salaries
+  [14] Search Saved Jobs (offline)
 
 [bold red][0] Exit[/bold red]
         """
@@ -61,7 +62,7 @@ class MenuSystem:
         # Get user choice
         choice = Prompt.ask(
             "\n[bold]Select an option[/bold]",
-            choices=[str(i) for i in range(14)],
+            choices=[str(i) for i in range(15)],
             default="0"
         )
 
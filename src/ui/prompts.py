@@ -118,6 +118,17 @@ class Prompts:
 
         return job_id, country
 
+    def get_saved_search_query(self) -> str:
+        """
+        Request keywords to search among saved jobs
+
+        Returns:
+            Search keywords
+        """
+        self.console.print_header("SEARCH SAVED JOBS")
+
+        return Prompt.ask("\n[cyan]Keywords[/cyan] (e.g: python django remote)")
+
     def get_salary_estimate_params(self) -> Dict[str, str]:
         """
         Get parameters for salary estimation
@@ -11,9 +11,10 @@ Versión: 3.0.0
 Fecha: 2025-12-08
 """
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field
+from pydantic import Field, model_validator
+from src.utils.file_utils import check_compression_level
 
 
 class Config(BaseSettings):
@@ -26,8 +27,52 @@ class Config(BaseSettings):
     # Request Settings
     max_retries: int = Field(default=3, ge=1, le=10, description="Número máximo de reintentos")
     retry_delay: int = Field(default=2, ge=1, le=10, description="Delay entre reintentos (segundos)")
+    retry_deadline: float = Field(default=60.0, ge=1.0, le=600.0, description="Tiempo máximo por llamada con reintentos (segundos)")
+    retry_budget_ratio: float = Field(default=0.2, ge=0.0, le=1.0, description="Reintentos permitidos por request original")
     request_timeout: int = Field(default=30, ge=10, le=120, description="Timeout de requests (segundos)")
     rate_limit_delay: float = Field(default=1.0, ge=0.1, le=5.0, description="Delay entre requests (segundos)")
+    adaptive_rate_limit: bool = Field(default=True, description="Ajustar la tasa automáticamente según los 429 recibidos")
+    max_requests_per_second: Optional[float] = Field(default=None, ge=0.1, le=50.0, description="Tasa máxima del control adaptativo (por defecto la de rate_limit_delay: solo frena ante 429; un valor mayor sondea el límite del proveedor)")
+    rate_limit_burst: int = Field(default=1, ge=1, le=20, description="Requests permitidos en ráfaga sin esperar")
+    max_concurrency: int = Field(default=8, ge=1, le=64, description="Máximo de requests simultáneos en vuelo")
+    page_fan_out: bool = Field(default=False, description="Dividir búsquedas multipágina en requests paralelos por página")
+    search_page_by_page: bool = Field(default=False, description="Buscar página a página mostrando el progreso (una petición de cuota por página)")
+
+    # Response Cache
+    cache_enabled: bool = Field(default=True, description="Cachear respuestas de la API en disco")
+    cache_path: Path = Field(default=Path("cache/api_responses.sqlite3"), description="Archivo SQLite de la caché")
+    cache_max_entries: int = Field(default=2000, ge=10, le=100000, description="Máximo de respuestas cacheadas (LRU)")
+    cache_ttl_search: int = Field(default=900, ge=0, description="TTL de búsquedas (segundos)")
+    cache_ttl_details: int = Field(default=86400, ge=0, description="TTL de detalles de trabajo (segundos)")
+    cache_ttl_salary: int = Field(default=259200, ge=0, description="TTL de salarios (segundos)")
+
+    # Job Store
+    store_enabled: bool = Field(default=True, description="Guardar los trabajos encontrados en el almacén local")
+    store_path: Path = Field(default=Path("data/jobs.sqlite3"), description="Archivo SQLite del almacén de trabajos")
+
+    # Deduplication
+    dedup_enabled: bool = Field(default=True, description="Colapsar la misma oferta publicada en varios publishers")
+    dedup_threshold: float = Field(default=0.8, ge=0.5, le=1.0, description="Similitud mínima para considerar duplicadas dos ofertas")
+
+    # Skill Extraction
+    skills_enabled: bool = Field(default=True, description="Completar required_skills con las skills de la descripción")
+    skills_path: Optional[Path] = Field(default=None, description="Archivo JSON con skills y alias adicionales")
+
+    # Seen Jobs
+    seen_enabled: bool = Field(default=True, description="Marcar los trabajos ya vistos en ejecuciones anteriores")
+    seen_path: Path = Field(default=Path("data/seen_jobs.bloom"), description="Archivo del filtro de trabajos vistos")
+    seen_error_rate: float = Field(default=0.001, gt=0.0, le=0.1, description="Probabilidad máxima de falso positivo del filtro")
+    skip_seen_jobs: bool = Field(default=False, description="Omitir de los resultados los trabajos ya vistos")
+    export_only_new: bool = Field(default=False, description="Exportar solo los trabajos no exportados antes (un falso positivo del filtro, con probabilidad seen_error_rate, omite un trabajo)")
+    export_seen_path: Path = Field(default=Path("data/exported_jobs.bloom"), description="Archivo del filtro de trabajos exportados")
+
+    # Export Compression
+    export_compression: Optional[Literal["gzip", "zstd"]] = Field(default=None, description="Compresión de las exportaciones de trabajos (zstd requiere zstandard)")
+    export_compression_level: Optional[int] = Field(default=None, ge=1, le=22, description="Nivel de compresión (gzip 1-9, zstd 1-22; por defecto 6 y 3)")
+
+    # Export Deduplication
+    export_dedup: Optional[Literal["skip", "link"]] = Field(default=None, description="Exportación idéntica a una anterior: no escribir (skip) o enlazar (link)")
+    export_deltas: bool = Field(default=False, description="Escribir los job_id añadidos/eliminados desde la exportación anterior")
 
     # Paths
     output_dir: Path = Field(default=Path("output"), description="Directorio de salida")
@@ -44,6 +89,12 @@ class Config(BaseSettings):
         case_sensitive=False
     )
 
+    @model_validator(mode='after')
+    def check_export_compression_level(self) -> "Config":
+        """Valida el nivel de compresión contra el rango del algoritmo elegido"""
+        check_compression_level(self.export_compression, self.export_compression_level)
+        return self
+
     def validate_and_setup(self) -> None:
         """Valida configuración y crea directorios necesarios"""
         if not self.api_key or self.api_key == "TU_API_KEY_AQUI":
@@ -10,10 +10,25 @@ Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
 Versión: 3.0.0
 Fecha: 2025-12-08
 """
+import gzip
 import re
 from pathlib import Path
 from datetime import datetime
-from typing import Union
+from typing import IO, Optional, Union
+
+try:
+    import zstandard
+except ImportError:  # Dependencia opcional: solo para archivos .zst
+    zstandard = None
+
+# Extensión añadida por cada compresión
+COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+
+# Nivel por defecto de cada compresión
+DEFAULT_COMPRESSION_LEVELS = {'gzip': 6, 'zstd': 3}
+
+# Niveles admitidos por cada compresión (ambos incluidos)
+COMPRESSION_LEVEL_RANGES = {'gzip': (1, 9), 'zstd': (1, 22)}
 
 
 def clean_filename(filename: str) -> str:
@@ -103,3 +118,84 @@ def format_file_size(size_bytes: int) -> str:
             return f"{size_bytes:.1f} {unit}"
         size_bytes /= 1024.0
     return f"{size_bytes:.1f} TB"
+
+
+def compression_from_path(file_path: Union[str, Path]) -> Optional[str]:
+    """
+    Detecta la compresión de un archivo por su extensión
+
+    Args:
+        file_path: Ruta del archivo
+
+    Returns:
+        'gzip', 'zstd' o None si no está comprimido
+    """
+    suffix = Path(file_path).suffix
+    for compression, compression_suffix in COMPRESSION_SUFFIXES.items():
+        if suffix == compression_suffix:
+            return compression
+    return None
+
+
+def check_compression_level(compression: Optional[str], level: Optional[int]) -> None:
+    """
+    Comprueba que un nivel de compresión sea válido para el algoritmo
+
+    Args:
+        compression: 'gzip', 'zstd' o None (sin compresión, el nivel se ignora)
+        level: Nivel pedido (None: el nivel por defecto)
+
+    Raises:
+        ValueError: Si el nivel está fuera del rango del algoritmo
+    """
+    if compression is None or level is None or compression not in COMPRESSION_LEVEL_RANGES:
+        return
+    low, high = COMPRESSION_LEVEL_RANGES[compression]
+    if not low <= level <= high:
+        raise ValueError(f"Nivel de compresión {level} no válido para {compression} ({low}-{high})")
+
+
+def open_compressed(
+    file_path: Union[str, Path],
+    mode: str = 'rt',
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+    newline: Optional[str] = None
+) -> IO:
+    """
+    Abre un archivo de texto UTF-8 comprimiendo o descomprimiendo en streaming
+
+    Args:
+        file_path: Ruta del archivo
+        mode: 'rt' para leer o 'wt' para escribir
+        compression: 'gzip', 'zstd' o None (por defecto, según la extensión)
+        level: Nivel de compresión al escribir (por defecto DEFAULT_COMPRESSION_LEVELS)
+        newline: Igual que en open()
+
+    Returns:
+        Archivo de texto
+
+    Raises:
+        ValueError: Si la compresión o el nivel no son válidos o zstandard no
+            está instalado
+    """
+    if compression is None:
+        compression = compression_from_path(file_path)
+    if compression is not None and compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Compresión no válida: {compression}")
+    check_compression_level(compression, level)
+    if level is None and compression is not None:
+        level = DEFAULT_COMPRESSION_LEVELS[compression]
+    writing = 'w' in mode
+
+    if compression == 'gzip':
+        kwargs = {'compresslevel': level} if writing else {}
+        return gzip.open(file_path, mode, encoding='utf-8', newline=newline, **kwargs)
+
+    if compression == 'zstd':
+        if zstandard is None:
+            raise ValueError("Compresión zstd no disponible: instala el paquete zstandard")
+        kwargs = {'cctx': zstandard.ZstdCompressor(level=level)} if writing else {}
+        return zstandard.open(file_path, mode, encoding='utf-8', newline=newline, **kwargs)
+
+    return open(file_path, mode, encoding='utf-8', newline=newline)
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_async_jsearch_client.py
+Descripción: Tests para AsyncJSearchClient
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from src.api.async_jsearch_client import AsyncJSearchClient
+from src.api.client import HTTPError
+from src.api.jsearch_client import JSearchClient
+from src.api.rate_limiter import RateLimiter
+from src.api.response_cache import ResponseCache
+from src.models.search_params import SearchParameters
+
+
+def make_sync_client():
+    """Cliente síncrono simulado con un rate limiter real"""
+    sync_client = Mock()
+    sync_client.rate_limiter = RateLimiter(delay=0.1)
+    return sync_client
+
+
+class TestAsyncJSearchClient:
+    """Tests para AsyncJSearchClient"""
+
+    def test_initialization_wraps_sync_client(self):
+        """Test comparte rate limiter con el cliente síncrono"""
+        sync_client = JSearchClient(api_key="test_key")
+
+        client = AsyncJSearchClient(client=sync_client, max_concurrency=4)
+
+        assert client.client is sync_client
+        assert client.rate_limiter is sync_client.rate_limiter
+        assert client.max_concurrency == 4
+
+    def test_initialization_from_api_key(self):
+        """Test crea su propio JSearchClient"""
+        mock_config = Mock()
+        mock_config.request_timeout = 30
+        mock_config.rate_limit_delay = 1.0
+        mock_config.max_retries = 3
+        mock_config.retry_delay = 2
+        mock_config.retry_deadline = 60.0
+        mock_config.retry_budget_ratio = 0.2
+        mock_config.adaptive_rate_limit = False
+        mock_config.max_requests_per_second = 5.0
+        mock_config.rate_limit_burst = 1
+        mock_config.max_concurrency = 12
+        mock_config.page_fan_out = False
+        mock_config.cache_enabled = False
+
+        client = AsyncJSearchClient(api_key="test_key", config=mock_config)
+
+        assert isinstance(client.client, JSearchClient)
+        assert client.max_concurrency == 12
+
+    def test_initialization_default_concurrency(self):
+        """Test concurrencia por defecto sin config"""
+        client = AsyncJSearchClient(api_key="test_key")
+        assert client.max_concurrency == 8
+
+    def test_initialization_requires_key_or_client(self):
+        """Test falla sin api_key ni cliente"""
+        with pytest.raises(ValueError):
+            AsyncJSearchClient()
+
+    def test_initialization_invalid_concurrency(self):
+        """Test rechaza concurrencia menor a 1"""
+        with pytest.raises(ValueError):
+            AsyncJSearchClient(api_key="test_key", max_concurrency=0)
+
+    def test_search_jobs(self):
+        """Test search_jobs delega en el cliente síncrono"""
+        sync_client = make_sync_client()
+        sync_client.search_jobs.return_value = [{"job_id": "1"}]
+        params = SearchParameters(query="python")
+
+        async def run():
+            async with AsyncJSearchClient(client=sync_client) as client:
+                return await client.search_jobs(params)
+
+        result = asyncio.run(run())
+
+        assert result == [{"job_id": "1"}]
+        sync_client.search_jobs.assert_called_once_with(params, bypass_cache=False)
+        sync_client.close.assert_not_called()
+
+    def test_aclose_keeps_shared_client_usable(self, tmp_path):
+        """Test cerrar el cliente asíncrono no cierra el síncrono (ni su caché) del llamador"""
+        cache = ResponseCache(tmp_path / "cache.sqlite3")
+        sync_client = JSearchClient(api_key="test_key", cache=cache)
+        sync_client.client.get = Mock(return_value={"data": [{"median_salary": 1}]})
+
+        async def run():
+            async with AsyncJSearchClient(client=sync_client):
+                pass
+
+        asyncio.run(run())
+
+        assert sync_client.get_estimated_salary("Dev", "Madrid") == [{"median_salary": 1}]
+        sync_client.close()
+
+    def test_aclose_closes_own_client(self):
+        """Test el cliente síncrono creado internamente sí se cierra"""
+        client = AsyncJSearchClient(api_key="test_key")
+        client.client.close = Mock()
+
+        asyncio.run(client.aclose())
+
+        client.client.close.assert_called_once()
+
+    def test_rate_limit_waits_run_on_event_loop(self):
+        """Test las esperas del rate limiter usan wait_async, no time.sleep en el hilo"""
+        sync_client = JSearchClient(api_key="test_key")
+        sync_client.rate_limiter = RateLimiter(delay=0.05)
+        sync_client.client.get = Mock(return_value={"data": []})
+        params = [SearchParameters(query=f"q{i}") for i in range(3)]
+        wait_async = sync_client.rate_limiter.wait_async
+
+        async def run():
+            async with AsyncJSearchClient(client=sync_client) as client:
+                await asyncio.gather(*(client.search_jobs(p) for p in params))
+
+        with patch.object(sync_client.rate_limiter, 'wait_async', side_effect=wait_async) as spy, \
+                patch('src.api.rate_limiter.time.sleep', side_effect=AssertionError("time.sleep")):
+            asyncio.run(run())
+
+        assert spy.call_count == 3
+        assert sync_client.client.get.call_count == 3
+
+    def test_get_job_details(self):
+        """Test get_job_details pasa los parámetros"""
+        sync_client = make_sync_client()
+        sync_client.get_job_details.return_value = {"job_id": "abc"}
+
+        async def run():
+            client = AsyncJSearchClient(client=sync_client)
+            return await client.get_job_details("abc", "es", language="es")
+
+        result = asyncio.run(run())
+
+        assert result == {"job_id": "abc"}
+        sync_client.get_job_details.assert_called_once_with(
+            "abc", "es", language="es", fields=None, bypass_cache=False
+        )
+
+    def test_salary_endpoints(self):
+        """Test endpoints de salarios"""
+        sync_client = make_sync_client()
+        sync_client.get_estimated_salary.return_value = [{"median_salary": 1}]
+        sync_client.get_company_salary.return_value = [{"median_salary": 2}]
+
+        async def run():
+            client = AsyncJSearchClient(client=sync_client)
+            return await asyncio.gather(
+                client.get_estimated_salary("Dev", "Madrid"),
+                client.get_company_salary("Acme", "Dev", location="Madrid")
+            )
+
+        estimated, company = asyncio.run(run())
+
+        assert estimated == [{"median_salary": 1}]
+        assert company == [{"median_salary": 2}]
+        sync_client.get_estimated_salary.assert_called_once_with(
+            "Dev", "Madrid", location_type="ANY", years_of_experience="ALL",
+            fields=None, bypass_cache=False
+        )
+        sync_client.get_company_salary.assert_called_once_with(
+            "Acme", "Dev", location="Madrid", location_type="ANY", years_of_experience="ALL",
+            bypass_cache=False
+        )
+
+    def test_errors_propagate(self):
+        """Test las excepciones del cliente síncrono se propagan"""
+        sync_client = make_sync_client()
+        sync_client.get_job_details.side_effect = HTTPError(404, "Trabajo no encontrado")
+
+        async def run():
+            client = AsyncJSearchClient(client=sync_client)
+            await client.get_job_details("missing")
+
+        with pytest.raises(HTTPError) as exc_info:
+            asyncio.run(run())
+
+        assert exc_info.value.status_code == 404
+
+    def test_concurrency_is_bounded(self):
+        """Test nunca hay más peticiones en vuelo que max_concurrency"""
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+
+        def slow_search(params, bypass_cache=False):
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            time.sleep(0.02)
+            with lock:
+                state["current"] -= 1
+            return []
+
+        sync_client = make_sync_client()
+        sync_client.search_jobs.side_effect = slow_search
+        params = SearchParameters(query="python")
+
+        async def run():
+            client = AsyncJSearchClient(client=sync_client, max_concurrency=3)
+            await asyncio.gather(*(client.search_jobs(params) for _ in range(12)))
+
+        asyncio.run(run())
+
+        assert sync_client.search_jobs.call_count == 12
+        assert 1 < state["peak"] <= 3
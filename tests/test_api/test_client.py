@@ -12,7 +12,7 @@ Fecha: 2025-12-08
 import pytest
 import json
 from unittest.mock import Mock, patch, MagicMock
-from src.api.client import HTTPClient, HTTPError
+from src.api.client import HTTPClient, HTTPError, HTTPResponse, parse_retry_after
 
 
 class TestHTTPClient:
@@ -43,6 +43,7 @@ class TestHTTPClient:
         """Test GET request exitoso"""
         # Mock de la respuesta
         mock_response = Mock()
+        mock_response.getheaders.return_value = []
         mock_response.status = 200
         mock_response.read.return_value = b'{"result": "success", "data": []}'
 
@@ -63,6 +64,7 @@ class TestHTTPClient:
     def test_get_request_with_params(self, mock_conn_class):
         """Test GET request con parámetros"""
         mock_response = Mock()
+        mock_response.getheaders.return_value = []
         mock_response.status = 200
         mock_response.read.return_value = b'{"ok": true}'
 
@@ -81,6 +83,7 @@ class TestHTTPClient:
     def test_get_request_without_params(self, mock_conn_class):
         """Test GET request sin parámetros"""
         mock_response = Mock()
+        mock_response.getheaders.return_value = []
         mock_response.status = 200
         mock_response.read.return_value = b'{"ok": true}'
 
@@ -98,6 +101,7 @@ class TestHTTPClient:
     def test_get_request_http_error(self, mock_conn_class):
         """Test GET request con error HTTP"""
         mock_response = Mock()
+        mock_response.getheaders.return_value = []
         mock_response.status = 404
         mock_response.read.return_value = b'Not Found'
 
@@ -118,6 +122,7 @@ class TestHTTPClient:
     def test_get_request_json_decode_error(self, mock_conn_class):
         """Test GET request con error de JSON"""
         mock_response = Mock()
+        mock_response.getheaders.return_value = []
         mock_response.status = 200
         mock_response.read.return_value = b'Invalid JSON{{'
 
@@ -136,6 +141,7 @@ class TestHTTPClient:
     def test_post_request_success(self, mock_conn_class):
         """Test POST request exitoso"""
         mock_response = Mock()
+        mock_response.getheaders.return_value = []
         mock_response.status = 201
         mock_response.read.return_value = b'{"id": "123", "created": true}'
 
@@ -154,6 +160,7 @@ class TestHTTPClient:
     def test_post_request_with_params_and_data(self, mock_conn_class):
         """Test POST request con parámetros y datos"""
         mock_response = Mock()
+        mock_response.getheaders.return_value = []
         mock_response.status = 200
         mock_response.read.return_value = b'{"ok": true}'
 
@@ -177,6 +184,7 @@ class TestHTTPClient:
     def test_post_request_status_200(self, mock_conn_class):
         """Test POST request con status 200"""
         mock_response = Mock()
+        mock_response.getheaders.return_value = []
         mock_response.status = 200
         mock_response.read.return_value = b'{"ok": true}'
 
@@ -193,6 +201,7 @@ class TestHTTPClient:
     def test_post_request_http_error(self, mock_conn_class):
         """Test POST request con error HTTP"""
         mock_response = Mock()
+        mock_response.getheaders.return_value = []
         mock_response.status = 400
         mock_response.read.return_value = b'Bad Request'
 
@@ -212,6 +221,7 @@ class TestHTTPClient:
     def test_post_request_sets_content_type(self, mock_conn_class):
         """Test POST request configura Content-Type"""
         mock_response = Mock()
+        mock_response.getheaders.return_value = []
         mock_response.status = 200
         mock_response.read.return_value = b'{"ok": true}'
 
@@ -233,6 +243,7 @@ class TestHTTPClient:
     def test_post_empty_data(self, mock_conn_class):
         """Test POST request sin datos"""
         mock_response = Mock()
+        mock_response.getheaders.return_value = []
         mock_response.status = 200
         mock_response.read.return_value = b'{"ok": true}'
 
@@ -249,6 +260,125 @@ class TestHTTPClient:
         body_data = json.loads(body.decode('utf-8'))
         assert body_data == {}
 
+    @patch('http.client.HTTPSConnection')
+    def test_keep_alive_connection_is_reused(self, mock_conn_class):
+        """Test conexiones keep-alive se reutilizan entre requests"""
+        mock_response = Mock()
+        mock_response.getheaders.return_value = []
+        mock_response.status = 200
+        mock_response.will_close = False
+        mock_response.read.return_value = b'{"ok": true}'
+
+        mock_conn = Mock()
+        mock_conn.getresponse.return_value = mock_response
+        mock_conn_class.return_value = mock_conn
+
+        client = HTTPClient(host="api.example.com")
+        client.get("/a")
+        client.get("/b")
+
+        assert mock_conn_class.call_count == 1
+        assert mock_conn.request.call_count == 2
+        mock_conn.close.assert_not_called()
+
+    @patch('http.client.HTTPSConnection')
+    def test_reconnects_when_pooled_connection_closed(self, mock_conn_class):
+        """Test reconexión transparente si el servidor cerró el socket"""
+        import http.client
+
+        ok_response = Mock()
+
+        ok_response.getheaders.return_value = []
+        ok_response.status = 200
+        ok_response.will_close = False
+        ok_response.read.return_value = b'{"ok": true}'
+
+        stale_conn = Mock()
+        stale_conn.getresponse.side_effect = [
+            ok_response,
+            http.client.RemoteDisconnected("closed")
+        ]
+        fresh_conn = Mock()
+        fresh_conn.getresponse.return_value = ok_response
+        mock_conn_class.side_effect = [stale_conn, fresh_conn]
+
+        client = HTTPClient(host="api.example.com")
+        client.get("/first")
+        result = client.get("/second")
+
+        assert result == {"ok": True}
+        stale_conn.close.assert_called_once()
+        assert mock_conn_class.call_count == 2
+
+    @patch('http.client.HTTPSConnection')
+    def test_fresh_connection_error_is_raised(self, mock_conn_class):
+        """Test errores en conexiones nuevas no se reintentan"""
+        import http.client
+
+        mock_conn = Mock()
+        mock_conn.getresponse.side_effect = http.client.RemoteDisconnected("closed")
+        mock_conn_class.return_value = mock_conn
+
+        client = HTTPClient(host="api.example.com")
+
+        with pytest.raises(http.client.RemoteDisconnected):
+            client.get("/test")
+
+        mock_conn.close.assert_called_once()
+
+    def test_close_releases_pool(self):
+        """Test close cierra las conexiones del pool"""
+        client = HTTPClient(host="api.example.com")
+        conn = Mock()
+        client.pool.release(conn)
+
+        client.close()
+
+        conn.close.assert_called_once()
+        assert client.pool.idle_count == 0
+
+    @patch('http.client.HTTPSConnection')
+    def test_get_response_exposes_headers(self, mock_conn_class):
+        """Test get_response retorna status y headers en minúsculas"""
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.getheaders.return_value = [("X-RateLimit-Remaining", "9")]
+        mock_response.read.return_value = b'{"ok": true}'
+
+        mock_conn = Mock()
+        mock_conn.getresponse.return_value = mock_response
+        mock_conn_class.return_value = mock_conn
+
+        client = HTTPClient(host="api.example.com")
+        response = client.get_response("/test")
+
+        assert isinstance(response, HTTPResponse)
+        assert response.status == 200
+        assert response.headers == {"x-ratelimit-remaining": "9"}
+        assert response.data == {"ok": True}
+
+    @patch('http.client.HTTPSConnection')
+    def test_on_response_callback(self, mock_conn_class):
+        """Test on_response recibe status y headers de cada respuesta"""
+        mock_response = Mock()
+        mock_response.status = 429
+        mock_response.getheaders.return_value = [("Retry-After", "7")]
+        mock_response.read.return_value = b'Too Many Requests'
+
+        mock_conn = Mock()
+        mock_conn.getresponse.return_value = mock_response
+        mock_conn_class.return_value = mock_conn
+
+        callback = Mock()
+        client = HTTPClient(host="api.example.com", on_response=callback)
+
+        with pytest.raises(HTTPError) as exc_info:
+            client.get("/test")
+
+        callback.assert_called_once_with(429, {"retry-after": "7"})
+        assert exc_info.value.headers == {"retry-after": "7"}
+        assert exc_info.value.retry_after == 7.0
+
 
 class TestHTTPError:
     """Tests para HTTPError"""
@@ -269,3 +399,32 @@ class TestHTTPError:
         assert error.status_code == 500
         assert error.message == ""
         assert "500" in str(error)
+
+    def test_http_error_retry_after_missing(self):
+        """Test retry_after es None sin header"""
+        assert HTTPError(429).retry_after is None
+
+
+class TestParseRetryAfter:
+    """Tests para parse_retry_after"""
+
+    def test_seconds(self):
+        """Test valor en segundos"""
+        assert parse_retry_after("12") == 12.0
+        assert parse_retry_after(" 1.5 ") == 1.5
+
+    def test_negative_seconds_clamped(self):
+        """Test valores negativos se tratan como 0"""
+        assert parse_retry_after("-3") == 0.0
+
+    @patch('time.time', return_value=1_700_000_000.0)
+    def test_http_date(self, mock_time):
+        """Test fecha HTTP"""
+        value = "Tue, 14 Nov 2023 22:13:50 GMT"  # 1_700_000_030
+        assert parse_retry_after(value) == pytest.approx(30.0)
+
+    def test_invalid_values(self):
+        """Test valores vacíos o inválidos"""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after("soon") is None
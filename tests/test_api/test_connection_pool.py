@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_connection_pool.py
+Descripción: Tests para ConnectionPool
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import ssl
+import threading
+from unittest.mock import Mock, patch
+from src.api.connection_pool import ConnectionPool, create_ssl_context
+
+
+class TestConnectionPool:
+    """Tests para ConnectionPool"""
+
+    def test_pool_initialization(self):
+        """Test inicialización del pool"""
+        pool = ConnectionPool("api.example.com", timeout=15, max_size=4, idle_timeout=30.0)
+
+        assert pool.host == "api.example.com"
+        assert pool.timeout == 15
+        assert pool.max_size == 4
+        assert pool.idle_timeout == 30.0
+        assert pool.idle_count == 0
+        assert isinstance(pool.ssl_context, ssl.SSLContext)
+
+    @patch('http.client.HTTPSConnection')
+    def test_acquire_creates_connection(self, mock_conn_class):
+        """Test acquire crea conexión nueva cuando el pool está vacío"""
+        pool = ConnectionPool("api.example.com", timeout=15)
+
+        conn, reused = pool.acquire()
+
+        assert conn is mock_conn_class.return_value
+        assert reused is False
+        assert pool.created_count == 1
+        mock_conn_class.assert_called_once_with(
+            "api.example.com", timeout=15, context=pool.ssl_context
+        )
+
+    @patch('http.client.HTTPSConnection')
+    def test_release_and_reuse(self, mock_conn_class):
+        """Test una conexión liberada se reutiliza"""
+        pool = ConnectionPool("api.example.com")
+
+        conn, _ = pool.acquire()
+        pool.release(conn)
+        assert pool.idle_count == 1
+
+        conn2, reused = pool.acquire()
+        assert conn2 is conn
+        assert reused is True
+        assert pool.reused_count == 1
+        assert mock_conn_class.call_count == 1
+        conn.close.assert_not_called()
+
+    def test_release_not_reusable_closes(self):
+        """Test liberar una conexión no reutilizable la cierra"""
+        pool = ConnectionPool("api.example.com")
+        conn = Mock()
+
+        pool.release(conn, reusable=False)
+
+        conn.close.assert_called_once()
+        assert pool.idle_count == 0
+
+    def test_release_respects_max_size(self):
+        """Test el pool no conserva más de max_size conexiones"""
+        pool = ConnectionPool("api.example.com", max_size=2)
+        conns = [Mock() for _ in range(3)]
+
+        for conn in conns:
+            pool.release(conn)
+
+        assert pool.idle_count == 2
+        conns[2].close.assert_called_once()
+
+    @patch('http.client.HTTPSConnection')
+    @patch('src.api.connection_pool.time.monotonic')
+    def test_idle_timeout_discards_connection(self, mock_monotonic, mock_conn_class):
+        """Test conexiones inactivas más allá del idle_timeout se descartan"""
+        pool = ConnectionPool("api.example.com", idle_timeout=10.0)
+        old_conn = Mock()
+
+        mock_monotonic.return_value = 100.0
+        pool.release(old_conn)
+
+        mock_monotonic.return_value = 111.0
+        conn, reused = pool.acquire()
+
+        assert reused is False
+        assert conn is mock_conn_class.return_value
+        old_conn.close.assert_called_once()
+
+    def test_close_all(self):
+        """Test close_all cierra las conexiones inactivas"""
+        pool = ConnectionPool("api.example.com")
+        conns = [Mock(), Mock()]
+        for conn in conns:
+            pool.release(conn)
+
+        pool.close_all()
+
+        assert pool.idle_count == 0
+        for conn in conns:
+            conn.close.assert_called_once()
+
+    def test_concurrent_release_is_thread_safe(self):
+        """Test liberaciones concurrentes no superan max_size"""
+        pool = ConnectionPool("api.example.com", max_size=5)
+        conns = [Mock() for _ in range(50)]
+
+        threads = [threading.Thread(target=pool.release, args=(c,)) for c in conns]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert pool.idle_count == 5
+        closed = sum(1 for c in conns if c.close.called)
+        assert closed == 45
+
+
+class TestSessionReusingContext:
+    """Tests para el contexto TLS con reutilización de sesión"""
+
+    def test_context_verifies_certificates(self):
+        """Test el contexto mantiene verificación de certificados"""
+        context = create_ssl_context()
+
+        assert context.check_hostname is True
+        assert context.verify_mode == ssl.CERT_REQUIRED
+        assert context.tls_session is None
+
+    def test_wrap_socket_reuses_session(self):
+        """Test wrap_socket pasa la sesión guardada al handshake"""
+        context = create_ssl_context()
+        session = Mock(spec=ssl.SSLSession)
+        context.tls_session = session
+
+        with patch.object(ssl.SSLContext, 'wrap_socket') as mock_wrap:
+            mock_wrap.return_value = Mock(session=None)
+            context.wrap_socket(Mock(), server_hostname="api.example.com")
+
+        assert mock_wrap.call_args[1]['session'] is session
+
+    def test_release_remembers_session(self):
+        """Test liberar una conexión guarda su sesión TLS"""
+        pool = ConnectionPool("api.example.com")
+        session = Mock(spec=ssl.SSLSession)
+        conn = Mock()
+        conn.sock.session = session
+
+        pool.release(conn)
+
+        assert pool.ssl_context.tls_session is session
+
+    def test_ignores_non_session_values(self):
+        """Test valores que no son SSLSession no se guardan"""
+        pool = ConnectionPool("api.example.com")
+        conn = Mock()
+
+        pool.release(conn)
+
+        assert pool.ssl_context.tls_session is None
@@ -9,11 +9,15 @@ Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
 Versión: 3.0.0
 Fecha: 2025-12-08
 """
+import threading
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
-from src.api.jsearch_client import JSearchClient
+from src.api.jsearch_client import JSearchClient, JSEARCH_PAGE_SIZE, merge_pages
+from src.api.response_cache import ResponseCache
 from src.api.client import HTTPError
 from src.models.search_params import SearchParameters
+from src.utils.config import Config
 
 
 class TestJSearchClient:
@@ -28,6 +32,20 @@ class TestJSearchClient:
         assert client.client is not None
         assert client.rate_limiter is not None
 
+    def test_adaptive_rate_capped_at_configured_rate_by_default(self):
+        """Test sin max_requests_per_second el control adaptativo no supera la tasa configurada"""
+        with patch.dict('os.environ', {'API_KEY': 'test_key', 'CACHE_ENABLED': 'false'}):
+            config = Config(_env_file=None)
+        client = JSearchClient(api_key="test_key", config=config)
+        limiter = client.rate_limiter
+
+        for _ in range(50):
+            limiter.record_success()
+
+        assert limiter.max_rate == limiter.rate == 1 / config.rate_limit_delay
+        assert limiter.controller.rate == limiter.rate
+        assert all(bucket.rate == limiter.rate for bucket in limiter.endpoint_buckets.values())
+
     def test_jsearch_client_initialization_with_config(self):
         """Test inicialización con config"""
         mock_config = Mock()
@@ -35,13 +53,25 @@ class TestJSearchClient:
         mock_config.rate_limit_delay = 2.0
         mock_config.max_retries = 5
         mock_config.retry_delay = 3
+        mock_config.retry_deadline = 60.0
+        mock_config.retry_budget_ratio = 0.2
+        mock_config.adaptive_rate_limit = False
+        mock_config.max_requests_per_second = 5.0
+        mock_config.rate_limit_burst = 2
+        mock_config.page_fan_out = True
+        mock_config.max_concurrency = 4
+        mock_config.cache_enabled = False
 
         client = JSearchClient(api_key="test_key", config=mock_config)
 
+        assert client.page_fan_out is True
+        assert client.max_concurrency == 4
+
         assert client.client.timeout == 60
         assert client.rate_limiter.delay == 2.0
         assert client.rate_limiter.max_retries == 5
         assert client.rate_limiter.retry_delay == 3
+        assert client.rate_limiter.burst == 2
 
     def test_jsearch_client_default_config(self):
         """Test inicialización sin config"""
@@ -51,6 +81,23 @@ class TestJSearchClient:
         assert client.rate_limiter.delay == 1.0
         assert client.rate_limiter.max_retries == 3
 
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_http_responses_feed_rate_limiter(self, mock_http_client):
+        """Test los headers de respuesta llegan al rate limiter"""
+        client = JSearchClient(api_key="test_key")
+
+        kwargs = mock_http_client.call_args[1]
+        assert kwargs['on_response'] == client.rate_limiter.observe_response
+        assert client.rate_limiter.controller is not None
+
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_close_closes_http_client(self, mock_http_client):
+        """Test close cierra el pool del cliente HTTP"""
+        client = JSearchClient(api_key="test_key")
+        client.close()
+
+        mock_http_client.return_value.close.assert_called_once()
+
     @patch('src.api.jsearch_client.RateLimiter')
     @patch('src.api.jsearch_client.HTTPClient')
     def test_search_jobs_success(self, mock_http_client, mock_rate_limiter):
@@ -67,7 +114,7 @@ class TestJSearchClient:
 
         # Mock del rate limiter
         mock_limiter_instance = Mock()
-        mock_limiter_instance.with_retry = lambda f: f
+        mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
         mock_rate_limiter.return_value = mock_limiter_instance
 
         client = JSearchClient(api_key="test_key")
@@ -90,7 +137,7 @@ class TestJSearchClient:
         mock_http_client.return_value = mock_client_instance
 
         mock_limiter_instance = Mock()
-        mock_limiter_instance.with_retry = lambda f: f
+        mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
         mock_rate_limiter.return_value = mock_limiter_instance
 
         client = JSearchClient(api_key="test_key")
@@ -109,10 +156,12 @@ class TestJSearchClient:
         mock_http_client.return_value = mock_client_instance
 
         # Simular error 429
-        def mock_with_retry(func):
-            def wrapper(*args, **kwargs):
-                raise HTTPError(429, "Rate limit exceeded")
-            return wrapper
+        def mock_with_retry(**retry_kwargs):
+            def decorator(func):
+                def wrapper(*args, **kwargs):
+                    raise HTTPError(429, "Rate limit exceeded")
+                return wrapper
+            return decorator
 
         mock_limiter_instance = Mock()
         mock_limiter_instance.with_retry = mock_with_retry
@@ -136,7 +185,7 @@ class TestJSearchClient:
         mock_http_client.return_value = mock_client_instance
 
         mock_limiter_instance = Mock()
-        mock_limiter_instance.with_retry = lambda f: f
+        mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
         mock_rate_limiter.return_value = mock_limiter_instance
 
         client = JSearchClient(api_key="test_key")
@@ -156,7 +205,7 @@ class TestJSearchClient:
         mock_http_client.return_value = mock_client_instance
 
         mock_limiter_instance = Mock()
-        mock_limiter_instance.with_retry = lambda f: f
+        mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
         mock_rate_limiter.return_value = mock_limiter_instance
 
         client = JSearchClient(api_key="test_key")
@@ -176,7 +225,7 @@ class TestJSearchClient:
         mock_http_client.return_value = mock_client_instance
 
         mock_limiter_instance = Mock()
-        mock_limiter_instance.with_retry = lambda f: f
+        mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
         mock_rate_limiter.return_value = mock_limiter_instance
 
         client = JSearchClient(api_key="test_key")
@@ -199,10 +248,17 @@ class TestJSearchClient:
 
         mock_limiter_instance = Mock()
 
-        def mock_with_retry(func):
-            def wrapper(*args, **kwargs):
-                raise HTTPError(404, "Trabajo no encontrado")
-            return wrapper
+        def mock_with_retry(**retry_kwargs):
+
+            def decorator(func):
+
+                def wrapper(*args, **kwargs):
+
+                    raise HTTPError(404, "Trabajo no encontrado")
+
+                return wrapper
+
+            return decorator
 
         mock_limiter_instance.with_retry = mock_with_retry
         mock_rate_limiter.return_value = mock_limiter_instance
@@ -228,7 +284,7 @@ class TestJSearchClient:
         mock_http_client.return_value = mock_client_instance
 
         mock_limiter_instance = Mock()
-        mock_limiter_instance.with_retry = lambda f: f
+        mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
         mock_rate_limiter.return_value = mock_limiter_instance
 
         client = JSearchClient(api_key="test_key")
@@ -246,7 +302,7 @@ class TestJSearchClient:
         mock_http_client.return_value = mock_client_instance
 
         mock_limiter_instance = Mock()
-        mock_limiter_instance.with_retry = lambda f: f
+        mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
         mock_rate_limiter.return_value = mock_limiter_instance
 
         client = JSearchClient(api_key="test_key")
@@ -274,7 +330,7 @@ class TestJSearchClient:
         mock_http_client.return_value = mock_client_instance
 
         mock_limiter_instance = Mock()
-        mock_limiter_instance.with_retry = lambda f: f
+        mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
         mock_rate_limiter.return_value = mock_limiter_instance
 
         client = JSearchClient(api_key="test_key")
@@ -293,7 +349,7 @@ class TestJSearchClient:
         mock_http_client.return_value = mock_client_instance
 
         mock_limiter_instance = Mock()
-        mock_limiter_instance.with_retry = lambda f: f
+        mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
         mock_rate_limiter.return_value = mock_limiter_instance
 
         client = JSearchClient(api_key="test_key")
@@ -311,7 +367,7 @@ class TestJSearchClient:
         mock_http_client.return_value = mock_client_instance
 
         mock_limiter_instance = Mock()
-        mock_limiter_instance.with_retry = lambda f: f
+        mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
         mock_rate_limiter.return_value = mock_limiter_instance
 
         client = JSearchClient(api_key="test_key")
@@ -338,7 +394,7 @@ class TestJSearchClient:
         mock_http_client.return_value = mock_client_instance
 
         mock_limiter_instance = Mock()
-        mock_limiter_instance.with_retry = lambda f: f
+        mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
         mock_rate_limiter.return_value = mock_limiter_instance
 
         client = JSearchClient(api_key="test_key")
@@ -358,7 +414,7 @@ class TestJSearchClient:
         mock_http_client.return_value = mock_client_instance
 
         mock_limiter_instance = Mock()
-        mock_limiter_instance.with_retry = lambda f: f
+        mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
         mock_rate_limiter.return_value = mock_limiter_instance
 
         client = JSearchClient(api_key="test_key")
@@ -376,7 +432,7 @@ def test_get_job_details_with_error_response(mock_http_client, mock_rate_limiter
     mock_http_client.return_value = mock_client_instance
 
     mock_limiter_instance = Mock()
-    mock_limiter_instance.with_retry = lambda f: f
+    mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
     mock_rate_limiter.return_value = mock_limiter_instance
 
     client = JSearchClient(api_key="test_key")
@@ -395,7 +451,7 @@ def test_get_job_details_empty_data(mock_http_client, mock_rate_limiter):
     mock_http_client.return_value = mock_client_instance
 
     mock_limiter_instance = Mock()
-    mock_limiter_instance.with_retry = lambda f: f
+    mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
     mock_rate_limiter.return_value = mock_limiter_instance
 
     client = JSearchClient(api_key="test_key")
@@ -404,3 +460,315 @@ def test_get_job_details_empty_data(mock_http_client, mock_rate_limiter):
         client.get_job_details("not_found_id")
     assert exc_info.value.status_code == 404
     assert "no encontrado" in str(exc_info.value.message).lower()
+
+
+class TestSearchPageFanOut:
+    """Tests para la división de búsquedas multipágina"""
+
+    @staticmethod
+    def _make_client(mock_http_client, mock_rate_limiter, get_side_effect):
+        mock_client_instance = Mock()
+        mock_client_instance.get.side_effect = get_side_effect
+        mock_http_client.return_value = mock_client_instance
+
+        mock_limiter_instance = Mock()
+        mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
+        mock_rate_limiter.return_value = mock_limiter_instance
+
+        return JSearchClient(api_key="test_key"), mock_client_instance
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_fan_out_requests_each_page(self, mock_http_client, mock_rate_limiter):
+        """Test cada página se pide por separado y se combina en orden"""
+        def fake_get(endpoint, api_params):
+            page = int(api_params['page'])
+            assert api_params['num_pages'] == '1'
+            return {"data": [{"job_id": f"p{page}-a"}, {"job_id": f"p{page}-b"}]}
+
+        client, http = self._make_client(mock_http_client, mock_rate_limiter, fake_get)
+        params = SearchParameters(query="python", page=2, num_pages=3)
+
+        jobs = client.search_jobs(params, fan_out=True)
+
+        assert [j["job_id"] for j in jobs] == [
+            "p2-a", "p2-b", "p3-a", "p3-b", "p4-a", "p4-b"
+        ]
+        assert http.get.call_count == 3
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_fan_out_drops_duplicate_ids(self, mock_http_client, mock_rate_limiter):
+        """Test job_id repetidos entre páginas se descartan"""
+        def fake_get(endpoint, api_params):
+            page = int(api_params['page'])
+            return {"data": [{"job_id": "shared"}, {"job_id": f"p{page}"}]}
+
+        client, _ = self._make_client(mock_http_client, mock_rate_limiter, fake_get)
+        params = SearchParameters(query="python", num_pages=2)
+
+        jobs = client.search_jobs(params, fan_out=True)
+
+        assert [j["job_id"] for j in jobs] == ["shared", "p1", "p2"]
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_fan_out_any_failed_page_raises(self, mock_http_client, mock_rate_limiter):
+        """Test una página fallida hace fallar la búsqueda en lugar de dejar un hueco"""
+        def fake_get(endpoint, api_params):
+            if api_params['page'] == '2':
+                raise HTTPError(500, "boom")
+            return {"data": [{"job_id": api_params['page']}]}
+
+        client, http = self._make_client(mock_http_client, mock_rate_limiter, fake_get)
+        params = SearchParameters(query="python", num_pages=3)
+
+        with pytest.raises(HTTPError) as exc_info:
+            client.search_jobs(params, fan_out=True)
+
+        assert exc_info.value.status_code == 500
+        assert http.get.call_count == 3
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_fan_out_all_pages_fail(self, mock_http_client, mock_rate_limiter):
+        """Test si fallan todas las páginas se lanza el error"""
+        client, _ = self._make_client(
+            mock_http_client, mock_rate_limiter, HTTPError(500, "boom")
+        )
+        params = SearchParameters(query="python", num_pages=2)
+
+        with pytest.raises(HTTPError) as exc_info:
+            client.search_jobs(params, fan_out=True)
+
+        assert exc_info.value.status_code == 500
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_fan_out_disabled_by_default(self, mock_http_client, mock_rate_limiter):
+        """Test sin fan_out se hace una sola petición multipágina"""
+        client, http = self._make_client(
+            mock_http_client, mock_rate_limiter, lambda e, p: {"data": []}
+        )
+        params = SearchParameters(query="python", num_pages=5)
+
+        client.search_jobs(params)
+
+        assert http.get.call_count == 1
+        assert http.get.call_args[0][1]['num_pages'] == '5'
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_fan_out_single_page_uses_one_request(self, mock_http_client, mock_rate_limiter):
+        """Test una búsqueda de una página no se divide"""
+        client, http = self._make_client(
+            mock_http_client, mock_rate_limiter, lambda e, p: {"data": []}
+        )
+        client.page_fan_out = True
+
+        client.search_jobs(SearchParameters(query="python"))
+
+        assert http.get.call_count == 1
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_exhausted_counts_raw_results(self, mock_http_client, mock_rate_limiter):
+        """Test una búsqueda está agotada solo si la API devolvió menos de lo pedido"""
+        full = {"data": [{"job_id": f"j{i}"} for i in range(JSEARCH_PAGE_SIZE)]}
+        client, _ = self._make_client(mock_http_client, mock_rate_limiter, lambda e, p: full)
+
+        assert client.search_jobs(SearchParameters(query="python")).exhausted is False
+        assert client.search_jobs(SearchParameters(query="python", num_pages=2)).exhausted is True
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_fan_out_exhausted_ignores_duplicates(self, mock_http_client, mock_rate_limiter):
+        """Test quitar repetidos entre páginas no marca la búsqueda como agotada"""
+        full = {"data": [{"job_id": f"j{i}"} for i in range(JSEARCH_PAGE_SIZE)]}
+        client, _ = self._make_client(mock_http_client, mock_rate_limiter, lambda e, p: full)
+
+        jobs = client.search_jobs(SearchParameters(query="python", num_pages=2), fan_out=True)
+
+        assert len(jobs) == JSEARCH_PAGE_SIZE
+        assert jobs.exhausted is False
+
+    def test_merge_pages_keeps_items_without_id(self):
+        """Test merge_pages conserva resultados sin job_id"""
+        merged = merge_pages([[{"job_id": "a"}, {"title": "x"}], [{"job_id": "a"}, {"title": "y"}]])
+
+        assert merged == [{"job_id": "a"}, {"title": "x"}, {"title": "y"}]
+
+
+class TestResponseCaching:
+    """Tests para la caché de respuestas delante de los endpoints"""
+
+    @staticmethod
+    def _make_client(mock_http_client, mock_rate_limiter, get_side_effect):
+        mock_client_instance = Mock()
+        mock_client_instance.get.side_effect = get_side_effect
+        mock_http_client.return_value = mock_client_instance
+
+        mock_limiter_instance = Mock()
+        mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
+        mock_rate_limiter.return_value = mock_limiter_instance
+
+        client = JSearchClient(api_key="test_key", cache=ResponseCache(":memory:"))
+        return client, mock_client_instance
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_search_served_from_cache(self, mock_http_client, mock_rate_limiter):
+        """Test la segunda búsqueda idéntica no llama a la API"""
+        client, http = self._make_client(
+            mock_http_client, mock_rate_limiter, lambda e, p: {"data": [{"job_id": "1"}]}
+        )
+        params = SearchParameters(query="python")
+
+        first = client.search_jobs(params)
+        second = client.search_jobs(params)
+
+        assert first == second == [{"job_id": "1"}]
+        assert http.get.call_count == 1
+        assert (first.api_requests, second.api_requests) == (1, 0)
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_fan_out_counts_only_uncached_pages(self, mock_http_client, mock_rate_limiter):
+        """Test en una búsqueda dividida solo cuentan las páginas pedidas a la API"""
+        client, http = self._make_client(
+            mock_http_client, mock_rate_limiter,
+            lambda e, p: {"data": [{"job_id": p['page']}]}
+        )
+        client.search_jobs(SearchParameters(query="python", num_pages=2), fan_out=True)
+
+        jobs = client.search_jobs(SearchParameters(query="python", num_pages=3), fan_out=True)
+
+        assert jobs.api_requests == 1
+        assert http.get.call_count == 3
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_bypass_cache_refreshes_entry(self, mock_http_client, mock_rate_limiter):
+        """Test bypass_cache ignora la caché y guarda la respuesta nueva"""
+        responses = iter([{"data": [{"job_id": "old"}]}, {"data": [{"job_id": "new"}]}])
+        client, http = self._make_client(
+            mock_http_client, mock_rate_limiter, lambda e, p: next(responses)
+        )
+        params = SearchParameters(query="python")
+
+        client.search_jobs(params)
+        refreshed = client.search_jobs(params, bypass_cache=True)
+
+        assert refreshed == [{"job_id": "new"}]
+        assert client.search_jobs(params) == [{"job_id": "new"}]
+        assert http.get.call_count == 2
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_errors_are_not_cached(self, mock_http_client, mock_rate_limiter):
+        """Test un error no deja entrada en caché"""
+        client, http = self._make_client(
+            mock_http_client, mock_rate_limiter, lambda e, p: {"data": []}
+        )
+
+        for _ in range(2):
+            with pytest.raises(HTTPError):
+                client.get_job_details("missing")
+
+        assert http.get.call_count == 2
+        assert len(client.cache) == 0
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_salary_endpoints_cached(self, mock_http_client, mock_rate_limiter):
+        """Test los endpoints de salarios usan la caché"""
+        client, http = self._make_client(
+            mock_http_client, mock_rate_limiter, lambda e, p: {"data": [{"median_salary": 1}]}
+        )
+
+        for _ in range(2):
+            client.get_estimated_salary("Dev", "Madrid")
+            client.get_company_salary("Acme", "Dev")
+
+        assert http.get.call_count == 2
+
+    def test_cache_created_from_config(self, tmp_path):
+        """Test la caché se crea según la configuración"""
+        mock_config = Mock()
+        mock_config.request_timeout = 30
+        mock_config.rate_limit_delay = 1.0
+        mock_config.max_retries = 3
+        mock_config.retry_delay = 2
+        mock_config.retry_deadline = 60.0
+        mock_config.retry_budget_ratio = 0.2
+        mock_config.adaptive_rate_limit = False
+        mock_config.max_requests_per_second = 5.0
+        mock_config.rate_limit_burst = 1
+        mock_config.page_fan_out = False
+        mock_config.max_concurrency = 8
+        mock_config.cache_enabled = True
+        mock_config.cache_path = tmp_path / "cache.sqlite3"
+        mock_config.cache_max_entries = 50
+        mock_config.cache_ttl_search = 60
+        mock_config.cache_ttl_details = 120
+        mock_config.cache_ttl_salary = 180
+
+        client = JSearchClient(api_key="test_key", config=mock_config)
+
+        assert client.cache.max_entries == 50
+        assert client.cache.ttls == {"search": 60, "details": 120, "salary": 180}
+        assert (tmp_path / "cache.sqlite3").exists()
+        client.close()
+
+    def test_no_cache_without_config(self):
+        """Test sin config no se crea caché en disco"""
+        assert JSearchClient(api_key="test_key").cache is None
+
+
+class TestRequestCoalescing:
+    """Tests para la agrupación de peticiones idénticas en vuelo"""
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_concurrent_identical_details_share_request(self, mock_http_client, mock_rate_limiter):
+        """Test varias llamadas idénticas concurrentes hacen una petición"""
+        release = threading.Event()
+
+        def slow_get(endpoint, params):
+            release.wait(2)
+            return {"data": [{"job_id": params["job_id"]}]}
+
+        mock_client_instance = Mock()
+        mock_client_instance.get.side_effect = slow_get
+        mock_http_client.return_value = mock_client_instance
+        mock_limiter_instance = Mock()
+        mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
+        mock_rate_limiter.return_value = mock_limiter_instance
+
+        client = JSearchClient(api_key="test_key")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(client.get_job_details, "abc") for _ in range(4)]
+            while client.singleflight.shared_count < 3:
+                threading.Event().wait(0.005)
+            release.set()
+
+        assert [f.result() for f in futures] == [{"job_id": "abc"}] * 4
+        assert mock_client_instance.get.call_count == 1
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_different_params_not_coalesced(self, mock_http_client, mock_rate_limiter):
+        """Test parámetros distintos generan peticiones distintas"""
+        mock_client_instance = Mock()
+        mock_client_instance.get.side_effect = lambda e, p: {"data": [{"job_id": p["job_id"]}]}
+        mock_http_client.return_value = mock_client_instance
+        mock_limiter_instance = Mock()
+        mock_limiter_instance.with_retry = lambda **kwargs: (lambda f: f)
+        mock_rate_limiter.return_value = mock_limiter_instance
+
+        client = JSearchClient(api_key="test_key")
+        client.get_job_details("a")
+        client.get_job_details("b")
+
+        assert mock_client_instance.get.call_count == 2
@@ -9,10 +9,23 @@ Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
 Versión: 3.0.0
 Fecha: 2025-12-08
 """
+import asyncio
+import threading
 import pytest
 import time
-from unittest.mock import Mock, patch
-from src.api.rate_limiter import RateLimiter, retry_on_http_error
+from unittest.mock import AsyncMock, Mock, patch
+from src.api.rate_limiter import (
+    RateLimiter,
+    TokenBucket,
+    AdaptiveRateController,
+    retry_on_http_error,
+    ENDPOINTS,
+    ENDPOINT_SEARCH,
+    ENDPOINT_DETAILS,
+    ENDPOINT_SALARY,
+)
+from src.api.client import HTTPError
+from src.api.retry_policy import RetryPolicy
 
 
 class TestRateLimiter:
@@ -20,13 +33,16 @@ class TestRateLimiter:
 
     def test_rate_limiter_initialization(self):
         """Test inicialización del rate limiter"""
-        limiter = RateLimiter(delay=2.0, max_retries=5, retry_delay=3)
+        limiter = RateLimiter(delay=2.0, max_retries=5, retry_delay=3, burst=4)
 
         assert limiter.delay == 2.0
         assert limiter.max_retries == 5
         assert limiter.retry_delay == 3
+        assert limiter.burst == 4
+        assert limiter.rate == 0.5
         assert limiter.request_count == 0
         assert limiter.last_request_time == 0.0
+        assert set(limiter.endpoint_buckets) == set(ENDPOINTS)
 
     def test_rate_limiter_default_values(self):
         """Test valores por defecto"""
@@ -35,12 +51,21 @@ class TestRateLimiter:
         assert limiter.delay == 1.0
         assert limiter.max_retries == 3
         assert limiter.retry_delay == 2
+        assert limiter.burst == 1
+
+    def test_rate_limiter_custom_endpoint_limits(self):
+        """Test límites propios por endpoint"""
+        limiter = RateLimiter(delay=1.0, endpoint_limits={ENDPOINT_SALARY: (0.2, 2)})
+
+        assert limiter.endpoint_buckets[ENDPOINT_SALARY].rate == 0.2
+        assert limiter.endpoint_buckets[ENDPOINT_SALARY].capacity == 2
+        assert limiter.endpoint_buckets[ENDPOINT_SEARCH].rate == 1.0
 
     @patch('time.sleep')
-    @patch('time.time')
-    def test_wait_first_request(self, mock_time, mock_sleep):
+    @patch('time.monotonic')
+    def test_wait_first_request(self, mock_monotonic, mock_sleep):
         """Test wait en primer request"""
-        mock_time.return_value = 100.0
+        mock_monotonic.return_value = 100.0
 
         limiter = RateLimiter(delay=1.0)
         limiter.wait()
@@ -48,20 +73,17 @@ class TestRateLimiter:
         # No debería dormir en el primer request
         mock_sleep.assert_not_called()
         assert limiter.request_count == 1
-        assert limiter.last_request_time == 100.0
+        assert limiter.last_request_time > 0
 
     @patch('time.sleep')
-    @patch('time.time')
-    def test_wait_needs_delay(self, mock_time, mock_sleep):
+    @patch('time.monotonic')
+    def test_wait_needs_delay(self, mock_monotonic, mock_sleep):
         """Test wait cuando necesita delay"""
-        # Simular dos requests muy rápidos
-        # wait() llama a time.time() 2 veces: al inicio y al final
-        # Primer wait(): 100.0 (inicio), 100.0 (final)
-        # Segundo wait(): 100.5 (inicio), 100.5 (final)
-        mock_time.side_effect = [100.0, 100.0, 100.5, 100.5]
-
+        mock_monotonic.return_value = 100.0
         limiter = RateLimiter(delay=1.0)
         limiter.wait()  # Primer request
+
+        mock_monotonic.return_value = 100.5
         limiter.wait()  # Segundo request
 
         # Debería dormir 0.5 segundos (1.0 - 0.5)
@@ -70,21 +92,135 @@ class TestRateLimiter:
         assert 0.4 < sleep_time < 0.6  # Aproximadamente 0.5
 
     @patch('time.sleep')
-    @patch('time.time')
-    def test_wait_no_delay_needed(self, mock_time, mock_sleep):
+    @patch('time.monotonic')
+    def test_wait_no_delay_needed(self, mock_monotonic, mock_sleep):
         """Test wait cuando no necesita delay"""
-        # Simular que pasó suficiente tiempo
-        # Primer wait(): 100.0 (inicio), 100.0 (final)
-        # Segundo wait(): 102.0 (inicio), 102.0 (final)
-        mock_time.side_effect = [100.0, 100.0, 102.0, 102.0]
-
+        mock_monotonic.return_value = 100.0
         limiter = RateLimiter(delay=1.0)
         limiter.wait()  # Primer request
+
+        mock_monotonic.return_value = 102.0
         limiter.wait()  # Segundo request
 
         # No debería dormir porque pasó más del delay
         assert mock_sleep.call_count == 0
 
+    @patch('time.sleep')
+    @patch('time.monotonic')
+    def test_wait_allows_burst(self, mock_monotonic, mock_sleep):
+        """Test burst permite varios requests seguidos sin esperar"""
+        mock_monotonic.return_value = 100.0
+        limiter = RateLimiter(delay=1.0, burst=3)
+
+        for _ in range(3):
+            limiter.wait()
+        mock_sleep.assert_not_called()
+
+        limiter.wait()
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(1.0)
+
+    @patch('time.sleep')
+    @patch('time.monotonic')
+    def test_wait_uses_slowest_bucket(self, mock_monotonic, mock_sleep):
+        """Test el bucket del endpoint puede ser más restrictivo que el global"""
+        mock_monotonic.return_value = 100.0
+        limiter = RateLimiter(
+            delay=0.1,
+            burst=5,
+            endpoint_limits={ENDPOINT_SALARY: (0.5, 1)}
+        )
+
+        limiter.wait(ENDPOINT_SALARY)
+        limiter.wait(ENDPOINT_SALARY)
+
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(2.0)
+
+    @patch('time.sleep')
+    @patch('time.monotonic')
+    def test_endpoints_have_separate_buckets(self, mock_monotonic, mock_sleep):
+        """Test un endpoint no consume el bucket de otro"""
+        mock_monotonic.return_value = 100.0
+        limiter = RateLimiter(
+            delay=0.1,
+            burst=5,
+            endpoint_limits={name: (1.0, 1) for name in ENDPOINTS}
+        )
+
+        limiter.wait(ENDPOINT_SEARCH)
+        limiter.wait(ENDPOINT_DETAILS)
+        limiter.wait(ENDPOINT_SALARY)
+
+        mock_sleep.assert_not_called()
+
+    def test_concurrent_reservations_are_serialized(self):
+        """Test hilos concurrentes no pasan todos a la vez"""
+        limiter = RateLimiter(delay=0.1)
+        delays = []
+        lock = threading.Lock()
+
+        def reserve():
+            value = limiter.reserve()
+            with lock:
+                delays.append(value)
+
+        threads = [threading.Thread(target=reserve) for _ in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        delays.sort()
+        assert limiter.request_count == 20
+        assert delays[0] == 0.0
+        # Cada reserva espera ~0.1s más que la anterior
+        for previous, current in zip(delays, delays[1:]):
+            assert current - previous == pytest.approx(0.1, abs=0.02)
+
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    def test_wait_async(self, mock_sleep):
+        """Test wait_async duerme con asyncio sin bloquear"""
+        limiter = RateLimiter(delay=1.0)
+
+        async def run():
+            await limiter.wait_async(ENDPOINT_SEARCH)
+            await limiter.wait_async(ENDPOINT_SEARCH)
+
+        asyncio.run(run())
+
+        mock_sleep.assert_awaited_once()
+        assert 0.9 < mock_sleep.call_args[0][0] <= 1.0
+
+    def test_custom_retry_policy(self):
+        """Test se puede inyectar una política de reintentos"""
+        policy = RetryPolicy(max_attempts=1)
+        limiter = RateLimiter(retry_policy=policy)
+
+        assert limiter.retry_policy is policy
+
+    def test_default_retry_policy_uses_parameters(self):
+        """Test la política por defecto usa max_retries y retry_delay"""
+        limiter = RateLimiter(max_retries=4, retry_delay=3, retry_deadline=20.0, retry_budget_ratio=0.5)
+
+        assert limiter.retry_policy.max_attempts == 4
+        assert limiter.retry_policy.base_delay == 3
+        assert limiter.retry_policy.deadline == 20.0
+        assert limiter.retry_policy.budget.ratio == 0.5
+
+    def test_with_retry_uses_endpoint_bucket(self):
+        """Test with_retry(endpoint=...) reserva en el bucket del endpoint"""
+        limiter = RateLimiter(delay=0.01)
+
+        @limiter.with_retry(endpoint=ENDPOINT_DETAILS)
+        def test_func():
+            return "ok"
+
+        with patch.object(limiter, 'wait') as mock_wait:
+            assert test_func() == "ok"
+
+        mock_wait.assert_called_once_with(ENDPOINT_DETAILS)
+
     def test_with_retry_success_first_attempt(self):
         """Test with_retry con éxito en primer intento"""
         limiter = RateLimiter(delay=0.01)  # Delay pequeño para tests
@@ -107,7 +243,7 @@ class TestRateLimiter:
         def test_func():
             attempt_count[0] += 1
             if attempt_count[0] < 3:
-                raise Exception("Temporary error")
+                raise ConnectionError("Temporary error")
             return "success"
 
         result = test_func()
@@ -120,6 +256,21 @@ class TestRateLimiter:
         """Test with_retry cuando todos los intentos fallan"""
         limiter = RateLimiter(delay=0.01, max_retries=3, retry_delay=1)
 
+        @limiter.with_retry
+        def test_func():
+            raise HTTPError(503, "Service Unavailable")
+
+        with pytest.raises(HTTPError) as exc_info:
+            test_func()
+
+        assert exc_info.value.status_code == 503
+        assert limiter.request_count == 3  # Intentó 3 veces
+
+    @patch('time.sleep')
+    def test_with_retry_non_retryable_error(self, mock_sleep):
+        """Test with_retry no reintenta errores permanentes"""
+        limiter = RateLimiter(delay=0.01, max_retries=3, retry_delay=1)
+
         @limiter.with_retry
         def test_func():
             raise ValueError("Permanent error")
@@ -128,11 +279,28 @@ class TestRateLimiter:
             test_func()
 
         assert "Permanent error" in str(exc_info.value)
-        assert limiter.request_count == 3  # Intentó 3 veces
+        assert limiter.request_count == 1
+        mock_sleep.assert_not_called()
 
     @patch('time.sleep')
-    def test_with_retry_exponential_backoff(self, mock_sleep):
-        """Test with_retry usa exponential backoff"""
+    def test_with_retry_job_not_found_is_not_retried(self, mock_sleep):
+        """Test un 404 de job-details falla de inmediato"""
+        limiter = RateLimiter(delay=0.01, max_retries=3, retry_delay=2)
+
+        @limiter.with_retry(endpoint=ENDPOINT_DETAILS)
+        def test_func():
+            raise HTTPError(404, "Trabajo no encontrado")
+
+        with pytest.raises(HTTPError):
+            test_func()
+
+        assert limiter.request_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch('random.uniform', side_effect=lambda low, high: high)
+    @patch('time.sleep')
+    def test_with_retry_exponential_backoff(self, mock_sleep, mock_uniform):
+        """Test with_retry usa exponential backoff (tope del jitter)"""
         limiter = RateLimiter(delay=0.01, max_retries=3, retry_delay=2)
         attempt_count = [0]
 
@@ -140,7 +308,7 @@ class TestRateLimiter:
         def test_func():
             attempt_count[0] += 1
             if attempt_count[0] < 4:
-                raise Exception("Error")
+                raise TimeoutError("Error")
             return "success"
 
         with pytest.raises(Exception):
@@ -178,6 +346,208 @@ class TestRateLimiter:
         assert result == "x-y-z"
 
 
+class TestTokenBucket:
+    """Tests para TokenBucket"""
+
+    def test_invalid_parameters(self):
+        """Test rechaza rate y burst inválidos"""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1.0, burst=0)
+
+    @patch('time.monotonic')
+    def test_refill_is_capped_at_capacity(self, mock_monotonic):
+        """Test el bucket no acumula más tokens que su capacidad"""
+        mock_monotonic.return_value = 0.0
+        bucket = TokenBucket(rate=1.0, burst=2)
+
+        mock_monotonic.return_value = 1000.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    @patch('time.monotonic')
+    def test_reservations_queue_up(self, mock_monotonic):
+        """Test reservas consecutivas esperan cada vez más"""
+        mock_monotonic.return_value = 0.0
+        bucket = TokenBucket(rate=2.0, burst=1)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+
+    @patch('time.monotonic')
+    def test_set_rate_keeps_tokens(self, mock_monotonic):
+        """Test set_rate cambia la tasa de reposición"""
+        mock_monotonic.return_value = 0.0
+        bucket = TokenBucket(rate=1.0, burst=1)
+        bucket.reserve()
+
+        bucket.set_rate(4.0)
+
+        assert bucket.rate == 4.0
+        assert bucket.reserve() == pytest.approx(0.25)
+        with pytest.raises(ValueError):
+            bucket.set_rate(0)
+
+    @patch('time.monotonic')
+    def test_block_for_delays_reservations(self, mock_monotonic):
+        """Test block_for retrasa reservas hasta el fin del bloqueo"""
+        mock_monotonic.return_value = 0.0
+        bucket = TokenBucket(rate=1.0, burst=5)
+
+        bucket.block_for(10.0)
+
+        assert bucket.reserve() == pytest.approx(10.0)
+        assert bucket.reserve() == pytest.approx(11.0)
+
+    @patch('time.monotonic')
+    def test_no_refill_during_block(self, mock_monotonic):
+        """Test los tokens no se acumulan durante el bloqueo"""
+        mock_monotonic.return_value = 0.0
+        bucket = TokenBucket(rate=1.0, burst=5)
+        bucket.block_for(10.0)
+
+        mock_monotonic.return_value = 11.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(1.0)
+
+
+class TestAdaptiveRateController:
+    """Tests para el control AIMD"""
+
+    def test_additive_increase(self):
+        """Test cada éxito sube la tasa un paso"""
+        bucket = TokenBucket(rate=1.0)
+        controller = AdaptiveRateController(bucket, min_rate=0.1, max_rate=1.2, increase_step=0.1)
+
+        controller.on_success()
+        assert controller.rate == pytest.approx(1.1)
+
+        for _ in range(5):
+            controller.on_success()
+        assert controller.rate == pytest.approx(1.2)  # Tope max_rate
+
+    def test_multiplicative_decrease(self):
+        """Test un 429 reduce la tasa a la mitad"""
+        bucket = TokenBucket(rate=2.0)
+        controller = AdaptiveRateController(bucket, min_rate=0.3, max_rate=5.0)
+
+        controller.on_throttle()
+        assert controller.rate == pytest.approx(1.0)
+
+        for _ in range(5):
+            controller.on_throttle()
+        assert controller.rate == pytest.approx(0.3)  # Suelo min_rate
+        assert controller.throttle_count == 6
+
+    def test_throttle_with_retry_after_blocks_bucket(self):
+        """Test Retry-After bloquea el bucket"""
+        bucket = Mock()
+        bucket.rate = 2.0
+        controller = AdaptiveRateController(bucket, min_rate=0.1, max_rate=5.0)
+
+        controller.on_throttle(retry_after=4.0)
+
+        bucket.set_rate.assert_called_once_with(1.0)
+        bucket.block_for.assert_called_once_with(4.0)
+
+
+class TestRateLimiterAdaptive:
+    """Tests para el rate limiter adaptativo"""
+
+    def test_adaptive_disabled_by_default(self):
+        """Test sin adaptive no hay controlador"""
+        limiter = RateLimiter()
+
+        assert limiter.controller is None
+        assert limiter.max_rate == limiter.rate
+
+    def test_adaptive_limits(self):
+        """Test límites del controlador adaptativo"""
+        limiter = RateLimiter(delay=1.0, adaptive=True, max_rate=5.0)
+
+        assert limiter.controller.min_rate == pytest.approx(0.1)
+        assert limiter.controller.max_rate == 5.0
+        # Los buckets de endpoint no frenan la subida adaptativa
+        assert limiter.endpoint_buckets[ENDPOINT_SEARCH].rate == 5.0
+
+    @patch('time.sleep')
+    def test_with_retry_feeds_controller(self, mock_sleep):
+        """Test with_retry informa éxitos y 429 al controlador"""
+        limiter = RateLimiter(delay=1.0, adaptive=True, max_rate=5.0, max_retries=2)
+        responses = [HTTPError(429, "slow down", {"retry-after": "3"}), "ok"]
+
+        @limiter.with_retry
+        def test_func():
+            result = responses.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with patch.object(limiter.controller, 'on_throttle') as on_throttle, \
+                patch.object(limiter.controller, 'on_success') as on_success:
+            assert test_func() == "ok"
+
+        on_throttle.assert_called_once_with(3.0)
+        on_success.assert_called_once()
+        # El reintento espera al menos el Retry-After
+        assert max(call[0][0] for call in mock_sleep.call_args_list) >= 3.0
+
+    def test_record_throttle_without_controller_blocks(self):
+        """Test sin controlador un Retry-After igualmente pausa el bucket"""
+        limiter = RateLimiter()
+
+        with patch.object(limiter.bucket, 'block_for') as block_for:
+            limiter.record_throttle(5.0)
+            limiter.record_success()
+
+        block_for.assert_called_once_with(5.0)
+
+    def test_observe_response_pauses_when_exhausted(self):
+        """Test headers de cuota agotada pausan el bucket hasta el reset"""
+        limiter = RateLimiter()
+
+        with patch.object(limiter.bucket, 'block_for') as block_for:
+            limiter.observe_response(200, {
+                'x-ratelimit-requests-remaining': '0',
+                'x-ratelimit-requests-reset': '30'
+            })
+
+        block_for.assert_called_once_with(30.0)
+
+    @patch('time.time', return_value=1000.0)
+    def test_observe_response_absolute_reset(self, mock_time):
+        """Test reset como timestamp absoluto"""
+        limiter = RateLimiter()
+
+        with patch.object(limiter.bucket, 'block_for') as block_for:
+            limiter.observe_response(200, {
+                'x-ratelimit-remaining': '0',
+                'x-ratelimit-reset': '1012'
+            })
+
+        block_for.assert_called_once_with(pytest.approx(12.0))
+
+    @pytest.mark.parametrize("headers", [
+        {},
+        {'x-ratelimit-remaining': '5', 'x-ratelimit-reset': '30'},
+        {'x-ratelimit-remaining': 'n/a', 'x-ratelimit-reset': '30'},
+        {'x-ratelimit-remaining': '0'},
+    ])
+    def test_observe_response_ignores_other_headers(self, headers):
+        """Test sin cuota agotada no se pausa"""
+        limiter = RateLimiter()
+
+        with patch.object(limiter.bucket, 'block_for') as block_for:
+            limiter.observe_response(200, headers)
+
+        block_for.assert_not_called()
+
+
 class TestRetryOnHttpError:
     """Tests para retry_on_http_error decorator"""
 
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_response_cache.py
+Descripción: Tests para ResponseCache
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import pytest
+from unittest.mock import patch
+from src.api.response_cache import ResponseCache, make_cache_key, MISS, DEFAULT_TTLS
+
+
+class TestMakeCacheKey:
+    """Tests para la clave canónica"""
+
+    def test_param_order_does_not_matter(self):
+        """Test el orden de los parámetros no cambia la clave"""
+        a = make_cache_key("/jsearch/search", {"query": "python", "page": "1"})
+        b = make_cache_key("/jsearch/search", {"page": "1", "query": "python"})
+        assert a == b
+
+    def test_normalizes_values(self):
+        """Test tipos, espacios y None se normalizan"""
+        a = make_cache_key("/jsearch/search", {"page": 1, "query": " python ", "x": None})
+        b = make_cache_key("/jsearch/search", {"page": "1", "query": "python"})
+        assert a == b
+
+    def test_endpoint_is_part_of_key(self):
+        """Test endpoints distintos generan claves distintas"""
+        params = {"job_title": "Dev"}
+        assert make_cache_key("/a", params) != make_cache_key("/b", params)
+
+
+class TestResponseCache:
+    """Tests para ResponseCache"""
+
+    def test_miss_then_hit(self):
+        """Test una respuesta guardada se recupera"""
+        cache = ResponseCache(":memory:")
+
+        assert cache.get("search", "/s", {"q": "x"}) is MISS
+        cache.set("search", "/s", {"q": "x"}, [{"job_id": "1"}])
+
+        assert cache.get("search", "/s", {"q": "x"}) == [{"job_id": "1"}]
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_empty_value_is_cached(self):
+        """Test una lista vacía es un hit, no un miss"""
+        cache = ResponseCache(":memory:")
+        cache.set("search", "/s", {}, [])
+
+        assert cache.get("search", "/s", {}) == []
+
+    @patch('src.api.response_cache.time.time')
+    def test_ttl_per_endpoint(self, mock_time):
+        """Test cada endpoint caduca según su TTL"""
+        mock_time.return_value = 1000.0
+        cache = ResponseCache(":memory:", ttls={"search": 60, "salary": 3600})
+        cache.set("search", "/s", {}, ["search"])
+        cache.set("salary", "/e", {}, ["salary"])
+
+        mock_time.return_value = 1100.0
+
+        assert cache.get("search", "/s", {}) is MISS
+        assert cache.get("salary", "/e", {}) == ["salary"]
+        assert len(cache) == 1
+
+    def test_zero_ttl_disables_endpoint(self):
+        """Test TTL 0 no guarda respuestas"""
+        cache = ResponseCache(":memory:", ttls={"details": 0})
+        cache.set("details", "/d", {"job_id": "1"}, {"job_id": "1"})
+
+        assert len(cache) == 0
+
+    def test_default_ttls(self):
+        """Test salarios duran más que búsquedas"""
+        assert DEFAULT_TTLS["salary"] > DEFAULT_TTLS["details"] > DEFAULT_TTLS["search"]
+
+    @patch('src.api.response_cache.time.time')
+    def test_lru_eviction(self, mock_time):
+        """Test se desaloja la entrada usada hace más tiempo"""
+        cache = ResponseCache(":memory:", max_entries=2)
+
+        mock_time.return_value = 1.0
+        cache.set("search", "/s", {"q": "a"}, "a")
+        mock_time.return_value = 2.0
+        cache.set("search", "/s", {"q": "b"}, "b")
+        mock_time.return_value = 3.0
+        cache.get("search", "/s", {"q": "a"})  # "a" pasa a ser la más reciente
+        mock_time.return_value = 4.0
+        cache.set("search", "/s", {"q": "c"}, "c")
+
+        assert len(cache) == 2
+        assert cache.get("search", "/s", {"q": "b"}) is MISS
+        assert cache.get("search", "/s", {"q": "a"}) == "a"
+        assert cache.get("search", "/s", {"q": "c"}) == "c"
+
+    def test_persists_on_disk(self, tmp_path):
+        """Test las respuestas sobreviven a una nueva instancia"""
+        path = tmp_path / "nested" / "cache.sqlite3"
+        cache = ResponseCache(path)
+        cache.set("salary", "/e", {"job_title": "Dev"}, [{"median_salary": 1}])
+        cache.close()
+
+        reopened = ResponseCache(path)
+
+        assert reopened.get("salary", "/e", {"job_title": "Dev"}) == [{"median_salary": 1}]
+        reopened.close()
+
+    def test_clear(self):
+        """Test clear vacía la caché"""
+        cache = ResponseCache(":memory:")
+        cache.set("search", "/s", {}, [1])
+
+        cache.clear()
+
+        assert len(cache) == 0
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_retry_policy.py
+Descripción: Tests para RetryPolicy y RetryBudget
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import http.client
+import json
+import socket
+import pytest
+from unittest.mock import Mock, patch
+from src.api.client import HTTPError
+from src.api.retry_policy import RetryPolicy, RetryBudget, RETRYABLE_STATUS_CODES
+
+
+class TestRetryClassification:
+    """Tests para la clasificación de errores"""
+
+    @pytest.mark.parametrize("status", sorted(RETRYABLE_STATUS_CODES))
+    def test_transient_status_codes_are_retryable(self, status):
+        """Test status transitorios son reintentables"""
+        assert RetryPolicy().is_retryable(HTTPError(status)) is True
+
+    @pytest.mark.parametrize("status", [400, 401, 403, 404, 422])
+    def test_client_errors_are_not_retryable(self, status):
+        """Test errores del cliente no son reintentables"""
+        assert RetryPolicy().is_retryable(HTTPError(status)) is False
+
+    @pytest.mark.parametrize("error", [
+        ConnectionResetError("reset"),
+        TimeoutError("timeout"),
+        socket.timeout("timeout"),
+        socket.gaierror("dns"),
+        http.client.RemoteDisconnected("closed"),
+    ])
+    def test_transport_errors_are_retryable(self, error):
+        """Test errores de red son reintentables"""
+        assert RetryPolicy().is_retryable(error) is True
+
+    @pytest.mark.parametrize("error", [
+        ValueError("bad"),
+        KeyError("missing"),
+        json.JSONDecodeError("bad", "doc", 0),
+    ])
+    def test_programming_errors_are_not_retryable(self, error):
+        """Test errores de datos o programación no son reintentables"""
+        assert RetryPolicy().is_retryable(error) is False
+
+    def test_custom_status_codes(self):
+        """Test conjunto de status personalizable"""
+        policy = RetryPolicy(retryable_status_codes=frozenset({418}))
+
+        assert policy.is_retryable(HTTPError(418)) is True
+        assert policy.is_retryable(HTTPError(503)) is False
+
+
+class TestRetryPolicy:
+    """Tests para RetryPolicy"""
+
+    def test_backoff_full_jitter_bounds(self):
+        """Test backoff es uniforme entre 0 y el tope exponencial"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+        with patch('random.uniform') as mock_uniform:
+            mock_uniform.side_effect = lambda low, high: (low, high)
+            assert policy.backoff(0) == (0, 1.0)
+            assert policy.backoff(2) == (0, 4.0)
+            assert policy.backoff(5) == (0, 5.0)  # Tope max_delay
+
+    @patch('time.sleep')
+    def test_call_success(self, mock_sleep):
+        """Test call retorna el resultado sin reintentar"""
+        before = Mock()
+        result = RetryPolicy().call(lambda x: x * 2, 21, before_attempt=before)
+
+        assert result == 42
+        before.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    def test_call_retries_transient_errors(self, mock_sleep):
+        """Test call reintenta errores transitorios"""
+        func = Mock(side_effect=[HTTPError(503), HTTPError(502), "ok"])
+
+        result = RetryPolicy(max_attempts=3).call(func)
+
+        assert result == "ok"
+        assert func.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch('time.sleep')
+    def test_call_stops_on_non_retryable(self, mock_sleep):
+        """Test call no reintenta errores permanentes"""
+        func = Mock(side_effect=HTTPError(400, "bad request"))
+
+        with pytest.raises(HTTPError):
+            RetryPolicy(max_attempts=5).call(func)
+
+        assert func.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    def test_call_respects_deadline(self, mock_sleep):
+        """Test no se reintenta si el backoff superaría el deadline"""
+        func = Mock(side_effect=HTTPError(503))
+        policy = RetryPolicy(max_attempts=10, base_delay=5.0, deadline=1.0)
+
+        with patch('random.uniform', return_value=2.0):
+            with pytest.raises(HTTPError):
+                policy.call(func)
+
+        assert func.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    def test_call_waits_at_least_retry_after(self, mock_sleep):
+        """Test el backoff nunca es menor que Retry-After"""
+        func = Mock(side_effect=[HTTPError(429, "slow", {"retry-after": "8"}), "ok"])
+
+        with patch('random.uniform', return_value=0.5):
+            assert RetryPolicy(max_attempts=2).call(func) == "ok"
+
+        mock_sleep.assert_called_once_with(8.0)
+
+    @patch('time.sleep')
+    def test_call_respects_budget(self, mock_sleep):
+        """Test no se reintenta con el presupuesto agotado"""
+        budget = RetryBudget(ratio=0.0, min_per_second=0.0, max_tokens=1.0)
+        policy = RetryPolicy(max_attempts=5, budget=budget)
+
+        func = Mock(side_effect=HTTPError(503))
+        with pytest.raises(HTTPError):
+            policy.call(func)
+
+        # Un único reintento disponible en el presupuesto
+        assert func.call_count == 2
+        assert mock_sleep.call_count == 1
+
+    @patch('time.sleep')
+    def test_budget_shared_between_calls(self, mock_sleep):
+        """Test el presupuesto es global entre llamadas"""
+        budget = RetryBudget(ratio=0.0, min_per_second=0.0, max_tokens=2.0)
+        policy = RetryPolicy(max_attempts=3, budget=budget)
+        failing = Mock(side_effect=HTTPError(503))
+
+        for _ in range(3):
+            with pytest.raises(HTTPError):
+                policy.call(failing)
+
+        # 3 llamadas originales + 2 reintentos en total
+        assert failing.call_count == 5
+
+
+class TestRetryBudget:
+    """Tests para RetryBudget"""
+
+    def test_deposit_per_request(self):
+        """Test cada request deposita ratio tokens"""
+        budget = RetryBudget(ratio=0.5, min_per_second=0.0, max_tokens=10.0)
+        budget.tokens = 0.0
+
+        budget.record_request()
+        assert budget.try_acquire() is False
+
+        budget.record_request()
+        assert budget.try_acquire() is True
+        assert budget.try_acquire() is False
+
+    @patch('time.monotonic')
+    def test_reserve_refills_over_time(self, mock_monotonic):
+        """Test la reserva mínima se repone con el tiempo"""
+        mock_monotonic.return_value = 0.0
+        budget = RetryBudget(ratio=0.0, min_per_second=1.0, max_tokens=3.0)
+        budget.tokens = 0.0
+
+        assert budget.try_acquire() is False
+        mock_monotonic.return_value = 2.0
+        assert budget.try_acquire() is True
+        assert budget.try_acquire() is True
+        assert budget.try_acquire() is False
+
+    def test_tokens_are_capped(self):
+        """Test los tokens no superan max_tokens"""
+        budget = RetryBudget(ratio=5.0, max_tokens=3.0)
+
+        budget.record_request()
+
+        assert budget.tokens <= 3.0
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_singleflight.py
+Descripción: Tests para SingleFlight
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from src.api.client import HTTPError
+from src.api.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests para SingleFlight"""
+
+    def test_sequential_calls_execute_each_time(self):
+        """Test sin concurrencia no se reutiliza el resultado"""
+        flight = SingleFlight()
+        calls = []
+
+        flight.do("k", lambda: calls.append(1))
+        flight.do("k", lambda: calls.append(1))
+
+        assert len(calls) == 2
+        assert flight.in_flight == 0
+
+    def test_concurrent_calls_share_execution(self):
+        """Test llamadas idénticas concurrentes ejecutan func una vez"""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(2)
+            return {"data": "shared"}
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(flight.do, "k", slow) for _ in range(5)]
+            while flight.shared_count < 4:
+                threading.Event().wait(0.005)
+            release.set()
+
+        results = [f.result() for f in futures]
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+
+    def test_errors_propagate_to_all_callers(self):
+        """Test todos los que esperan reciben la misma excepción"""
+        flight = SingleFlight()
+        release = threading.Event()
+        error = HTTPError(503, "boom")
+
+        def failing():
+            release.wait(2)
+            raise error
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(flight.do, "k", failing) for _ in range(3)]
+            while flight.shared_count < 2:
+                threading.Event().wait(0.005)
+            release.set()
+
+        for future in futures:
+            with pytest.raises(HTTPError) as exc_info:
+                future.result()
+            assert exc_info.value is error
+        assert flight.in_flight == 0
+
+    def test_different_keys_do_not_share(self):
+        """Test claves distintas se ejecutan por separado"""
+        flight = SingleFlight()
+
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+        assert flight.shared_count == 0
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_batch_validation.py
+Descripción: Tests para la validación en lote
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import pytest
+from unittest.mock import patch
+from pydantic import ValidationError
+from src.models.batch_validation import validate_batch
+from src.models.job import Job
+from src.models.salary import SalaryInfo
+
+
+class TestValidateBatch:
+    """Tests para validate_batch"""
+
+    def test_all_valid_single_pass(self, sample_job_data):
+        """Test sin errores no se valida elemento a elemento"""
+        data = [dict(sample_job_data, job_id=str(i)) for i in range(5)]
+
+        with patch.object(Job, 'model_validate', wraps=Job.model_validate) as per_item:
+            result = validate_batch(Job, data)
+
+        assert [job.job_id for job in result.items] == ["0", "1", "2", "3", "4"]
+        assert result.skipped == []
+        per_item.assert_not_called()
+
+    def test_invalid_items_skipped_and_reported(self, sample_job_data):
+        """Test los elementos inválidos se omiten con su índice y error"""
+        data = [
+            dict(sample_job_data, job_id="a"),
+            {"job_title": "sin id"},
+            dict(sample_job_data, job_id="b"),
+            dict(sample_job_data, job_id="c", job_min_salary="mucho"),
+        ]
+
+        with patch.object(Job, 'model_validate', wraps=Job.model_validate) as per_item:
+            result = validate_batch(Job, data)
+
+        assert [job.job_id for job in result.items] == ["a", "b"]
+        assert result.skipped == [1, 3]
+        assert set(result.errors) == {1, 3}
+        assert all(isinstance(e, ValidationError) for e in result.errors.values())
+        # Solo los fallidos se validan individualmente
+        assert per_item.call_count == 2
+
+    def test_matches_per_item_validation(self, sample_job_data):
+        """Test el resultado coincide con model_validate uno a uno"""
+        data = [sample_job_data, dict(sample_job_data, job_id="x", job_required_skills="SQL")]
+
+        result = validate_batch(Job, data)
+
+        assert result.items == [Job.model_validate(d) for d in data]
+
+    def test_empty_list(self):
+        """Test lista vacía"""
+        assert validate_batch(SalaryInfo, []).items == []
+
+    def test_non_list_raises(self):
+        """Test datos que no son lista lanzan ValidationError"""
+        with pytest.raises(ValidationError):
+            validate_batch(SalaryInfo, None)
@@ -196,6 +196,15 @@ def test_job_populate_by_name():
     assert job.city == "Madrid"
 
 
+def test_job_is_new_not_dumped(sample_job_data):
+    """Test is_new es estado de la búsqueda y no se serializa"""
+    job = Job.model_validate(sample_job_data)
+    job.is_new = True
+
+    assert job.is_new is True
+    assert 'is_new' not in job.model_dump()
+
+
 def test_job_all_optional_fields():
     """Test job con solo campo requerido"""
     job = Job.model_validate({"job_id": "minimal"})
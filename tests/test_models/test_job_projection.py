@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_job_projection.py
+Descripción: Tests para la proyección directa al formato del dashboard
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import pytest
+from src.models.job import Job
+from src.models.job_projection import project_jobs, job_to_dashboard
+
+DASHBOARD_KEYS = {
+    'id', 'title', 'company', 'location', 'salary', 'employment_type', 'is_remote',
+    'posted_at', 'description', 'required_experience', 'required_education', 'apply_link'
+}
+
+
+def payload_variants(base):
+    """Variantes de payload que ejercitan cada rama de formato"""
+    return [
+        base,
+        {"job_id": "minimal"},
+        dict(base, job_id="min-only", job_max_salary=None),
+        dict(base, job_id="max-only", job_min_salary=None, job_salary_currency=None),
+        dict(base, job_id="zero-salary", job_min_salary=0, job_max_salary=0),
+        dict(base, job_id="str-salary", job_min_salary="45000.5", job_salary_period=None),
+        dict(base, job_id="long-desc", job_description="palabra   " * 200),
+        dict(base, job_id="remote", job_is_remote="true", job_city=None, job_state=""),
+        dict(base, job_id="extras", job_required_skills="Python",
+             job_highlights={"Qualifications": ["x"]}, job_benefits=["dental"],
+             job_required_experience={"no_experience_required": False},
+             job_required_education=None),
+    ]
+
+
+class TestJobProjection:
+    """Tests para project_jobs"""
+
+    def test_matches_model_path(self, sample_job_data):
+        """Test la salida coincide exactamente con la proyección desde Job"""
+        raw = payload_variants(sample_job_data)
+        # required_experience es texto en Job; un dict no valida en ningún camino
+        raw_valid = [r for r in raw if not isinstance(r.get("job_required_experience"), dict)]
+
+        projected = project_jobs(raw_valid).items
+        expected = [job_to_dashboard(Job.model_validate(r)) for r in raw_valid]
+
+        assert projected == expected
+
+    def test_dashboard_keys(self, sample_job_data):
+        """Test cada trabajo tiene las 12 claves del dashboard"""
+        projected = project_jobs([sample_job_data]).items
+
+        assert set(projected[0]) == DASHBOARD_KEYS
+        assert projected[0]["location"] == "Madrid, Comunidad de Madrid, Spain"
+        assert projected[0]["salary"] == "40,000 - 60,000 EUR/YEAR"
+
+    def test_invalid_used_fields_skipped(self, sample_job_data):
+        """Test trabajos inválidos en campos usados se omiten como en Job"""
+        raw = [
+            {"job_title": "sin id"},
+            dict(sample_job_data, job_min_salary="mucho"),
+            sample_job_data,
+        ]
+
+        result = project_jobs(raw)
+
+        assert result.skipped == [0, 1]
+        assert [j["id"] for j in result.items] == [sample_job_data["job_id"]]
+
+    def test_unused_fields_not_validated(self, sample_job_data):
+        """Test errores en campos que el dashboard no usa no descartan el trabajo"""
+        raw = [dict(sample_job_data, job_latitude="no es número")]
+
+        with pytest.raises(ValueError):
+            Job.model_validate(raw[0])
+        assert len(project_jobs(raw).items) == 1
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_job_record.py
+Descripción: Tests para JobRecord
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import pickle
+import pytest
+from src.models.job import Job
+from src.models.job_record import JobRecord, to_records
+from src.models.job_projection import job_to_dashboard
+from src.services.export_service import ExportService
+from src.ui.formatters import JobFormatter
+
+
+@pytest.fixture
+def full_job(sample_job_data):
+    """Job con listas, highlights y timestamps"""
+    return Job.model_validate(dict(
+        sample_job_data,
+        job_publisher="LinkedIn",
+        job_posted_at_timestamp=1700000000,
+        job_required_skills=["Python", "SQL"],
+        job_benefits=["dental"],
+        job_highlights={"Qualifications": ["3 años"], "Benefits": ["Remoto"]},
+    ))
+
+
+class TestJobRecord:
+    """Tests para JobRecord"""
+
+    def test_roundtrip_is_lossless(self, full_job):
+        """Test Job -> JobRecord -> Job conserva todos los campos"""
+        record = JobRecord.from_job(full_job)
+
+        assert record.to_job() == full_job
+        assert record.model_dump() == full_job.model_dump()
+
+    def test_roundtrip_minimal_job(self):
+        """Test campos por defecto se conservan"""
+        job = Job(job_id="min")
+
+        assert JobRecord.from_job(job).to_job() == job
+
+    def test_is_read_only(self, full_job):
+        """Test no se pueden modificar ni borrar atributos"""
+        record = JobRecord.from_job(full_job)
+
+        with pytest.raises(AttributeError):
+            record.title = "otro"
+        with pytest.raises(AttributeError):
+            del record.title
+        record.highlights["Benefits"].append("x")
+        assert record.highlights["Benefits"] == ["Remoto"]
+
+    def test_compact_storage(self, full_job):
+        """Test sin __dict__, listas como tuplas y textos internados"""
+        record = JobRecord.from_job(full_job)
+        other = JobRecord.from_job(Job.model_validate(full_job.model_dump()))
+
+        assert not hasattr(record, '__dict__')
+        assert record.required_skills == ("Python", "SQL")
+        assert isinstance(record.posted_at_timestamp, int)
+        assert record.country is other.country
+        assert record.employment_type is other.employment_type
+        assert record.job_publisher is other.job_publisher
+
+    def test_unknown_field_rejected(self):
+        """Test campos desconocidos lanzan TypeError"""
+        with pytest.raises(TypeError):
+            JobRecord(job_id="x", job_title="alias no admitido")
+
+    def test_equality_hash_and_pickle(self, full_job):
+        """Test igualdad por valor, hashable y serializable"""
+        record = JobRecord.from_job(full_job)
+
+        assert record == JobRecord.from_job(full_job)
+        assert len({record, JobRecord.from_job(full_job)}) == 1
+        assert pickle.loads(pickle.dumps(record)) == record
+
+    def test_formatting_matches_job(self, full_job):
+        """Test los métodos de formato coinciden con Job"""
+        record = JobRecord.from_job(full_job)
+
+        assert record.get_location() == full_job.get_location()
+        assert record.get_salary_range() == full_job.get_salary_range()
+        assert record.get_short_description(20) == full_job.get_short_description(20)
+        assert job_to_dashboard(record) == job_to_dashboard(full_job)
+
+    def test_accepted_by_formatters(self, full_job):
+        """Test los formateadores aceptan JobRecord"""
+        records = to_records([full_job])
+
+        assert JobFormatter.format_job_table(records).row_count == 1
+        assert JobFormatter.format_job_details(records[0]) is not None
+
+    def test_accepted_by_exports(self, full_job, tmp_path):
+        """Test las exportaciones producen el mismo contenido"""
+        service = ExportService(tmp_path)
+        from_jobs = service.export_jobs_to_json([full_job], "jobs")
+        from_records = service.export_jobs_to_json(to_records([full_job]), "records")
+        csv_path = service.export_jobs_to_csv(to_records([full_job]), "records")
+
+        assert from_jobs.read_text(encoding='utf-8') == from_records.read_text(encoding='utf-8')
+        assert "Python, SQL" in csv_path.read_text(encoding='utf-8')
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_export_manifest.py
+Descripción: Tests para la deduplicación de exportaciones y los deltas
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import json
+import os
+from unittest.mock import patch
+import pytest
+from src.models.job import Job
+from src.services.export_manifest import ExportManifest, job_id_delta
+from src.services.export_service import ExportService
+from src.services.seen_jobs import SeenJobs
+
+
+@pytest.fixture
+def jobs(sample_job_data):
+    return [Job(**dict(sample_job_data, job_id=str(i))) for i in range(5)]
+
+
+@pytest.fixture
+def clock():
+    """Nombres de archivo distintos en cada exportación (una por segundo simulado)"""
+    ticks = iter(range(100))
+    with patch('src.utils.file_utils.datetime') as mock_datetime:
+        mock_datetime.now.return_value.strftime.side_effect = lambda fmt: f"20260117_1040{next(ticks):02d}"
+        yield
+
+
+class TestJobIdDelta:
+    """Tests para job_id_delta"""
+
+    def test_added_and_removed_in_order(self):
+        """Test añadidos en orden actual y eliminados en orden anterior"""
+        assert job_id_delta(["a", "b", "c"], ["c", "d", "a", "e"]) == {
+            'added': ["d", "e"],
+            'removed': ["b"],
+        }
+
+
+class TestExportDedup:
+    """Tests para exportaciones idénticas"""
+
+    def test_link_identical_export(self, jobs, temp_output_dir, clock):
+        """Test un resultado idéntico se enlaza al archivo anterior"""
+        service = ExportService(temp_output_dir, dedup='link')
+
+        first = service.export_many(jobs, "backend developer", ["csv", "json"])
+        second = service.export_many(list(jobs), "backend developer", ["csv", "json"])
+
+        assert first.duplicate_of == {}
+        assert second.content_hash == first.content_hash
+        assert second.duplicate_of == first.paths
+        for name in ("csv", "json"):
+            assert second.paths[name] != first.paths[name]
+            assert os.path.samefile(second.paths[name], first.paths[name])
+        assert not list(temp_output_dir.glob("*.part"))
+
+    def test_is_new_does_not_change_content(self, jobs, temp_output_dir, clock):
+        """Test los mismos trabajos vistos de nuevo (is_new distinto) se deduplican"""
+        service = ExportService(temp_output_dir, dedup='link')
+        for job in jobs:
+            job.is_new = True
+        first = service.export_many(jobs, "backend", ["csv", "json"])
+
+        for job in jobs:
+            job.is_new = False
+        second = service.export_many(jobs, "backend", ["csv", "json"])
+
+        assert second.content_hash == first.content_hash
+        assert second.duplicate_of == first.paths
+
+    def test_skip_identical_export(self, jobs, temp_output_dir, clock):
+        """Test con skip no se crea archivo y se devuelve el anterior"""
+        service = ExportService(temp_output_dir, dedup='skip')
+
+        first = service.export_many(jobs, "backend", ["csv"])
+        second = service.export_many(jobs, "backend", ["csv"])
+
+        assert second.paths == first.paths
+        assert sorted(p.name for p in temp_output_dir.glob("*.csv")) == [first.paths["csv"].name]
+
+    def test_identical_content_across_base_names_and_restarts(self, jobs, temp_output_dir, clock):
+        """Test el manifiesto persiste y el contenido se reconoce con otro nombre base"""
+        ExportService(temp_output_dir, dedup='link').export_jobs_to_csv(jobs, "search a")
+
+        batch = ExportService(temp_output_dir, dedup='link').export_many(jobs, "search b", ["csv"])
+
+        assert "csv" in batch.duplicate_of
+
+    def test_different_format_or_content_is_written(self, jobs, temp_output_dir, clock):
+        """Test otro formato, compresión o contenido se escriben normalmente"""
+        service = ExportService(temp_output_dir, dedup='link')
+        service.export_many(jobs, "backend", ["csv"])
+
+        assert service.export_many(jobs, "backend", ["csv"], compression="gzip").duplicate_of == {}
+        assert service.export_many(jobs[:3], "backend", ["csv"]).duplicate_of == {}
+
+    def test_deleted_previous_file_is_rewritten(self, jobs, temp_output_dir, clock):
+        """Test si el archivo anterior ya no existe se escribe de nuevo"""
+        service = ExportService(temp_output_dir, dedup='link')
+        first = service.export_many(jobs, "backend", ["csv"])
+        first.paths["csv"].unlink()
+
+        second = service.export_many(jobs, "backend", ["csv"])
+
+        assert second.duplicate_of == {}
+        assert second.paths["csv"].exists()
+
+    def test_invalid_mode(self, temp_output_dir):
+        """Test modo de deduplicación desconocido"""
+        with pytest.raises(ValueError):
+            ExportService(temp_output_dir, dedup='copy')
+
+
+class TestExportDeltas:
+    """Tests para los archivos delta"""
+
+    def test_delta_since_previous_export(self, jobs, temp_output_dir, clock):
+        """Test el delta lista los IDs añadidos y eliminados sin releer exportaciones"""
+        service = ExportService(temp_output_dir, write_deltas=True)
+        first = service.export_many(jobs[:3], "python spain", ["csv"])
+        assert first.delta_path is None
+
+        first.paths["csv"].unlink()
+        second = service.export_many(jobs[1:], "python spain", ["jsonl"])
+
+        delta = json.loads(second.delta_path.read_text(encoding='utf-8'))
+        assert second.delta_path.name.startswith("python_spain_delta_")
+        assert delta['added'] == ["3", "4"]
+        assert delta['removed'] == ["0"]
+        assert (delta['previous_count'], delta['count']) == (3, 4)
+
+    def test_no_delta_for_identical_export(self, jobs, temp_output_dir, clock):
+        """Test sin cambios no se escribe delta"""
+        service = ExportService(temp_output_dir, write_deltas=True)
+        service.export_many(jobs, "python", ["csv"])
+
+        assert service.export_many(jobs, "python", ["csv"]).delta_path is None
+
+    def test_background_export_tracks_manifest(self, jobs, temp_output_dir, clock):
+        """Test la exportación en segundo plano también registra y deduplica"""
+        service = ExportService(temp_output_dir, dedup='link', write_deltas=True)
+        service.export_many(jobs[:2], "python", ["csv"])
+
+        batch = service.export_many(jobs, "python", ["csv"], background=True)
+
+        assert batch.wait(5) == 5
+        assert batch.delta_path is not None
+        assert ExportManifest(temp_output_dir).previous("python")['count'] == 5
+        service.wait()
+
+
+    def test_job_ids_streamed_to_file(self, jobs, temp_output_dir, clock):
+        """Test los IDs se escriben a un archivo durante la exportación y no quedan temporales"""
+        history = SeenJobs()
+        service = ExportService(temp_output_dir, history, write_deltas=True)
+
+        batch = service.export_many(iter(jobs), "python", ["csv"])
+
+        assert ExportManifest(temp_output_dir).job_ids(batch.content_hash) == [job.job_id for job in jobs]
+        assert all(job.job_id in history for job in jobs)
+        assert not list(temp_output_dir.glob("*.part"))
+
+    def test_seen_history_without_manifest_leaves_no_ids_file(self, jobs, temp_output_dir):
+        """Test sin manifiesto el archivo de IDs solo vive durante la exportación"""
+        history = SeenJobs()
+        ExportService(temp_output_dir, history).export_many(jobs, "python", ["csv"])
+
+        assert all(job.job_id in history for job in jobs)
+        assert [path.suffix for path in temp_output_dir.iterdir()] == [".csv"]
+
+
+class TestExportManifest:
+    """Tests para ExportManifest"""
+
+    def test_unreadable_manifest_starts_empty(self, temp_output_dir):
+        """Test un manifiesto corrupto no impide exportar"""
+        manifest = ExportManifest(temp_output_dir)
+        manifest.path.parent.mkdir(parents=True)
+        manifest.path.write_text("{not json", encoding='utf-8')
+
+        assert ExportManifest(temp_output_dir).previous("python") is None
+
+    def test_job_ids_stored_once_per_hash(self, temp_output_dir):
+        """Test los IDs se guardan por hash de contenido"""
+        manifest = ExportManifest(temp_output_dir)
+        manifest.record("a", "hash1", 2, {}, ["x", "y"])
+        manifest.record("b", "hash1", 2, {}, ["ignored"])
+
+        assert manifest.job_ids("hash1") == ["x", "y"]
+        assert manifest.job_ids("missing") is None
+        assert manifest.previous("b")['hash'] == "hash1"
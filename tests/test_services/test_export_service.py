@@ -12,9 +12,16 @@ Fecha: 2025-12-08
 """
 import json
 import csv
+import threading
+import tracemalloc
 import pytest
 from unittest.mock import mock_open, patch, MagicMock
-from src.services.export_service import ExportService
+from src.models.job import Job
+from src.services import export_service
+from src.services.export_service import (
+    ExportService, iter_export_rows, iter_exported_jobs, job_arrow_schema, read_parquet
+)
+from src.services.seen_jobs import SeenJobs
 
 
 def test_export_jobs_to_csv(sample_job, temp_output_dir):
@@ -272,3 +279,314 @@ def test_export_salaries_to_csv_error_handling(sample_salary, temp_output_dir):
     with patch('builtins.open', side_effect=PermissionError("Write protected")):
         with pytest.raises(PermissionError):
             service.export_salaries_to_csv(salaries, "test_salaries")
+
+
+def test_select_new_skips_previously_exported(sample_job_data, temp_output_dir):
+    """Test solo se exportan los trabajos no exportados antes, entre ejecuciones"""
+    history = temp_output_dir / "exported.bloom"
+    jobs = [Job(**dict(sample_job_data, job_id=str(i))) for i in range(3)]
+
+    first_service = ExportService(temp_output_dir, SeenJobs(history))
+    first = first_service.select_new(jobs[:2])
+    first_service.export_jobs_to_csv(first, "jobs")
+    service = ExportService(temp_output_dir, SeenJobs(history))
+    second = service.select_new(jobs)
+    service.export_jobs_to_jsonl(second, "jobs")
+
+    assert [job.job_id for job in first] == ["0", "1"]
+    assert [job.job_id for job in second] == ["2"]
+    assert service.select_new(jobs) == []
+
+
+def test_select_new_marks_only_after_successful_export(sample_job_data, temp_output_dir):
+    """Test un trabajo seleccionado no cuenta como exportado si la escritura falla"""
+    jobs = [Job(**dict(sample_job_data, job_id=str(i))) for i in range(2)]
+    service = ExportService(temp_output_dir, SeenJobs())
+
+    assert service.select_new(jobs) == jobs
+    with patch('src.services.export_service._CsvJobWriter.write', side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            service.export_jobs_to_csv(jobs, "jobs")
+
+    assert service.select_new(jobs) == jobs
+
+
+def test_select_new_without_history(sample_job, temp_output_dir):
+    """Test sin historial se exporta todo"""
+    service = ExportService(temp_output_dir)
+
+    assert service.select_new([sample_job]) == [sample_job]
+
+
+def make_job_stream(count, description_size=0):
+    """Genera trabajos bajo demanda, sin lista intermedia"""
+    for i in range(count):
+        yield Job(job_id=str(i), job_title=f"Job {i}", job_description="x" * description_size)
+
+
+def test_export_jobs_json_from_iterator_matches_json_dump(sample_job_data, temp_output_dir):
+    """Test el array en streaming es idéntico a json.dump(indent=2)"""
+    service = ExportService(temp_output_dir)
+    jobs = [Job(**dict(sample_job_data, job_id=str(i))) for i in range(3)]
+
+    filepath = service.export_jobs_to_json(iter(jobs), "stream")
+
+    expected = json.dumps([job.model_dump() for job in jobs], ensure_ascii=False, indent=2)
+    assert filepath.read_text(encoding='utf-8') == expected
+
+
+def test_export_jobs_to_jsonl(sample_job, temp_output_dir):
+    """Test exportación a JSON Lines desde un generador"""
+    service = ExportService(temp_output_dir)
+
+    filepath = service.export_jobs_to_jsonl(make_job_stream(5), "test_jobs")
+
+    assert filepath.suffix == ".jsonl"
+    lines = filepath.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['job_id'] for line in lines] == ["0", "1", "2", "3", "4"]
+
+
+def test_exports_omit_is_new(sample_job, temp_output_dir):
+    """Test la marca is_new de la búsqueda no llega a las exportaciones"""
+    sample_job.is_new = True
+    service = ExportService(temp_output_dir)
+
+    json_path = service.export_jobs_to_json([sample_job], "test_jobs")
+    jsonl_path = service.export_jobs_to_jsonl([sample_job], "test_jobs")
+
+    assert 'is_new' not in json.loads(json_path.read_text(encoding='utf-8'))[0]
+    assert 'is_new' not in json.loads(jsonl_path.read_text(encoding='utf-8'))
+
+
+def test_export_jobs_csv_from_iterator(temp_output_dir):
+    """Test el CSV acepta cualquier iterable"""
+    service = ExportService(temp_output_dir)
+
+    filepath = service.export_jobs_to_csv(make_job_stream(4), "test_jobs")
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        assert [row['job_id'] for row in csv.DictReader(f)] == ["0", "1", "2", "3"]
+
+
+@pytest.mark.parametrize("method", ["export_jobs_to_csv", "export_jobs_to_json", "export_jobs_to_jsonl"])
+def test_streaming_export_memory_is_flat(method, temp_output_dir):
+    """Test la memoria no crece con el número de trabajos exportados"""
+    service = ExportService(temp_output_dir)
+
+    tracemalloc.start()
+    try:
+        getattr(service, method)(make_job_stream(5000, description_size=2000), "big")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Materializar los 5000 trabajos ocuparía más de 10 MB
+    assert peak < 3 * 1024 * 1024
+
+
+class CountingJob(Job):
+    """Job que cuenta sus llamadas a model_dump"""
+    dumps: int = 0
+
+    def model_dump(self, **kwargs):
+        object.__setattr__(self, 'dumps', self.dumps + 1)
+        return super().model_dump(exclude={'dumps'}, **kwargs)
+
+
+def test_export_many_dumps_each_job_once(sample_job_data, temp_output_dir):
+    """Test una sola conversión por trabajo para todos los formatos"""
+    service = ExportService(temp_output_dir)
+    jobs = [CountingJob(**dict(sample_job_data, job_id=str(i))) for i in range(3)]
+
+    batch = service.export_many(iter(jobs), "multi", ["csv", "json", "jsonl"])
+
+    assert batch.count == 3
+    assert [job.dumps for job in jobs] == [1, 1, 1]
+    assert {path.suffix for path in batch.paths.values()} == {".csv", ".json", ".jsonl"}
+    assert len(json.loads(batch.paths["json"].read_text(encoding='utf-8'))) == 3
+    with open(batch.paths["csv"], 'r', encoding='utf-8') as f:
+        assert [row['job_id'] for row in csv.DictReader(f)] == ["0", "1", "2"]
+
+
+def test_export_many_matches_single_format_exports(sample_job_data, temp_output_dir):
+    """Test el resultado es idéntico al de cada exportación por separado"""
+    service = ExportService(temp_output_dir)
+    jobs = [Job(**dict(sample_job_data, job_id=str(i))) for i in range(2)]
+
+    batch = service.export_many(jobs, "multi", ["json", "csv"])
+    csv_path = service.export_jobs_to_csv(jobs, "single")
+    json_path = service.export_jobs_to_json(jobs, "single")
+
+    assert batch.paths["csv"].read_bytes() == csv_path.read_bytes()
+    assert batch.paths["json"].read_bytes() == json_path.read_bytes()
+
+
+def test_export_many_in_background(sample_job, temp_output_dir):
+    """Test en segundo plano devuelve las rutas enseguida y escribe después"""
+    service = ExportService(temp_output_dir)
+    release = threading.Event()
+
+    def slow_jobs():
+        release.wait(5)
+        yield sample_job
+
+    batch = service.export_many(slow_jobs(), "background", ["jsonl"], background=True)
+
+    assert not batch.done
+    release.set()
+    assert batch.wait(5) == 1
+    assert batch.paths["jsonl"].read_text(encoding='utf-8').count('\n') == 1
+    service.wait()
+
+
+def test_export_many_background_error(sample_job, temp_output_dir):
+    """Test el error de una escritura en segundo plano se propaga al esperar"""
+    service = ExportService(temp_output_dir)
+
+    def broken_jobs():
+        yield sample_job
+        raise OSError("No space left")
+
+    batch = service.export_many(broken_jobs(), "broken", ["csv"], background=True)
+
+    with pytest.raises(OSError):
+        batch.wait(5)
+
+
+def test_export_many_invalid_format(sample_job, temp_output_dir):
+    """Test formato desconocido"""
+    service = ExportService(temp_output_dir)
+
+    with pytest.raises(ValueError):
+        service.export_many([sample_job], "bad", ["xml"])
+    with pytest.raises(ValueError):
+        service.export_many([sample_job], "bad", [])
+
+
+@pytest.mark.parametrize("compression,suffix", [("gzip", ".gz"), ("zstd", ".zst")])
+def test_export_many_compressed_round_trip(compression, suffix, sample_job_data, temp_output_dir):
+    """Test exportación comprimida y lectura descomprimiendo sobre la marcha"""
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    service = ExportService(temp_output_dir, compression=compression, compression_level=3)
+    jobs = [Job(**dict(sample_job_data, job_id=str(i), job_required_skills=["Python", "SQL"])) for i in range(20)]
+
+    batch = service.export_many(jobs, "archive", ["csv", "jsonl", "json"])
+
+    assert all(path.name.endswith(suffix) for path in batch.paths.values())
+    assert batch.paths["csv"].name.endswith(".csv" + suffix)
+    assert list(iter_exported_jobs(batch.paths["jsonl"])) == jobs
+    assert list(iter_exported_jobs(batch.paths["json"])) == jobs
+    rows = list(iter_export_rows(batch.paths["csv"]))
+    assert [row['job_id'] for row in rows] == [str(i) for i in range(20)]
+    assert rows[0]['required_skills'] == "Python, SQL"
+
+
+def test_compressed_export_is_smaller(sample_job_data, temp_output_dir):
+    """Test la compresión reduce el tamaño de claves y descripciones repetidas"""
+    service = ExportService(temp_output_dir)
+    jobs = [Job(**dict(sample_job_data, job_id=str(i))) for i in range(50)]
+
+    plain = service.export_many(jobs, "plain", ["jsonl"]).paths["jsonl"]
+    packed = service.export_many(jobs, "packed", ["jsonl"], compression="gzip", level=9).paths["jsonl"]
+
+    assert packed.stat().st_size * 5 < plain.stat().st_size
+    assert list(iter_export_rows(packed)) == list(iter_export_rows(plain))
+
+
+def test_exported_readers_reject_unknown_files(temp_output_dir):
+    """Test lectores con extensiones no exportables"""
+    with pytest.raises(ValueError):
+        list(iter_export_rows(temp_output_dir / "notes.txt.gz"))
+    with pytest.raises(ValueError):
+        list(iter_exported_jobs(temp_output_dir / "jobs.csv"))
+
+
+def test_invalid_compression(temp_output_dir, sample_job):
+    """Test compresión desconocida"""
+    with pytest.raises(ValueError):
+        ExportService(temp_output_dir, compression="lzma")
+    with pytest.raises(ValueError):
+        ExportService(temp_output_dir).export_many([sample_job], "bad", ["csv"], compression="lzma")
+
+
+def test_invalid_compression_level(temp_output_dir, sample_job):
+    """Test un nivel de zstd no vale para gzip, ni al crear el servicio ni por llamada"""
+    with pytest.raises(ValueError):
+        ExportService(temp_output_dir, compression="gzip", compression_level=19)
+
+    service = ExportService(temp_output_dir, compression="zstd", compression_level=19)
+    with pytest.raises(ValueError):
+        service.export_many([sample_job], "bad", ["csv"], compression="gzip")
+    assert not list(temp_output_dir.glob("bad_*"))
+
+
+class TestParquetExport:
+    """Tests para la exportación columnar"""
+
+    @pytest.fixture(autouse=True)
+    def require_pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    @pytest.fixture
+    def jobs(self, sample_job_data):
+        return [
+            Job(**dict(
+                sample_job_data,
+                job_id=str(i),
+                job_min_salary=1000.0 * i,
+                job_required_skills=["Python", "SQL"][:i % 3],
+                job_benefits=None if i % 2 else ["health_insurance"],
+            ))
+            for i in range(10)
+        ]
+
+    def test_schema_is_typed(self):
+        """Test el esquema conserva tipos y listas"""
+        import pyarrow as pa
+        schema = job_arrow_schema()
+
+        assert schema.names == [name for name in Job.model_fields if name != 'is_new']
+        assert schema.field('min_salary').type == pa.float64()
+        assert schema.field('posted_at_timestamp').type == pa.int64()
+        assert schema.field('is_remote').type == pa.bool_()
+        assert schema.field('required_skills').type == pa.list_(pa.string())
+        assert schema.field('benefits').type == pa.list_(pa.string())
+        assert schema.field('highlights').type == pa.string()
+
+    def test_round_trip(self, jobs, temp_output_dir, monkeypatch):
+        """Test los trabajos se recuperan idénticos, con varios row groups"""
+        import pyarrow.parquet as pq
+        monkeypatch.setattr(export_service, 'PARQUET_ROW_GROUP_SIZE', 4)
+        service = ExportService(temp_output_dir)
+
+        filepath = service.export_many(iter(jobs), "analytics", ["parquet", "jsonl"]).paths["parquet"]
+
+        assert filepath.suffix == ".parquet"
+        assert pq.ParquetFile(filepath).metadata.num_row_groups == 3
+        assert list(iter_exported_jobs(filepath)) == jobs
+        assert next(iter_export_rows(filepath))['highlights'] == jobs[0].highlights
+
+    def test_read_selected_columns(self, jobs, temp_output_dir):
+        """Test el cargador lee solo las columnas pedidas, de varios archivos"""
+        service = ExportService(temp_output_dir)
+        first = service.export_many(jobs[:4], "month_1", ["parquet"]).paths["parquet"]
+        second = service.export_many(jobs[4:], "month_2", ["parquet"]).paths["parquet"]
+
+        table = read_parquet([first, second], columns=["job_id", "required_skills"])
+
+        assert table.column_names == ["job_id", "required_skills"]
+        assert table.column("job_id").to_pylist() == [job.job_id for job in jobs]
+        assert table.column("required_skills").to_pylist() == [job.required_skills for job in jobs]
+
+    def test_compression_uses_parquet_codec(self, jobs, temp_output_dir):
+        """Test la compresión se aplica dentro del Parquet, sin extensión extra"""
+        import pyarrow.parquet as pq
+        service = ExportService(temp_output_dir, compression="gzip")
+
+        batch = service.export_many(jobs, "packed", ["parquet", "csv"])
+
+        assert batch.paths["parquet"].name.endswith(".parquet")
+        assert batch.paths["csv"].name.endswith(".csv.gz")
+        metadata = pq.ParquetFile(batch.paths["parquet"]).metadata
+        assert metadata.row_group(0).column(0).compression == "GZIP"
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_job_dedup.py
+Descripción: Tests para JobDeduplicator
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import random
+import pytest
+from unittest.mock import Mock
+from src.models.job import Job
+from src.models.job_record import JobRecord
+from src.services.job_dedup import JobDeduplicator, ngram_hashes, normalize_text
+from src.services.job_service import JobService
+from src.services.job_store import JobStore
+
+WORDS = [f"palabra{i}" for i in range(2000)]
+
+
+def posting(job_id, description, employer="Acme", title="Python Developer", **extra):
+    return Job(
+        job_id=job_id,
+        job_title=title,
+        employer_name=employer,
+        job_city="Madrid",
+        job_country="ES",
+        job_description=description,
+        **{"job_apply_link": f"https://apply/{job_id}", **extra}
+    )
+
+
+def random_description(rng, length=200):
+    return " ".join(rng.choice(WORDS) for _ in range(length))
+
+
+class TestNormalization:
+    """Tests para la normalización de textos"""
+
+    def test_normalize_text(self):
+        """Test minúsculas, sin tildes ni puntuación"""
+        assert normalize_text("  Desarrollador/a SENIOR — Python, Señor!  ") == \
+            "desarrollador a senior python senor"
+        assert normalize_text(None) == ""
+
+    def test_ngram_hashes(self):
+        """Test un hash por n-grama y textos cortos"""
+        assert len(ngram_hashes("a b c d e", 3)) == 3
+        assert len(ngram_hashes("a b", 3)) == 1
+        assert len(ngram_hashes("", 3)) == 0
+        assert ngram_hashes("a b c", 3)[0] != ngram_hashes("c b a", 3)[0]
+
+
+class TestJobDeduplicator:
+    """Tests para JobDeduplicator"""
+
+    def test_collapses_near_duplicates_across_publishers(self):
+        """Test la misma oferta con cambios menores se colapsa"""
+        rng = random.Random(3)
+        description = random_description(rng)
+        edited = description.replace(description.split()[10], "Cambiado", 1) + " Apply now!"
+
+        jobs = [
+            posting("linkedin", description, job_publisher="LinkedIn"),
+            posting("other", random_description(rng)),
+            posting("indeed", edited.upper(), job_publisher="Indeed", job_max_salary=50000),
+        ]
+
+        result = JobDeduplicator().collapse(jobs)
+
+        assert [job.job_id for job in result.jobs] == ["indeed", "other"]
+        assert result.duplicates == {"linkedin": "indeed"}
+        assert result.jobs[0].alternate_apply_links == ["https://apply/linkedin"]
+        assert jobs[2].alternate_apply_links == []
+
+    def test_different_employers_not_merged(self):
+        """Test descripciones iguales de empresas distintas no se colapsan"""
+        description = random_description(random.Random(4))
+
+        result = JobDeduplicator().collapse([
+            posting("1", description, employer="Acme"),
+            posting("2", description, employer="Globex"),
+        ])
+
+        assert result.removed == 0
+
+    def test_missing_employer_does_not_bridge_employers(self):
+        """Test un trabajo sin empresa no une grupos de empresas distintas"""
+        description = random_description(random.Random(4))
+
+        result = JobDeduplicator().collapse([
+            posting("1", description, employer="Acme"),
+            posting("2", description, employer=None),
+            posting("3", description, employer="Globex"),
+        ])
+
+        assert result.duplicates == {"2": "1"}
+        assert [job.job_id for job in result.jobs] == ["1", "3"]
+
+    def test_dissimilar_jobs_kept(self):
+        """Test ofertas distintas de la misma empresa se conservan"""
+        rng = random.Random(5)
+        jobs = [posting(str(i), random_description(rng)) for i in range(50)]
+
+        result = JobDeduplicator().collapse(jobs)
+
+        assert result.jobs == jobs
+
+    def test_clusters_are_transitive_and_links_unique(self):
+        """Test cadenas de duplicados forman un solo grupo sin enlaces repetidos"""
+        description = random_description(random.Random(6))
+        jobs = [
+            posting("a", description),
+            posting("b", description, job_apply_link="https://apply/a"),
+            posting("c", description + " extra"),
+        ]
+
+        result = JobDeduplicator().collapse(jobs)
+
+        assert len(result.jobs) == 1
+        canonical = result.jobs[0]
+        assert canonical.job_id == "c"
+        assert canonical.alternate_apply_links == ["https://apply/a"]
+
+    def test_recall_on_many_jobs(self):
+        """Test encuentra los duplicados plantados entre muchos trabajos"""
+        rng = random.Random(7)
+        jobs = [posting(str(i), random_description(rng), employer=f"E{i % 20}") for i in range(600)]
+        for i in range(0, 600, 10):
+            words = jobs[i].description.split()
+            words[rng.randrange(len(words))] = "modificado"
+            jobs.append(posting(f"dup{i}", " ".join(words), employer=jobs[i].employer_name))
+
+        result = JobDeduplicator().collapse(jobs)
+
+        assert result.removed == 60
+        assert len(result.jobs) == 600
+
+    def test_accepts_job_records(self):
+        """Test funciona con JobRecord"""
+        description = random_description(random.Random(8))
+        records = [JobRecord.from_job(posting(job_id, description)) for job_id in ("a", "b")]
+
+        result = JobDeduplicator().collapse(records)
+
+        assert isinstance(result.jobs[0], JobRecord)
+        assert result.jobs[0].alternate_apply_links == ("https://apply/b",)
+
+    def test_invalid_bands(self):
+        """Test num_perm debe ser múltiplo de bands"""
+        with pytest.raises(ValueError):
+            JobDeduplicator(num_perm=100, bands=16)
+
+
+class TestJobServiceCollapse:
+    """Tests para JobService.collapse_duplicates"""
+
+    def test_without_deduplicator_returns_all(self):
+        """Test sin deduplicador no se colapsa nada"""
+        description = random_description(random.Random(9))
+        jobs = [posting("a", description), posting("b", description)]
+
+        assert JobService(Mock()).collapse_duplicates(jobs) == jobs
+
+    def test_with_deduplicator(self):
+        """Test con deduplicador se colapsan los duplicados"""
+        description = random_description(random.Random(9))
+        jobs = [posting("a", description), posting("b", description)]
+
+        service = JobService(Mock(), deduplicator=JobDeduplicator())
+
+        assert [job.job_id for job in service.collapse_duplicates(jobs)] == ["a"]
+
+    def test_collapse_saved_duplicates(self):
+        """Test la misma oferta guardada por búsquedas distintas se colapsa en el almacén"""
+        rng = random.Random(10)
+        description = random_description(rng)
+        store = JobStore(":memory:")
+        store.upsert(posting("linkedin", description), seen_at=100)
+        store.upsert(posting("other", random_description(rng)), seen_at=100)
+        store.upsert(posting("indeed", description, job_max_salary=50000), seen_at=200)
+        service = JobService(Mock(), job_store=store, deduplicator=JobDeduplicator())
+        service.search_saved("python")
+
+        removed = service.collapse_saved_duplicates()
+
+        assert removed == 1
+        assert sorted(store.iter_ids()) == ["indeed", "other"]
+        assert store.get("indeed").alternate_apply_links == ["https://apply/linkedin"]
+        assert store.seen_range("indeed")[1] == 200
+        assert "linkedin" not in {job.job_id for job in service.search_saved("python")}
+
+    def test_collapse_saved_without_store(self):
+        """Test sin almacén o sin deduplicador no hace nada"""
+        assert JobService(Mock(), deduplicator=JobDeduplicator()).collapse_saved_duplicates() == 0
+        assert JobService(Mock(), job_store=JobStore(":memory:")).collapse_saved_duplicates() == 0
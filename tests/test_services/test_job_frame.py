@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_job_frame.py
+Descripción: Tests para JobFrame
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import math
+import random
+import numpy as np
+import pytest
+from unittest.mock import Mock
+from src.models.job import Job
+from src.models.job_record import to_records
+from src.services.job_frame import JobFrame, MISSING_TIMESTAMP
+from src.services.job_service import JobService
+
+
+def make_jobs(count, seed=7):
+    """Trabajos aleatorios con salarios, monedas y huecos variados"""
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        min_salary = rng.choice([None, 0, 30000, 45000, 60000, 60000])
+        max_salary = rng.choice([None, 0, 50000, 80000, 80000])
+        jobs.append(Job(
+            job_id=str(i),
+            job_min_salary=min_salary,
+            job_max_salary=max_salary,
+            job_salary_currency=rng.choice([None, "USD", "EUR"]),
+            job_salary_period=rng.choice([None, "YEAR", "MONTH"]),
+            job_employment_type=rng.choice([None, "FULLTIME", "CONTRACTOR"]),
+            job_is_remote=rng.random() < 0.3,
+            job_posted_at_timestamp=rng.choice([None, 1_700_000_000 + i]),
+            job_latitude=rng.choice([None, 40.4]),
+        ))
+    return jobs
+
+
+def remote_reference(jobs):
+    """Filtro de remotos recorriendo la lista"""
+    return [job for job in jobs if job.is_remote]
+
+
+def salary_reference(jobs, min_salary, currency):
+    """Filtro de salario mínimo recorriendo la lista"""
+    return [
+        job for job in jobs
+        if job.min_salary and job.salary_currency == currency and job.min_salary >= min_salary
+    ]
+
+
+def sort_reference(jobs, descending=True):
+    """Orden por salario (max, si no min, si no 0) con sorted()"""
+    return sorted(jobs, key=lambda job: job.max_salary or job.min_salary or 0, reverse=descending)
+
+
+@pytest.fixture
+def jobs():
+    return make_jobs(300)
+
+
+@pytest.fixture
+def service():
+    return JobService(Mock())
+
+
+class TestJobFrame:
+    """Tests para JobFrame"""
+
+    def test_columns(self):
+        """Test columnas numéricas, categóricas y valores ausentes"""
+        frame = JobFrame.from_jobs([
+            Job(job_id="a", job_min_salary=10, job_salary_currency="EUR", job_posted_at_timestamp=5),
+            Job(job_id="b", job_is_remote=True),
+        ])
+
+        assert len(frame) == 2
+        assert frame.min_salary[0] == 10 and math.isnan(frame.min_salary[1])
+        assert frame.posted_at.tolist() == [5, MISSING_TIMESTAMP]
+        assert frame.is_remote.tolist() == [False, True]
+        assert frame.currency.labels() == ["EUR", None]
+
+    def test_remote_filter_matches_reference(self, jobs, service):
+        """Test filtro de remotos equivalente al recorrido por lista y al de JobService"""
+        frame = JobFrame.from_jobs(jobs)
+
+        assert frame.where(frame.remote_mask()).rows() == remote_reference(jobs)
+        assert service.filter_remote_jobs(jobs) == remote_reference(jobs)
+        assert service.filter_remote_jobs(frame) == remote_reference(jobs)
+
+    def test_salary_filter_matches_reference(self, jobs, service):
+        """Test filtro de salario equivalente al recorrido por lista y al de JobService"""
+        frame = JobFrame.from_jobs(jobs)
+
+        for threshold in (0, 40000, 60000, 100000):
+            expected = salary_reference(jobs, threshold, "USD")
+            assert frame.where(frame.salary_mask(threshold, "USD")).rows() == expected
+            assert service.filter_by_salary(jobs, threshold, "USD") == expected
+
+    def test_sort_matches_reference(self, jobs, service):
+        """Test orden por salario estable e igual a sorted() y al de JobService"""
+        frame = JobFrame.from_jobs(jobs)
+
+        assert frame.sort_by_salary().rows() == sort_reference(jobs)
+        assert frame.sort_by_salary(descending=False).rows() == sort_reference(jobs, descending=False)
+        assert service.sort_by_salary(jobs) == sort_reference(jobs)
+        assert service.sort_by_salary(frame, descending=False) == sort_reference(jobs, descending=False)
+
+    @pytest.mark.parametrize("k", [0, 1, 5, 37, 300, 500])
+    def test_top_k_matches_sort(self, jobs, k):
+        """Test top-k coincide con los k primeros del orden completo, con empates"""
+        frame = JobFrame.from_jobs(jobs)
+
+        assert frame.top_k_salary(k).tolist() == frame.argsort_salary()[:k].tolist()
+        assert frame.top_k_salary(k, descending=False).tolist() == \
+            frame.argsort_salary(descending=False)[:k].tolist()
+
+    def test_chained_masks_single_pass(self, jobs):
+        """Test máscaras combinadas equivalen a encadenar los filtros"""
+        frame = JobFrame.from_jobs(jobs)
+        mask = frame.remote_mask() & frame.salary_mask(40000, "USD")
+
+        expected = sort_reference(salary_reference(remote_reference(jobs), 40000, "USD"))
+        assert frame.where(mask).sort_by_salary().rows() == expected
+
+    def test_posted_after_and_employment_type(self, jobs):
+        """Test máscaras de fecha y tipo de empleo"""
+        frame = JobFrame.from_jobs(jobs)
+        cutoff = 1_700_000_150
+
+        posted = frame.where(frame.posted_after_mask(cutoff)).rows()
+        contractors = frame.where(frame.employment_type_mask(["CONTRACTOR", "PARTTIME"])).rows()
+
+        assert posted == [j for j in jobs if j.posted_at_timestamp and j.posted_at_timestamp >= cutoff]
+        assert contractors == [j for j in jobs if j.employment_type == "CONTRACTOR"]
+
+    def test_group_by(self):
+        """Test agregados por grupo ignorando valores ausentes"""
+        frame = JobFrame.from_jobs([
+            Job(job_id="1", job_salary_currency="USD", job_min_salary=10, job_max_salary=30),
+            Job(job_id="2", job_salary_currency="USD", job_max_salary=50),
+            Job(job_id="3", job_salary_currency="USD"),
+            Job(job_id="4", job_salary_currency="EUR", job_min_salary=20),
+            Job(job_id="5"),
+        ])
+
+        stats = frame.group_by("currency", "salary")
+
+        assert set(stats) == {"USD", "EUR"}
+        assert stats["USD"]["count"] == 3
+        assert stats["USD"]["with_value"] == 2
+        assert stats["USD"]["mean"] == 40
+        assert stats["USD"]["median"] == 40
+        assert (stats["USD"]["min"], stats["USD"]["max"]) == (30, 50)
+        assert stats["EUR"]["max"] == 20
+
+    def test_group_by_remote_without_values(self):
+        """Test agrupar por is_remote y grupos sin valores"""
+        frame = JobFrame.from_jobs([Job(job_id="1", job_is_remote=True), Job(job_id="2")])
+
+        stats = frame.group_by("is_remote", "min_salary")
+
+        assert stats[True]["count"] == 1
+        assert math.isnan(stats[True]["mean"])
+
+    def test_group_by_employer_and_city_mask(self):
+        """Test agrupar por empresa y filtrar ciudad sin distinguir mayúsculas"""
+        frame = JobFrame.from_jobs([
+            Job(job_id="1", employer_name="Acme", job_city="Madrid", job_max_salary=10),
+            Job(job_id="2", employer_name="Acme", job_city="madrid", job_max_salary=30),
+            Job(job_id="3", employer_name="Globex", job_city="Bilbao"),
+        ])
+
+        stats = frame.group_by("employer")
+
+        assert stats["Acme"]["mean"] == 20
+        assert stats["Globex"]["with_value"] == 0
+        assert frame.city.isin(["MADRID"], casefold=True).tolist() == [True, True, False]
+        assert frame.city.isin(["MADRID"]).tolist() == [False, False, False]
+
+    def test_group_by_invalid_columns(self, jobs):
+        """Test columnas no válidas lanzan ValueError"""
+        frame = JobFrame.from_jobs(jobs)
+
+        with pytest.raises(ValueError):
+            frame.group_by("title")
+        with pytest.raises(ValueError):
+            frame.group_by("currency", "title")
+
+    def test_accepts_job_records(self, jobs):
+        """Test funciona igual con JobRecord"""
+        records = to_records(jobs)
+
+        frame = JobFrame.from_jobs(records)
+
+        assert frame.rows(frame.top_k_salary(3)) == [records[i] for i in JobFrame.from_jobs(jobs).top_k_salary(3)]
+
+    def test_empty_frame(self):
+        """Test frame vacío"""
+        frame = JobFrame.from_jobs([])
+
+        assert len(frame) == 0
+        assert frame.top_k_salary(5).size == 0
+        assert frame.group_by("currency") == {}
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_job_query.py
+Descripción: Tests para JobQuery
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import random
+from datetime import datetime, timezone
+import pytest
+from unittest.mock import Mock
+from src.models.job import Job
+from src.models.job_record import to_records
+from src.services.job_frame import JobFrame
+from src.services.job_query import JobQuery
+from src.services.job_service import JobService
+
+
+def make_jobs(count, seed=11):
+    """Trabajos aleatorios con empresas, ciudades y skills variadas"""
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        jobs.append(Job(
+            job_id=str(i),
+            employer_name=rng.choice([None, "Acme", "Globex", "Initech"]),
+            job_city=rng.choice([None, "Madrid", "Barcelona"]),
+            job_employment_type=rng.choice([None, "FULLTIME", "CONTRACTOR"]),
+            job_is_remote=rng.random() < 0.4,
+            job_posted_at_timestamp=rng.choice([None, 1_700_000_000 + i * 10]),
+            job_min_salary=rng.choice([None, 0, 30000, 50000]),
+            job_max_salary=rng.choice([None, 40000, 70000, 70000]),
+            job_salary_currency=rng.choice([None, "USD", "EUR"]),
+            job_required_skills=rng.sample(["Python", "Java", "SQL", "Docker"], rng.randint(0, 3)),
+        ))
+    return jobs
+
+
+@pytest.fixture
+def jobs():
+    return make_jobs(400)
+
+
+@pytest.fixture
+def service():
+    return JobService(Mock())
+
+
+QUERIES = [
+    JobQuery(),
+    JobQuery().remote(),
+    JobQuery().remote(False).has_salary(),
+    JobQuery().employer_in("acme", "GLOBEX").city("madrid"),
+    JobQuery().employment_type("fulltime").posted_after(1_700_001_000),
+    JobQuery().skills_contain("python", "sql"),
+    JobQuery().min_salary(40000, "USD").order_by('salary').limit(7),
+    JobQuery().has_salary().order_by('salary', descending=False).limit(15),
+    JobQuery().order_by('posted_at').order_by('salary').limit(25),
+    JobQuery().employer_in("Initech").skills_contain("Docker").order_by('salary'),
+    JobQuery().remote().limit(5),
+]
+
+
+def reference(query, jobs):
+    """Implementación directa: filtros encadenados y sorted() completo"""
+    def ok(job):
+        if query.remote_filter is not None and job.is_remote != query.remote_filter:
+            return False
+        if query.posted_after_ts is not None and not (
+            job.posted_at_timestamp and job.posted_at_timestamp >= query.posted_after_ts
+        ):
+            return False
+        if query.salary_required and not (job.min_salary or job.max_salary):
+            return False
+        if query.employers is not None and (job.employer_name or '').lower() not in query.employers:
+            return False
+        if query.cities is not None and (job.city or '').lower() not in query.cities:
+            return False
+        if query.employment_types is not None and (job.employment_type or '').lower() not in query.employment_types:
+            return False
+        if not query.skills <= {s.lower() for s in job.required_skills}:
+            return False
+        return True
+
+    result = [job for job in jobs if ok(job)]
+    if query.min_salary_filter:
+        amount, currency = query.min_salary_filter
+        result = [
+            job for job in result
+            if job.min_salary and job.salary_currency == currency and job.min_salary >= amount
+        ]
+    for name, descending in reversed(query.sort_keys):
+        attr = {'salary': lambda j: j.max_salary or j.min_salary or 0,
+                'posted_at': lambda j: j.posted_at_timestamp}[name]
+        present = [j for j in result if attr(j) is not None]
+        missing = [j for j in result if attr(j) is None]
+        result = sorted(present, key=attr, reverse=descending) + missing
+    if query.max_results is not None:
+        result = result[:query.max_results]
+    return result
+
+
+class TestJobQuery:
+    """Tests para JobQuery"""
+
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_matches_reference_on_list(self, jobs, query):
+        """Test sobre lista coincide con filtros encadenados + sorted()"""
+        assert query.run(jobs) == reference(query, jobs)
+
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_frame_matches_list(self, jobs, query):
+        """Test sobre JobFrame devuelve lo mismo que sobre la lista"""
+        assert query.run(JobFrame.from_jobs(jobs)) == query.run(jobs)
+
+    def test_equivalent_to_service_helpers(self, jobs, service):
+        """Test reproduce los tres helpers de JobService"""
+        query = JobQuery().remote().min_salary(30000, "USD").order_by('salary')
+        expected = service.sort_by_salary(
+            service.filter_by_salary(service.filter_remote_jobs(jobs), 30000, "USD")
+        )
+
+        assert query.run(jobs) == expected
+        assert query.limit(20).run(jobs) == expected[:20]
+
+    def test_builder_is_immutable(self):
+        """Test cada método devuelve una consulta nueva"""
+        base = JobQuery().remote()
+        limited = base.limit(3)
+
+        assert base.max_results is None
+        assert limited.max_results == 3
+        assert limited.remote_filter is True
+
+    def test_posted_after_accepts_datetime(self, jobs):
+        """Test posted_after con datetime"""
+        when = datetime.fromtimestamp(1_700_002_000, tz=timezone.utc)
+
+        assert JobQuery().posted_after(when).run(jobs) == JobQuery().posted_after(1_700_002_000).run(jobs)
+
+    def test_limit_without_order_stops_early(self):
+        """Test sin orden la pasada termina al alcanzar el límite"""
+        consumed = []
+
+        def stream():
+            for i in range(100):
+                consumed.append(i)
+                yield Job(job_id=str(i), job_is_remote=True)
+
+        result = JobQuery().remote().limit(3).run(stream())
+
+        assert [job.job_id for job in result] == ["0", "1", "2"]
+        assert len(consumed) == 3
+
+    def test_accepts_job_records(self, jobs):
+        """Test funciona con JobRecord"""
+        query = JobQuery().skills_contain("python").order_by('salary').limit(5)
+
+        records = query.run(to_records(jobs))
+
+        assert [r.job_id for r in records] == [j.job_id for j in query.run(jobs)]
+
+    def test_invalid_arguments(self):
+        """Test clave de orden y límite no válidos"""
+        with pytest.raises(ValueError):
+            JobQuery().order_by('title')
+        with pytest.raises(ValueError):
+            JobQuery().limit(-1)
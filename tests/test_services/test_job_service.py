@@ -9,12 +9,21 @@ Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
 Versión: 3.0.0
 Fecha: 2025-12-08
 """
+import asyncio
+import threading
 import pytest
 from unittest.mock import Mock, MagicMock
 from pydantic import ValidationError
 from src.services.job_service import JobService
 from src.models.job import Job
 from src.models.search_params import SearchParameters
+from src.services.search_cache import SearchCache
+from src.services.job_store import JobStore
+from src.services.skill_extractor import SkillExtractor
+from src.services.seen_jobs import SeenJobs
+from src.api.client import HTTPError
+from src.api.jsearch_client import SearchResults
+from src.models.job_projection import project_jobs
 
 
 class TestJobService:
@@ -44,6 +53,191 @@ class TestJobService:
         assert all(isinstance(job, Job) for job in jobs)
         mock_client.search_jobs.assert_called_once_with(params)
 
+    def test_search_jobs_uses_search_cache(self, sample_job_data):
+        """Test búsquedas contenidas en otra se responden sin llamar a la API"""
+        remote = dict(sample_job_data, job_id="remote", job_is_remote=True)
+        onsite = dict(sample_job_data, job_id="onsite", job_is_remote=False)
+        mock_client = Mock()
+        mock_client.search_jobs.return_value = SearchResults([remote, onsite], exhausted=True)
+
+        service = JobService(mock_client, SearchCache())
+        service.search_jobs(SearchParameters(query="python"))
+        jobs = service.search_jobs(SearchParameters(query="python", work_from_home=True))
+
+        assert [job.job_id for job in jobs] == ["remote"]
+        mock_client.search_jobs.assert_called_once()
+
+    def test_search_jobs_persists_to_job_store(self, sample_job_data):
+        """Test los trabajos encontrados se guardan en el almacén local"""
+        mock_client = Mock()
+        mock_client.rate_limiter.request_count = 0
+        mock_client.search_jobs.return_value = [sample_job_data, {"invalid": "data"}]
+        store = JobStore(":memory:")
+
+        service = JobService(mock_client, job_store=store)
+        service.search_jobs(SearchParameters(query="python"))
+        list(service.iter_search(SearchParameters(query="java")))
+
+        assert len(store) == 1
+        assert store.get(sample_job_data["job_id"]).title == sample_job_data["job_title"]
+
+    def test_projected_searches_persist_to_job_store(self, sample_job_data):
+        """Test search_raw y iter_search con parser también guardan en el almacén"""
+        mock_client = Mock()
+        mock_client.search_jobs.side_effect = [
+            [dict(sample_job_data, job_id="raw"), {"invalid": "data"}],
+            [dict(sample_job_data, job_id="page")],
+        ]
+        store = JobStore(":memory:")
+        service = JobService(mock_client, job_store=store)
+
+        raw = service.search_raw(SearchParameters(query="python"))
+        pages = list(service.iter_search(SearchParameters(query="java"), parser=project_jobs))
+        service.wait()
+
+        assert len(raw) == 2
+        assert pages[0].jobs[0]["id"] == "page"
+        assert sorted(store.iter_ids()) == ["page", "raw"]
+
+    def test_search_raw_stores_in_background(self, sample_job_data):
+        """Test search_raw responde sin esperar a validar y guardar los trabajos"""
+        mock_client = Mock()
+        mock_client.search_jobs.return_value = [sample_job_data]
+        store = JobStore(":memory:")
+        service = JobService(mock_client, job_store=store)
+        release = threading.Event()
+        parse_jobs = service._parse_jobs
+        service._parse_jobs = lambda raw: release.wait(5) and parse_jobs(raw)
+
+        raw = service.search_raw(SearchParameters(query="python"))
+
+        assert raw == [sample_job_data]
+        assert len(store) == 0
+        release.set()
+        service.wait()
+        assert len(store) == 1
+
+    def test_job_store_errors_do_not_break_search(self, sample_job_data):
+        """Test un fallo del almacén no interrumpe la búsqueda"""
+        mock_client = Mock()
+        mock_client.search_jobs.return_value = [sample_job_data]
+        store = JobStore(":memory:")
+        store.close()
+
+        jobs = JobService(mock_client, job_store=store).search_jobs(SearchParameters(query="python"))
+
+        assert len(jobs) == 1
+
+    def test_search_saved_uses_store_and_index(self, sample_job_data):
+        """Test búsqueda local por relevancia sin llamar a la API"""
+        store = JobStore(":memory:")
+        store.upsert(Job(job_id="old", job_title="Kubernetes Admin"))
+        mock_client = Mock()
+        mock_client.search_jobs.return_value = [
+            dict(sample_job_data, job_id="new", job_title="Kubernetes Platform Engineer")
+        ]
+        service = JobService(mock_client, job_store=store)
+
+        assert [job.job_id for job in service.search_saved("kubernetes")] == ["old"]
+
+        service.search_jobs(SearchParameters(query="platform"))
+        assert [job.job_id for job in service.search_saved("kubernetes platform")] == ["new", "old"]
+        assert mock_client.search_jobs.call_count == 1
+
+    def test_prune_saved_removes_from_store_and_index(self):
+        """Test los trabajos caducados salen del almacén y del índice"""
+        store = JobStore(":memory:")
+        store.upsert(Job(job_id="old", job_title="Golang Developer"), seen_at=10.0)
+        store.upsert(Job(job_id="new", job_title="Golang Lead"), seen_at=50.0)
+        service = JobService(Mock(), job_store=store)
+        service.search_saved("golang")
+
+        assert service.prune_saved(20.0) == 1
+        assert [job.job_id for job in service.search_saved("golang")] == ["new"]
+
+    def test_search_saved_without_store(self):
+        """Test sin almacén la búsqueda local no devuelve nada"""
+        assert JobService(Mock()).search_saved("python") == []
+        assert JobService(Mock()).prune_saved(0) == 0
+
+    def test_skill_extractor_fills_required_skills(self, sample_job_data):
+        """Test las skills de la descripción se añaden antes de guardar"""
+        store = JobStore(":memory:")
+        mock_client = Mock()
+        mock_client.search_jobs.return_value = [
+            dict(sample_job_data, job_required_skills=[], job_description="Python and k8s")
+        ]
+        service = JobService(mock_client, job_store=store, skill_extractor=SkillExtractor())
+
+        jobs = service.search_jobs(SearchParameters(query="python"))
+
+        assert jobs[0].required_skills == ["Python", "Kubernetes"]
+        assert store.get(jobs[0].job_id).required_skills == ["Python", "Kubernetes"]
+
+    def test_seen_jobs_tags_new_and_seen(self, sample_job_data):
+        """Test los trabajos de ejecuciones anteriores se marcan is_new=False"""
+        mock_client = Mock()
+        mock_client.search_jobs.return_value = [
+            dict(sample_job_data, job_id="old"),
+            dict(sample_job_data, job_id="new"),
+        ]
+        seen = SeenJobs()
+        seen.add_many(["old"])
+        service = JobService(mock_client, seen_jobs=seen)
+
+        jobs = service.search_jobs(SearchParameters(query="python"))
+
+        assert [(job.job_id, job.is_new) for job in jobs] == [("old", False), ("new", True)]
+        assert "new" in seen
+
+    def test_seen_jobs_skip_in_incremental_search(self, sample_job_data):
+        """Test con skip_seen solo se entregan los trabajos nuevos"""
+        mock_client = Mock()
+        mock_client.rate_limiter.request_count = 0
+        mock_client.search_jobs.return_value = [
+            dict(sample_job_data, job_id="old"),
+            dict(sample_job_data, job_id="new"),
+        ]
+        store = JobStore(":memory:")
+        store.upsert(Job(job_id="old"), seen_at=100)
+        service = JobService(mock_client, job_store=store, seen_jobs=SeenJobs(job_store=store), skip_seen=True)
+
+        pages = list(service.iter_search(SearchParameters(query="python", num_pages=1)))
+
+        assert [job.job_id for job in pages[0].jobs] == ["new"]
+        assert "new" in store
+        assert store.seen_range("old")[1] > 100
+        assert service.prune_saved(not_seen_since=200) == 0
+
+    def test_seen_jobs_saved_on_close(self, sample_job_data, tmp_path):
+        """Test el historial de vistos se escribe una vez, al cerrar el servicio"""
+        mock_client = Mock()
+        mock_client.search_jobs.return_value = [sample_job_data]
+        path = tmp_path / "seen.bloom"
+        service = JobService(mock_client, seen_jobs=SeenJobs(path))
+
+        service.search_jobs(SearchParameters(query="python"))
+        service.search_jobs(SearchParameters(query="java"))
+        assert not path.exists()
+
+        service.close()
+        assert sample_job_data["job_id"] in SeenJobs(path)
+
+    def test_iter_jobs_flattens_pages(self, sample_job_data):
+        """Test iter_jobs entrega los trabajos de todas las páginas en orden"""
+        mock_client = Mock()
+        mock_client.rate_limiter.request_count = 0
+        mock_client.search_jobs.side_effect = [
+            [dict(sample_job_data, job_id="a"), dict(sample_job_data, job_id="b")],
+            [dict(sample_job_data, job_id="c")],
+        ]
+        service = JobService(mock_client)
+
+        jobs = service.iter_jobs(SearchParameters(query="python", num_pages=2))
+
+        assert mock_client.search_jobs.call_count == 0
+        assert [job.job_id for job in jobs] == ["a", "b", "c"]
+
     def test_search_jobs_empty_results(self):
         """Test búsqueda sin resultados"""
         mock_client = Mock()
@@ -361,3 +555,147 @@ class TestJobService:
         sorted_jobs = service.sort_by_salary([])
 
         assert sorted_jobs == []
+
+
+class TestIterSearch:
+    """Tests para la búsqueda incremental página a página"""
+
+    @staticmethod
+    def _make_service(sample_job_data, pages):
+        """Servicio cuyo cliente devuelve `pages` (lista de listas de job_id) y cuenta peticiones"""
+        mock_client = Mock()
+        mock_client.rate_limiter.request_count = 0
+
+        def search(params):
+            mock_client.rate_limiter.request_count += 1
+            ids = pages[params.page - 1]
+            return [dict(sample_job_data, job_id=job_id) for job_id in ids]
+
+        mock_client.search_jobs.side_effect = search
+        return JobService(mock_client), mock_client
+
+    def test_yields_each_page_with_progress(self, sample_job_data):
+        """Test cada página se entrega con su progreso"""
+        service, client = self._make_service(sample_job_data, [["a", "b"], ["c"], ["d"]])
+
+        pages = list(service.iter_search(SearchParameters(query="python", num_pages=3)))
+
+        assert [[j.job_id for j in p.jobs] for p in pages] == [["a", "b"], ["c"], ["d"]]
+        assert [p.page for p in pages] == [1, 2, 3]
+        assert [p.pages_done for p in pages] == [1, 2, 3]
+        assert all(p.total_pages == 3 for p in pages)
+        assert [p.quota_spent for p in pages] == [1, 2, 3]
+        assert pages[-1].is_last and not pages[0].is_last
+        for call in client.search_jobs.call_args_list:
+            assert call[0][0].num_pages == 1
+
+    def test_quota_counts_only_this_search(self, sample_job_data):
+        """Test las peticiones de otras búsquedas o reintentos no se cuentan"""
+        service, client = self._make_service(sample_job_data, [["a"], ["b"]])
+        search = client.search_jobs.side_effect
+
+        def busy_search(params):
+            client.rate_limiter.request_count += 5
+            return search(params)
+
+        client.search_jobs.side_effect = busy_search
+
+        pages = list(service.iter_search(SearchParameters(query="python", num_pages=2)))
+
+        assert [p.quota_spent for p in pages] == [1, 2]
+
+    def test_page_reports_skipped_indices(self, sample_job_data):
+        """Test los trabajos inválidos se informan por índice en la página"""
+        mock_client = Mock()
+        mock_client.rate_limiter.request_count = 0
+        mock_client.search_jobs.return_value = [sample_job_data, {"invalid": "data"}]
+
+        page = next(iter(JobService(mock_client).iter_search(SearchParameters(query="python"))))
+
+        assert len(page.jobs) == 1
+        assert page.skipped == [1]
+
+    def test_custom_parser_and_raw_dedup(self, sample_job_data):
+        """Test un parser alternativo recibe cada página sin repetidos"""
+        service, _ = self._make_service(sample_job_data, [["a", "b"], ["b", "c"]])
+
+        pages = list(service.iter_search(
+            SearchParameters(query="python", num_pages=2), parser=project_jobs
+        ))
+
+        assert [[j["id"] for j in p.jobs] for p in pages] == [["a", "b"], ["c"]]
+
+    def test_search_raw_skips_validation(self, sample_job_data):
+        """Test search_raw retorna los resultados sin validar"""
+        mock_client = Mock()
+        mock_client.search_jobs.return_value = [sample_job_data, {"invalid": "data"}]
+
+        raw = JobService(mock_client).search_raw(SearchParameters(query="python"))
+
+        assert raw == [sample_job_data, {"invalid": "data"}]
+
+    def test_stop_early_skips_remaining_pages(self, sample_job_data):
+        """Test detenerse tras la primera página no pide más"""
+        service, client = self._make_service(sample_job_data, [["a"], ["b"], ["c"]])
+
+        first = next(iter(service.iter_search(SearchParameters(query="python", num_pages=3))))
+
+        assert [j.job_id for j in first.jobs] == ["a"]
+        assert client.search_jobs.call_count == 1
+
+    def test_duplicates_across_pages_dropped(self, sample_job_data):
+        """Test job_id repetido en otra página se omite"""
+        service, _ = self._make_service(sample_job_data, [["a", "b"], ["b", "c"]])
+
+        pages = list(service.iter_search(SearchParameters(query="python", num_pages=2)))
+
+        assert [j.job_id for j in pages[1].jobs] == ["c"]
+
+    def test_search_cache_hits_spend_no_quota(self, sample_job_data):
+        """Test páginas servidas desde caché no consumen cuota"""
+        service, client = self._make_service(sample_job_data, [["a"], ["b"]])
+        service.search_cache = SearchCache()
+        params = SearchParameters(query="python", num_pages=2)
+
+        list(service.iter_search(params))
+        pages = list(service.iter_search(params))
+
+        assert pages[-1].quota_spent == 0
+        assert client.search_jobs.call_count == 2
+
+    def test_response_cache_hits_spend_no_quota(self, sample_job_data):
+        """Test páginas que el cliente sirvió desde su caché de respuestas no cuentan"""
+        mock_client = Mock()
+        mock_client.search_jobs.side_effect = [
+            SearchResults([dict(sample_job_data, job_id="a")], api_requests=1),
+            SearchResults([dict(sample_job_data, job_id="b")], api_requests=0),
+        ]
+
+        pages = list(JobService(mock_client).iter_search(SearchParameters(query="python", num_pages=2)))
+
+        assert [p.quota_spent for p in pages] == [1, 1]
+
+    def test_page_error_propagates(self, sample_job_data):
+        """Test un error en una página se lanza tras entregar las anteriores"""
+        mock_client = Mock()
+        mock_client.rate_limiter.request_count = 0
+        mock_client.search_jobs.side_effect = [[sample_job_data], HTTPError(500, "boom")]
+        iterator = JobService(mock_client).iter_search(SearchParameters(query="python", num_pages=2))
+
+        assert next(iterator).pages_done == 1
+        with pytest.raises(HTTPError):
+            next(iterator)
+
+    def test_aiter_search(self, sample_job_data):
+        """Test la variante asíncrona entrega las mismas páginas"""
+        service, _ = self._make_service(sample_job_data, [["a"], ["b"]])
+
+        async def collect():
+            return [page async for page in service.aiter_search(
+                SearchParameters(query="python", num_pages=2)
+            )]
+
+        pages = asyncio.run(collect())
+
+        assert [[j.job_id for j in p.jobs] for p in pages] == [["a"], ["b"]]
+        assert pages[-1].quota_spent == 2
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_job_store.py
+Descripción: Tests para JobStore
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import pytest
+from src.models.job import Job
+from src.models.job_record import JobRecord
+from src.services.job_query import JobQuery
+from src.services.job_store import JobStore, to_fts_query
+from tests.test_services.test_job_query import QUERIES, make_jobs
+
+
+@pytest.fixture
+def store():
+    job_store = JobStore(":memory:")
+    yield job_store
+    job_store.close()
+
+
+class TestJobStore:
+    """Tests para JobStore"""
+
+    def test_round_trip(self, store, sample_job):
+        """Test el trabajo recuperado es igual al guardado"""
+        store.upsert(sample_job)
+
+        assert store.get(sample_job.job_id) == sample_job
+        assert sample_job.job_id in store
+        assert store.get("missing") is None
+
+    def test_upsert_tracks_first_and_last_seen(self, store, sample_job):
+        """Test upsert conserva first_seen y actualiza campos y last_seen"""
+        assert store.upsert(sample_job, seen_at=100.0) is True
+
+        updated = sample_job.model_copy(update={'title': 'Staff Engineer'})
+        assert store.upsert(updated, seen_at=200.0) is False
+
+        assert len(store) == 1
+        assert store.get(sample_job.job_id).title == 'Staff Engineer'
+        assert store.seen_range(sample_job.job_id) == (100.0, 200.0)
+
+    def test_upsert_many_counts_new_jobs(self, store):
+        """Test upsert_many devuelve los nuevos y deduplica la entrada"""
+        jobs = make_jobs(30)
+
+        assert store.upsert_many(jobs[:20]) == 20
+        assert store.upsert_many(jobs[10:] + jobs[10:15]) == 10
+        assert len(store) == 30
+        assert store.known_ids(["0", "29", "nope"]) == {"0", "29"}
+
+    def test_get_many_and_stale_ids(self, store):
+        """Test lectura por lotes e IDs no vistos desde una fecha"""
+        store.upsert_many(make_jobs(10), seen_at=10.0)
+        store.upsert_many(make_jobs(3), seen_at=50.0)
+
+        jobs = store.get_many(["1", "7", "missing"])
+
+        assert set(jobs) == {"1", "7"}
+        assert jobs["7"].job_id == "7"
+        assert store.stale_ids(20.0) == [str(i) for i in range(3, 10)]
+
+    def test_accepts_job_records(self, store, sample_job):
+        """Test acepta JobRecord"""
+        store.upsert(JobRecord.from_job(sample_job))
+
+        assert store.get(sample_job.job_id) == sample_job
+
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_query_matches_in_memory(self, store, query):
+        """Test el SQL equivale a ejecutar JobQuery sobre la lista"""
+        jobs = make_jobs(400)
+        store.upsert_many(jobs)
+
+        assert [j.job_id for j in store.query(query)] == [j.job_id for j in query.run(jobs)]
+
+    def test_full_text_search(self, store):
+        """Test FTS5 en título, descripción y skills, ordenado por relevancia"""
+        store.upsert_many([
+            Job(job_id="1", job_title="Python Developer", job_description="Django and APIs"),
+            Job(job_id="2", job_title="Data Engineer", job_description="Python, Spark"),
+            Job(job_id="3", job_title="Frontend", job_required_skills=["React", "Kubernetes"]),
+            Job(job_id="4", job_title="Diseñador", job_description="Figma"),
+        ])
+
+        assert [j.job_id for j in store.search("python")] == ["1", "2"]
+        assert [j.job_id for j in store.search("kubern")] == ["3"]
+        assert [j.job_id for j in store.search("disenador")] == ["4"]
+        assert store.search("python spark")[0].job_id == "2"
+        assert store.search("  ") == []
+
+    def test_search_combined_with_query(self, store):
+        """Test texto libre combinado con filtros"""
+        store.upsert_many([
+            Job(job_id="1", job_title="Python Developer", job_is_remote=True, job_max_salary=50),
+            Job(job_id="2", job_title="Python Lead", job_is_remote=True, job_max_salary=90),
+            Job(job_id="3", job_title="Python Intern"),
+        ])
+
+        result = store.query(JobQuery().remote().order_by('salary'), text="python")
+
+        assert [j.job_id for j in result] == ["2", "1"]
+
+    def test_fts_follows_updates_and_removals(self, store):
+        """Test el índice de texto se mantiene al actualizar y borrar"""
+        store.upsert(Job(job_id="1", job_title="Golang Developer"))
+        store.upsert(Job(job_id="1", job_title="Rust Developer"))
+
+        assert store.search("golang") == []
+        assert [j.job_id for j in store.search("rust")] == ["1"]
+
+        assert store.remove(["1", "x"]) == 1
+        assert store.search("rust") == []
+
+    def test_remove_not_seen_since(self, store):
+        """Test elimina trabajos no vistos desde una fecha"""
+        store.upsert(Job(job_id="old"), seen_at=10.0)
+        store.upsert(Job(job_id="new"), seen_at=50.0)
+
+        assert store.remove_not_seen_since(20.0) == 1
+        assert [j.job_id for j in store.iter_jobs()] == ["new"]
+
+    def test_iter_jobs_in_batches(self, store):
+        """Test recorre todos los trabajos en orden de inserción"""
+        store.upsert_many(make_jobs(25))
+
+        assert [j.job_id for j in store.iter_jobs(batch_size=7)] == [str(i) for i in range(25)]
+
+    def test_uses_indexes(self, store):
+        """Test las consultas habituales usan índices"""
+        def plan(sql, *params):
+            return " ".join(row[-1] for row in store._conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+        assert "idx_jobs_country" in plan("SELECT * FROM jobs WHERE country = ?", "ES")
+        assert "idx_jobs_employer" in plan("SELECT * FROM jobs WHERE employer_name IN (?, ?)", "a", "b")
+        assert "idx_jobs_posted_at" in plan("SELECT * FROM jobs WHERE posted_at >= ?", 1)
+
+    def test_persists_to_disk(self, tmp_path, sample_job):
+        """Test los trabajos sobreviven al reabrir el archivo"""
+        path = tmp_path / "store" / "jobs.sqlite3"
+        first = JobStore(path)
+        first.upsert(sample_job)
+        first.optimize()
+        first.close()
+
+        reopened = JobStore(path)
+        assert reopened.get(sample_job.job_id) == sample_job
+        reopened.close()
+
+    def test_to_fts_query_escapes_syntax(self):
+        """Test el texto libre no se interpreta como sintaxis FTS5"""
+        assert to_fts_query('c++ "OR" NEAR(') == '"c" "OR" "NEAR"*'
+        assert to_fts_query("") == ""
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_search_cache.py
+Descripción: Tests para SearchCache
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import pytest
+from unittest.mock import patch
+from src.models.search_params import SearchParameters
+from src.services.search_cache import SearchCache, JSEARCH_PAGE_SIZE
+
+NOW = 1_700_000_000
+DAY = 86400
+
+
+def make_results(count):
+    """Genera resultados en bruto: uno de cada dos remoto, job-i publicado hace i días"""
+    return [
+        {
+            "job_id": f"job-{i}",
+            "job_is_remote": i % 2 == 0,
+            "job_posted_at_timestamp": NOW - i * DAY,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def frozen_time():
+    with patch('src.services.search_cache.time.time', return_value=NOW) as mock_time:
+        yield mock_time
+
+
+class TestSearchCache:
+    """Tests para SearchCache"""
+
+    def test_exact_hit(self, frozen_time):
+        """Test la misma búsqueda se responde desde caché"""
+        cache = SearchCache()
+        params = SearchParameters(query="python")
+        cache.put(params, make_results(10))
+
+        assert len(cache.get(params)) == 10
+        assert cache.hits == 1
+
+    def test_new_search_misses(self, frozen_time):
+        """Test otra query o país va a la API"""
+        cache = SearchCache()
+        cache.put(SearchParameters(query="python"), make_results(10))
+
+        assert cache.get(SearchParameters(query="java")) is None
+        assert cache.get(SearchParameters(query="python", country="es")) is None
+        assert cache.misses == 2
+
+    def test_narrower_date_posted_filters_by_timestamp(self, frozen_time):
+        """Test 'week' se responde filtrando un resultado 'month' agotado"""
+        cache = SearchCache()
+        cache.put(SearchParameters(query="python", date_posted="month"), make_results(8), exhausted=True)
+
+        results = cache.get(SearchParameters(query="python", date_posted="3days"))
+
+        assert [r["job_id"] for r in results] == ["job-0", "job-1", "job-2", "job-3"]
+
+    def test_wider_date_posted_misses(self, frozen_time):
+        """Test un periodo más amplio no se puede responder"""
+        cache = SearchCache()
+        cache.put(SearchParameters(query="python", date_posted="week"), make_results(5))
+
+        assert cache.get(SearchParameters(query="python", date_posted="month")) is None
+        assert cache.get(SearchParameters(query="python")) is None
+
+    def test_same_window_later_filters_again(self, frozen_time):
+        """Test una consulta posterior recorta por la fecha actual"""
+        cache = SearchCache(ttl=30 * DAY)
+        cache.put(SearchParameters(query="python", date_posted="week"), make_results(5), exhausted=True)
+
+        frozen_time.return_value = NOW + 2 * DAY
+        results = cache.get(SearchParameters(query="python", date_posted="3days"))
+
+        assert [r["job_id"] for r in results] == ["job-0", "job-1"]
+
+    def test_undated_jobs_dropped_when_filtering_by_date(self, frozen_time):
+        """Test sin timestamp no se puede confirmar la fecha"""
+        cache = SearchCache()
+        cache.put(SearchParameters(query="python"), [
+            {"job_id": "x"},
+            {"job_id": "y", "job_posted_at_timestamp": NOW},
+        ], exhausted=True)
+
+        results = cache.get(SearchParameters(query="python", date_posted="today"))
+
+        assert [r["job_id"] for r in results] == ["y"]
+
+    def test_remote_filters_by_is_remote(self, frozen_time):
+        """Test solo remotos se responde filtrando la búsqueda general"""
+        cache = SearchCache()
+        cache.put(SearchParameters(query="python"), make_results(6), exhausted=True)
+
+        results = cache.get(SearchParameters(query="python", work_from_home=True))
+
+        assert [r["job_id"] for r in results] == ["job-0", "job-2", "job-4"]
+
+    def test_remote_cached_does_not_answer_general(self, frozen_time):
+        """Test una búsqueda remota no responde la general"""
+        cache = SearchCache()
+        cache.put(SearchParameters(query="python", work_from_home=True), make_results(6))
+
+        assert cache.get(SearchParameters(query="python")) is None
+
+    def test_fewer_pages_is_prefix(self, frozen_time):
+        """Test menos páginas toma las primeras posiciones"""
+        cache = SearchCache()
+        cache.put(SearchParameters(query="python", num_pages=3), make_results(30))
+
+        first = cache.get(SearchParameters(query="python", num_pages=1))
+        second = cache.get(SearchParameters(query="python", page=2, num_pages=2))
+
+        assert len(first) == JSEARCH_PAGE_SIZE
+        assert first[0]["job_id"] == "job-0"
+        assert [r["job_id"] for r in second][0] == "job-10"
+        assert len(second) == 20
+
+    def test_more_pages_misses(self, frozen_time):
+        """Test más páginas de las cacheadas va a la API"""
+        cache = SearchCache()
+        cache.put(SearchParameters(query="python", num_pages=2), make_results(20))
+
+        assert cache.get(SearchParameters(query="python", num_pages=3)) is None
+        assert cache.get(SearchParameters(query="python", page=2, num_pages=2)) is None
+
+    def test_combined_narrowing(self, frozen_time):
+        """Test páginas, remotos y fecha se combinan"""
+        cache = SearchCache()
+        cache.put(SearchParameters(query="python", num_pages=2), make_results(15), exhausted=True)
+
+        results = cache.get(SearchParameters(
+            query="python", num_pages=1, work_from_home=True, date_posted="week"
+        ))
+
+        assert [r["job_id"] for r in results] == ["job-0", "job-2", "job-4", "job-6"]
+
+    def test_narrower_filter_needs_exhausted_results(self, frozen_time):
+        """Test con páginas completas el filtro más estricto va a la API"""
+        cache = SearchCache()
+        cache.put(SearchParameters(query="python", date_posted="month", num_pages=2), make_results(20))
+
+        assert cache.get(SearchParameters(query="python", date_posted="week")) is None
+        assert cache.get(SearchParameters(query="python", date_posted="month", work_from_home=True)) is None
+
+    def test_narrower_filter_needs_exhausted_flag(self, frozen_time):
+        """Test pocos resultados no bastan: pueden venir de quitar repetidos"""
+        cache = SearchCache()
+        cache.put(SearchParameters(query="python", date_posted="month"), make_results(8))
+
+        assert cache.get(SearchParameters(query="python", date_posted="week")) is None
+
+    def test_narrower_filter_needs_first_page(self, frozen_time):
+        """Test sin las primeras páginas no se sabe qué cae en cada página filtrada"""
+        cache = SearchCache()
+        cache.put(SearchParameters(query="python", page=2), make_results(4), exhausted=True)
+
+        assert cache.get(SearchParameters(query="python", page=2, work_from_home=True)) is None
+
+    def test_narrower_filter_pages_after_filtering(self, frozen_time):
+        """Test las páginas se cuentan sobre el resultado ya filtrado"""
+        cache = SearchCache(ttl=30 * DAY)
+        results = make_results(25)
+        for job in results:
+            job["job_posted_at_timestamp"] = NOW
+        cache.put(SearchParameters(query="python", date_posted="month", num_pages=3), results, exhausted=True)
+
+        second = cache.get(SearchParameters(
+            query="python", date_posted="month", page=2, work_from_home=True
+        ))
+
+        assert [r["job_id"] for r in second] == ["job-20", "job-22", "job-24"]
+
+    def test_partial_pages_not_sliced(self, frozen_time):
+        """Test sin todas las páginas completas no se corta por posición"""
+        cache = SearchCache()
+        params = SearchParameters(query="python", num_pages=3)
+        cache.put(params, make_results(28))
+
+        assert cache.get(SearchParameters(query="python", num_pages=1)) is None
+        assert len(cache.get(params)) == 28
+
+    def test_entries_expire(self, frozen_time):
+        """Test las búsquedas caducan tras el TTL"""
+        cache = SearchCache(ttl=60)
+        params = SearchParameters(query="python")
+        cache.put(params, make_results(1))
+
+        frozen_time.return_value = NOW + 61
+
+        assert cache.get(params) is None
+        assert len(cache) == 0
+
+    def test_wider_entry_replaces_covered_ones(self, frozen_time):
+        """Test una búsqueda más amplia sustituye a las contenidas"""
+        cache = SearchCache()
+        cache.put(SearchParameters(query="python", date_posted="week"), make_results(5), exhausted=True)
+        cache.put(SearchParameters(query="python", date_posted="month", num_pages=2), make_results(15), exhausted=True)
+
+        assert len(cache) == 1
+
+    def test_max_entries_evicts_oldest(self, frozen_time):
+        """Test el tamaño está acotado"""
+        cache = SearchCache(max_entries=2)
+        for query in ("a", "b", "c"):
+            cache.put(SearchParameters(query=query), [])
+
+        assert len(cache) == 2
+        assert cache.get(SearchParameters(query="a")) is None
+        assert cache.get(SearchParameters(query="c")) == []
+
+    def test_zero_ttl_disables_cache(self, frozen_time):
+        """Test TTL 0 no guarda nada"""
+        cache = SearchCache(ttl=0)
+        cache.put(SearchParameters(query="python"), [])
+
+        assert len(cache) == 0
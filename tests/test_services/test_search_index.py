@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_search_index.py
+Descripción: Tests para SearchIndex
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import math
+import random
+from collections import Counter
+import pytest
+from src.models.job import Job
+from src.models.job_record import JobRecord
+from src.services.search_index import SearchIndex, tokenize, job_fields, DEFAULT_FIELD_WEIGHTS
+
+
+def reference_scores(jobs, text, k1=1.2, b=0.75):
+    """BM25 calculado directamente sobre todos los documentos"""
+    docs = {}
+    for job in jobs:
+        tf = Counter()
+        for name, value in job_fields(job).items():
+            for term in tokenize(value):
+                tf[term] += DEFAULT_FIELD_WEIGHTS[name]
+        docs[job.job_id] = tf
+    avg = sum(sum(tf.values()) for tf in docs.values()) / len(docs)
+    scores = {}
+    for job_id, tf in docs.items():
+        length = sum(tf.values())
+        score = 0.0
+        for term in set(tokenize(text)):
+            if term not in tf:
+                continue
+            df = sum(1 for other in docs.values() if term in other)
+            idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+            score += idf * tf[term] * (k1 + 1) / (tf[term] + k1 * (1 - b + b * length / avg))
+        if score:
+            scores[job_id] = score
+    return scores
+
+
+def random_jobs(count, seed=0):
+    rng = random.Random(seed)
+    words = [f"term{i}" for i in range(300)]
+    return [
+        Job(
+            job_id=str(i),
+            job_title=" ".join(rng.sample(words, 3)),
+            job_description=" ".join(rng.choice(words) for _ in range(rng.randint(0, 60))),
+            job_required_skills=rng.sample(words, rng.randint(0, 3)),
+        )
+        for i in range(count)
+    ]
+
+
+class TestTokenize:
+    """Tests para la tokenización"""
+
+    def test_normalizes_and_drops_stop_words(self):
+        """Test minúsculas, sin tildes, sin puntuación ni palabras vacías"""
+        assert tokenize("The Senior Ingeniero de Datos, con Python!") == \
+            ["senior", "ingeniero", "datos", "python"]
+        assert tokenize(None) == []
+
+    def test_job_fields_include_highlights(self):
+        """Test los highlights se indexan como texto"""
+        job = Job(job_id="1", job_highlights={"Qualifications": ["Kubernetes", "Go"]})
+
+        assert job_fields(job)['highlights'] == "Kubernetes Go"
+
+
+class TestSearchIndex:
+    """Tests para SearchIndex"""
+
+    def test_scores_match_reference_bm25(self):
+        """Test puntuaciones y orden iguales al BM25 de referencia"""
+        jobs = random_jobs(200)
+        index = SearchIndex.from_jobs(jobs)
+
+        for query in ["term1", "term5 term17", "term200 term3 term99 unknown"]:
+            expected = reference_scores(jobs, query)
+            hits = index.search(query, limit=len(jobs))
+
+            assert {hit.job_id for hit in hits} == set(expected)
+            for hit in hits:
+                assert hit.score == pytest.approx(expected[hit.job_id], rel=1e-5)
+            assert [h.score for h in hits] == sorted((h.score for h in hits), reverse=True)
+
+    def test_top_k_matches_full_ranking(self):
+        """Test el top-k coincide con los primeros del ranking completo"""
+        index = SearchIndex.from_jobs(random_jobs(300, seed=1))
+
+        full = index.search("term1 term2 term3", limit=1000)
+        assert index.search("term1 term2 term3", limit=10) == full[:10]
+
+    def test_title_weighs_more_than_description(self):
+        """Test un término en el título puntúa más que en la descripción"""
+        index = SearchIndex.from_jobs([
+            Job(job_id="desc", job_title="Engineer", job_description="We use kubernetes daily"),
+            Job(job_id="title", job_title="Kubernetes Engineer", job_description="We build platforms daily"),
+        ])
+
+        assert [hit.job_id for hit in index.search("kubernetes")] == ["title", "desc"]
+
+    def test_incremental_add_and_remove(self):
+        """Test altas, reemplazos y bajas entre búsquedas"""
+        index = SearchIndex()
+        index.add(Job(job_id="1", job_title="Python Developer"))
+        assert [h.job_id for h in index.search("python")] == ["1"]
+
+        index.add(Job(job_id="2", job_title="Python Lead"))
+        index.add(Job(job_id="1", job_title="Rust Developer"))
+
+        assert [h.job_id for h in index.search("python")] == ["2"]
+        assert [h.job_id for h in index.search("rust")] == ["1"]
+        assert len(index) == 2
+
+        assert index.remove("2") is True
+        assert index.remove("2") is False
+        assert index.search("python") == []
+        assert "2" not in index and "1" in index
+
+    def test_removals_match_fresh_index(self):
+        """Test tras bajas (y compactación) puntúa igual que un índice nuevo"""
+        jobs = random_jobs(120, seed=2)
+        index = SearchIndex.from_jobs(jobs)
+        index.search("term1")
+
+        removed = {str(i) for i in range(0, 120, 3)}
+        for job_id in removed:
+            index.remove(job_id)
+        remaining = [job for job in jobs if job.job_id not in removed]
+        fresh = SearchIndex.from_jobs(remaining)
+
+        for query in ["term1 term2", "term50"]:
+            got = index.search(query, limit=200)
+            expected = fresh.search(query, limit=200)
+            assert [h.job_id for h in got] == [h.job_id for h in expected]
+            assert [h.score for h in got] == pytest.approx([h.score for h in expected])
+
+    def test_accepts_job_records(self):
+        """Test indexa JobRecord"""
+        index = SearchIndex.from_jobs([JobRecord.from_job(Job(job_id="1", job_title="Data Engineer"))])
+
+        assert index.search("data")[0].job_id == "1"
+
+    def test_empty_queries(self):
+        """Test consultas vacías o solo con palabras vacías"""
+        index = SearchIndex.from_jobs(random_jobs(5))
+
+        assert index.search("") == []
+        assert index.search("the and of") == []
+        assert index.search("term1", limit=0) == []
+        assert SearchIndex().search("term1") == []
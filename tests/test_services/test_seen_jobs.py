@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_seen_jobs.py
+Descripción: Tests para el filtro de Bloom y el historial de trabajos vistos
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import pytest
+from src.models.job import Job
+from src.services.job_store import JobStore
+from src.services.seen_jobs import BloomFilter, ScalableBloomFilter, SeenJobs
+
+
+class TestBloomFilter:
+    """Tests para BloomFilter"""
+
+    def test_no_false_negatives(self):
+        """Test todo lo añadido se encuentra"""
+        bloom = BloomFilter(1000, 0.01)
+        for i in range(1000):
+            bloom.add(f"job-{i}")
+
+        assert all(f"job-{i}" in bloom for i in range(1000))
+        # Un falso positivo al añadir no cuenta como clave nueva
+        assert 980 <= bloom.count <= 1000
+
+    def test_false_positive_rate(self):
+        """Test la tasa de falsos positivos respeta error_rate"""
+        bloom = BloomFilter(5000, 0.01)
+        for i in range(5000):
+            bloom.add(f"job-{i}")
+
+        false_positives = sum(1 for i in range(20000) if f"other-{i}" in bloom)
+        assert false_positives / 20000 < 0.02
+
+    def test_invalid_parameters(self):
+        """Test parámetros fuera de rango"""
+        with pytest.raises(ValueError):
+            BloomFilter(0, 0.01)
+        with pytest.raises(ValueError):
+            BloomFilter(10, 1.5)
+
+
+class TestScalableBloomFilter:
+    """Tests para ScalableBloomFilter"""
+
+    def test_grows_in_layers_and_bounds_error(self):
+        """Test añade capas al llenarse y mantiene el error total"""
+        bloom = ScalableBloomFilter(initial_capacity=500, error_rate=0.01)
+        for i in range(4000):
+            bloom.add(f"job-{i}")
+
+        assert len(bloom.filters) > 1
+        assert all(f"job-{i}" in bloom for i in range(4000))
+        false_positives = sum(1 for i in range(20000) if f"other-{i}" in bloom)
+        assert false_positives / 20000 < 0.01
+
+    def test_add_reports_new_keys(self):
+        """Test add devuelve False para claves repetidas"""
+        bloom = ScalableBloomFilter(initial_capacity=10)
+
+        assert bloom.add("a") is True
+        assert bloom.add("a") is False
+        assert len(bloom) == 1
+        assert 123 not in bloom
+
+    def test_save_and_load(self, tmp_path):
+        """Test el filtro se recupera idéntico desde disco"""
+        bloom = ScalableBloomFilter(initial_capacity=100, error_rate=0.01)
+        for i in range(300):
+            bloom.add(f"job-{i}")
+        path = tmp_path / "seen.bloom"
+
+        bloom.save(path)
+        loaded = ScalableBloomFilter.load(path)
+
+        assert len(loaded.filters) == len(bloom.filters)
+        assert len(loaded) == len(bloom)
+        assert all(f"job-{i}" in loaded for i in range(300))
+        assert [f._bits for f in loaded.filters] == [f._bits for f in bloom.filters]
+        assert not path.with_name("seen.bloom.tmp").exists()
+
+    def test_load_rejects_other_files(self, tmp_path):
+        """Test un archivo ajeno o truncado no se carga"""
+        path = tmp_path / "seen.bloom"
+        path.write_bytes(b"not a bloom filter")
+        with pytest.raises(ValueError):
+            ScalableBloomFilter.load(path)
+
+        bloom = ScalableBloomFilter(initial_capacity=100)
+        bloom.add("a")
+        bloom.save(path)
+        path.write_bytes(path.read_bytes()[:-10])
+        with pytest.raises(ValueError):
+            ScalableBloomFilter.load(path)
+
+
+class TestSeenJobs:
+    """Tests para SeenJobs"""
+
+    def test_persists_between_runs(self, tmp_path):
+        """Test los IDs marcados siguen vistos en la siguiente ejecución"""
+        path = tmp_path / "seen.bloom"
+        seen = SeenJobs(path)
+        assert seen.add_many(["a", "b", "a"]) == 2
+        seen.save()
+
+        again = SeenJobs(path)
+
+        assert "a" in again and "b" in again
+        assert "c" not in again
+
+    def test_split_keeps_order(self):
+        """Test separa nuevos y vistos sin marcarlos"""
+        seen = SeenJobs()
+        seen.add_many(["2"])
+        jobs = [Job(job_id=str(i)) for i in range(4)]
+
+        new_jobs, seen_jobs = seen.split(jobs)
+
+        assert [job.job_id for job in new_jobs] == ["0", "1", "3"]
+        assert [job.job_id for job in seen_jobs] == ["2"]
+        assert "0" not in seen
+
+    def test_store_confirms_positives(self, tmp_path):
+        """Test con almacén un positivo del filtro se confirma por clave"""
+        store = JobStore(":memory:")
+        store.upsert(Job(job_id="stored"))
+        seen = SeenJobs(tmp_path / "seen.bloom", store)
+
+        assert "stored" in seen
+        seen.add_many(["removed"])
+        assert "removed" not in seen
+
+    def test_seeds_from_store_when_file_missing(self, tmp_path):
+        """Test sin archivo, el filtro arranca con los IDs del almacén"""
+        store = JobStore(":memory:")
+        store.upsert_many([Job(job_id=str(i)) for i in range(50)])
+        path = tmp_path / "seen.bloom"
+
+        seen = SeenJobs(path, store)
+        seen.save()
+
+        assert len(seen) == 50
+        assert path.exists()
+        assert "7" in SeenJobs(path)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_skill_extractor.py
+Descripción: Tests para SkillExtractor
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import json
+import random
+import re
+import pytest
+from src.models.job import Job
+from src.models.job_record import JobRecord
+from src.services.skill_extractor import (
+    SkillExtractor, tokenize_skills, load_skill_dictionary, skill_counts, CONTEXT_WINDOW
+)
+
+
+DICTIONARY = {
+    "Kubernetes": ["k8s"],
+    "Java": [],
+    "JavaScript": ["js"],
+    "React": ["reactjs"],
+    "React Native": [],
+    "Machine Learning": ["ml"],
+    "C++": [],
+    "C#": [],
+    ".NET": ["dotnet", "asp.net"],
+    "Node.js": ["nodejs"],
+    "CI/CD": [],
+    "Learning Management": [],
+}
+
+
+def naive_extract(dictionary, text):
+    """Busca cada alias por separado con una expresión regular"""
+    words = " ".join(tokenize_skills(text))
+    matches = []
+    for canonical, aliases in dictionary.items():
+        for alias in (canonical, *aliases):
+            pattern = r"(?<!\S)" + re.escape(" ".join(tokenize_skills(alias))) + r"(?!\S)"
+            for match in re.finditer(pattern, words):
+                matches.append((match.start(), -(match.end() - match.start()), canonical))
+    found = {}
+    covered = -1
+    for start, negative_length, canonical in sorted(matches, key=lambda m: (m[0], m[1])):
+        if start > covered:
+            found.setdefault(canonical)
+            covered = start - negative_length - 1
+    return list(found)
+
+
+class TestTokenizeSkills:
+    """Tests para la tokenización de skills"""
+
+    def test_keeps_symbols_of_skill_names(self):
+        """Test conserva C++, C#, .NET y Node.js; separa CI/CD"""
+        assert tokenize_skills("C++, C#, .NET and Node.js... CI/CD!") == \
+            ["c++", "c#", ".net", "and", "node.js", "ci", "cd"]
+        assert tokenize_skills(None) == []
+
+
+class TestSkillExtractor:
+    """Tests para SkillExtractor"""
+
+    @pytest.fixture
+    def extractor(self):
+        return SkillExtractor(DICTIONARY)
+
+    def test_aliases_map_to_canonical(self, extractor):
+        """Test alias y mayúsculas se resuelven al nombre canónico"""
+        assert extractor.extract("Deploying on K8S with ReactJS and dotnet") == \
+            ["Kubernetes", "React", ".NET"]
+
+    def test_whole_words_only(self, extractor):
+        """Test Java no coincide dentro de JavaScript ni ml dentro de html"""
+        assert extractor.extract("Strong JavaScript and HTML skills") == ["JavaScript"]
+
+    def test_longest_match_wins(self, extractor):
+        """Test React Native prevalece sobre React en la misma posición"""
+        assert extractor.extract("React Native apps and some React") == ["React Native", "React"]
+        assert extractor.extract("machine learning management") == ["Machine Learning"]
+
+    def test_order_and_no_repeats(self, extractor):
+        """Test orden de primera aparición sin repetidos"""
+        assert extractor.extract("C# then C++ then c# again, CI/CD") == ["C#", "C++", "CI/CD"]
+        assert extractor.extract("") == []
+
+    def test_matches_naive_search(self):
+        """Test el autómata coincide con buscar cada alias por separado"""
+        extractor = SkillExtractor(DICTIONARY, ambiguous=())
+        rng = random.Random(0)
+        vocabulary = ["machine", "learning", "management", "react", "native", "java",
+                      "k8s", "c++", "node.js", "ci", "cd", "the", "asp.net", "js"]
+        for _ in range(300):
+            text = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 30)))
+            assert extractor.extract(text) == naive_extract(DICTIONARY, text)
+
+    def test_ambiguous_terms_need_context(self, extractor):
+        """Test una palabra común solo cuenta como skill con otra skill cerca"""
+        assert extractor.extract("You must react quickly to customer requests") == []
+        assert extractor.extract("Frontend in React with k8s deployments") == ["React", "Kubernetes"]
+        assert extractor.extract("React Native apps") == ["React Native"]
+        assert extractor.extract("We use ReactJS") == ["React"]
+
+    def test_context_window(self):
+        """Test la skill que da contexto tiene que estar a CONTEXT_WINDOW palabras o menos"""
+        extractor = SkillExtractor(DICTIONARY, ambiguous=["react"])
+        filler = " ".join(["word"] * CONTEXT_WINDOW)
+
+        assert extractor.extract(f"react {filler} java") == ["Java"]
+        assert extractor.extract(f"react {filler[5:]} java") == ["React", "Java"]
+
+    def test_default_dictionary_common_words(self):
+        """Test el diccionario por defecto no etiqueta expresiones corrientes"""
+        extractor = SkillExtractor()
+        text = (
+            "Swift delivery matters here. Teams react fast, keep guard rails in place, "
+            "spark new ideas and fix rust on every node of the network. Our TS clearance..."
+        )
+
+        assert extractor.extract(text) == []
+        assert extractor.extract("Python and Rust services, a Swift iOS app") == \
+            ["Python", "Rust", "Swift"]
+
+    def test_default_dictionary(self):
+        """Test el diccionario por defecto reconoce alias habituales"""
+        extractor = SkillExtractor()
+
+        assert extractor.extract("Python, Docker and k8s on AWS; go to the rest of the team") == \
+            ["Python", "Docker", "Kubernetes", "AWS"]
+
+
+class TestEnrichment:
+    """Tests para completar required_skills"""
+
+    @pytest.fixture
+    def extractor(self):
+        return SkillExtractor(DICTIONARY)
+
+    def test_enrich_keeps_existing_skills_first(self, extractor):
+        """Test las skills ya presentes se conservan y no se duplican"""
+        job = Job(
+            job_id="1",
+            job_title="React Developer",
+            job_description="Node.js and k8s",
+            job_highlights={"Qualifications": ["C++"]},
+            job_required_skills=["Kubernetes", "Figma"],
+        )
+
+        enriched = extractor.enrich(job)
+
+        assert enriched.required_skills == ["Kubernetes", "Figma", "React", "C++", "Node.js"]
+        assert job.required_skills == ["Kubernetes", "Figma"]
+
+    def test_enrich_without_new_skills_returns_same_job(self, extractor):
+        """Test sin skills nuevas no se copia el trabajo"""
+        job = Job(job_id="1", job_description="k8s", job_required_skills=["kubernetes"])
+
+        assert extractor.enrich(job) is job
+
+    def test_enrich_job_record(self, extractor):
+        """Test también enriquece JobRecord"""
+        record = JobRecord.from_job(Job(job_id="1", job_description="Java and C#"))
+
+        enriched = extractor.enrich_many([record])[0]
+
+        assert isinstance(enriched, JobRecord)
+        assert enriched.required_skills == ("Java", "C#")
+
+    def test_skill_counts(self):
+        """Test cuenta trabajos por skill sin distinguir mayúsculas"""
+        jobs = [
+            Job(job_id="1", job_required_skills=["Python", "Docker"]),
+            Job(job_id="2", job_required_skills=["python"]),
+            Job(job_id="3", job_required_skills=["Go"]),
+        ]
+
+        assert skill_counts(jobs, top=2) == [("Python", 2), ("Docker", 1)]
+
+
+class TestSkillDictionary:
+    """Tests para cargar diccionarios de skills"""
+
+    def test_from_config_extends_default(self, tmp_path):
+        """Test un archivo añade skills y alias al diccionario por defecto"""
+        path = tmp_path / "skills.json"
+        path.write_text(json.dumps({"Kubernetes": ["kube"], "LangChain": []}), encoding='utf-8')
+
+        extractor = SkillExtractor.from_config(path)
+
+        assert extractor.extract("LangChain on kube with k8s and Python") == \
+            ["LangChain", "Kubernetes", "Python"]
+
+    def test_invalid_dictionary(self, tmp_path):
+        """Test rechaza archivos con otro formato"""
+        path = tmp_path / "skills.json"
+        path.write_text(json.dumps({"Kubernetes": "k8s"}), encoding='utf-8')
+
+        with pytest.raises(ValueError):
+            load_skill_dictionary(path)
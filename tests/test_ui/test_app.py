@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_app.py
+Descripción: Tests para los endpoints del dashboard web
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2026-10-17
+"""
+import importlib
+import sys
+from unittest.mock import Mock, patch
+import pytest
+
+
+@pytest.fixture
+def dashboard(tmp_path, monkeypatch):
+    """Módulo app con almacén temporal y cliente de API simulado"""
+    monkeypatch.setenv("API_KEY", "test-key")
+    monkeypatch.setenv("CACHE_ENABLED", "false")
+    monkeypatch.setenv("STORE_PATH", str(tmp_path / "jobs.sqlite3"))
+    monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "output"))
+    monkeypatch.setenv("LOG_DIR", str(tmp_path / "logs"))
+    monkeypatch.setenv("LOG_TO_FILE", "false")
+    sys.modules.pop("app", None)
+
+    module = importlib.import_module("app")
+    module.job_service.api_client = Mock()
+    yield module
+
+    module.job_service.wait()
+    if module.job_service.job_store is not None:
+        module.job_service.job_store.close()
+    sys.modules.pop("app", None)
+
+
+class TestSavedSearch:
+    """Tests para /api/saved-search"""
+
+    def test_dashboard_search_is_searchable_locally(self, dashboard, sample_job_data):
+        """Test los trabajos de una búsqueda del dashboard aparecen en la búsqueda local"""
+        dashboard.job_service.api_client.search_jobs.return_value = [
+            dict(sample_job_data, job_id="kotlin-1", job_title="Kotlin Android Engineer"),
+            dict(sample_job_data, job_id="go-1", job_title="Go Backend Engineer"),
+        ]
+        client = dashboard.app.test_client()
+
+        searched = client.post("/api/custom-search", json={"query": "mobile", "country": "es"})
+        dashboard.job_service.wait()
+        saved = client.get("/api/saved-search?q=kotlin")
+
+        assert searched.get_json()["total"] == 2
+        body = saved.get_json()
+        assert body["success"] is True
+        assert [job["id"] for job in body["jobs"]] == ["kotlin-1"]
+
+    def test_missing_query(self, dashboard):
+        """Test sin q se responde 400"""
+        response = dashboard.app.test_client().get("/api/saved-search")
+
+        assert response.status_code == 400
+
+
+class TestJobDetails:
+    """Tests para /api/job-details"""
+
+    def test_details_reused_until_ttl(self, dashboard, sample_job_data):
+        """Test los detalles se sirven de memoria hasta que caduca cache_ttl_details"""
+        get_details = dashboard.job_service.api_client.get_job_details
+        get_details.return_value = sample_job_data
+        client = dashboard.app.test_client()
+        ttl = dashboard.config.cache_ttl_details
+        url = f"/api/job-details/{sample_job_data['job_id']}"
+
+        with patch("app.time.time", return_value=1000.0):
+            first = client.get(url)
+            client.get(url)
+        with patch("app.time.time", return_value=1000.0 + ttl):
+            client.get(url)
+
+        assert first.get_json()["id"] == sample_job_data["job_id"]
+        assert get_details.call_count == 2
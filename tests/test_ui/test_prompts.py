@@ -128,6 +128,16 @@ class TestPrompts:
 
         assert country == "us"
 
+    @patch('rich.prompt.Prompt.ask')
+    def test_get_saved_search_query(self, mock_prompt):
+        """Test obtener palabras clave para la búsqueda local"""
+        mock_prompt.return_value = "python django"
+
+        console = Console()
+        prompts = Prompts(console)
+
+        assert prompts.get_saved_search_query() == "python django"
+
     @patch('rich.prompt.Prompt.ask')
     def test_get_salary_estimate_params(self, mock_prompt):
         """Test obtener parámetros de estimación salarial"""
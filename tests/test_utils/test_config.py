@@ -55,6 +55,36 @@ class TestConfig:
         assert config.retry_delay == 2
         assert config.request_timeout == 30
         assert config.rate_limit_delay == 1.0
+        assert config.rate_limit_burst == 1
+        assert config.adaptive_rate_limit is True
+        assert config.max_requests_per_second is None
+        assert config.retry_deadline == 60.0
+        assert config.retry_budget_ratio == 0.2
+        assert config.max_concurrency == 8
+        assert config.page_fan_out is False
+        assert config.search_page_by_page is False
+        assert config.cache_enabled is True
+        assert config.cache_path == Path("cache/api_responses.sqlite3")
+        assert config.cache_max_entries == 2000
+        assert config.cache_ttl_search == 900
+        assert config.cache_ttl_details == 86400
+        assert config.cache_ttl_salary == 259200
+        assert config.store_enabled is True
+        assert config.store_path == Path("data/jobs.sqlite3")
+        assert config.dedup_enabled is True
+        assert config.dedup_threshold == 0.8
+        assert config.skills_enabled is True
+        assert config.skills_path is None
+        assert config.seen_enabled is True
+        assert config.seen_path == Path("data/seen_jobs.bloom")
+        assert config.seen_error_rate == 0.001
+        assert config.skip_seen_jobs is False
+        assert config.export_only_new is False
+        assert config.export_seen_path == Path("data/exported_jobs.bloom")
+        assert config.export_compression is None
+        assert config.export_compression_level is None
+        assert config.export_dedup is None
+        assert config.export_deltas is False
         assert config.log_level == "INFO"
         assert config.log_to_file is True
         assert config.log_to_console is True
@@ -93,6 +123,20 @@ class TestConfig:
         assert config.log_to_file is False
         assert config.log_to_console is False
 
+    @patch.dict('os.environ', {
+        'API_KEY': 'test_key',
+        'EXPORT_COMPRESSION': 'gzip',
+        'EXPORT_COMPRESSION_LEVEL': '19'
+    })
+    def test_config_compression_level_per_algorithm(self):
+        """Test el nivel de compresión se valida según el algoritmo"""
+        with pytest.raises(ValidationError) as exc_info:
+            Config()
+        assert 'gzip' in str(exc_info.value)
+
+        with patch.dict('os.environ', {'EXPORT_COMPRESSION': 'zstd'}):
+            assert Config().export_compression_level == 19
+
     def test_config_missing_api_key(self, monkeypatch):
         """Test configuración sin API key"""
         # Limpiar entorno y evitar que lea .env
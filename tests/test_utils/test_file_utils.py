@@ -16,7 +16,10 @@ from src.utils.file_utils import (
     generate_filename,
     ensure_dir_exists,
     get_file_size,
-    format_file_size
+    format_file_size,
+    compression_from_path,
+    check_compression_level,
+    open_compressed
 )
 
 
@@ -287,3 +290,49 @@ class TestFileUtils:
         # El directorio debería ser accesible
         assert result.exists()
         assert result.is_dir()
+
+
+class TestCompressedFiles:
+    """Tests para archivos comprimidos"""
+
+    def test_compression_from_path(self):
+        """Test detección por extensión"""
+        assert compression_from_path("jobs.csv.gz") == "gzip"
+        assert compression_from_path("jobs.jsonl.zst") == "zstd"
+        assert compression_from_path("jobs.csv") is None
+
+    def test_gzip_round_trip(self, tmp_path):
+        """Test escribir y leer gzip en modo texto"""
+        path = tmp_path / "data.txt.gz"
+        with open_compressed(path, 'wt', level=9) as f:
+            f.write("línea\n" * 1000)
+
+        with open_compressed(path) as f:
+            assert f.read() == "línea\n" * 1000
+        assert path.read_bytes()[:2] == b"\x1f\x8b"
+        assert get_file_size(path) < 200
+
+    def test_zstd_round_trip(self, tmp_path):
+        """Test escribir y leer zstd en modo texto"""
+        pytest.importorskip("zstandard")
+        path = tmp_path / "data.txt.zst"
+        with open_compressed(path, 'wt', level=19) as f:
+            f.write("línea\n" * 1000)
+
+        with open_compressed(path) as f:
+            assert f.read() == "línea\n" * 1000
+
+    def test_compression_level_range(self, tmp_path):
+        """Test niveles fuera del rango de cada algoritmo"""
+        check_compression_level('zstd', 22)
+        check_compression_level(None, 50)
+
+        with pytest.raises(ValueError):
+            check_compression_level('gzip', 10)
+        with pytest.raises(ValueError):
+            open_compressed(tmp_path / "data.txt.gz", 'wt', level=12)
+
+    def test_invalid_compression(self, tmp_path):
+        """Test compresión desconocida"""
+        with pytest.raises(ValueError):
+            open_compressed(tmp_path / "data.txt", 'wt', compression="lzma")